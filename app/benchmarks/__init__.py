@@ -0,0 +1,4 @@
+"""
+Suíte de benchmarks das camadas de repositório e serviço
+Executada por ``run_benchmarks.py`` contra um PostgreSQL local
+"""
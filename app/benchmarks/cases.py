@@ -0,0 +1,86 @@
+"""
+Casos de benchmark das camadas de repositório e serviço
+"""
+
+import contextlib
+import io
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from src.repositories.chunk_repository import ChunkRepositoryImpl
+from src.services.interface_service import InterfaceService
+from src.utils.db_helpers import setup_database
+
+from .seed import BENCH_MAPA, BENCH_PLAYER_PREFIX
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    Operação medida pelo runner
+
+    Attributes:
+        name: Nome do caso no relatório e no JSON
+        fn: Operação medida
+        setup: Executado antes de cada repetição, fora da medição
+        rows: Linhas carregadas por repetição, para o relatório de vazão
+    """
+    name: str
+    fn: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None
+    rows: Optional[int] = None
+
+
+def build_cases() -> List[BenchmarkCase]:
+    """Monta os casos sobre o mapa de benchmark já populado por ``seed.seed``"""
+    interface_service = InterfaceService.get_instance()
+    game_service = interface_service.game_service
+    chunk_repository = game_service.chunk_repository
+    player_repository = game_service.player_repository
+
+    # Jogador e chunk de referência, no meio do mapa de benchmark
+    player = player_repository.find_by_name(f"{BENCH_PLAYER_PREFIX}1")
+    if player is None:
+        raise RuntimeError("Jogadores de benchmark não encontrados; rode seed.seed antes")
+    chunks = chunk_repository.find_by_mapa(BENCH_MAPA, "Dia")
+    chunk_id = chunks[len(chunks) // 2].id_chunk if chunks else 1
+
+    # Rota do canto do mapa até o chunk de referência; o destino já tem campo de distâncias
+    origem = chunks[0].id_chunk if chunks else chunk_id
+    if chunks:
+        game_service.pathfinder.field(chunks[0].id_mapa, chunk_id)
+
+    def startup_check():
+        # Verificação feita antes do primeiro menu; a saída não interessa aqui
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup_database()
+
+    def save_player():
+        player.experiencia += 1
+        player_repository.save(player)
+
+    return [
+        BenchmarkCase("db_helpers.setup_database", startup_check),
+        # Mesmo mapa pelos dois caminhos: fetchall + Chunk por linha e COPY binário → NumPy
+        BenchmarkCase("chunk_repository.find_by_mapa",
+                      lambda: chunk_repository.find_by_mapa(BENCH_MAPA, "Dia"), rows=len(chunks)),
+        BenchmarkCase("chunk_repository.find_store_by_mapa",
+                      lambda: chunk_repository.find_store_by_mapa(BENCH_MAPA, "Dia"), rows=len(chunks)),
+        BenchmarkCase("player_repository.find_all", player_repository.find_all),
+        # Varredura completa em memória constante (cursor no servidor)
+        BenchmarkCase("chunk_repository.iter_all",
+                      lambda: sum(1 for _ in chunk_repository.iter_all())),
+        BenchmarkCase("player_repository.save", save_player),
+        # Primeira consulta após invalidar: mede a carga completa do índice
+        BenchmarkCase("chunk_grid.load", chunk_repository.get_grid,
+                      setup=ChunkRepositoryImpl.invalidate_grid),
+        BenchmarkCase("interface_service.get_adjacent_chunks",
+                      lambda: interface_service.get_adjacent_chunks(chunk_id)),
+        BenchmarkCase("pathfinding.route_warm", lambda: game_service.find_route(origem, chunk_id)),
+        # Grafo do mapa montado do zero (store, custos, pontes e regiões) + A*
+        BenchmarkCase("pathfinding.route_cold", lambda: game_service.find_route(origem, chunk_id),
+                      setup=game_service.pathfinder.invalidate),
+        BenchmarkCase("game_service.get_map_statistics", game_service.get_map_statistics),
+        BenchmarkCase("game_service.get_players_in_bioma",
+                      lambda: game_service.get_players_in_bioma(1)),
+    ]
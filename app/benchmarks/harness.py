@@ -0,0 +1,131 @@
+"""
+Medição, persistência e comparação dos resultados de benchmark
+"""
+
+import json
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Tempos (s) de um caso de benchmark em uma escala
+
+    Attributes:
+        name: Nome do caso (ex.: 'chunk_repository.find_by_mapa')
+        scale: Escala do banco (ex.: '100k')
+        samples: Duração de cada repetição medida
+        rows: Linhas processadas por repetição (para casos de carga), se conhecido
+    """
+    name: str
+    scale: str
+    samples: List[float] = field(default_factory=list)
+    rows: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.scale}:{self.name}"
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples) if self.samples else 0.0
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples) if self.samples else 0.0
+
+    @property
+    def minimum(self) -> float:
+        return min(self.samples) if self.samples else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        """Vazão pela mediana (None se o caso não informa linhas)"""
+        if self.rows is None or not self.median:
+            return None
+        return self.rows / self.median
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.update(median=self.median, mean=self.mean, min=self.minimum, stdev=self.stdev,
+                    rows_per_second=self.rows_per_second)
+        return data
+
+
+@dataclass
+class Regression:
+    """Caso cuja mediana piorou além da tolerância em relação à linha de base"""
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5, warmup: int = 1,
+            setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    Executa ``fn`` ``warmup + repeat`` vezes e retorna as durações medidas
+
+    Args:
+        fn: Operação a medir
+        repeat: Repetições medidas
+        warmup: Repetições descartadas (aquecem pool, caches e planos do banco)
+        setup: Executado antes de cada repetição, fora da medição
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def save_results(path: str, results: List[BenchmarkResult], metadata: Dict[str, Any]) -> None:
+    """Grava os resultados em JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": metadata, "results": [r.to_dict() for r in results]},
+                  f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> Dict[str, float]:
+    """Lê um arquivo de resultados e retorna a mediana de cada caso por chave 'escala:nome'"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {f"{r['scale']}:{r['name']}": r["median"] for r in data.get("results", [])}
+
+
+def compare(baseline: Dict[str, float], results: List[BenchmarkResult],
+            tolerance: float = 0.2) -> List[Regression]:
+    """
+    Compara as medianas com a linha de base
+
+    Args:
+        baseline: Medianas de referência por chave (ver ``load_results``)
+        results: Resultados da execução atual
+        tolerance: Piora relativa aceita (0.2 = até 20% mais lento)
+
+    Returns:
+        Casos que pioraram além da tolerância (casos sem linha de base são ignorados)
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+        if result.median > reference * (1 + tolerance):
+            regressions.append(Regression(result.key, reference, result.median))
+    return regressions
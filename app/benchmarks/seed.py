@@ -0,0 +1,85 @@
+"""
+Popula o banco com um mapa de benchmark na escala pedida
+Os dados são gerados no próprio PostgreSQL com generate_series, então
+mesmo a escala de 1M de chunks é criada em poucos segundos
+"""
+
+import math
+from typing import Tuple, Union
+
+from src.utils.db_helpers import connection_db
+from src.utils.reference_cache import bump_reference_version
+
+# Escalas nomeadas aceitas por --scales
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+
+BENCH_MAPA = "Benchmark"
+BENCH_PLAYER_PREFIX = "bench_"
+
+
+def parse_scale(scale: Union[str, int]) -> Tuple[str, int]:
+    """Converte '100k' (ou um número) em (rótulo, quantidade de chunks)"""
+    if isinstance(scale, int):
+        return str(scale), scale
+    if scale in SCALES:
+        return scale, SCALES[scale]
+    try:
+        return scale, int(scale)
+    except ValueError:
+        raise ValueError(f"Escala inválida: {scale} (use {', '.join(SCALES)} ou um número)")
+
+
+def cleanup() -> None:
+    """Remove jogadores, chunks e mapa criados por execuções anteriores"""
+    with connection_db() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM player WHERE nome LIKE %s", (BENCH_PLAYER_PREFIX + "%",))
+            cursor.execute("""
+                DELETE FROM chunk WHERE id_mapa IN (SELECT id_mapa FROM mapa WHERE nome = %s)
+            """, (BENCH_MAPA,))
+            cursor.execute("DELETE FROM mapa WHERE nome = %s", (BENCH_MAPA,))
+        conn.commit()
+    bump_reference_version('mapa')
+
+
+def seed(n_chunks: int, n_players: int = 1000) -> int:
+    """
+    Cria o mapa de benchmark com ``n_chunks`` chunks e ``n_players`` jogadores
+
+    Os chunks formam uma grade quadrada; os biomas são distribuídos entre os
+    biomas existentes e os jogadores espalhados pelos chunks do mapa (10% mortos).
+
+    Returns:
+        ID do mapa de benchmark
+    """
+    width = math.ceil(math.sqrt(n_chunks))
+    with connection_db() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO mapa (nome, turno) VALUES (%s, 'Dia') RETURNING id_mapa", (BENCH_MAPA,))
+            id_mapa = cursor.fetchone()[0]
+
+            cursor.execute("""
+                INSERT INTO chunk (id_bioma, id_mapa, x, y)
+                SELECT b.ids[1 + (g::bigint * 7919) %% array_length(b.ids, 1)], %s, g %% %s, g / %s
+                FROM generate_series(0, %s - 1) AS g,
+                     (SELECT array_agg(id_bioma ORDER BY id_bioma) AS ids FROM bioma) AS b
+            """, (id_mapa, width, width, n_chunks))
+
+            cursor.execute("SELECT min(id_chunk) FROM chunk WHERE id_mapa = %s", (id_mapa,))
+            first_chunk = cursor.fetchone()[0]
+
+            cursor.execute("""
+                INSERT INTO player (nome, vida_maxima, vida_atual, forca, localizacao,
+                                    nivel, experiencia, current_chunk_id)
+                SELECT %s || g, 100, CASE WHEN g %% 10 = 0 THEN 0 ELSE 100 END, 10,
+                       'Mapa ' || %s || ' - Chunk ' || c, 1, 0, c
+                FROM generate_series(1, %s) AS g,
+                     LATERAL (SELECT %s + (g::bigint * 104729) %% %s AS c) AS pos
+            """, (BENCH_PLAYER_PREFIX, id_mapa, n_players, first_chunk, n_chunks))
+
+            cursor.execute("ANALYZE chunk")
+            cursor.execute("ANALYZE player")
+        conn.commit()
+    bump_reference_version('mapa')
+    return id_mapa
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Gera um mundo procedural e grava os chunks no banco configurado
+
+Exemplos:
+    python generate_world.py --width 1024 --height 1024 --seed 7
+    python generate_world.py --width 64 --height 48 --replace
+"""
+import argparse
+import sys
+import time
+
+from src.utils.world_generator import seed_world
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Gerador procedural de mundos")
+    parser.add_argument("--width", type=int, default=32, help="Largura do mapa em chunks")
+    parser.add_argument("--height", type=int, default=32, help="Altura do mapa em chunks")
+    parser.add_argument("--mapa", default="Mapa_Principal", help="Nome dos mapas (Dia e Noite)")
+    parser.add_argument("--seed", type=int, default=None, help="Semente do terreno")
+    parser.add_argument("--replace", action="store_true",
+                        help="Apaga os chunks já existentes nos mapas antes de gerar")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        mapas = seed_world(args.width, args.height, args.mapa, seed=args.seed, replace=args.replace)
+    except Exception as e:
+        print(f"❌ Erro ao gerar o mundo: {str(e)}")
+        return 1
+
+    total = args.width * args.height * len(mapas)
+    print(f"✅ {total} chunks gravados em {time.perf_counter() - inicio:.2f}s "
+          f"(mapas: {', '.join(f'{turno}={id_mapa}' for turno, id_mapa in mapas.items())})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,25 @@
+import time
+_inicio = time.perf_counter()
+
+import os
 from src.interface.display import tela_inicial
 from src.utils.db_helpers import setup_database
+from src.services.interface_service import InterfaceService
+
+# Meta de tempo entre o início do processo e o primeiro menu
+STARTUP_TARGET_MS = float(os.getenv("STARTUP_TARGET_MS", "1500"))
 
 if __name__ == "__main__":
     # Verifica e configura o banco de dados antes de iniciar a aplicação
     setup_database()
     
+    # Flush periódico das alterações dos jogadores (e flush final no encerramento)
+    InterfaceService.get_instance().start_background_flush()
+    
+    elapsed_ms = (time.perf_counter() - _inicio) * 1000
+    if elapsed_ms > STARTUP_TARGET_MS:
+        print(f"Aviso: inicialização levou {elapsed_ms:.0f} ms (meta: {STARTUP_TARGET_MS:.0f} ms)")
+    
     # Inicia a aplicação
     tela_inicial()
  
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Publica o mundo (chunks e tabelas de referência) em memória compartilhada
+
+Os processos do jogo iniciados com ``SHARED_WORLD=<nome>`` leem o mundo
+publicado sem carregar uma cópia própria. Os segmentos existem enquanto
+este processo estiver rodando. A cada ``--interval`` segundos o publicador
+confere o carimbo do mundo (``mapa.versao`` e tabelas de referência) e só
+republica quando ele mudou. Se uma tabela de referência vier vazia ou com
+erro, a geração anterior continua publicada.
+
+Exemplos:
+    python publish_world.py --name minecraft_world
+    python publish_world.py --name minecraft_world --interval 300
+    python publish_world.py --name minecraft_world --interval 0   # publica uma vez
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from src.models.bioma import Bioma
+from src.models.item import Item
+from src.models.mapa import Mapa
+from src.repositories import BiomaRepositoryImpl, ChunkRepositoryImpl, MapaRepositoryImpl
+from src.repositories.item_repository import ItemRepositoryImpl
+from src.utils import map_snapshot
+from src.utils.chunk_store import ChunkStore
+from src.utils.db_helpers import connection_db
+from src.utils.shared_world import SHARED_WORLD_NAME, SharedWorldPublisher
+
+
+def load_reference_tables() -> Tuple[List[Bioma], List[Mapa], List[Item]]:
+    """
+    Lê bioma, mapa e item do banco
+
+    Usa ``load_all``, que propaga erros de banco, e recusa tabelas vazias:
+    publicar uma tabela vazia tiraria os dados de todos os leitores.
+    """
+    tabelas = (BiomaRepositoryImpl().load_all(), MapaRepositoryImpl().load_all(),
+               ItemRepositoryImpl().load_all())
+    for nome, linhas in zip(("bioma", "mapa", "item"), tabelas):
+        if not linhas:
+            raise RuntimeError(f"Tabela {nome} vazia no banco")
+    return tabelas
+
+
+def world_stamp(biomas: List[Bioma], mapas: List[Mapa], itens: List[Item]) -> int:
+    """
+    Carimbo do mundo: ``mapa.versao`` de cada mapa (trigger da migração 0003)
+    e o conteúdo das tabelas de referência, sem ler os chunks
+    """
+    with connection_db() as conn:
+        with conn.cursor() as cursor:
+            mapas_carimbos = [map_snapshot.fetch_stamp(cursor, mapa.nome, mapa.turno.value)
+                              for mapa in mapas]
+    return map_snapshot.compute_stamp(mapas_carimbos, biomas, mapas, itens)
+
+
+def publish(publisher: SharedWorldPublisher, published_stamp: Optional[int] = None) -> int:
+    """
+    Carrega o mundo do banco e publica uma nova geração, se ele mudou
+
+    Args:
+        publisher: Publicador do segmento
+        published_stamp: Carimbo da geração publicada (None: publica sempre)
+
+    Returns:
+        Carimbo da geração publicada
+    """
+    # Leitores que gravaram depois deste instante continuam no banco até a próxima geração
+    loaded_at = time.time()
+    biomas, mapas, itens = load_reference_tables()
+    # Calculado antes de ler os chunks: uma alteração durante a leitura muda o
+    # carimbo e entra na próxima publicação
+    stamp = world_stamp(biomas, mapas, itens)
+    if stamp == published_stamp:
+        return stamp
+    chunk_repository = ChunkRepositoryImpl()
+    store = ChunkStore.concatenate([
+        chunk_repository.find_store_by_mapa(mapa.nome, mapa.turno.value) for mapa in mapas
+    ])
+    if not len(store):
+        raise RuntimeError("Nenhum chunk carregado do banco")
+    generation = publisher.publish(store, biomas, mapas, itens, loaded_at=loaded_at)
+    print(f"✅ Geração {generation} publicada em '{publisher.name}': "
+          f"{len(store)} chunks, {store.nbytes / 2**20:.1f} MB")
+    return stamp
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Publicador do mundo em memória compartilhada")
+    parser.add_argument("--name", default=SHARED_WORLD_NAME or "minecraft_world",
+                        help="Nome do segmento (o mesmo de SHARED_WORLD nos processos do jogo)")
+    parser.add_argument("--interval", type=float,
+                        default=float(os.getenv("SHARED_WORLD_INTERVAL", "60")),
+                        help="Republica a cada N segundos (padrão: 60; 0 publica uma vez e aguarda)")
+    args = parser.parse_args(argv)
+
+    publisher = SharedWorldPublisher(args.name)
+    try:
+        stamp = publish(publisher)
+        while True:
+            time.sleep(args.interval or 3600)
+            if args.interval:
+                try:
+                    stamp = publish(publisher, stamp)
+                except Exception as e:
+                    # Mantém a geração anterior publicada
+                    print(f"❌ Erro ao republicar o mundo: {str(e)}")
+    except KeyboardInterrupt:
+        return 0
+    except Exception as e:
+        print(f"❌ Erro ao publicar o mundo: {str(e)}")
+        return 1
+    finally:
+        publisher.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Executa a suíte de benchmarks contra o PostgreSQL configurado
+
+Para cada escala, popula um mapa de benchmark, mede os casos de
+benchmarks/cases.py, grava o resultado em JSON e, se houver linha de base,
+falha quando algum caso ficar mais lento que a tolerância.
+
+Exemplos:
+    python run_benchmarks.py --scales 1k,100k
+    python run_benchmarks.py --scales 1k --baseline benchmarks/results/base.json
+"""
+import argparse
+import logging
+import os
+import platform
+import sys
+from datetime import datetime
+
+from benchmarks import seed
+from benchmarks.cases import build_cases
+from benchmarks.harness import BenchmarkResult, compare, load_results, measure, save_results
+from src.repositories.chunk_repository import ChunkRepositoryImpl
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "benchmarks", "results")
+
+
+def run_scale(label: str, n_chunks: int, n_players: int, repeat: int, warmup: int,
+              keep_data: bool) -> list:
+    """Popula o banco na escala pedida e mede todos os casos"""
+    print(f"\n📦 Escala {label}: {n_chunks} chunks, {n_players} jogadores")
+    seed.cleanup()
+    seed.seed(n_chunks, n_players)
+    ChunkRepositoryImpl.invalidate_grid()
+
+    results = []
+    try:
+        for case in build_cases():
+            samples = measure(case.fn, repeat=repeat, warmup=warmup, setup=case.setup)
+            result = BenchmarkResult(case.name, label, samples, rows=case.rows)
+            results.append(result)
+            vazao = (f", {result.rows_per_second:,.0f} linhas/s"
+                     if result.rows_per_second is not None else "")
+            print(f"  {case.name:<42} mediana {result.median * 1000:>10.2f}ms "
+                  f"(min {result.minimum * 1000:.2f}ms{vazao})")
+    finally:
+        if not keep_data:
+            seed.cleanup()
+            ChunkRepositoryImpl.invalidate_grid()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks dos repositórios e serviços")
+    parser.add_argument("--scales", default="1k",
+                        help=f"Escalas separadas por vírgula ({', '.join(seed.SCALES)} ou número)")
+    parser.add_argument("--players", type=int, default=1000, help="Jogadores por escala")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições medidas por caso")
+    parser.add_argument("--warmup", type=int, default=1, help="Repetições de aquecimento")
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: benchmarks/results/<data>.json)")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Piora relativa aceita antes de falhar (padrão 0.2 = 20%%)")
+    parser.add_argument("--keep-data", action="store_true", help="Não remove os dados de benchmark")
+    args = parser.parse_args(argv)
+    # Consultas lentas (logger minecraft.slow_query) no stderr
+    logging.basicConfig(format="%(asctime)s %(message)s")
+
+    try:
+        scales = [seed.parse_scale(s.strip()) for s in args.scales.split(",") if s.strip()]
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    print("⏱️  Executando benchmarks do Minecraft")
+    print("=" * 50)
+    results = []
+    for label, n_chunks in scales:
+        results.extend(run_scale(label, n_chunks, args.players, args.repeat,
+                                 args.warmup, args.keep_data))
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    save_results(output, results, {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "scales": [label for label, _ in scales],
+        "players": args.players,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+    })
+    print(f"\n💾 Resultados salvos em: {output}")
+
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), results, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressão(ões) acima de {args.tolerance:.0%}:")
+            for r in regressions:
+                print(f"  {r.key}: {r.baseline * 1000:.2f}ms → {r.current * 1000:.2f}ms "
+                      f"({r.ratio:.2f}x)")
+            return 1
+        print(f"\n✅ Nenhuma regressão acima de {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Executa a simulação headless de vários jogadores contra o banco configurado
+
+Exemplo:
+    python simulate.py --players 50 --duration 30 --seed 7
+"""
+import argparse
+import logging
+import json
+import sys
+
+from src.utils.query_stats import get_query_stats
+from src.utils.simulation import SimulationConfig, SimulationRunner
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulação headless de carga do jogo")
+    parser.add_argument("--players", type=int, default=10, help="Número de jogadores simulados")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duração em segundos")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do roteiro aleatório")
+    parser.add_argument("--max-actions", type=int, default=None, help="Limite de ações por jogador")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pausa entre ações (s)")
+    parser.add_argument("--keep-players", action="store_true", help="Não remove os jogadores criados")
+    parser.add_argument("--json", action="store_true", help="Imprime o relatório em JSON")
+    parser.add_argument("--top-queries", type=int, default=0,
+                        help="Mostra as N consultas SQL mais caras da simulação")
+    args = parser.parse_args(argv)
+    # Consultas lentas (logger minecraft.slow_query) no stderr
+    logging.basicConfig(format="%(asctime)s %(message)s")
+
+    config = SimulationConfig(
+        players=args.players,
+        duration=args.duration,
+        seed=args.seed,
+        max_actions=args.max_actions,
+        think_time=args.think_time,
+        cleanup=not args.keep_players,
+    )
+    report = SimulationRunner(config).run()
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    if args.top_queries:
+        print()
+        print(get_query_stats().format(args.top_queries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
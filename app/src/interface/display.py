@@ -8,9 +8,8 @@ from src.utils.player_manager import (
     load_player_by_id, get_all_players, create_new_player,
     display_player_status, save_player_changes, display_players_grid,
     delete_player, confirm_player_deletion, get_adjacent_chunks,
-    move_player_to_chunk, ensure_player_location
+    move_player_to_chunk, ensure_player_location, PlayerPager
 )
-import re
 
 init(autoreset=True)
 
@@ -53,8 +52,8 @@ def exibir_jogador_atual():
         print(f"🎮 Personagem ativo: {Fore.GREEN}{current_player.nome}{Fore.RESET}")
         print(f"❤️  Vida: {current_player.vida_atual}/{current_player.vida_maxima} | "
               f"⭐ XP: {current_player.experiencia} | 💪 Força: {current_player.forca}")
-        if current_player.localizacao:
-            print(f"📍 Localização: Chunk {current_player.localizacao}")
+        if current_player.has_location():
+            print(f"📍 Localização: {current_player.localizacao_display}")
         print("-" * 50)
     else:
         print(f"{Fore.YELLOW}⚠️  Nenhum personagem selecionado{Fore.RESET}")
@@ -125,7 +124,15 @@ def menu_inicial():
                 print(f"{Fore.RED}❌ Opção inválida!{Fore.RESET}")
                 input("⏳ Pressione Enter para continuar...")
 
-def exibir_localizacao_atual():
+def obter_visao_jogador():
+    """Busca a visão do personagem atual (chunk, bioma, turno e vizinhos) para uma tela"""
+    current_player = get_current_player()
+    if not current_player or not current_player.has_location():
+        return None
+    interface_service = InterfaceService.get_instance()
+    return interface_service.get_player_view(current_player, current_player.current_chunk_id)
+
+def exibir_localizacao_atual(view=None):
     """Exibe a localização atual do personagem de forma detalhada"""
     current_player = get_current_player()
     if not current_player:
@@ -136,14 +143,13 @@ def exibir_localizacao_atual():
     print("=" * 60)
     
     # Exibir informações de localização
-    if current_player.localizacao:
-        print(f"📍 CHUNK: {current_player.localizacao}")
+    if current_player.has_location():
+        print(f"📍 CHUNK: {current_player.localizacao_display}")
         
-        # Buscar informações do chunk usando InterfaceService Singleton
-        interface_service = InterfaceService.get_instance()
-        chunk = interface_service.get_chunk_by_id(extract_chunk_id_from_location(current_player.localizacao))
+        if view is None:
+            view = obter_visao_jogador()
         
-        if chunk:
+        if view and view.atual:
             bioma_emoji = {
                 'Deserto': '🏜️',
                 'Oceano': '🌊',
@@ -151,31 +157,12 @@ def exibir_localizacao_atual():
                 'Floresta': '🌲'
             }
             
-            # Get bioma name by ID
-            bioma_name = str(chunk.id_bioma)  # Default to ID if name not found
-            try:
-                bioma = interface_service.get_bioma_by_id(chunk.id_bioma)
-                if bioma:
-                    bioma_name = bioma.nome
-            except Exception:
-                # If we can't get bioma info, use the ID
-                pass
-            
+            bioma_name = view.atual.bioma_nome
             emoji = bioma_emoji.get(bioma_name, '📍')
             
-            # Get turno information from the map
-            turno_display = 'Dia'  # Default
-            turno_emoji = '☀️'  # Default
-            
-            try:
-                # Get map information using the chunk's id_mapa
-                mapa = interface_service.get_map_by_id(chunk.id_mapa)
-                if mapa:
-                    turno_display = mapa.turno.value
-                    turno_emoji = '☀️' if mapa.turno.value == 'Dia' else '🌙'
-            except Exception:
-                # If we can't get map info, use defaults
-                pass
+            # Turno vem do mapa do chunk
+            turno_display = view.turno or 'Dia'
+            turno_emoji = '☀️' if turno_display == 'Dia' else '🌙'
             
             print(f"{emoji} BIOMA: {Fore.YELLOW}{bioma_name}{Fore.RESET}")
             print(f"{turno_emoji} TURNO: {turno_display}")
@@ -186,58 +173,58 @@ def exibir_localizacao_atual():
     
     print("=" * 60)
 
-def determinar_direcao(current_chunk: int, target_chunk: int) -> str:
-    """Determina a direção de movimento baseada na diferença entre chunks"""
-    diff = target_chunk - current_chunk
-    
-    # Assumindo que os chunks são organizados em uma grade 32x32
-    # Chunks adjacentes horizontalmente têm diferença de ±1
-    # Chunks adjacentes verticalmente têm diferença de ±32
+def determinar_direcao(atual, destino) -> str:
+    """Determina a direção de movimento pela diferença de coordenadas (x, y) entre os chunks"""
+    if atual is None or destino is None:
+        return "📍 Direção"
+    dx, dy = destino.x - atual.x, destino.y - atual.y
     
-    if diff == 1:
+    # y cresce para baixo, como nas linhas do mapa
+    if (dx, dy) == (1, 0):
         return "➡️ Direita"
-    elif diff == -1:
+    elif (dx, dy) == (-1, 0):
         return "⬅️ Esquerda"
-    elif diff == 32:
+    elif (dx, dy) == (0, 1):
         return "⬇️ Baixo"
-    elif diff == -32:
+    elif (dx, dy) == (0, -1):
         return "⬆️ Cima"
-    elif diff > 1 and diff < 32:
+    elif abs(dx) >= abs(dy) and dx > 0:
         return "➡️ Direita (distante)"
-    elif diff < -1 and diff > -32:
+    elif abs(dx) >= abs(dy) and dx < 0:
         return "⬅️ Esquerda (distante)"
-    elif diff > 32:
+    elif dy > 0:
         return "⬇️ Baixo (distante)"
-    elif diff < -32:
+    elif dy < 0:
         return "⬆️ Cima (distante)"
     else:
         return "📍 Direção"
 
-def exibir_opcoes_movimento():
+def exibir_opcoes_movimento(view=None):
     """Exibe as opções de movimento disponíveis com direções"""
     current_player = get_current_player()
-    if not current_player or not current_player.localizacao:
+    if not current_player or not current_player.has_location():
         print(f"{Fore.RED}❌ Não é possível mover - localização inválida{Fore.RESET}")
         return []
     
-    # Usar InterfaceService Singleton
-    interface_service = InterfaceService.get_instance()
-    adjacent_chunks = interface_service.get_adjacent_chunks(extract_chunk_id_from_location(current_player.localizacao), 'Dia')
+    if view is None:
+        view = obter_visao_jogador()
     
-    if not adjacent_chunks:
+    if not view or not (view.vizinhos or view.pontes):
         print(f"{Fore.YELLOW}⚠️  Nenhuma direção disponível para movimento{Fore.RESET}")
         return []
     
     print("🚶 OPÇÕES DE MOVIMENTO:")
     print("-" * 40)
     
-    # Determinar direções baseado na diferença de chunk_id
-    current_chunk = extract_chunk_id_from_location(current_player.localizacao)
+    # Direções pelas coordenadas do chunk atual e de cada vizinho
+    current_chunk = view.atual.chunk if view.atual else None
     directions = []
     
-    for chunk_id, bioma in adjacent_chunks:
-        direction = determinar_direcao(current_chunk, chunk_id)
-        directions.append((chunk_id, bioma, direction))
+    # Os vizinhos já vêm com o nome do bioma, sem consultas por vizinho
+    for vizinho in view.vizinhos:
+        chunk_id = vizinho.chunk.id_chunk
+        direction = determinar_direcao(current_chunk, vizinho.chunk)
+        directions.append((chunk_id, vizinho.bioma_nome, direction))
     
     # Ordenar por direção (cima, baixo, esquerda, direita)
     direction_order = {"⬆️ Cima": 0, "⬇️ Baixo": 1, "⬅️ Esquerda": 2, "➡️ Direita": 3, "📍 Direção": 4}
@@ -250,20 +237,15 @@ def exibir_opcoes_movimento():
         'Floresta': '🌲'
     }
     
-    for i, (chunk_id, bioma, direction) in enumerate(directions, 1):
-        # Get bioma name by ID if bioma is a number
-        bioma_name = bioma
-        if isinstance(bioma, int):
-            try:
-                bioma_obj = interface_service.get_bioma_by_id(bioma)
-                if bioma_obj:
-                    bioma_name = bioma_obj.nome
-            except Exception:
-                bioma_name = str(bioma)
-        
+    for i, (chunk_id, bioma_name, direction) in enumerate(directions, 1):
         emoji = bioma_emoji.get(bioma_name, '📍')
         print(f"{i}. {direction} - {emoji} {bioma_name} (Chunk {chunk_id})")
     
+    # Destinos das pontes, vindos do índice de pontes junto com a visão
+    for i, destino in enumerate(view.pontes, 1):
+        emoji = bioma_emoji.get(destino.bioma_nome, '📍')
+        print(f"P{i}. 🌉 Ponte - {emoji} {destino.bioma_nome} (Chunk {destino.chunk.id_chunk})")
+    
     return [(chunk_id, bioma) for chunk_id, bioma, _ in directions]
 
 def iniciar_jogo():
@@ -285,7 +267,10 @@ def iniciar_jogo():
     while True:
         clear_terminal()
         exibir_titulo()
-        exibir_localizacao_atual()
+        
+        # Uma única visão por tela, compartilhada pela localização e pelo movimento
+        view = obter_visao_jogador()
+        exibir_localizacao_atual(view)
         
         # Exibir status do personagem
         print(f"❤️  Vida: {current_player.vida_atual}/{current_player.vida_maxima}")
@@ -293,14 +278,17 @@ def iniciar_jogo():
         print()
         
         # Exibir opções de movimento
-        adjacent_chunks = exibir_opcoes_movimento()
+        adjacent_chunks = exibir_opcoes_movimento(view)
         
         print()
         print("🎮 OPÇÕES DO JOGO:")
         print("1-4. Mover para direção")
+        if view and view.pontes:
+            print(f"P1-P{len(view.pontes)}. Atravessar ponte")
         print("5. 💾 Salvar progresso")
         print("6. 📊 Ver status detalhado")
         print("7. 🔙 Voltar ao menu principal")
+        print("8. 🧭 Viajar até um chunk")
         print()
         
         try:
@@ -313,16 +301,8 @@ def iniciar_jogo():
                     if 0 <= indice < len(adjacent_chunks):
                         chunk_id, bioma = adjacent_chunks[indice]
                         
-                        # Verificar se há mudança de bioma
-                        current_bioma = None
-                        try:
-                            # Buscar o bioma atual do chunk onde o jogador está
-                            current_chunk = interface_service.get_chunk_by_id(extract_chunk_id_from_location(current_player.localizacao))
-                            if current_chunk:
-                                current_bioma = current_chunk.id_bioma
-                        except Exception:
-                            # Se não conseguir determinar o bioma atual, assumir que há mudança
-                            current_bioma = None
+                        # Verificar se há mudança de bioma (bioma atual já está na visão)
+                        current_bioma = view.atual.bioma_nome if view and view.atual else None
                         
                         print(f"🚶 Movendo...")
                         
@@ -369,10 +349,39 @@ def iniciar_jogo():
                 input("\n⏳ Pressione Enter para continuar...")
                 
             elif opcao == "7":
-                # Voltar ao menu principal
+                # Voltar ao menu principal (grava o que ficou pendente no buffer)
+                interface_service.flush_player(current_player.id_player)
                 print("🔙 Voltando ao menu principal...")
                 break
                 
+            elif opcao.upper().startswith("P") and opcao[1:].isdigit():
+                # Travessia de ponte: o destino já está na visão, sem consulta extra
+                indice = int(opcao[1:]) - 1
+                if view and 0 <= indice < len(view.pontes):
+                    destino = view.pontes[indice]
+                    updated_player = interface_service.move_player_to_chunk(current_player, destino.chunk.id_chunk)
+                    if updated_player:
+                        current_player = updated_player
+                        set_current_player(updated_player)
+                        print(f"✅ Atravessou a ponte até {destino.bioma_nome}!")
+                    else:
+                        print(f"❌ Erro ao mover!")
+                else:
+                    print(f"{Fore.RED}❌ Opção inválida!{Fore.RESET}")
+                input("⏳ Pressione Enter para continuar...")
+                
+            elif opcao == "8":
+                # Rota inteira calculada e aplicada de uma vez
+                destino = int(input("🧭 ID do chunk de destino: ").strip())
+                resultado = interface_service.travel_player_to_chunk(current_player, destino)
+                if resultado.get("success"):
+                    set_current_player(current_player)
+                    print(f"✅ Chegou ao chunk {destino} em {resultado['passos']} passos "
+                          f"(custo {resultado['custo']})")
+                else:
+                    print(f"{Fore.RED}❌ {resultado.get('error', 'Erro ao viajar!')}{Fore.RESET}")
+                input("⏳ Pressione Enter para continuar...")
+                
             else:
                 print(f"{Fore.RED}❌ Opção inválida!{Fore.RESET}")
                 input("⏳ Pressione Enter para continuar...")
@@ -407,65 +416,99 @@ def salvar_progresso():
 
 def trocar_jogador():
     """Permite trocar para outro personagem"""
+    current_player = get_current_player()
+    if current_player:
+        InterfaceService.get_instance().flush_player(current_player.id_player)
     clear_current_player()
     selecionar_jogador()
 
+def navegacao_paginas(pager: PlayerPager) -> str:
+    """Texto com os comandos de troca de página disponíveis"""
+    opcoes = []
+    if pager.has_previous:
+        opcoes.append("'a' página anterior")
+    if pager.has_next:
+        opcoes.append("'p' próxima página")
+    return " | ".join(opcoes)
+
+def escolher_jogador(pager: PlayerPager, titulo: str, prompt: str):
+    """
+    Lista numerada e paginada de personagens para escolha
+    
+    Returns:
+        Personagem escolhido, ou None se o usuário cancelar
+    """
+    current_player = get_current_player()
+    current_id = current_player.id_player if current_player else None
+    
+    while True:
+        clear_terminal()
+        print(titulo)
+        print("=" * 40)
+        print()
+        
+        print(f"Personagens disponíveis (página {pager.page_number}):")
+        for i, player in enumerate(pager.players, 1):
+            status_icon = "🎮" if player.id_player == current_id else "👤"
+            print(f"{i}. {status_icon} {player.nome} (Vida: {player.vida_atual}/{player.vida_maxima} | XP: {player.experiencia} | Força: {player.forca})")
+        
+        print()
+        navegacao = navegacao_paginas(pager)
+        if navegacao:
+            print(f"📄 {navegacao}")
+        
+        escolha = input(f"{prompt} (ou 'c' para cancelar): ").strip().lower()
+        
+        if escolha == 'c':
+            return None
+        if escolha == 'p' and pager.next_page():
+            continue
+        if escolha == 'a' and pager.previous_page():
+            continue
+        
+        try:
+            indice = int(escolha) - 1
+        except ValueError:
+            print(f"{Fore.RED}❌ Digite apenas números válidos!{Fore.RESET}")
+            input("⏳ Pressione Enter para continuar...")
+            continue
+        
+        if 0 <= indice < len(pager.players):
+            return pager.players[indice]
+        
+        print(f"{Fore.RED}❌ Número inválido! Digite um número entre 1 e {len(pager.players)}.{Fore.RESET}")
+        input("⏳ Pressione Enter para continuar...")
+
 def selecionar_jogador():
     """Interface para seleção de personagem"""
-    clear_terminal()
-    print("👥 SELEÇÃO DE PERSONAGEM")
-    print("=" * 40)
-    
-    # Usar InterfaceService Singleton
-    interface_service = InterfaceService.get_instance()
-    players = interface_service.get_all_players()
+    pager = PlayerPager()
     
-    if not players:
+    if not pager.players:
+        clear_terminal()
+        print("👥 SELEÇÃO DE PERSONAGEM")
+        print("=" * 40)
         print(f"{Fore.YELLOW}⚠️  Nenhum personagem encontrado!{Fore.RESET}")
         print("Crie um novo personagem primeiro.")
         input("⏳ Pressione Enter para continuar...")
         return
     
-    print("Personagens disponíveis:")
-    print()
+    player = escolher_jogador(pager, "👥 SELEÇÃO DE PERSONAGEM", "🎯 Digite o número do personagem")
+    if player is None:
+        return
     
-    for i, player in enumerate(players, 1):
-        print(f"{i}. {player.nome} (Vida: {player.vida_atual}/{player.vida_maxima} | XP: {player.experiencia} | Força: {player.forca})")
+    # Verificar se é o personagem atual
+    current_player = get_current_player()
+    current_id = current_player.id_player if current_player else None
     
-    print()
-    try:
-        escolha = input("🎯 Digite o número do personagem (ou 'c' para cancelar): ").strip()
-        
-        if escolha.lower() == 'c':
-            return
-        
-        indice = int(escolha) - 1
-        
-        if 0 <= indice < len(players):
-            player = players[indice]
-            
-            # Verificar se é o personagem atual
-            current_player = get_current_player()
-            current_id = current_player.id_player if current_player else None
-            
-            if current_id and player.id_player == current_id:
-                print(f"{Fore.YELLOW}⚠️  '{player.nome}' já é o personagem ativo!{Fore.RESET}")
-                input("⏳ Pressione Enter para continuar...")
-                return
-            
-            # Definir personagem
-            set_current_player(player)
-            print(f"{Fore.GREEN}✅ Personagem '{player.nome}' selecionado com sucesso!{Fore.RESET}")
-            input("⏳ Pressione Enter para continuar...")
-            return  # Sair da função e voltar ao menu principal
-        else:
-            print(f"{Fore.RED}❌ Número inválido! Digite um número entre 1 e {len(players)}.{Fore.RESET}")
-            input("⏳ Pressione Enter para continuar...")
-            return
-            
-    except ValueError:
-        print(f"{Fore.RED}❌ Digite apenas números!{Fore.RESET}")
+    if current_id and player.id_player == current_id:
+        print(f"{Fore.YELLOW}⚠️  '{player.nome}' já é o personagem ativo!{Fore.RESET}")
         input("⏳ Pressione Enter para continuar...")
+        return
+    
+    # Definir personagem
+    set_current_player(player)
+    print(f"{Fore.GREEN}✅ Personagem '{player.nome}' selecionado com sucesso!{Fore.RESET}")
+    input("⏳ Pressione Enter para continuar...")
 
 def criar_jogador():
     """Interface para criação de novo personagem"""
@@ -502,154 +545,101 @@ def criar_jogador():
     input("⏳ Pressione Enter para continuar...")
 
 def listar_jogadores():
-    """Lista todos os personagens"""
-    clear_terminal()
-    print("📋 LISTA DE PERSONAGENS")
-    print("=" * 70)
-    print()
-    
+    """Lista os personagens, uma página por vez"""
     # Usar InterfaceService Singleton
     interface_service = InterfaceService.get_instance()
-    players = interface_service.get_all_players()
+    pager = PlayerPager()
     
-    if not players:
+    if not pager.players:
+        clear_terminal()
+        print("📋 LISTA DE PERSONAGENS")
+        print("=" * 70)
+        print()
         print(f"{Fore.YELLOW}⚠️  Nenhum personagem cadastrado.{Fore.RESET}")
         print("Use a opção 'Criar novo personagem' para adicionar personagens.")
         print()
         input("⏳ Pressione Enter para voltar ao menu...")
         return
     
-    print(f"📊 Total de personagens: {len(players)}")
-    print()
-    
-    # Exibir personagens em formato de grid com tabelas
-    display_players_grid(players)
-    
-    print()
-    print("=" * 70)
-    print("⚙️  OPÇÕES:")
-    print("1. 🎮 Selecionar personagem")
-    print("2. 🗑️  Deletar personagem")
-    print("3. 🔙 Voltar ao menu")
-    print()
-    
     while True:
+        clear_terminal()
+        print("📋 LISTA DE PERSONAGENS")
+        print("=" * 70)
+        print()
+        print(f"📄 Página {pager.page_number}")
+        print()
+        
+        # Exibir personagens da página em formato de grid com tabelas
+        display_players_grid(pager.players)
+        
+        print()
+        print("=" * 70)
+        print("⚙️  OPÇÕES:")
+        print("1. 🎮 Selecionar personagem")
+        print("2. 🗑️  Deletar personagem")
+        print("3. 🔙 Voltar ao menu")
+        navegacao = navegacao_paginas(pager)
+        if navegacao:
+            print(f"📄 {navegacao}")
+        print()
+        
         try:
-            opcao = input("🎯 Escolha uma opção: ").strip()
+            opcao = input("🎯 Escolha uma opção: ").strip().lower()
+            current_player = get_current_player()
+            current_id = current_player.id_player if current_player else None
 
             if opcao == "1":
-                # Mostrar lista numerada para seleção
-                clear_terminal()
-                print("👥 SELEÇÃO DE PERSONAGEM")
-                print("=" * 40)
-                print()
-                
-                current_player = get_current_player()
-                current_id = current_player.id_player if current_player else None
-                
-                print("Personagens disponíveis:")
-                for i, player in enumerate(players, 1):
-                    status_icon = "🎮" if player.id_player == current_id else "👤"
-                    print(f"{i}. {status_icon} {player.nome} (Vida: {player.vida_atual}/{player.vida_maxima} | XP: {player.experiencia} | Força: {player.forca})")
+                player = escolher_jogador(pager, "👥 SELEÇÃO DE PERSONAGEM",
+                                          "🎯 Digite o número do personagem")
+                if player is None:
+                    continue  # Voltar para a lista principal
                 
-                print()
-                
-                while True:
-                    try:
-                        escolha = input("🎯 Digite o número do personagem (ou 'c' para cancelar): ").strip()
-                        
-                        if escolha.lower() == 'c':
-                            break
-                        
-                        indice = int(escolha) - 1
-                        
-                        if 0 <= indice < len(players):
-                            player = players[indice]
-                            
-                            # Verificar se é o personagem atual
-                            if current_id and player.id_player == current_id:
-                                print(f"{Fore.YELLOW}⚠️  '{player.nome}' já é o personagem ativo!{Fore.RESET}")
-                                input("⏳ Pressione Enter para continuar...")
-                                return
-                            
-                            # Definir personagem
-                            set_current_player(player)
-                            print(f"{Fore.GREEN}✅ Personagem '{player.nome}' selecionado com sucesso!{Fore.RESET}")
-                            input("⏳ Pressione Enter para continuar...")
-                            return  # Sair da função e voltar ao menu principal
-                        else:
-                            print(f"{Fore.RED}❌ Número inválido! Digite um número entre 1 e {len(players)}.{Fore.RESET}")
-                            
-                    except ValueError:
-                        print(f"{Fore.RED}❌ Digite apenas números válidos!{Fore.RESET}")
+                # Verificar se é o personagem atual
+                if current_id and player.id_player == current_id:
+                    print(f"{Fore.YELLOW}⚠️  '{player.nome}' já é o personagem ativo!{Fore.RESET}")
+                    input("⏳ Pressione Enter para continuar...")
+                    return
                 
-                # Voltar para a lista principal
-                break
+                # Definir personagem
+                set_current_player(player)
+                print(f"{Fore.GREEN}✅ Personagem '{player.nome}' selecionado com sucesso!{Fore.RESET}")
+                input("⏳ Pressione Enter para continuar...")
+                return  # Sair da função e voltar ao menu principal
                 
             elif opcao == "2":
-                # Mostrar lista numerada para deletar
-                clear_terminal()
-                print("🗑️  DELETAR PERSONAGEM")
-                print("=" * 40)
-                print()
+                player = escolher_jogador(pager, "🗑️  DELETAR PERSONAGEM",
+                                          "🗑️  Digite o número do personagem para deletar")
+                if player is None:
+                    continue  # Voltar para a lista principal
                 
-                current_player = get_current_player()
-                current_id = current_player.id_player if current_player else None
-                
-                print("Personagens disponíveis para deletar:")
-                for i, player in enumerate(players, 1):
-                    status_icon = "🎮" if player.id_player == current_id else "👤"
-                    print(f"{i}. {status_icon} {player.nome} (Vida: {player.vida_atual}/{player.vida_maxima} | XP: {player.experiencia} | Força: {player.forca})")
-                
-                print()
-                
-                while True:
-                    try:
-                        escolha = input("🗑️  Digite o número do personagem para deletar (ou 'c' para cancelar): ").strip()
-                        
-                        if escolha.lower() == 'c':
-                            break
-                        
-                        indice = int(escolha) - 1
-                        
-                        if 0 <= indice < len(players):
-                            player = players[indice]
-                            
-                            # Verificar se é o personagem atual
-                            if current_id and player.id_player == current_id:
-                                print(f"{Fore.RED}❌ Não é possível deletar o personagem ativo '{player.nome}'!{Fore.RESET}")
-                                print("💡 Dica: Troque de personagem primeiro ou saia da sessão.")
-                                input("⏳ Pressione Enter para continuar...")
-                                return
-                            
-                            # Confirmar deleção
-                            if confirm_player_deletion(player.nome):
-                                # Deletar personagem
-                                if interface_service.delete_player(player.id_player):
-                                    print(f"{Fore.GREEN}✅ Personagem '{player.nome}' deletado com sucesso!{Fore.RESET}")
-                                    input("⏳ Pressione Enter para continuar...")
-                                    return  # Sair da função e voltar ao menu principal
-                                else:
-                                    print(f"{Fore.RED}❌ Erro ao deletar personagem!{Fore.RESET}")
-                                    input("⏳ Pressione Enter para continuar...")
-                                    return
-                            else:
-                                print("✅ Operação cancelada pelo usuário.")
-                                input("⏳ Pressione Enter para continuar...")
-                                return
-                        else:
-                            print(f"{Fore.RED}❌ Número inválido! Digite um número entre 1 e {len(players)}.{Fore.RESET}")
-                            
-                    except ValueError:
-                        print(f"{Fore.RED}❌ Digite apenas números válidos!{Fore.RESET}")
+                # Verificar se é o personagem atual
+                if current_id and player.id_player == current_id:
+                    print(f"{Fore.RED}❌ Não é possível deletar o personagem ativo '{player.nome}'!{Fore.RESET}")
+                    print("💡 Dica: Troque de personagem primeiro ou saia da sessão.")
+                    input("⏳ Pressione Enter para continuar...")
+                    return
                 
-                # Voltar para a lista principal
-                break
+                # Confirmar deleção
+                if confirm_player_deletion(player.nome):
+                    # Deletar personagem
+                    if interface_service.delete_player(player.id_player):
+                        print(f"{Fore.GREEN}✅ Personagem '{player.nome}' deletado com sucesso!{Fore.RESET}")
+                    else:
+                        print(f"{Fore.RED}❌ Erro ao deletar personagem!{Fore.RESET}")
+                else:
+                    print("✅ Operação cancelada pelo usuário.")
+                input("⏳ Pressione Enter para continuar...")
+                return  # Sair da função e voltar ao menu principal
                 
+            elif opcao == "p" and pager.next_page():
+                continue
+            elif opcao == "a" and pager.previous_page():
+                continue
             elif opcao == "3":
                 return  # Voltar ao menu principal
             else:
                 print(f"{Fore.RED}❌ Opção inválida! Digite 1, 2 ou 3.{Fore.RESET}")
+                input("⏳ Pressione Enter para continuar...")
                 
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}⚠️  Operação cancelada.{Fore.RESET}")
@@ -669,30 +659,3 @@ def sair_jogo():
     
     print("🚪 Saindo do Minecraft")
     print("Até a próxima! 🎮")
-
-def extract_chunk_id_from_location(location: str) -> int:
-    """
-    Extract chunk ID from location string like 'Mapa 1 - Chunk 364'
-    
-    Args:
-        location: Location string in format 'Mapa X - Chunk Y'
-        
-    Returns:
-        Chunk ID as integer
-        
-    Raises:
-        ValueError: If location format is invalid
-    """
-    if not location:
-        raise ValueError("Location is empty")
-        
-    # Try to extract chunk ID using regex
-    match = re.search(r'Chunk (\d+)', location)
-    if match:
-        return int(match.group(1))
-    
-    # If no match found, try to convert the entire string to int (backwards compatibility)
-    try:
-        return int(location)
-    except ValueError:
-        raise ValueError(f"Cannot extract chunk ID from location: {location}")
@@ -58,29 +58,32 @@ class Chunk:
         """Verifica se é noite no chunk"""
         return self.x % 2 != 0
     
-    def get_adjacent_chunk_ids(self, map_size: int = 32) -> List[int]:
+    def get_adjacent_chunk_ids(self, map_size: int = 32, map_height: Optional[int] = None) -> List[int]:
         """
         Retorna os IDs dos chunks adjacentes
-        Baseado na lógica de grid do mapa
+        Baseado na lógica de grid do mapa (IDs sequenciais por linha, como
+        gravados pelo seed e pelo gerador de mundos)
         
         Args:
-            map_size: Tamanho do mapa (assumindo mapa quadrado)
+            map_size: Largura do mapa
+            map_height: Altura do mapa (padrão: mapa quadrado)
             
         Returns:
             Lista de IDs dos chunks adjacentes
         """
+        height = map_size if map_height is None else map_height
         adjacent = []
         
-        # Horizontal
-        if self.id_chunk > 1:
+        # Horizontal (sem atravessar a borda para a linha vizinha)
+        if self.x > 0:
             adjacent.append(self.id_chunk - 1)
-        if self.id_chunk < 1000:  # Assumindo 1000 chunks
+        if self.x < map_size - 1:
             adjacent.append(self.id_chunk + 1)
         
         # Vertical
-        if self.id_chunk > map_size:
+        if self.y > 0:
             adjacent.append(self.id_chunk - map_size)
-        if self.id_chunk <= 1000 - map_size:
+        if self.y < height - 1:
             adjacent.append(self.id_chunk + map_size)
         
         return adjacent
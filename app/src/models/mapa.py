@@ -26,12 +26,14 @@ class Mapa:
         turno: Turno do mapa
         chunks: Lista de chunks relacionados a este mapa
         _chunk_repository: Repository para acesso aos chunks (injeção de dependência)
+        _chunk_store: Chunks do mapa em colunas (ChunkStore), carregados sob demanda
     """
     id_mapa: int
     nome: str
     turno: TurnoType
     chunks: List[Chunk] = field(default_factory=list)
     _chunk_repository = None  # Será injetado via setter
+    _chunk_store = None  # Carregado em get_chunk_store()
     
     def __post_init__(self):
         """Converte string para enum se necessário"""
@@ -41,42 +43,51 @@ class Mapa:
     def set_chunk_repository(self, repository):
         """Define o repository de chunks (injeção de dependência)"""
         self._chunk_repository = repository
+        self._chunk_store = None
     
-    def get_chunks_by_bioma(self, bioma: str) -> List[Chunk]:
+    def get_chunk_store(self):
+        """
+        Retorna os chunks deste mapa em colunas (ChunkStore), carregando-os uma vez
+        """
+        if not self._chunk_repository:
+            raise ValueError("Chunk repository não foi configurado")
+        
+        if self._chunk_store is None:
+            self._chunk_store = self._chunk_repository.find_store_by_mapa(self.nome, self.turno.value)
+        return self._chunk_store
+    
+    def get_chunks_by_bioma(self, bioma: int) -> List[Chunk]:
         """
         Retorna todos os chunks de um bioma específico neste mapa
         
+        O filtro roda vetorizado sobre o ChunkStore; só os chunks do bioma
+        viram objetos Chunk.
+        
         Args:
-            bioma: Nome do bioma
+            bioma: ID do bioma
             
         Returns:
             Lista de chunks do bioma
         """
-        if not self._chunk_repository:
-            raise ValueError("Chunk repository não foi configurado")
-        
-        chunks = self.get_chunks()
-        return [chunk for chunk in chunks if chunk.id_bioma == bioma]
+        return self.get_chunk_store().chunks_by_bioma(bioma)
     
-    def get_bioma_distribution(self) -> Dict[str, int]:
+    def get_bioma_distribution(self) -> Dict[int, int]:
         """
         Retorna a distribuição de biomas no mapa
         
+        Com o ChunkStore já carregado, a contagem é feita nas colunas em
+        memória; caso contrário é agregada no banco (GROUP BY), sem carregar
+        os chunks.
+        
         Returns:
-            Dicionário com bioma e quantidade de chunks
+            Dicionário com id do bioma e quantidade de chunks
         """
         if not self._chunk_repository:
             raise ValueError("Chunk repository não foi configurado")
         
-        chunks = self.get_chunks()
-        if not chunks:
-            return {}
-        
-        distribution = {}
-        for chunk in chunks:
-            bioma = chunk.id_bioma
-            distribution[bioma] = distribution.get(bioma, 0) + 1
-        return distribution
+        if self._chunk_store is not None:
+            return self._chunk_store.bioma_distribution()
+        return self._chunk_repository.count_by_bioma(self.nome, self.turno.value)
     
     def is_day_map(self) -> bool:
         """Verifica se é um mapa de dia"""
@@ -102,10 +113,10 @@ class Mapa:
             'tipo': 'Dia' if self.is_day_map() else 'Noite'
         }
         
-        chunks = self.get_chunks()
-        if chunks:
-            info['total_chunks'] = len(chunks)
-            info['distribuicao'] = self.get_bioma_distribution()
+        distribuicao = self.get_bioma_distribution()
+        if distribuicao:
+            info['total_chunks'] = sum(distribuicao.values())
+            info['distribuicao'] = distribuicao
         
         return info
     
@@ -20,9 +20,10 @@ class Player:
         vida_maxima: Vida máxima do personagem
         vida_atual: Vida atual do personagem
         forca: Força do personagem
-        localizacao: Localização atual do personagem
+        localizacao: Texto de exibição da localização (derivado de current_chunk_id)
         nivel: Nível do personagem
         experiencia: Experiência acumulada
+        current_chunk_id: ID do chunk onde o personagem está (localização de fato)
     """
     id_player: int
     nome: str
@@ -40,6 +41,61 @@ class Player:
         if self.vida_atual > self.vida_maxima:
             self.vida_atual = self.vida_maxima
     
+    @staticmethod
+    def format_localizacao(id_mapa, id_chunk) -> str:
+        """Texto de exibição da localização, ex.: 'Mapa 1 - Chunk 364'"""
+        return f"Mapa {id_mapa} - Chunk {id_chunk}"
+    
+    def move_to(self, id_chunk: int, id_mapa=None) -> None:
+        """
+        Move o personagem para um chunk
+        
+        Args:
+            id_chunk: ID do chunk de destino
+            id_mapa: Mapa do chunk, usado apenas no texto de exibição
+        """
+        self.current_chunk_id = id_chunk
+        self.localizacao = (self.format_localizacao(id_mapa, id_chunk)
+                            if id_mapa is not None else f"Chunk {id_chunk}")
+    
+    def validation_error(self) -> Optional[str]:
+        """Retorna a mensagem de erro de validação do personagem, ou None se válido"""
+        if not self.nome or not self.nome.strip():
+            return "Nome do jogador não pode estar vazio"
+        
+        if self.vida_atual < 0:
+            return "Vida atual não pode ser negativa"
+        
+        if self.vida_maxima <= 0:
+            return "Vida máxima deve ser maior que zero"
+        
+        if self.vida_atual > self.vida_maxima:
+            return "Vida atual não pode ser maior que vida máxima"
+        
+        if self.forca < 0:
+            return "Força não pode ser negativa"
+        
+        if self.nivel < 1:
+            return "Nível deve ser pelo menos 1"
+        
+        if self.experiencia < 0:
+            return "Experiência não pode ser negativa"
+        
+        return None
+    
+    def has_location(self) -> bool:
+        """Verifica se o personagem está em algum chunk"""
+        return self.current_chunk_id is not None
+    
+    @property
+    def localizacao_display(self) -> str:
+        """Localização para exibição na interface"""
+        if self.localizacao:
+            return self.localizacao
+        if self.current_chunk_id is not None:
+            return f"Chunk {self.current_chunk_id}"
+        return "Desconhecida"
+    
     def is_alive(self) -> bool:
         """Verifica se o personagem está vivo"""
         return self.vida_atual > 0
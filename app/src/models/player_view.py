@@ -0,0 +1,48 @@
+"""
+Model da visão do jogador
+Agrupa tudo o que uma tela do loop do jogo precisa exibir: o jogador,
+o chunk atual com bioma e turno, e os chunks vizinhos
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+from .chunk import Chunk
+from .mapa import Mapa
+from .player import Player
+
+
+@dataclass
+class ChunkView:
+    """
+    Chunk acompanhado do nome do seu bioma
+
+    Attributes:
+        chunk: Chunk
+        bioma_nome: Nome do bioma do chunk
+    """
+    chunk: Chunk
+    bioma_nome: str
+
+
+@dataclass
+class PlayerView:
+    """
+    Visão desnormalizada do jogador para o loop do jogo
+
+    Attributes:
+        player: Jogador
+        atual: Chunk onde o jogador está (None se a localização for inválida)
+        mapa: Mapa do chunk atual, que define o turno
+        vizinhos: Chunks adjacentes na ordem cima, baixo, esquerda, direita
+        pontes: Chunks alcançáveis por ponte a partir do chunk atual
+    """
+    player: Player
+    atual: Optional[ChunkView] = None
+    mapa: Optional[Mapa] = None
+    vizinhos: List[ChunkView] = field(default_factory=list)
+    pontes: List[ChunkView] = field(default_factory=list)
+
+    @property
+    def turno(self) -> Optional[str]:
+        """Turno do mapa atual ('Dia' ou 'Noite')"""
+        return self.mapa.turno.value if self.mapa else None
@@ -4,7 +4,7 @@ Implementa o padrão Repository para acesso a dados
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from ..models.bioma import Bioma
 from ..models.chunk import Chunk
 from ..models.mapa import Mapa, TurnoType
@@ -12,6 +12,8 @@ from ..models.player import Player
 from ..models.fantasma import Fantasma
 from ..models.totem import Totem
 from ..models.ponte import Ponte
+from ..utils.chunk_grid import ChunkGrid
+from ..utils.chunk_store import ChunkStore
 from .bioma_repository import BiomaRepository, BiomaRepositoryImpl
 from .chunk_repository import ChunkRepository, ChunkRepositoryImpl
 from .mapa_repository import MapaRepository, MapaRepositoryImpl
@@ -19,6 +21,8 @@ from .player_repository import PlayerRepository, PlayerRepositoryImpl
 from .totem_repository import TotemRepository, TotemRepositoryImpl
 from .ponte_repository import PonteRepository, PonteRepositoryImpl
 from .fatasma_repository import FantasmaRepository, FantasmaRepositoryImpl
+from .player_view_repository import PlayerViewRepository, PlayerViewRepositoryImpl
+from .statistics_repository import StatisticsRepository, StatisticsRepositoryImpl
 class BaseRepository(ABC):
     """Interface base para todos os repositories"""
     
@@ -70,6 +74,10 @@ class ChunkRepository(BaseRepository):
         """Retorna todos os chunks"""
         pass
     
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Chunk]:
+        """Percorre todos os chunks sem carregá-los de uma vez na memória"""
+        pass
+    
     def find_by_id(self, id: int) -> Optional[Chunk]:
         """Busca chunk por ID"""
         pass
@@ -82,13 +90,37 @@ class ChunkRepository(BaseRepository):
         """Deleta um chunk por ID"""
         pass
     
-    def find_by_mapa(self, mapa_nome: str, mapa_turno: str) -> List[Chunk]:
+    def find_by_mapa(self, mapa_nome: str, mapa_turno: str, limit: Optional[int] = None) -> List[Chunk]:
         """Busca chunks por mapa"""
         pass
     
+    def find_store_by_mapa(self, mapa_nome: str, mapa_turno: str) -> ChunkStore:
+        """Carrega os chunks de um mapa em colunas"""
+        pass
+    
+    def count_by_bioma(self, mapa_nome: str, mapa_turno: str) -> Dict[int, int]:
+        """Conta os chunks de um mapa por bioma"""
+        pass
+    
     def find_by_bioma(self, bioma_id: str) -> List[Chunk]:
         """Busca chunks por bioma"""
         pass
+    
+    def find_by_ids(self, ids: List[int]) -> List[Chunk]:
+        """Busca vários chunks por ID"""
+        pass
+    
+    def save_many(self, chunks: List[Chunk]) -> int:
+        """Salva vários chunks em uma transação"""
+        pass
+    
+    def delete_many(self, ids: List[int]) -> int:
+        """Deleta vários chunks em uma transação"""
+        pass
+    
+    def get_grid(self) -> ChunkGrid:
+        """Retorna o índice espacial em memória dos chunks"""
+        pass
 
 
 class MapaRepository(BaseRepository):
@@ -122,6 +154,10 @@ class PlayerRepository(BaseRepository):
         """Retorna todos os jogadores"""
         pass
     
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Player]:
+        """Percorre todos os jogadores sem carregá-los de uma vez na memória"""
+        pass
+    
     def find_by_id(self, id: int) -> Optional[Player]:
         """Busca jogador por ID"""
         pass
@@ -140,7 +176,40 @@ class PlayerRepository(BaseRepository):
     
     def find_active_players(self) -> List[Player]:
         """Busca jogadores ativos"""
-        pass 
+        pass
+    
+    def find_by_chunk(self, chunk_id: int) -> List[Player]:
+        """Busca jogadores em um chunk"""
+        pass
+    
+    def find_by_bioma(self, bioma_id: int) -> List[Player]:
+        """Busca jogadores em chunks de um bioma"""
+        pass
+    
+    def find_by_mapa(self, mapa_id: int) -> List[Player]:
+        """Busca jogadores em chunks de um mapa"""
+        pass
+    
+    def find_by_ids(self, ids: List[int]) -> List[Player]:
+        """Busca vários jogadores por ID"""
+        pass
+    
+    def save_many(self, players: List[Player]) -> int:
+        """Salva vários jogadores em uma transação"""
+        pass
+    
+    def update_many(self, players: List[Player]) -> List[int]:
+        """Atualiza vários jogadores já salvos em uma transação, retornando os IDs gravados"""
+        pass
+    
+    def delete_many(self, ids: List[int]) -> int:
+        """Deleta vários jogadores em uma transação"""
+        pass
+    
+    def find_page(self, after_nome: Optional[str] = None, limit: int = 20) -> List[Player]:
+        """Busca uma página de jogadores em ordem de nome, após ``after_nome``"""
+        pass
+
 
 class FantasmaRepository(BaseRepository):
     """Repository para entidade Fantasma"""
@@ -1,4 +1,5 @@
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
+from psycopg2.extras import execute_values
 from ..utils.db_helpers import connection_db
 from ..models.aldeao import Aldeao, BobMago, BobConstrutor
 from abc import ABC, abstractmethod
@@ -18,6 +19,21 @@ class AldeaoRepository(ABC):
         """Salva um aldeão e sua especialização."""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[int]) -> List[Tuple[Aldeao, Optional[BobMago], Optional[BobConstrutor]]]:
+        """Busca vários aldeões e suas especializações com uma consulta por tabela."""
+        pass
+
+    @abstractmethod
+    def save_many(self, aldeoes: Iterable[Tuple[Aldeao, Optional[BobMago | BobConstrutor]]]) -> int:
+        """Salva vários aldeões (e especializações) em uma única transação, retornando as linhas afetadas."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários aldeões em uma única transação, retornando as linhas afetadas."""
+        pass
+
 class AldeaoRepositoryImpl(AldeaoRepository):
     """Implementação PostgreSQL do AldeaoRepository - Adaptado para o esquema da main"""
 
@@ -150,3 +166,147 @@ class AldeaoRepositoryImpl(AldeaoRepository):
         except Exception as e:
             print(f"Erro ao salvar aldeão: {str(e)}")
             return None
+
+    def find_by_ids(self, ids: Iterable[int]) -> List[Tuple[Aldeao, Optional[BobMago], Optional[BobConstrutor]]]:
+        """
+        Busca vários aldeões e suas especializações.
+        Usa três consultas (Aldeao, Bob_mago, Bob_construtor) independentemente
+        da quantidade de IDs, em vez de até três consultas por aldeão.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT id_aldeao, nome, tipo, descricao, id_casa FROM Aldeao WHERE id_aldeao = ANY(%s) ORDER BY id_aldeao",
+                        (ids,)
+                    )
+                    aldeoes = [
+                        Aldeao(id_aldeao=r[0], nome=r[1], tipo=r[2], descricao=r[3], id_casa=r[4])
+                        for r in cursor.fetchall()
+                    ]
+
+                    magos = {}
+                    mago_ids = [a.id_aldeao for a in aldeoes if a.tipo == 'Mago']
+                    if mago_ids:
+                        cursor.execute(
+                            "SELECT id_aldeao_mago, habilidade_mago, nivel, descricao FROM Bob_mago WHERE id_aldeao_mago = ANY(%s)",
+                            (mago_ids,)
+                        )
+                        for r in cursor.fetchall():
+                            magos[r[0]] = BobMago(id_aldeao_mago=r[0], habilidade_mago=r[1], nivel=r[2], descricao=r[3])
+
+                    construtores = {}
+                    construtor_ids = [a.id_aldeao for a in aldeoes if a.tipo == 'Construtor']
+                    if construtor_ids:
+                        cursor.execute(
+                            "SELECT id_aldeao_construtor, habilidades_construtor, nivel, descricao FROM Bob_construtor WHERE id_aldeao_construtor = ANY(%s)",
+                            (construtor_ids,)
+                        )
+                        for r in cursor.fetchall():
+                            construtores[r[0]] = BobConstrutor(
+                                id_aldeao_construtor=r[0], habilidades_construtor=r[1], nivel=r[2], descricao=r[3]
+                            )
+
+                    return [
+                        (a, magos.get(a.id_aldeao), construtores.get(a.id_aldeao))
+                        for a in aldeoes
+                    ]
+
+        except Exception as e:
+            print(f"Erro ao buscar aldeões {ids}: {str(e)}")
+            return []
+
+    def save_many(self, aldeoes: Iterable[Tuple[Aldeao, Optional[BobMago | BobConstrutor]]]) -> int:
+        """
+        Salva vários aldeões e suas especializações em uma única transação.
+        Aldeões novos recebem o ID gerado. Retorna o número de aldeões gravados.
+        """
+        aldeoes = list(aldeoes)
+        if not aldeoes:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    affected = 0
+                    updates = [a for a, _ in aldeoes if a.id_aldeao]
+                    inserts = [a for a, _ in aldeoes if not a.id_aldeao]
+
+                    # 1. Aldeões (pais)
+                    if updates:
+                        result = execute_values(cursor, """
+                            UPDATE Aldeao AS a
+                            SET nome = v.nome, tipo = v.tipo, descricao = v.descricao, id_casa = v.id_casa
+                            FROM (VALUES %s) AS v(id_aldeao, nome, tipo, descricao, id_casa)
+                            WHERE a.id_aldeao = v.id_aldeao
+                            RETURNING a.id_aldeao
+                            """,
+                            [(a.id_aldeao, a.nome, a.tipo, a.descricao, a.id_casa) for a in updates],
+                            template="(%s::int, %s::varchar, %s::varchar, %s::text, %s::int)",
+                            fetch=True
+                        )
+                        affected += len(result)
+                    if inserts:
+                        result = execute_values(cursor, """
+                            INSERT INTO Aldeao (nome, tipo, descricao, id_casa)
+                            VALUES %s RETURNING id_aldeao
+                            """,
+                            [(a.nome, a.tipo, a.descricao, a.id_casa) for a in inserts],
+                            page_size=len(inserts), fetch=True
+                        )
+                        # Uma única página: os IDs voltam na ordem dos VALUES
+                        for aldeao, row in zip(inserts, result):
+                            aldeao.id_aldeao = row[0]
+                        affected += len(result)
+
+                    # 2. Especializações
+                    magos = [(a.id_aldeao, e.habilidade_mago, e.nivel, e.descricao)
+                             for a, e in aldeoes if isinstance(e, BobMago)]
+                    construtores = [(a.id_aldeao, e.habilidades_construtor, e.nivel, e.descricao)
+                                    for a, e in aldeoes if isinstance(e, BobConstrutor)]
+                    if magos:
+                        execute_values(cursor, """
+                            INSERT INTO Bob_mago (id_aldeao_mago, habilidade_mago, nivel, descricao)
+                            VALUES %s
+                            ON CONFLICT (id_aldeao_mago) DO UPDATE SET
+                            habilidade_mago = EXCLUDED.habilidade_mago,
+                            nivel = EXCLUDED.nivel,
+                            descricao = EXCLUDED.descricao
+                            """, magos)
+                    if construtores:
+                        execute_values(cursor, """
+                            INSERT INTO Bob_construtor (id_aldeao_construtor, habilidades_construtor, nivel, descricao)
+                            VALUES %s
+                            ON CONFLICT (id_aldeao_construtor) DO UPDATE SET
+                            habilidades_construtor = EXCLUDED.habilidades_construtor,
+                            nivel = EXCLUDED.nivel,
+                            descricao = EXCLUDED.descricao
+                            """, construtores)
+
+                    conn.commit()
+                    return affected
+
+        except Exception as e:
+            print(f"Erro ao salvar aldeões em lote: {str(e)}")
+            return 0
+
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """
+        Deleta vários aldeões em uma única transação.
+        As especializações são removidas pelo ON DELETE CASCADE.
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("DELETE FROM Aldeao WHERE id_aldeao = ANY(%s)", (ids,))
+                    deleted = cursor.rowcount
+                    conn.commit()
+                    return deleted
+        except Exception as e:
+            print(f"Erro ao deletar aldeões {ids}: {str(e)}")
+            return 0
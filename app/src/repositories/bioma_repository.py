@@ -4,6 +4,7 @@ Implementação PostgreSQL do BiomaRepository
 
 from typing import List, Optional
 from ..utils.db_helpers import connection_db
+from ..utils.reference_cache import bump_reference_version
 from ..models.bioma import Bioma
 from abc import ABC, abstractmethod
 
@@ -15,6 +16,11 @@ class BiomaRepository(ABC):
     def find_all(self) -> List[Bioma]:
         """Retorna todos os biomas"""
         pass
+
+    @abstractmethod
+    def load_all(self) -> List[Bioma]:
+        """Retorna todos os biomas, propagando erros de banco"""
+        pass
     
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Bioma]:
@@ -38,29 +44,38 @@ class BiomaRepositoryImpl(BiomaRepository):
     def find_all(self) -> List[Bioma]:
         """Retorna todos os biomas"""
         try:
-            with connection_db() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT id_bioma, nome, descricao
-                        FROM bioma
-                        ORDER BY nome
-                    """)
-                    
-                    results = cursor.fetchall()
-                    biomas = []
-                    
-                    for row in results:
-                        bioma = Bioma(
-                            id_bioma=row[0],
-                            nome=row[1],
-                            descricao=row[2]
-                        )
-                        biomas.append(bioma)
-                    
-                    return biomas
+            return self.load_all()
         except Exception as e:
             print(f"Erro ao buscar biomas: {str(e)}")
             return []
+
+    def load_all(self) -> List[Bioma]:
+        """
+        Retorna todos os biomas, propagando erros de banco
+
+        Usado pelo cache de referência, que precisa distinguir uma falha de
+        leitura de uma tabela vazia (``find_all`` devolve [] nos dois casos).
+        """
+        with connection_db() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id_bioma, nome, descricao
+                    FROM bioma
+                    ORDER BY nome
+                """)
+                
+                results = cursor.fetchall()
+                biomas = []
+                
+                for row in results:
+                    bioma = Bioma(
+                        id_bioma=row[0],
+                        nome=row[1],
+                        descricao=row[2]
+                    )
+                    biomas.append(bioma)
+                
+                return biomas
     
     def find_by_id(self, id: int) -> Optional[Bioma]:
         """Busca bioma por ID"""
@@ -99,6 +114,7 @@ class BiomaRepositoryImpl(BiomaRepository):
                     """, (bioma.id_bioma, bioma.nome, bioma.descricao))
                     result = cursor.fetchone()
                     conn.commit()
+                    bump_reference_version('bioma')
                     return Bioma(
                         id_bioma=result[0],
                         nome=result[1],
@@ -118,6 +134,8 @@ class BiomaRepositoryImpl(BiomaRepository):
                     cursor.execute("DELETE FROM bioma WHERE id_bioma = %s", (id,))
                     deleted = cursor.rowcount > 0
                     conn.commit()
+                    if deleted:
+                        bump_reference_version('bioma')
                     return deleted
         except Exception as e:
             if 'conn' in locals():
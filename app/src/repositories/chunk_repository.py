@@ -2,8 +2,17 @@
 Implementação PostgreSQL do ChunkRepository
 """
 
-from typing import List, Optional
-from ..utils.db_helpers import connection_db
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+from psycopg2.extras import execute_values
+from ..utils.db_helpers import STREAM_ITERSIZE, connection_db
+from ..utils.chunk_grid import ChunkGrid
+from ..utils.chunk_store import ChunkStore
+from ..utils import map_snapshot
+from ..utils import shared_world
+from ..utils.binary_copy import copy_int4_columns
+from ..utils.reference_cache import bump_reference_version
+from ..utils.unit_of_work import on_commit
 from ..models.chunk import Chunk
 from abc import ABC, abstractmethod
 
@@ -15,6 +24,11 @@ class ChunkRepository(ABC):
     def find_all(self) -> List[Chunk]:
         """Retorna todos os chunks"""
         pass
+
+    @abstractmethod
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Chunk]:
+        """Percorre todos os chunks sem carregá-los de uma vez na memória"""
+        pass
     
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Chunk]:
@@ -32,19 +46,101 @@ class ChunkRepository(ABC):
         pass
     
     @abstractmethod
-    def find_by_mapa(self, mapa_nome: str, mapa_turno: str) -> List[Chunk]:
-        """Busca chunks por mapa"""
+    def find_by_mapa(self, mapa_nome: str, mapa_turno: str, limit: Optional[int] = None) -> List[Chunk]:
+        """Busca chunks por mapa (os ``limit`` primeiros, se informado)"""
+        pass
+    
+    @abstractmethod
+    def find_store_by_mapa(self, mapa_nome: str, mapa_turno: str) -> ChunkStore:
+        """Carrega os chunks de um mapa em colunas (sem criar objetos Chunk)"""
+        pass
+    
+    @abstractmethod
+    def count_by_bioma(self, mapa_nome: str, mapa_turno: str) -> Dict[int, int]:
+        """Conta os chunks de um mapa por bioma"""
         pass
     
     @abstractmethod
     def find_by_bioma(self, bioma_id: int) -> List[Chunk]:
         """Busca chunks por bioma"""
         pass
+    
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[int]) -> List[Chunk]:
+        """Busca vários chunks por ID em uma única consulta"""
+        pass
+    
+    @abstractmethod
+    def save_many(self, chunks: Iterable[Chunk]) -> int:
+        """Salva vários chunks em uma única transação, retornando as linhas afetadas"""
+        pass
+    
+    @abstractmethod
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários chunks em uma única transação, retornando as linhas afetadas"""
+        pass
+    
+    @abstractmethod
+    def get_grid(self) -> ChunkGrid:
+        """Retorna o índice espacial em memória de todos os chunks"""
+        pass
 
 
 class ChunkRepositoryImpl(ChunkRepository):
     """Implementação PostgreSQL do ChunkRepository"""
     
+    # Índice espacial compartilhado por todas as instâncias do processo
+    _grid: Optional[ChunkGrid] = None
+    _grid_lock = threading.Lock()
+    # Incrementada a cada invalidação; um índice lido antes dela não é publicado
+    _grid_generation = 0
+    
+    def get_grid(self) -> ChunkGrid:
+        """
+        Retorna o índice espacial dos chunks, carregando-o na primeira chamada
+        
+        O índice é descartado em save/delete e recarregado sob demanda. Com
+        ``SHARED_WORLD`` publicado, usa o índice da memória compartilhada, a
+        menos que este processo tenha alterado chunks depois da publicação.
+        """
+        world = shared_world.current_world('chunk')
+        if world is not None:
+            return world.grid
+        grid = ChunkRepositoryImpl._grid
+        if grid is not None:
+            return grid
+        with ChunkRepositoryImpl._grid_lock:
+            if ChunkRepositoryImpl._grid is not None:
+                return ChunkRepositoryImpl._grid
+            generation = ChunkRepositoryImpl._grid_generation
+        # A leitura roda fora do lock para não segurar save/delete
+        chunks = self.find_all()
+        if not chunks:
+            # Falha de leitura ou tabela vazia: não memoriza o índice vazio
+            return ChunkGrid()
+        grid = ChunkGrid(chunks)
+        with ChunkRepositoryImpl._grid_lock:
+            if ChunkRepositoryImpl._grid_generation == generation:
+                # Nenhuma escrita desde o início da leitura
+                ChunkRepositoryImpl._grid = grid
+        return grid
+    
+    @classmethod
+    def invalidate_grid(cls) -> None:
+        """
+        Descarta o índice espacial (recarregado no próximo get_grid) e as rotas calculadas
+
+        Dentro de uma UnitOfWork, o descarte espera o commit da unidade.
+        """
+        on_commit(cls._discard_grid)
+
+    @classmethod
+    def _discard_grid(cls) -> None:
+        with cls._grid_lock:
+            cls._grid_generation += 1
+            cls._grid = None
+        bump_reference_version('chunk')
+    
     def find_all(self) -> List[Chunk]:
         """Retorna todos os chunks"""
         try:
@@ -74,6 +170,34 @@ class ChunkRepositoryImpl(ChunkRepository):
             print(f"Erro ao buscar chunks: {str(e)}")
             return []
     
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Chunk]:
+        """
+        Percorre todos os chunks com um cursor no servidor
+
+        Só ``itersize`` linhas (padrão ``DB_ITERSIZE``) ficam na memória por
+        vez. A conexão fica emprestada até o fim da iteração; interromper o
+        laço (``break`` ou ``close()``) a devolve ao pool.
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor(name="iter_chunk") as cursor:
+                    cursor.itersize = itersize or STREAM_ITERSIZE
+                    cursor.execute("""
+                        SELECT id_chunk, id_bioma, id_mapa, x, y
+                        FROM chunk
+                        ORDER BY id_chunk
+                    """)
+                    for row in cursor:
+                        yield Chunk(
+                            id_chunk=row[0],
+                            id_bioma=row[1],
+                            id_mapa=row[2],
+                            x=row[3],
+                            y=row[4]
+                        )
+        except Exception as e:
+            print(f"Erro ao percorrer chunks: {str(e)}")
+
     def find_by_id(self, id: int) -> Optional[Chunk]:
         """Busca chunk por ID"""
         try:
@@ -115,6 +239,7 @@ class ChunkRepositoryImpl(ChunkRepository):
                     """, (chunk.id_chunk, chunk.id_bioma, chunk.id_mapa, chunk.x, chunk.y))
                     result = cursor.fetchone()
                     conn.commit()
+                    self.invalidate_grid()
                     return Chunk(
                         id_chunk=result[0],
                         id_bioma=result[1],
@@ -136,6 +261,8 @@ class ChunkRepositoryImpl(ChunkRepository):
                     cursor.execute("DELETE FROM chunk WHERE id_chunk = %s", (id,))
                     deleted = cursor.rowcount > 0
                     conn.commit()
+                    if deleted:
+                        self.invalidate_grid()
                     return deleted
         except Exception as e:
             if 'conn' in locals():
@@ -143,18 +270,20 @@ class ChunkRepositoryImpl(ChunkRepository):
             print(f"Erro ao deletar chunk {id}: {str(e)}")
             return False
     
-    def find_by_mapa(self, mapa_nome: str, mapa_turno: str) -> List[Chunk]:
-        """Busca chunks por mapa"""
+    def find_by_mapa(self, mapa_nome: str, mapa_turno: str, limit: Optional[int] = None) -> List[Chunk]:
+        """Busca chunks por mapa (os ``limit`` primeiros por ID, se informado)"""
         try:
             with connection_db() as conn:
                 with conn.cursor() as cursor:
+                    # LIMIT NULL equivale a sem limite no PostgreSQL
                     cursor.execute("""
                         SELECT c.id_chunk, c.id_bioma, c.id_mapa, c.x, c.y
                         FROM chunk c
                         JOIN mapa m ON c.id_mapa = m.id_mapa
                         WHERE m.nome = %s AND m.turno = %s
                         ORDER BY c.id_chunk
-                    """, (mapa_nome, mapa_turno))
+                        LIMIT %s
+                    """, (mapa_nome, mapa_turno, limit))
                     
                     results = cursor.fetchall()
                     chunks = []
@@ -174,6 +303,65 @@ class ChunkRepositoryImpl(ChunkRepository):
             print(f"Erro ao buscar chunks do mapa {mapa_nome} ({mapa_turno}): {str(e)}")
             return []
     
+    def find_store_by_mapa(self, mapa_nome: str, mapa_turno: str) -> ChunkStore:
+        """
+        Carrega os chunks de um mapa em um ChunkStore colunar
+        
+        Com ``MAP_SNAPSHOT_DIR`` configurado, o store vem do snapshot binário
+        do mapa (mmap, compartilhado entre processos), regravado quando o
+        carimbo do banco muda.
+        """
+        if map_snapshot.SNAPSHOT_DIR:
+            try:
+                return map_snapshot.load_map_store(
+                    mapa_nome, mapa_turno, lambda: self._query_store(mapa_nome, mapa_turno))
+            except Exception as e:
+                print(f"Erro ao usar snapshot do mapa {mapa_nome} ({mapa_turno}): {str(e)}")
+        return self._query_store(mapa_nome, mapa_turno)
+    
+    def _query_store(self, mapa_nome: str, mapa_turno: str) -> ChunkStore:
+        """
+        Lê o mapa do banco com ``COPY ... (FORMAT binary)``: o fluxo é
+        decodificado direto em arrays, sem tuplas nem Chunk por linha
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    query = cursor.mogrify("""
+                        SELECT c.id_chunk, c.id_bioma, c.id_mapa, c.x, c.y
+                        FROM chunk c
+                        JOIN mapa m ON c.id_mapa = m.id_mapa
+                        WHERE m.nome = %s AND m.turno = %s
+                        ORDER BY c.id_chunk
+                    """, (mapa_nome, mapa_turno))
+                    return ChunkStore(*copy_int4_columns(cursor, query.decode(), 5))
+        except Exception as e:
+            print(f"Erro ao carregar chunks do mapa {mapa_nome} ({mapa_turno}): {str(e)}")
+            return ChunkStore.empty()
+    
+    def count_by_bioma(self, mapa_nome: str, mapa_turno: str) -> Dict[int, int]:
+        """
+        Conta os chunks de um mapa por bioma, agregando no banco
+        
+        Returns:
+            Dicionário id_bioma -> quantidade de chunks
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT c.id_bioma, COUNT(*)
+                        FROM chunk c
+                        JOIN mapa m ON c.id_mapa = m.id_mapa
+                        WHERE m.nome = %s AND m.turno = %s
+                        GROUP BY c.id_bioma
+                        ORDER BY c.id_bioma
+                    """, (mapa_nome, mapa_turno))
+                    return {id_bioma: total for id_bioma, total in cursor.fetchall()}
+        except Exception as e:
+            print(f"Erro ao contar chunks do mapa {mapa_nome} ({mapa_turno}): {str(e)}")
+            return {}
+    
     def find_by_bioma(self, bioma_id: int) -> List[Chunk]:
         """Busca chunks por bioma"""
         try:
@@ -202,4 +390,73 @@ class ChunkRepositoryImpl(ChunkRepository):
                     return chunks
         except Exception as e:
             print(f"Erro ao buscar chunks do bioma {bioma_id}: {str(e)}")
-            return [] 
+            return []
+    
+    def find_by_ids(self, ids: Iterable[int]) -> List[Chunk]:
+        """Busca vários chunks por ID em uma única consulta"""
+        ids = list(ids)
+        if not ids:
+            return []
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT id_chunk, id_bioma, id_mapa, x, y
+                        FROM chunk
+                        WHERE id_chunk = ANY(%s)
+                        ORDER BY id_chunk
+                    """, (ids,))
+                    return [
+                        Chunk(id_chunk=row[0], id_bioma=row[1], id_mapa=row[2], x=row[3], y=row[4])
+                        for row in cursor.fetchall()
+                    ]
+        except Exception as e:
+            print(f"Erro ao buscar chunks {ids}: {str(e)}")
+            return []
+    
+    def save_many(self, chunks: Iterable[Chunk]) -> int:
+        """Salva vários chunks em uma única transação, retornando as linhas afetadas"""
+        rows = [(c.id_chunk, c.id_bioma, c.id_mapa, c.x, c.y) for c in chunks]
+        if not rows:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    result = execute_values(cursor, """
+                        INSERT INTO chunk (id_chunk, id_bioma, id_mapa, x, y)
+                        VALUES %s
+                        ON CONFLICT (id_chunk)
+                        DO UPDATE SET id_bioma = EXCLUDED.id_bioma,
+                                       id_mapa  = EXCLUDED.id_mapa,
+                                       x        = EXCLUDED.x,
+                                       y        = EXCLUDED.y
+                        RETURNING id_chunk
+                    """, rows, fetch=True)
+                    conn.commit()
+                    self.invalidate_grid()
+                    return len(result)
+        except Exception as e:
+            if 'conn' in locals():
+                conn.rollback()
+            print(f"Erro ao salvar chunks em lote: {str(e)}")
+            return 0
+    
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários chunks em uma única transação, retornando as linhas afetadas"""
+        ids = list(ids)
+        if not ids:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("DELETE FROM chunk WHERE id_chunk = ANY(%s)", (ids,))
+                    deleted = cursor.rowcount
+                    conn.commit()
+                    if deleted:
+                        self.invalidate_grid()
+                    return deleted
+        except Exception as e:
+            if 'conn' in locals():
+                conn.rollback()
+            print(f"Erro ao deletar chunks {ids}: {str(e)}")
+            return 0
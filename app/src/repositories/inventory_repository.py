@@ -2,8 +2,9 @@
 Implementação PostgreSQL do InventoryRepository
 """
 
-from typing import List, Optional
-from ..utils.db_helpers import connection_db
+from typing import Iterable, Iterator, List, Optional
+from psycopg2.extras import execute_values
+from ..utils.db_helpers import STREAM_ITERSIZE, connection_db
 from ..models.inventory import InventoryEntry
 from abc import ABC, abstractmethod
 
@@ -16,6 +17,11 @@ class InventoryRepository(ABC):
         """Retorna todas as entradas de inventário"""
         pass
 
+    @abstractmethod
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[InventoryEntry]:
+        """Percorre todas as entradas de inventário sem carregá-los de uma vez na memória"""
+        pass
+
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[InventoryEntry]:
         """Busca entrada de inventário por ID"""
@@ -31,6 +37,21 @@ class InventoryRepository(ABC):
         """Deleta uma entrada de inventário por ID"""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[int]) -> List[InventoryEntry]:
+        """Busca várias entradas de inventário por ID em uma única consulta"""
+        pass
+
+    @abstractmethod
+    def save_many(self, entries: Iterable[InventoryEntry]) -> int:
+        """Salva várias entradas em uma única transação, retornando as linhas afetadas"""
+        pass
+
+    @abstractmethod
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta várias entradas em uma única transação, retornando as linhas afetadas"""
+        pass
+
 
 class InventoryRepositoryImpl(InventoryRepository):
     """Implementação PostgreSQL do InventoryRepository"""
@@ -56,6 +77,30 @@ class InventoryRepositoryImpl(InventoryRepository):
             print(f"Erro ao buscar inventário: {e}")
             return []
 
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[InventoryEntry]:
+        """
+        Percorre todas as entradas de inventário com um cursor no servidor
+
+        Só ``itersize`` linhas (padrão ``DB_ITERSIZE``) ficam na memória por
+        vez. A conexão fica emprestada até o fim da iteração; interromper o
+        laço (``break`` ou ``close()``) a devolve ao pool.
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor(name="iter_inventario") as cursor:
+                    cursor.itersize = itersize or STREAM_ITERSIZE
+                    cursor.execute("""
+                        SELECT id, player_id, item_id, quantidade
+                        FROM inventario
+                        ORDER BY id
+                    """)
+                    for row in cursor:
+                        yield InventoryEntry(
+                            id=row[0], player_id=row[1], item_id=row[2], quantidade=row[3]
+                        )
+        except Exception as e:
+            print(f"Erro ao percorrer inventário: {e}")
+
     def find_by_id(self, id: int) -> Optional[InventoryEntry]:
         """Busca entrada de inventário por ID"""
         try:
@@ -113,3 +158,64 @@ class InventoryRepositoryImpl(InventoryRepository):
         except Exception as e:
             print(f"Erro ao deletar inventário {id}: {e}")
             return False
+
+    def find_by_ids(self, ids: Iterable[int]) -> List[InventoryEntry]:
+        """Busca várias entradas de inventário por ID em uma única consulta"""
+        ids = list(ids)
+        if not ids:
+            return []
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT id, player_id, item_id, quantidade
+                        FROM inventario
+                        WHERE id = ANY(%s)
+                        ORDER BY id
+                    """, (ids,))
+                    return [
+                        InventoryEntry(id=r[0], player_id=r[1], item_id=r[2], quantidade=r[3])
+                        for r in cursor.fetchall()
+                    ]
+        except Exception as e:
+            print(f"Erro ao buscar inventário {ids}: {e}")
+            return []
+
+    def save_many(self, entries: Iterable[InventoryEntry]) -> int:
+        """Salva várias entradas em uma única transação, retornando as linhas afetadas"""
+        rows = [(e.id, e.player_id, e.item_id, e.quantidade) for e in entries]
+        if not rows:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    result = execute_values(cursor, """
+                        INSERT INTO inventario (id, player_id, item_id, quantidade)
+                        VALUES %s
+                        ON CONFLICT (id)
+                        DO UPDATE SET player_id = EXCLUDED.player_id,
+                                       item_id   = EXCLUDED.item_id,
+                                       quantidade= EXCLUDED.quantidade
+                        RETURNING id
+                    """, rows, fetch=True)
+                    conn.commit()
+                    return len(result)
+        except Exception as e:
+            print(f"Erro ao salvar inventário em lote: {e}")
+            return 0
+
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta várias entradas em uma única transação, retornando as linhas afetadas"""
+        ids = list(ids)
+        if not ids:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("DELETE FROM inventario WHERE id = ANY(%s)", (ids,))
+                    deleted = cursor.rowcount
+                    conn.commit()
+                    return deleted
+        except Exception as e:
+            print(f"Erro ao deletar inventário {ids}: {e}")
+            return 0
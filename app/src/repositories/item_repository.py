@@ -2,8 +2,10 @@
 Implementação PostgreSQL do ItemRepository
 """
 
-from typing import List, Optional
-from ..utils.db_helpers import connection_db
+from typing import Iterable, Iterator, List, Optional
+from psycopg2.extras import execute_values
+from ..utils.db_helpers import STREAM_ITERSIZE, connection_db
+from ..utils.reference_cache import bump_reference_version
 from ..models.item import Item
 from abc import ABC, abstractmethod
 
@@ -15,6 +17,16 @@ class ItemRepository(ABC):
     def find_all(self) -> List[Item]:
         """Retorna todos os items"""
         pass
+
+    @abstractmethod
+    def load_all(self) -> List[Item]:
+        """Retorna todos os items, propagando erros de banco"""
+        pass
+
+    @abstractmethod
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Item]:
+        """Percorre todos os items sem carregá-los de uma vez na memória"""
+        pass
     
     @abstractmethod
     def find_by_id(self, id_item: int) -> Optional[Item]:
@@ -31,31 +43,75 @@ class ItemRepository(ABC):
         """Deleta um item por ID"""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[int]) -> List[Item]:
+        """Busca vários items por ID em uma única consulta"""
+        pass
+
+    @abstractmethod
+    def save_many(self, items: Iterable[Item]) -> int:
+        """Salva vários items em uma única transação, retornando as linhas afetadas"""
+        pass
+
+    @abstractmethod
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários items em uma única transação, retornando as linhas afetadas"""
+        pass
+
 
 class ItemRepositoryImpl(ItemRepository):
     """Implementação PostgreSQL do ItemRepository"""
     
     def find_all(self) -> List[Item]:
         """Retorna todos os items"""
+        try:
+            return self.load_all()
+        except Exception as e:
+            print(f"Erro ao buscar items: {e}")
+            return []
+
+    def load_all(self) -> List[Item]:
+        """Retorna todos os items, propagando erros de banco"""
+        with connection_db() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id_item, nome, tipo, poder, durabilidade
+                    FROM item
+                    ORDER BY nome
+                """)
+                rows = cursor.fetchall()
+                items: List[Item] = []
+                for r in rows:
+                    items.append(Item(
+                        id_item=r[0], nome=r[1], tipo=r[2],
+                        poder=r[3], durabilidade=r[4]
+                    ))
+                return items
+
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Item]:
+        """
+        Percorre todos os items com um cursor no servidor
+
+        Só ``itersize`` linhas (padrão ``DB_ITERSIZE``) ficam na memória por
+        vez. A conexão fica emprestada até o fim da iteração; interromper o
+        laço (``break`` ou ``close()``) a devolve ao pool.
+        """
         try:
             with connection_db() as conn:
-                with conn.cursor() as cursor:
+                with conn.cursor(name="iter_item") as cursor:
+                    cursor.itersize = itersize or STREAM_ITERSIZE
                     cursor.execute("""
                         SELECT id_item, nome, tipo, poder, durabilidade
                         FROM item
                         ORDER BY nome
                     """)
-                    rows = cursor.fetchall()
-                    items: List[Item] = []
-                    for r in rows:
-                        items.append(Item(
-                            id_item=r[0], nome=r[1], tipo=r[2],
-                            poder=r[3], durabilidade=r[4]
-                        ))
-                    return items
+                    for row in cursor:
+                        yield Item(
+                            id_item=row[0], nome=row[1], tipo=row[2],
+                            poder=row[3], durabilidade=row[4]
+                        )
         except Exception as e:
-            print(f"Erro ao buscar items: {e}")
-            return []
+            print(f"Erro ao percorrer items: {e}")
 
     def find_by_id(self, id_item: int) -> Optional[Item]:
         """Busca item por ID"""
@@ -98,6 +154,7 @@ class ItemRepositoryImpl(ItemRepository):
                     ))
                     result = cursor.fetchone()
                     conn.commit()
+                    bump_reference_version('item')
                     return Item(
                         id_item=result[0], nome=result[1], tipo=result[2],
                         poder=result[3], durabilidade=result[4]
@@ -114,7 +171,74 @@ class ItemRepositoryImpl(ItemRepository):
                     cursor.execute("DELETE FROM item WHERE id_item = %s", (id_item,))
                     deleted = cursor.rowcount > 0
                     conn.commit()
+                    if deleted:
+                        bump_reference_version('item')
                     return deleted
         except Exception as e:
             print(f"Erro ao deletar item {id_item}: {e}")
             return False
+
+    def find_by_ids(self, ids: Iterable[int]) -> List[Item]:
+        """Busca vários items por ID em uma única consulta"""
+        ids = list(ids)
+        if not ids:
+            return []
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT id_item, nome, tipo, poder, durabilidade
+                        FROM item
+                        WHERE id_item = ANY(%s)
+                        ORDER BY id_item
+                    """, (ids,))
+                    return [
+                        Item(id_item=r[0], nome=r[1], tipo=r[2], poder=r[3], durabilidade=r[4])
+                        for r in cursor.fetchall()
+                    ]
+        except Exception as e:
+            print(f"Erro ao buscar items {ids}: {e}")
+            return []
+
+    def save_many(self, items: Iterable[Item]) -> int:
+        """Salva vários items em uma única transação, retornando as linhas afetadas"""
+        rows = [(i.id_item, i.nome, i.tipo, i.poder, i.durabilidade) for i in items]
+        if not rows:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    result = execute_values(cursor, """
+                        INSERT INTO item (id_item, nome, tipo, poder, durabilidade)
+                        VALUES %s
+                        ON CONFLICT (id_item)
+                        DO UPDATE SET nome = EXCLUDED.nome,
+                                       tipo = EXCLUDED.tipo,
+                                       poder = EXCLUDED.poder,
+                                       durabilidade = EXCLUDED.durabilidade
+                        RETURNING id_item
+                    """, rows, fetch=True)
+                    conn.commit()
+                    bump_reference_version('item')
+                    return len(result)
+        except Exception as e:
+            print(f"Erro ao salvar items em lote: {e}")
+            return 0
+
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários items em uma única transação, retornando as linhas afetadas"""
+        ids = list(ids)
+        if not ids:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("DELETE FROM item WHERE id_item = ANY(%s)", (ids,))
+                    deleted = cursor.rowcount
+                    conn.commit()
+                    if deleted:
+                        bump_reference_version('item')
+                    return deleted
+        except Exception as e:
+            print(f"Erro ao deletar items {ids}: {e}")
+            return 0
@@ -4,6 +4,7 @@ Implementação PostgreSQL do MapaRepository
 
 from typing import List, Optional
 from ..utils.db_helpers import connection_db
+from ..utils.reference_cache import bump_reference_version
 from ..models.mapa import Mapa, TurnoType
 from abc import ABC, abstractmethod
 
@@ -15,6 +16,11 @@ class MapaRepository(ABC):
     def find_all(self) -> List[Mapa]:
         """Retorna todos os mapas"""
         pass
+
+    @abstractmethod
+    def load_all(self) -> List[Mapa]:
+        """Retorna todos os mapas, propagando erros de banco"""
+        pass
     
     @abstractmethod
     def find_by_id(self, nome: str, turno: TurnoType) -> Optional[Mapa]:
@@ -43,25 +49,29 @@ class MapaRepositoryImpl(MapaRepository):
     def find_all(self) -> List[Mapa]:
         """Retorna todos os mapas"""
         try:
-            with connection_db() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT id_mapa, nome, turno
-                        FROM mapa
-                        ORDER BY nome, turno
-                    """)
-                    
-                    results = cursor.fetchall()
-                    mapas = []
-                    
-                    for row in results:
-                        mapa = Mapa(id_mapa=row[0], nome=row[1], turno=row[2])
-                        mapas.append(mapa)
-                    
-                    return mapas
+            return self.load_all()
         except Exception as e:
             print(f"Erro ao buscar mapas: {str(e)}")
             return []
+
+    def load_all(self) -> List[Mapa]:
+        """Retorna todos os mapas, propagando erros de banco"""
+        with connection_db() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id_mapa, nome, turno
+                    FROM mapa
+                    ORDER BY nome, turno
+                """)
+                
+                results = cursor.fetchall()
+                mapas = []
+                
+                for row in results:
+                    mapa = Mapa(id_mapa=row[0], nome=row[1], turno=row[2])
+                    mapas.append(mapa)
+                
+                return mapas
     
     def find_by_id(self, nome: str, turno: TurnoType) -> Optional[Mapa]:
         """Busca mapa por nome e turno"""
@@ -95,6 +105,7 @@ class MapaRepositoryImpl(MapaRepository):
                     """, (mapa.nome, mapa.turno.value))
                     result = cursor.fetchone()
                     conn.commit()
+                    bump_reference_version('mapa')
                     return Mapa(id_mapa=result[0], nome=result[1], turno=result[2])
         except Exception as e:
             if 'conn' in locals():
@@ -110,6 +121,8 @@ class MapaRepositoryImpl(MapaRepository):
                     cursor.execute("DELETE FROM mapa WHERE nome = %s AND turno = %s", (nome, turno.value))
                     deleted = cursor.rowcount > 0
                     conn.commit()
+                    if deleted:
+                        bump_reference_version('mapa')
                     return deleted
         except Exception as e:
             if 'conn' in locals():
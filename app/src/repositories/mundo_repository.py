@@ -21,6 +21,11 @@ class MundoRepository(ABC):
         """Atualiza o estado do mundo."""
         pass
 
+    @abstractmethod
+    def avancar_relogio(self, tempo_max_turno: int) -> Optional[Mundo]:
+        """Avança um tick (virando o turno ao fim dele) e retorna o novo estado."""
+        pass
+
 class MundoRepositoryImpl(MundoRepository):
     """Implementação PostgreSQL do MundoRepository - Adaptado para esquema da main"""
 
@@ -72,3 +77,47 @@ class MundoRepositoryImpl(MundoRepository):
         except Exception as e:
             print(f"Erro ao atualizar o estado do mundo: {str(e)}")
             return False
+
+    def avancar_relogio(self, tempo_max_turno: int) -> Optional[Mundo]:
+        """
+        Avança o relógio do mundo em um único UPDATE ... RETURNING.
+
+        O incremento e a troca de turno são calculados pelo banco a partir da
+        linha travada pelo UPDATE, então ações concorrentes (outros jogadores
+        ou processos) nunca perdem ticks, e cada tick custa uma ida ao banco.
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        """
+                        UPDATE Mundo
+                        SET ticks_no_turno = CASE
+                                WHEN ticks_no_turno + 1 >= %(max)s THEN 0
+                                ELSE ticks_no_turno + 1
+                            END,
+                            turno_atual = CASE
+                                WHEN ticks_no_turno + 1 < %(max)s THEN turno_atual
+                                WHEN turno_atual = 'Dia' THEN 'Noite'
+                                ELSE 'Dia'
+                            END
+                        WHERE id_mundo = 1
+                        RETURNING id_mundo, turno_atual, ticks_no_turno
+                        """,
+                        {"max": tempo_max_turno}
+                    )
+                    row = cursor.fetchone()
+                    conn.commit()
+
+                    if not row:
+                        print("ERRO: Estado do mundo não encontrado no banco de dados.")
+                        return None
+
+                    return Mundo(
+                        id_mundo=row[0],
+                        turno_atual=row[1],
+                        ticks_no_turno=row[2]
+                    )
+        except Exception as e:
+            print(f"Erro ao avançar o relógio do mundo: {str(e)}")
+            return None
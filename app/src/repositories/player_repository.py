@@ -2,11 +2,11 @@
 Implementação PostgreSQL do PlayerRepository
 """
 
-from typing import List, Optional
-from ..utils.db_helpers import connection_db
+from typing import Iterable, Iterator, List, Optional
+from psycopg2.extras import execute_values
+from ..utils.db_helpers import STREAM_ITERSIZE, connection_db
 from ..models.player import Player
 from abc import ABC, abstractmethod
-import re
 
 
 class PlayerRepository(ABC):
@@ -16,6 +16,11 @@ class PlayerRepository(ABC):
     def find_all(self) -> List[Player]:
         """Retorna todos os jogadores"""
         pass
+
+    @abstractmethod
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Player]:
+        """Percorre todos os jogadores sem carregá-los de uma vez na memória"""
+        pass
     
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Player]:
@@ -41,26 +46,54 @@ class PlayerRepository(ABC):
     def find_active_players(self) -> List[Player]:
         """Busca jogadores ativos"""
         pass
+    
+    @abstractmethod
+    def find_by_chunk(self, chunk_id: int) -> List[Player]:
+        """Busca jogadores em um chunk"""
+        pass
+    
+    @abstractmethod
+    def find_by_bioma(self, bioma_id: int) -> List[Player]:
+        """Busca jogadores em chunks de um bioma"""
+        pass
+    
+    @abstractmethod
+    def find_by_mapa(self, mapa_id: int) -> List[Player]:
+        """Busca jogadores em chunks de um mapa"""
+        pass
+    
+    @abstractmethod
+    def find_page(self, after_nome: Optional[str] = None, limit: int = 20) -> List[Player]:
+        """Busca uma página de jogadores em ordem de nome, após ``after_nome``"""
+        pass
+    
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[int]) -> List[Player]:
+        """Busca vários jogadores por ID em uma única consulta"""
+        pass
+    
+    @abstractmethod
+    def save_many(self, players: Iterable[Player]) -> int:
+        """Salva vários jogadores em uma única transação, retornando as linhas afetadas"""
+        pass
+    
+    @abstractmethod
+    def update_many(self, players: Iterable[Player]) -> List[int]:
+        """Atualiza vários jogadores já salvos em uma única transação, retornando os IDs gravados"""
+        pass
+    
+    @abstractmethod
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários jogadores em uma única transação, retornando as linhas afetadas"""
+        pass
 
 
 class PlayerRepositoryImpl(PlayerRepository):
     """Implementação PostgreSQL do PlayerRepository"""
     
-    def _extract_chunk_id_from_location(self, location: str) -> int:
-        """Extract chunk ID from location string like 'Mapa 1 - Chunk 364'"""
-        if not location:
-            return 1  # Default chunk
-            
-        # Try to extract chunk ID using regex
-        match = re.search(r'Chunk (\d+)', location)
-        if match:
-            return int(match.group(1))
-        
-        # If no match found, try to convert the entire string to int (backwards compatibility)
-        try:
-            return int(location)
-        except ValueError:
-            return 1  # Default chunk if conversion fails
+    def _validation_error(self, player: Player) -> Optional[str]:
+        """Retorna a mensagem de erro de validação do jogador, ou None se válido"""
+        return player.validation_error()
     
     def find_all(self) -> List[Player]:
         """Retorna todos os jogadores"""
@@ -96,6 +129,39 @@ class PlayerRepositoryImpl(PlayerRepository):
             print(f"Erro ao buscar jogadores: {str(e)}")
             return []
     
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[Player]:
+        """
+        Percorre todos os jogadores com um cursor no servidor
+
+        Só ``itersize`` linhas (padrão ``DB_ITERSIZE``) ficam na memória por
+        vez. A conexão fica emprestada até o fim da iteração; interromper o
+        laço (``break`` ou ``close()``) a devolve ao pool.
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor(name="iter_player") as cursor:
+                    cursor.itersize = itersize or STREAM_ITERSIZE
+                    cursor.execute("""
+                        SELECT id_player, nome, vida_maxima, vida_atual, forca,
+                               localizacao, nivel, experiencia, current_chunk_id
+                        FROM Player
+                        ORDER BY nome
+                    """)
+                    for row in cursor:
+                        yield Player(
+                            id_player=row[0],
+                            nome=row[1],
+                            vida_maxima=row[2],
+                            vida_atual=row[3],
+                            forca=row[4],
+                            localizacao=row[5] or "",
+                            nivel=row[6],
+                            experiencia=row[7],
+                            current_chunk_id=row[8]
+                        )
+        except Exception as e:
+            print(f"Erro ao percorrer jogadores: {str(e)}")
+
     def find_by_id(self, id: int) -> Optional[Player]:
         """Busca um jogador por ID"""
         try:
@@ -135,33 +201,9 @@ class PlayerRepositoryImpl(PlayerRepository):
     
     def save(self, player: Player) -> Player:
         """Salva um jogador no banco de dados"""
-        # Validações
-        if not player.nome or not player.nome.strip():
-            print("Nome do jogador não pode estar vazio")
-            return player
-        
-        if player.vida_atual < 0:
-            print("Vida atual não pode ser negativa")
-            return player
-        
-        if player.vida_maxima <= 0:
-            print("Vida máxima deve ser maior que zero")
-            return player
-        
-        if player.vida_atual > player.vida_maxima:
-            print("Vida atual não pode ser maior que vida máxima")
-            return player
-        
-        if player.forca < 0:
-            print("Força não pode ser negativa")
-            return player
-        
-        if player.nivel < 1:
-            print("Nível deve ser pelo menos 1")
-            return player
-        
-        if player.experiencia < 0:
-            print("Experiência não pode ser negativa")
+        erro = self._validation_error(player)
+        if erro:
+            print(erro)
             return player
         
         try:
@@ -180,7 +222,7 @@ class PlayerRepositoryImpl(PlayerRepository):
                 """
                 cursor.execute(query, (
                     player.nome, player.vida_maxima, player.vida_atual, 
-                    player.experiencia, player.forca, player.localizacao, self._extract_chunk_id_from_location(player.localizacao),
+                    player.experiencia, player.forca, player.localizacao, player.current_chunk_id,
                     player.id_player
                 ))
             else:
@@ -193,7 +235,7 @@ class PlayerRepositoryImpl(PlayerRepository):
                 """
                 cursor.execute(query, (
                     player.nome, player.vida_maxima, player.vida_atual, 
-                    player.experiencia, player.forca, player.nivel, player.localizacao, self._extract_chunk_id_from_location(player.localizacao)
+                    player.experiencia, player.forca, player.nivel, player.localizacao, player.current_chunk_id
                 ))
             
             result = cursor.fetchone()
@@ -217,6 +259,10 @@ class PlayerRepositoryImpl(PlayerRepository):
             return None
             
         except Exception as e:
+            if 'conn' in locals():
+                # Desfaz a transação (e marca a unidade de trabalho, se houver, como falha)
+                conn.rollback()
+                conn.close()
             print(f"Erro ao salvar jogador: {str(e)}")
             return player
     
@@ -316,4 +362,217 @@ class PlayerRepositoryImpl(PlayerRepository):
             
         except Exception as e:
             print(f"Erro ao buscar jogadores ativos: {str(e)}")
-            return [] 
+            return []
+    
+    def _select_players(self, erro: str, where: Optional[str] = None, params: tuple = (),
+                        join: str = "", limit: Optional[int] = None) -> List[Player]:
+        """
+        Busca jogadores em ordem de nome
+        
+        Args:
+            erro: Mensagem impressa se a consulta falhar
+            where: Condição sobre ``p`` (e ``c``, com a junção em chunk)
+            params: Parâmetros da condição
+            join: Junção opcional, ex.: chunk da localização
+            limit: Máximo de jogadores
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"""
+                        SELECT p.id_player, p.nome, p.vida_maxima, p.vida_atual, p.forca,
+                               p.localizacao, p.nivel, p.experiencia, p.current_chunk_id
+                        FROM Player p
+                        {join}
+                        {f"WHERE {where}" if where else ""}
+                        ORDER BY p.nome
+                        {"LIMIT %s" if limit is not None else ""}
+                    """, params + ((limit,) if limit is not None else ()))
+                    return [
+                        Player(
+                            id_player=row[0],
+                            nome=row[1],
+                            vida_maxima=row[2],
+                            vida_atual=row[3],
+                            forca=row[4],
+                            localizacao=row[5] or "",
+                            nivel=row[6],
+                            experiencia=row[7],
+                            current_chunk_id=row[8]
+                        )
+                        for row in cursor.fetchall()
+                    ]
+        except Exception as e:
+            print(f"{erro}: {str(e)}")
+            return []
+    
+    def find_by_chunk(self, chunk_id: int) -> List[Player]:
+        """Busca jogadores em um chunk (índice idx_player_chunk)"""
+        return self._select_players(f"Erro ao buscar jogadores no chunk {chunk_id}",
+                                    "p.current_chunk_id = %s", (chunk_id,))
+    
+    def find_by_bioma(self, bioma_id: int) -> List[Player]:
+        """Busca jogadores em chunks de um bioma"""
+        return self._select_players(f"Erro ao buscar jogadores no bioma {bioma_id}",
+                                    "c.id_bioma = %s", (bioma_id,),
+                                    join="JOIN chunk c ON c.id_chunk = p.current_chunk_id")
+    
+    def find_by_mapa(self, mapa_id: int) -> List[Player]:
+        """Busca jogadores em chunks de um mapa"""
+        return self._select_players(f"Erro ao buscar jogadores no mapa {mapa_id}",
+                                    "c.id_mapa = %s", (mapa_id,),
+                                    join="JOIN chunk c ON c.id_chunk = p.current_chunk_id")
+    
+    def find_page(self, after_nome: Optional[str] = None, limit: int = 20) -> List[Player]:
+        """
+        Retorna até ``limit`` jogadores em ordem de nome, após ``after_nome``
+        
+        Paginação por chave (keyset): a página seguinte começa depois do nome
+        do último jogador da anterior, percorrendo o índice único de nome sem
+        OFFSET, então o custo não cresce com o número da página.
+        """
+        if after_nome is None:
+            return self._select_players("Erro ao buscar a primeira página de jogadores", limit=limit)
+        return self._select_players(f"Erro ao buscar a página de jogadores após '{after_nome}'",
+                                    "p.nome > %s", (after_nome,), limit=limit)
+    
+    def find_by_ids(self, ids: Iterable[int]) -> List[Player]:
+        """Busca vários jogadores por ID em uma única consulta"""
+        ids = list(ids)
+        if not ids:
+            return []
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT id_player, nome, vida_maxima, vida_atual, forca,
+                               localizacao, nivel, experiencia, current_chunk_id
+                        FROM Player
+                        WHERE id_player = ANY(%s)
+                        ORDER BY id_player
+                    """, (ids,))
+                    return [
+                        Player(
+                            id_player=row[0],
+                            nome=row[1],
+                            vida_maxima=row[2],
+                            vida_atual=row[3],
+                            forca=row[4],
+                            localizacao=row[5] or "",
+                            nivel=row[6],
+                            experiencia=row[7],
+                            current_chunk_id=row[8]
+                        )
+                        for row in cursor.fetchall()
+                    ]
+        except Exception as e:
+            print(f"Erro ao buscar jogadores {ids}: {str(e)}")
+            return []
+    
+    def save_many(self, players: Iterable[Player]) -> int:
+        """
+        Salva vários jogadores em uma única transação
+        
+        Jogadores com id_player são atualizados em um único UPDATE ... FROM (VALUES ...);
+        os demais são inseridos em um único INSERT e recebem o ID gerado.
+        Se algum jogador for inválido, nada é gravado.
+        
+        Returns:
+            Número de linhas afetadas
+        """
+        players = list(players)
+        if not players:
+            return 0
+        for player in players:
+            erro = self._validation_error(player)
+            if erro:
+                print(f"{erro} (jogador '{player.nome}')")
+                return 0
+        
+        updates = [p for p in players if p.id_player]
+        inserts = [p for p in players if not p.id_player]
+        
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    affected = 0
+                    if updates:
+                        affected += len(self._update_rows(cursor, updates))
+                    if inserts:
+                        result = execute_values(cursor, """
+                            INSERT INTO Player (nome, vida_maxima, vida_atual, experiencia, forca, nivel, localizacao, current_chunk_id)
+                            VALUES %s
+                            RETURNING id_player
+                        """, [
+                            (p.nome, p.vida_maxima, p.vida_atual, p.experiencia, p.forca, p.nivel,
+                             p.localizacao, p.current_chunk_id)
+                            for p in inserts
+                        ], page_size=len(inserts), fetch=True)
+                        # Uma única página: os IDs voltam na ordem dos VALUES
+                        for player, row in zip(inserts, result):
+                            player.id_player = row[0]
+                        affected += len(result)
+                    conn.commit()
+                    return affected
+        except Exception as e:
+            if 'conn' in locals():
+                conn.rollback()
+            print(f"Erro ao salvar jogadores em lote: {str(e)}")
+            return 0
+    
+    def update_many(self, players: Iterable[Player]) -> List[int]:
+        """
+        Atualiza vários jogadores já salvos em uma única transação
+        
+        Diferente de ``save_many``, não valida nem engole erros: uma exceção
+        do banco chega a quem chamou, que decide o que tentar de novo.
+        
+        Returns:
+            IDs dos jogadores gravados (jogadores removidos do banco ficam de fora)
+        """
+        players = list(players)
+        if not players:
+            return []
+        with connection_db() as conn:
+            with conn.cursor() as cursor:
+                ids = self._update_rows(cursor, players)
+            conn.commit()
+            return ids
+    
+    @staticmethod
+    def _update_rows(cursor, players: List[Player]) -> List[int]:
+        """UPDATE ... FROM (VALUES ...) dos jogadores, retornando os IDs atualizados"""
+        result = execute_values(cursor, """
+            UPDATE Player AS p
+            SET nome = v.nome, vida_maxima = v.vida_maxima, vida_atual = v.vida_atual,
+                experiencia = v.experiencia, forca = v.forca,
+                localizacao = v.localizacao, current_chunk_id = v.current_chunk_id
+            FROM (VALUES %s) AS v(id_player, nome, vida_maxima, vida_atual,
+                                  experiencia, forca, localizacao, current_chunk_id)
+            WHERE p.id_player = v.id_player
+            RETURNING p.id_player
+        """, [
+            (p.id_player, p.nome, p.vida_maxima, p.vida_atual, p.experiencia,
+             p.forca, p.localizacao, p.current_chunk_id)
+            for p in players
+        ], template="(%s::int, %s::varchar, %s::int, %s::int, %s::int, %s::int, %s::varchar, %s::int)",
+           page_size=len(players), fetch=True)
+        return [row[0] for row in result]
+    
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Deleta vários jogadores em uma única transação, retornando as linhas afetadas"""
+        ids = list(ids)
+        if not ids:
+            return 0
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("DELETE FROM Player WHERE id_player = ANY(%s)", (ids,))
+                    deleted = cursor.rowcount
+                    conn.commit()
+                    return deleted
+        except Exception as e:
+            if 'conn' in locals():
+                conn.rollback()
+            print(f"Erro ao deletar jogadores {ids}: {str(e)}")
+            return 0
@@ -0,0 +1,103 @@
+"""
+Implementação PostgreSQL do PlayerViewRepository
+Monta a visão do jogador (chunk atual, bioma, mapa e vizinhos) em uma única consulta
+"""
+
+from typing import Optional
+from ..utils.db_helpers import connection_db
+from ..models.chunk import Chunk
+from ..models.mapa import Mapa
+from ..models.player import Player
+from ..models.player_view import ChunkView, PlayerView
+from abc import ABC, abstractmethod
+
+
+class PlayerViewRepository(ABC):
+    """Interface para repositório de PlayerView"""
+
+    @abstractmethod
+    def find_by_player(self, player_id: int, chunk_id: Optional[int] = None) -> Optional[PlayerView]:
+        """Busca a visão do jogador no chunk informado (ou no seu current_chunk_id)"""
+        pass
+
+
+class PlayerViewRepositoryImpl(PlayerViewRepository):
+    """Implementação PostgreSQL do PlayerViewRepository"""
+
+    def find_by_player(self, player_id: int, chunk_id: Optional[int] = None) -> Optional[PlayerView]:
+        """
+        Busca a visão do jogador com uma única ida ao banco
+
+        Junta Player, chunk, bioma e mapa, e traz os vizinhos (x±1, y±1 no mesmo
+        mapa) com os nomes dos seus biomas: uma linha por vizinho.
+
+        Args:
+            player_id: ID do jogador
+            chunk_id: Chunk a exibir; por padrão o current_chunk_id do jogador
+
+        Returns:
+            PlayerView ou None se o jogador não existir
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT p.id_player, p.nome, p.vida_maxima, p.vida_atual, p.forca,
+                               p.localizacao, p.nivel, p.experiencia, p.current_chunk_id,
+                               c.id_chunk, c.id_bioma, c.id_mapa, c.x, c.y, b.nome,
+                               m.nome, m.turno,
+                               n.id_chunk, n.id_bioma, n.id_mapa, n.x, n.y, nb.nome
+                        FROM Player p
+                        LEFT JOIN chunk c ON c.id_chunk = COALESCE(%s, p.current_chunk_id)
+                        LEFT JOIN bioma b ON b.id_bioma = c.id_bioma
+                        LEFT JOIN mapa m ON m.id_mapa = c.id_mapa
+                        LEFT JOIN chunk n ON n.id_mapa = c.id_mapa
+                             AND (n.x, n.y) IN ((c.x, c.y - 1), (c.x, c.y + 1),
+                                                (c.x - 1, c.y), (c.x + 1, c.y))
+                        LEFT JOIN bioma nb ON nb.id_bioma = n.id_bioma
+                        WHERE p.id_player = %s
+                        ORDER BY CASE
+                            WHEN n.y < c.y THEN 0
+                            WHEN n.y > c.y THEN 1
+                            WHEN n.x < c.x THEN 2
+                            ELSE 3
+                        END
+                    """, (chunk_id, player_id))
+
+                    rows = cursor.fetchall()
+                    if not rows:
+                        return None
+
+                    first = rows[0]
+                    view = PlayerView(player=Player(
+                        id_player=first[0],
+                        nome=first[1],
+                        vida_maxima=first[2],
+                        vida_atual=first[3],
+                        forca=first[4],
+                        localizacao=first[5] or "",
+                        nivel=first[6],
+                        experiencia=first[7],
+                        current_chunk_id=first[8]
+                    ))
+
+                    if first[9] is not None:
+                        view.atual = ChunkView(
+                            chunk=Chunk(id_chunk=first[9], id_bioma=first[10], id_mapa=first[11],
+                                        x=first[12], y=first[13]),
+                            bioma_nome=first[14]
+                        )
+                        view.mapa = Mapa(id_mapa=first[11], nome=first[15], turno=first[16])
+
+                    for row in rows:
+                        if row[17] is not None:
+                            view.vizinhos.append(ChunkView(
+                                chunk=Chunk(id_chunk=row[17], id_bioma=row[18], id_mapa=row[19],
+                                            x=row[20], y=row[21]),
+                                bioma_nome=row[22]
+                            ))
+
+                    return view
+        except Exception as e:
+            print(f"Erro ao buscar visão do jogador {player_id}: {str(e)}")
+            return None
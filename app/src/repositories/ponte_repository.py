@@ -1,8 +1,19 @@
+import re
+import threading
 from typing import List, Optional
 from ..utils.db_helpers import connection_db
+from ..utils.reference_cache import bump_reference_version
+from ..utils.bridge_index import BridgeIndex
+from ..utils.unit_of_work import on_commit
 from ..models.ponte import Ponte
 from abc import ABC, abstractmethod
 
+def _chunk_id(valor) -> Optional[int]:
+    """ID do chunk a partir da referência textual da tabela pontes"""
+    encontrado = re.search(r"(\d+)$", str(valor).strip())
+    return int(encontrado.group(1)) if encontrado else None
+
+
 # Interface abstrata para o repositório de Pontes
 class PonteRepository(ABC):
 
@@ -26,52 +37,111 @@ class PonteRepository(ABC):
         """Desativa uma ponte (ativa = False)"""
         pass
 
+    @abstractmethod
+    def get_index(self) -> BridgeIndex:
+        """Retorna o índice em memória das pontes ativas"""
+        pass
+
 class PonteRepositoryImpl(PonteRepository):
 
+    # Índice das pontes ativas compartilhado por todas as instâncias do processo
+    _index: Optional[BridgeIndex] = None
+    _index_lock = threading.Lock()
+
+    def get_index(self) -> BridgeIndex:
+        """
+        Retorna o índice das pontes ativas, carregando-o na primeira chamada
+
+        Depois da carga, ``inserir`` e ``desativar`` atualizam o índice no
+        lugar, sem reler a tabela.
+        """
+        index = PonteRepositoryImpl._index
+        if index is not None:
+            return index
+        with PonteRepositoryImpl._index_lock:
+            if PonteRepositoryImpl._index is None:
+                try:
+                    pontes = self._buscar_ativas()
+                except Exception as e:
+                    # Falha de leitura: não memoriza o índice vazio
+                    print(f"Erro ao carregar índice de pontes: {str(e)}")
+                    return BridgeIndex()
+                PonteRepositoryImpl._index = BridgeIndex(pontes)
+            return PonteRepositoryImpl._index
+
+    @classmethod
+    def invalidate_index(cls) -> None:
+        """Descarta o índice de pontes (recarregado no próximo get_index)"""
+        cls._index = None
+        bump_reference_version('ponte')
+
     def inserir(self, ponte: Ponte) -> Ponte:
         query = """
-        INSERT INTO pontes (origem, destino, comprimento, largura, material, ativa)
-        VALUES (%s, %s, %s, %s, %s, %s)
+        INSERT INTO pontes (chunk_origem, chunk_destino, construida)
+        VALUES (%s, %s, %s)
         RETURNING id;
         """
         with connection_db() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (
-                    ponte.origem,
-                    ponte.destino,
-                    ponte.comprimento,
-                    ponte.largura,
-                    ponte.material,
-                    ponte.ativa
-                ))
+                cur.execute(query, (str(ponte.chunk_origem), str(ponte.chunk_destino), ponte.ativa))
                 ponte.id = cur.fetchone()[0]
+                conn.commit()
+        # Dentro de uma UnitOfWork, o índice só muda se a unidade for confirmada
+        on_commit(lambda: self._indexar(ponte))
         return ponte
 
-    def listar_ativas(self) -> List[Ponte]:
+    @staticmethod
+    def _indexar(ponte: Ponte) -> None:
+        with PonteRepositoryImpl._index_lock:
+            if PonteRepositoryImpl._index is not None:
+                PonteRepositoryImpl._index.add(ponte)
+        bump_reference_version('ponte')
+
+    def _buscar_ativas(self) -> List[Ponte]:
         query = """
-        SELECT id, origem, destino, comprimento, largura, material, ativa
+        SELECT id, chunk_origem, chunk_destino
         FROM pontes
-        WHERE ativa = TRUE
+        WHERE construida = TRUE
         """
         with connection_db() as conn:
             with conn.cursor() as cur:
                 cur.execute(query)
-                rows = cur.fetchall()
-                return [Ponte(*row) for row in rows]
+                pontes = []
+                for id_ponte, origem, destino in cur.fetchall():
+                    origem, destino = _chunk_id(origem), _chunk_id(destino)
+                    if origem is not None and destino is not None:
+                        pontes.append(Ponte(id_ponte, origem, destino, ativa=True))
+                return pontes
 
-    def existe_ponte_entre(self, origem: int, destino: int) -> bool:
-        query = """
-        SELECT 1 FROM pontes
-        WHERE origem = %s AND destino = %s AND ativa = TRUE
-        LIMIT 1
+    def listar_ativas(self) -> List[Ponte]:
         """
-        with connection_db() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, (origem, destino))
-                return cur.fetchone() is not None
+        Lista as pontes já construídas
+
+        A tabela guarda os chunks como texto (ex.: '42' ou 'Chunk-042');
+        pontes cujas pontas não identificam um chunk são ignoradas.
+        """
+        try:
+            return self._buscar_ativas()
+        except Exception as e:
+            print(f"Erro ao listar pontes ativas: {str(e)}")
+            return []
+
+    def existe_ponte_entre(self, origem: int, destino: int) -> bool:
+        """Verifica se há ponte ativa de ``origem`` para ``destino`` (no índice em memória)"""
+        return self.get_index().existe(origem, destino, bidirecional=False)
 
     def desativar(self, id_ponte: int) -> None:
-        query = "UPDATE pontes SET ativa = FALSE WHERE id = %s"
+        query = "UPDATE pontes SET construida = FALSE WHERE id = %s"
         with connection_db() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (id_ponte,))
\ No newline at end of file
+                cur.execute(query, (id_ponte,))
+                conn.commit()
+        on_commit(lambda: self._desindexar(id_ponte))
+
+    @staticmethod
+    def _desindexar(id_ponte: int) -> None:
+        with PonteRepositoryImpl._index_lock:
+            if PonteRepositoryImpl._index is not None:
+                PonteRepositoryImpl._index.remove(id_ponte)
+        # Rotas calculadas com a ponte deixam de valer
+        bump_reference_version('ponte')
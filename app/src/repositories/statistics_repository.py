@@ -0,0 +1,77 @@
+"""
+Implementação PostgreSQL do StatisticsRepository
+Estatísticas agregadas do mundo calculadas no banco (COUNT/GROUP BY),
+sem carregar mapas, chunks ou jogadores na memória
+"""
+
+from typing import Any, Dict
+from ..utils.db_helpers import connection_db
+from abc import ABC, abstractmethod
+
+
+class StatisticsRepository(ABC):
+    """Interface para repositório de estatísticas"""
+
+    @abstractmethod
+    def get_map_statistics(self) -> Dict[str, Any]:
+        """Retorna totais de mapas, chunks e jogadores e os chunks por turno"""
+        pass
+
+
+class StatisticsRepositoryImpl(StatisticsRepository):
+    """Implementação PostgreSQL do StatisticsRepository"""
+
+    @staticmethod
+    def _empty_statistics() -> Dict[str, Any]:
+        return {
+            "total_mapas": 0,
+            "total_chunks": 0,
+            "total_jogadores": 0,
+            "jogadores_ativos": 0,
+            "jogadores_mortos": 0,
+            "chunks_por_turno": {}
+        }
+
+    def get_map_statistics(self) -> Dict[str, Any]:
+        """
+        Calcula as estatísticas do mundo com duas consultas agregadas
+
+        O custo em memória é constante: só os totais e uma linha por turno
+        voltam do banco, independente do número de chunks e jogadores.
+
+        Returns:
+            Dicionário com total_mapas, total_chunks, total_jogadores,
+            jogadores_ativos, jogadores_mortos e chunks_por_turno
+        """
+        try:
+            with connection_db() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT (SELECT COUNT(*) FROM mapa),
+                               (SELECT COUNT(*) FROM chunk),
+                               COUNT(*),
+                               COUNT(*) FILTER (WHERE vida_atual > 0)
+                        FROM player
+                    """)
+                    total_mapas, total_chunks, total_jogadores, ativos = cursor.fetchone()
+
+                    cursor.execute("""
+                        SELECT m.turno, COUNT(*)
+                        FROM chunk c
+                        JOIN mapa m ON c.id_mapa = m.id_mapa
+                        GROUP BY m.turno
+                        ORDER BY m.turno
+                    """)
+                    chunks_por_turno = {turno: total for turno, total in cursor.fetchall()}
+
+                    return {
+                        "total_mapas": total_mapas,
+                        "total_chunks": total_chunks,
+                        "total_jogadores": total_jogadores,
+                        "jogadores_ativos": ativos,
+                        "jogadores_mortos": total_jogadores - ativos,
+                        "chunks_por_turno": chunks_por_turno
+                    }
+        except Exception as e:
+            print(f"Erro ao calcular estatísticas do mapa: {str(e)}")
+            return self._empty_statistics()
@@ -3,6 +3,8 @@ Service layer que usa repositories para lógica de negócio
 Demonstra o uso do Repository Pattern e Singleton
 """
 
+import os
+import time
 from typing import List, Optional, Dict, Any
 from abc import ABC, abstractmethod
 from ..repositories import (
@@ -12,8 +14,16 @@ from ..repositories import (
     PlayerRepositoryImpl,
     FantasmaRepositoryImpl,
     TotemRepositoryImpl,
-    PonteRepositoryImpl
+    PonteRepositoryImpl,
+    PlayerViewRepositoryImpl,
+    StatisticsRepositoryImpl
 )
+from ..repositories.item_repository import ItemRepositoryImpl
+from ..utils.reference_cache import ReferenceDataCache
+from ..utils import shared_world
+from ..utils.player_state_buffer import PlayerStateBuffer
+from ..utils.unit_of_work import UnitOfWork, UnitOfWorkError
+from ..utils.pathfinding import Pathfinder, RouteGraph, Rota, bioma_costs
 from ..models.mapa import Mapa, TurnoType
 from ..models.player import Player
 from ..models.chunk import Chunk
@@ -26,6 +36,10 @@ try:
 except ImportError:
     MUNDO_AVAILABLE = False
 
+# Por quanto tempo (segundos) o estado do mundo lido ou avançado por este
+# processo é reaproveitado em get_mundo_estado
+MUNDO_CACHE_TTL = float(os.getenv("MUNDO_CACHE_TTL", "1"))
+
 from ..models.fantasma import Fantasma
 from ..models.totem import Totem 
 from ..models.ponte import Ponte
@@ -77,6 +91,16 @@ class GameService(ABC):
     def get_all_pontes(self) -> List[Dict[str, Any]]:
         pass
 
+    @abstractmethod
+    def find_route(self, origem: int, destino: int) -> Optional[Rota]:
+        """Rota de menor custo entre dois chunks do mesmo mapa"""
+        pass
+
+    @abstractmethod
+    def travel_player_to_chunk(self, player_id: int, chunk_id: int) -> Dict[str, Any]:
+        """Leva o jogador até o chunk pela melhor rota, em uma única gravação"""
+        pass
+
 class GameServiceImpl(GameService):
     """
     Implementação Singleton do GameService
@@ -95,17 +119,37 @@ class GameServiceImpl(GameService):
             self.chunk_repository = ChunkRepositoryImpl()
             self.mapa_repository = MapaRepositoryImpl()
             self.player_repository = PlayerRepositoryImpl()
+            self.item_repository = ItemRepositoryImpl()
+            self.player_view_repository = PlayerViewRepositoryImpl()
+            self.statistics_repository = StatisticsRepositoryImpl()
+            
+            # Cache das tabelas de referência (Bioma, Mapa, Item), carregado na inicialização
+            fontes = (self.bioma_repository, self.mapa_repository, self.item_repository)
+            if shared_world.SHARED_WORLD_NAME:
+                # Com o mundo publicado em memória compartilhada, as tabelas vêm de lá
+                fontes = tuple(shared_world.SharedReferenceSource(table, repository)
+                               for table, repository in zip(("bioma", "mapa", "item"), fontes))
+            self.reference_cache = ReferenceDataCache(*fontes)
+            self.reference_cache.load()
+            
+            # Alterações de jogadores são acumuladas e gravadas em lote (write-behind)
+            self.player_state_buffer = PlayerStateBuffer(self.player_repository)
             
             # Inicializa repositório do mundo se disponível
             if MUNDO_AVAILABLE:
                 self.mundo_repository = MundoRepositoryImpl()
                 self.TEMPO_MAX_TURNO = 20  # Turno dura 20 ações
+                self._mundo_cache = None
+                self._mundo_cache_em = 0.0
             else:
                 self.mundo_repository = None
                 
             self.fantasma_repository = FantasmaRepositoryImpl()
             self.totem_repository = TotemRepositoryImpl()  
             self.ponte_repository = PonteRepositoryImpl()
+            
+            # Rotas entre chunks, com os grafos de cada mapa montados sob demanda
+            self.pathfinder = Pathfinder(self._route_graph)
             GameServiceImpl._initialized = True
 
     @classmethod
@@ -124,22 +168,19 @@ class GameServiceImpl(GameService):
         if not mapa:
             return {"error": "Mapa não encontrado"}
         
-        chunks = self.chunk_repository.find_by_mapa(mapa_nome, turno.value)
-        bioma_distribution = {}
-        
-        for chunk in chunks:
-            bioma = chunk.id_bioma
-            bioma_distribution[bioma] = bioma_distribution.get(bioma, 0) + 1
+        # Contagem agregada no banco; só os 10 primeiros chunks são carregados
+        bioma_distribution = self.chunk_repository.count_by_bioma(mapa_nome, turno.value)
+        amostra = self.chunk_repository.find_by_mapa(mapa_nome, turno.value, limit=10)
         return {
             "nome": mapa.nome,
             "turno": mapa.turno.value,
-            "total_chunks": len(chunks),
+            "total_chunks": sum(bioma_distribution.values()),
             "distribuicao_biomas": bioma_distribution,
-            "chunks": [chunk.id_chunk for chunk in chunks[:10]]
+            "chunks": [chunk.id_chunk for chunk in amostra]
         }
 
     def get_player_status(self, player_id: int) -> Dict[str, Any]:
-        player = self.player_repository.find_by_id(player_id)
+        player = self.get_player(player_id)
         if not player:
             return {"error": "Jogador não encontrado"}
 
@@ -151,15 +192,29 @@ class GameServiceImpl(GameService):
             "vida_maxima": player.vida_maxima,
             "vida_percentual": round(vida_percentual, 1),
             "forca": player.forca,
-            "localizacao": player.localizacao,
+            "localizacao": player.localizacao_display,
+            "current_chunk_id": player.current_chunk_id,
             "nivel": player.nivel,
             "experiencia": player.experiencia,
             "status": "Vivo" if player.vida_atual > 0 else "Morto"
         }
 
+    def get_player(self, player_id: int) -> Optional[Player]:
+        """Busca jogador considerando as alterações ainda pendentes no buffer"""
+        player = self.player_state_buffer.get(player_id)
+        if player is not None:
+            return player
+        return self.player_repository.find_by_id(player_id)
+
     def move_player_to_chunk(self, player_id: int, chunk_id: int) -> Dict[str, Any]:
-        player = self.player_repository.find_by_id(player_id)
-        chunk = self.chunk_repository.find_by_id(chunk_id)
+        # Leituras do jogador e do chunk na mesma conexão
+        try:
+            with UnitOfWork():
+                player = self.get_player(player_id)
+                chunk = self.chunk_repository.find_by_id(chunk_id)
+        except UnitOfWorkError as e:
+            print(f"Erro ao mover jogador {player_id}: {str(e)}")
+            return {"error": "Falha ao buscar jogador ou chunk"}
 
         if not player:
             return {"error": "Jogador não encontrado"}
@@ -167,15 +222,18 @@ class GameServiceImpl(GameService):
         if not chunk:
             return {"error": "Chunk não encontrado"}
 
-        player.localizacao = f"Mapa {chunk.id_mapa} - Chunk {chunk.id_chunk}"
-        updated_player = self.player_repository.save(player)
+        player.move_to(chunk.id_chunk, chunk.id_mapa)
+        # Gravado no próximo flush do buffer, junto com os demais jogadores
+        self.player_state_buffer.mark_dirty(player)
+        updated_player = player
         return {
             "success": True,
             "message": f"Jogador {player.nome} movido para {player.localizacao}",
             "player": {
                 "id": updated_player.id_player,
                 "nome": updated_player.nome,
-                "localizacao": updated_player.localizacao
+                "localizacao": updated_player.localizacao,
+                "current_chunk_id": updated_player.current_chunk_id
             },
             "chunk": {
                 "id": chunk.id_chunk,
@@ -185,70 +243,118 @@ class GameServiceImpl(GameService):
             }
         }
 
-    def get_players_in_bioma(self, bioma_id: int) -> List[Dict[str, Any]]:
-        players_in_bioma = []
-        chunks = self.chunk_repository.find_by_bioma(bioma_id)
-        players = self.player_repository.find_all()
-
-        for player in players:
-            for chunk in chunks:
-                if f"Chunk {chunk.id_chunk}" in player.localizacao:
-                    players_in_bioma.append({
-                        "id": player.id_player,
-                        "nome": player.nome,
-                        "localizacao": player.localizacao,
-                        "vida_atual": player.vida_atual,
-                        "nivel": player.nivel
-                    })
-                    break
-        return players_in_bioma
+    def _route_graph(self, id_mapa: int) -> Optional[RouteGraph]:
+        """Monta o grafo de movimento de um mapa (chunks em colunas, custos e pontes)"""
+        world = shared_world.current_world('chunk')
+        if world is not None:
+            store = world.store
+        else:
+            mapa = self.reference_cache.get_mapa(id_mapa)
+            if not mapa:
+                return None
+            store = self.chunk_repository.find_store_by_mapa(mapa.nome, mapa.turno.value)
+        custos = bioma_costs(self.reference_cache.biomas.all())
+        return RouteGraph(store, id_mapa, custos, self.ponte_repository.get_index().pontes())
+
+    def find_route(self, origem: int, destino: int) -> Optional[Rota]:
+        # O mapa da origem sai dos grafos de rota já montados; só no primeiro uso do mapa
+        # é preciso uma leitura pela chave (sem carregar o índice de todos os chunks)
+        id_mapa = self.pathfinder.mapa_of(origem)
+        if id_mapa is None:
+            inicio = self.chunk_repository.find_by_id(origem)
+            if inicio is None:
+                return None
+            id_mapa = inicio.id_mapa
+        return self.pathfinder.route(id_mapa, origem, destino)
+
+    def travel_player_to_chunk(self, player_id: int, chunk_id: int) -> Dict[str, Any]:
+        player = self.get_player(player_id)
+        if not player:
+            return {"error": "Jogador não encontrado"}
 
-    def get_map_statistics(self) -> Dict[str, Any]:
-        mapas = self.mapa_repository.find_all()
-        chunks = self.chunk_repository.find_all()
-        players = self.player_repository.find_all()
-
-        total_chunks = len(chunks)
-        total_players = len(players)
-        active_players = len([p for p in players if p.vida_atual > 0])
-
-        chunks_por_turno = {}
-        for chunk in chunks:
-            # Como não temos mais id_mapa_turno, vamos buscar o turno do mapa
-            mapa = next((m for m in mapas if m.id_mapa == chunk.id_mapa), None)
-            if mapa:
-                turno = mapa.turno.value
-                chunks_por_turno[turno] = chunks_por_turno.get(turno, 0) + 1
+        chunk = self.chunk_repository.find_by_id(chunk_id)
+        if not chunk:
+            return {"error": "Chunk não encontrado"}
+        if not player.current_chunk_id:
+            return {"error": "Jogador sem localização"}
+
+        rota = self.find_route(player.current_chunk_id, chunk_id)
+        if rota is None:
+            return {"error": "Não há caminho até o chunk"}
+
+        # A rota inteira vira um único estado pendente no buffer (uma linha no próximo flush)
+        player.move_to(chunk.id_chunk, chunk.id_mapa)
+        self.player_state_buffer.mark_dirty(player)
         return {
-            "total_mapas": len(mapas),
-            "total_chunks": total_chunks,
-            "total_jogadores": total_players,
-            "jogadores_ativos": active_players,
-            "jogadores_mortos": total_players - active_players,
-            "chunks_por_turno": chunks_por_turno
+            "success": True,
+            "message": f"Jogador {player.nome} viajou {rota.passos} chunks até {player.localizacao}",
+            "rota": rota.chunks,
+            "passos": rota.passos,
+            "custo": rota.custo,
+            "player": {
+                "id": player.id_player,
+                "nome": player.nome,
+                "localizacao": player.localizacao,
+                "current_chunk_id": player.current_chunk_id
+            },
+            "chunk": {
+                "id": chunk.id_chunk,
+                "bioma": chunk.id_bioma,
+                "mapa": chunk.id_mapa
+            }
         }
 
+    def get_players_in_bioma(self, bioma_id: int) -> List[Dict[str, Any]]:
+        # Movimentos pendentes no buffer precisam estar no banco antes da junção
+        self.player_state_buffer.flush()
+        return [
+            {
+                "id": player.id_player,
+                "nome": player.nome,
+                "localizacao": player.localizacao_display,
+                "current_chunk_id": player.current_chunk_id,
+                "vida_atual": player.vida_atual,
+                "nivel": player.nivel
+            }
+            for player in self.player_repository.find_by_bioma(bioma_id)
+        ]
+
+    def get_map_statistics(self) -> Dict[str, Any]:
+        # Jogadores pendentes no buffer precisam estar no banco antes da contagem
+        self.player_state_buffer.flush()
+        return self.statistics_repository.get_map_statistics()
+
     def create_new_player(self, nome: str, localizacao: str = "1") -> Dict[str, Any]:
-        # O chunk 1 é o inicial do deserto (ver docs/database.rst)
-        existing = [p for p in self.player_repository.find_all() if p.nome == nome]
-        if existing:
-            return {"error": "Nome de jogador já existe"}
-        
-        # Get the chunk to format the location properly
-        chunk = self.chunk_repository.find_by_id(1)  # Chunk 1 (Deserto)
-        initial_location = f"Mapa {chunk.id_mapa} - Chunk {chunk.id_chunk}" if chunk else "1"
-        
-        player = Player(
-            id_player=0,  # Será definido pelo repository
-            nome=nome,
-            vida_maxima=100,
-            vida_atual=100,
-            forca=10,
-            localizacao=initial_location,  # Use proper format
-            nivel=1,
-            experiencia=0
-        )
-        saved = self.player_repository.save(player)
+        # A busca por nome só poupa o INSERT no caso comum: em READ COMMITTED
+        # ela não impede dois creates simultâneos com o mesmo nome. Quem
+        # garante a unicidade é o UNIQUE(nome) da tabela, tratado abaixo
+        try:
+            with UnitOfWork():
+                if self.player_repository.find_by_name(nome) is not None:
+                    return {"error": "Nome de jogador já existe"}
+                
+                # O chunk 1 é o inicial do deserto (ver docs/database.rst)
+                chunk = self.chunk_repository.find_by_id(1)
+                
+                player = Player(
+                    id_player=0,  # Será definido pelo repository
+                    nome=nome,
+                    vida_maxima=100,
+                    vida_atual=100,
+                    forca=10,
+                    localizacao="",
+                    nivel=1,
+                    experiencia=0
+                )
+                player.move_to(1, chunk.id_mapa if chunk else None)
+                saved = self.player_repository.save(player)
+        except UnitOfWorkError as e:
+            # INSERT recusado pelo UNIQUE(nome): outro create com o mesmo nome
+            # foi confirmado primeiro
+            if self.player_repository.find_by_name(nome) is not None:
+                return {"error": "Nome de jogador já existe"}
+            print(f"Erro ao criar jogador '{nome}': {str(e)}")
+            return {"error": "Falha ao criar jogador"}
         return {
             "success": True,
             "player": {
@@ -259,7 +365,8 @@ class GameServiceImpl(GameService):
                 "forca": saved.forca,
                 "nivel": saved.nivel,
                 "experiencia": saved.experiencia,
-                "localizacao": saved.localizacao
+                "localizacao": saved.localizacao,
+                "current_chunk_id": saved.current_chunk_id
             }
         }
     
@@ -276,13 +383,14 @@ class GameServiceImpl(GameService):
         ]
 
     def get_all_pontes(self) -> List[Dict[str, Any]]:
-        pontes = self.ponte_repository.find_all()
+        # Pontes ativas servidas pelo índice em memória
+        pontes = self.ponte_repository.get_index().pontes()
         return [
             {
-                "id": ponte.id_ponte,
+                "id": ponte.id,
                 "chunk_origem": ponte.chunk_origem,
                 "chunk_destino": ponte.chunk_destino,
-                "durabilidade": ponte.durabilidade
+                "ativa": ponte.ativa
             }
             for ponte in pontes
         ]
@@ -335,12 +443,24 @@ class GameServiceImpl(GameService):
 
     
 
+    def _cache_mundo(self, mundo: 'Mundo') -> 'Mundo':
+        self._mundo_cache = mundo
+        self._mundo_cache_em = time.monotonic()
+        return mundo
+
+    def _estado_mundo(self) -> Optional['Mundo']:
+        """Estado do mundo em cache (recente) ou lido do banco"""
+        if self._mundo_cache is not None and time.monotonic() - self._mundo_cache_em < MUNDO_CACHE_TTL:
+            return self._mundo_cache
+        mundo = self.mundo_repository.get_estado()
+        return self._cache_mundo(mundo) if mundo else None
+
     def get_mundo_estado(self) -> Optional[Dict[str, Any]]:
         """Retorna o estado atual do mundo (turno, ticks)"""
         if not MUNDO_AVAILABLE or not self.mundo_repository:
             return {"error": "Funcionalidade do mundo não disponível"}
         
-        mundo = self.mundo_repository.get_estado()
+        mundo = self._estado_mundo()
         if not mundo:
             return {"error": "Estado do mundo não encontrado"}
         
@@ -352,46 +472,36 @@ class GameServiceImpl(GameService):
         }
 
     def avancar_tempo(self) -> Dict[str, Any]:
-        """Avança o tempo do mundo e retorna o novo estado"""
+        """
+        Avança o tempo do mundo e retorna o novo estado
+        
+        O incremento e a troca de turno acontecem no banco em um único
+        UPDATE ... RETURNING (uma ida ao banco, sem corrida entre atores).
+        """
         if not MUNDO_AVAILABLE or not self.mundo_repository:
             return {"error": "Funcionalidade do mundo não disponível"}
         
-        mundo = self.mundo_repository.get_estado()
+        mundo = self._avancar_relogio_mundo()
         if not mundo:
-            return {"error": "Estado do mundo não encontrado"}
+            return {"error": "Falha ao atualizar estado do mundo"}
         
-        # Incrementa o contador de tempo
-        mundo.ticks_no_turno += 1
-        turno_mudou = False
-
-        # Verifica se o tempo do turno acabou
-        if mundo.ticks_no_turno >= self.TEMPO_MAX_TURNO:
-            turno_mudou = True
-            # Muda o turno
-            if mundo.turno_atual == 'Dia':
-                mundo.turno_atual = 'Noite'
-                mensagem = "O sol se pôs. A noite chegou trazendo perigos..."
-            else:
-                mundo.turno_atual = 'Dia'
-                mensagem = "O sol nasce em um novo dia."
-            
-            # Reseta o contador
-            mundo.ticks_no_turno = 0
-        else:
+        # O contador só volta a zero quando o turno vira
+        turno_mudou = mundo.ticks_no_turno == 0
+        if not turno_mudou:
             mensagem = f"Tempo avança... ({mundo.ticks_no_turno}/{self.TEMPO_MAX_TURNO})"
-
-        # Salva o novo estado do mundo no banco
-        if self.mundo_repository.update_estado(mundo):
-            return {
-                "success": True,
-                "turno_atual": mundo.turno_atual,
-                "ticks_no_turno": mundo.ticks_no_turno,
-                "turno_mudou": turno_mudou,
-                "mensagem": mensagem,
-                "progresso": f"{mundo.ticks_no_turno}/{self.TEMPO_MAX_TURNO}"
-            }
+        elif mundo.turno_atual == 'Noite':
+            mensagem = "O sol se pôs. A noite chegou trazendo perigos..."
         else:
-            return {"error": "Falha ao atualizar estado do mundo"}
+            mensagem = "O sol nasce em um novo dia."
+
+        return {
+            "success": True,
+            "turno_atual": mundo.turno_atual,
+            "ticks_no_turno": mundo.ticks_no_turno,
+            "turno_mudou": turno_mudou,
+            "mensagem": mensagem,
+            "progresso": f"{mundo.ticks_no_turno}/{self.TEMPO_MAX_TURNO}"
+        }
 
     def _avancar_relogio_mundo(self) -> Optional['Mundo']:
         """
@@ -401,10 +511,14 @@ class GameServiceImpl(GameService):
         if not MUNDO_AVAILABLE or not self.mundo_repository:
             return None
         
-        resultado = self.avancar_tempo()
-        if resultado.get("success"):
-            return self.mundo_repository.get_estado()
-        return None
+        # Estado devolvido pelo próprio UPDATE, sem nova leitura. O cache só é
+        # escrito: outra thread pode trocá-lo antes de este método retornar
+        mundo = self.mundo_repository.avancar_relogio(self.TEMPO_MAX_TURNO)
+        if not mundo:
+            return None
+        self._cache_mundo(mundo)
+        self.player_state_buffer.tick()
+        return mundo
         # Busca jogadores no bioma
         players_in_bioma = service.get_players_in_bioma("Deserto")
         print(f"Jogadores no deserto: {players_in_bioma}")
@@ -7,7 +7,10 @@ Implementa o padrão Singleton para garantir uma única instância
 from typing import List, Optional, Dict, Any
 from ..models.player import Player
 from ..models.chunk import Chunk
-from ..models.mapa import TurnoType
+from ..models.mapa import Mapa, TurnoType
+from ..models.bioma import Bioma
+from ..models.item import Item
+from ..models.player_view import ChunkView, PlayerView
 from .game_service import GameServiceImpl
 
 
@@ -45,17 +48,33 @@ class InterfaceService:
         cls._instance = None
         cls._initialized = False
 
+    def _with_pending(self, player: Optional[Player]) -> Optional[Player]:
+        """Aplica ao jogador lido do banco o estado pendente no buffer, se houver"""
+        if player is None:
+            return None
+        return self.game_service.player_state_buffer.overlay([player])[0]
+
     def get_all_players(self) -> List[Player]:
-        """Retorna todos os jogadores"""
-        return self.game_service.player_repository.find_all()
+        """Retorna todos os jogadores (gravando antes as alterações pendentes)"""
+        buffer = self.game_service.player_state_buffer
+        buffer.flush()
+        # Se o flush falhar, as alterações voltam ao buffer e são aplicadas aqui
+        return buffer.overlay(self.game_service.player_repository.find_all())
 
+    def get_players_page(self, after_nome: Optional[str] = None, limit: int = 20) -> List[Player]:
+        """Retorna uma página de jogadores em ordem de nome, após ``after_nome``"""
+        buffer = self.game_service.player_state_buffer
+        buffer.flush()
+        return buffer.overlay(self.game_service.player_repository.find_page(after_nome, limit))
+    
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
-        """Busca jogador por ID"""
-        return self.game_service.player_repository.find_by_id(player_id)
+        """Busca jogador por ID (gravando antes as alterações pendentes dele)"""
+        self.game_service.player_state_buffer.flush_player(player_id)
+        return self._with_pending(self.game_service.player_repository.find_by_id(player_id))
 
     def get_player_by_name(self, name: str) -> Optional[Player]:
-        """Busca jogador por nome"""
-        return self.game_service.player_repository.find_by_name(name)
+        """Busca jogador por nome, com as alterações ainda pendentes no buffer"""
+        return self._with_pending(self.game_service.player_repository.find_by_name(name))
 
     def create_player(self, nome: str, vida_maxima: int = 100, forca: int = 10) -> Optional[Player]:
         """Cria um novo jogador"""
@@ -74,28 +93,34 @@ class InterfaceService:
         return None
 
     def save_player(self, player: Player) -> Optional[Player]:
-        """Salva um jogador"""
+        """Salva um jogador imediatamente (o estado salvo substitui o pendente no buffer)"""
+        self.game_service.player_state_buffer.discard(player.id_player)
         return self.game_service.player_repository.save(player)
 
     def delete_player(self, player_id: int) -> bool:
         """Deleta um jogador"""
+        self.game_service.player_state_buffer.discard(player_id)
         return self.game_service.player_repository.delete(player_id)
 
-    def get_adjacent_chunks(self, chunk_id: int, turno: str = 'Dia') -> List[tuple]:
-        """Retorna chunks adjacentes ao chunk atual"""
+    def flush_player(self, player_id: int) -> bool:
+        """Grava as alterações pendentes de um jogador (ex.: ao sair do jogo)"""
+        return self.game_service.player_state_buffer.flush_player(player_id)
+
+    def start_background_flush(self) -> None:
+        """Inicia o flush periódico do buffer de jogadores e o flush no encerramento"""
+        self.game_service.player_state_buffer.start()
+
+    def get_adjacent_chunks(self, chunk_id: int) -> List[tuple]:
+        """
+        Retorna chunks adjacentes ao chunk atual como tuplas (id_chunk, id_bioma)
+        
+        Os vizinhos são buscados no mapa do próprio chunk, que já identifica o turno.
+        """
         try:
-            # Buscar todos os chunks do turno
-            all_chunks = self.game_service.chunk_repository.find_by_mapa('Mapa_Principal', turno)
-            
-            # Filtrar chunks adjacentes
-            adjacent_chunks = []
-            for chunk in all_chunks:
-                # Verificar se é adjacente (lógica básica)
-                cid = chunk.id_chunk
-                if abs(cid - chunk_id) == 1 or abs(cid - chunk_id) == 32:
-                    adjacent_chunks.append((cid, chunk.id_bioma))
-            
-            return adjacent_chunks
+            # Vizinhos por coordenada (x, y) servidos pelo índice em memória,
+            # na ordem cima, baixo, esquerda, direita
+            grid = self.game_service.chunk_repository.get_grid()
+            return [(chunk.id_chunk, chunk.id_bioma) for chunk in grid.neighbours(chunk_id)]
         except Exception as e:
             print(f"Erro ao buscar chunks adjacentes: {str(e)}")
             return []
@@ -105,10 +130,22 @@ class InterfaceService:
         result = self.game_service.move_player_to_chunk(player.id_player, chunk_id)
         if result.get("success"):
             # Atualizar o objeto player local
-            player.localizacao = f"Mapa {result['chunk']['mapa']} - Chunk {result['chunk']['id']}"
+            player.move_to(result['chunk']['id'], result['chunk']['mapa'])
             return player
         return None
 
+    def travel_player_to_chunk(self, player: Player, chunk_id: int) -> Dict[str, Any]:
+        """
+        Leva o jogador até um chunk distante pela rota de menor custo
+        
+        Returns:
+            Resultado do GameService (com ``rota``, ``passos`` e ``custo`` em caso de sucesso)
+        """
+        result = self.game_service.travel_player_to_chunk(player.id_player, chunk_id)
+        if result.get("success"):
+            player.move_to(result['chunk']['id'], result['chunk']['mapa'])
+        return result
+
     def get_desert_chunk(self, turno: str = 'Dia') -> Optional[int]:
         """Retorna o ID de um chunk de deserto"""
         try:
@@ -129,20 +166,19 @@ class InterfaceService:
 
     def ensure_player_location(self, player: Player) -> bool:
         """Garante que o jogador tem uma localização válida"""
-        if not player.localizacao or player.localizacao == "0":
+        if not player.has_location():
             desert_chunk = self.get_desert_chunk('Dia')
             if desert_chunk:
-                updated_player = self.move_player_to_chunk(player, desert_chunk)
-                if updated_player:
-                    # Atualizar o objeto original
-                    player.localizacao = updated_player.localizacao
-                    return True
+                return self.move_player_to_chunk(player, desert_chunk) is not None
             return False
         return True
 
     def get_active_players(self) -> List[Player]:
         """Retorna jogadores ativos (com vida > 0)"""
-        return self.game_service.player_repository.find_active_players()
+        buffer = self.game_service.player_state_buffer
+        buffer.flush()
+        players = buffer.overlay(self.game_service.player_repository.find_active_players())
+        return [player for player in players if player.vida_atual > 0]
 
     def get_player_statistics(self) -> Dict[str, Any]:
         """Retorna estatísticas dos jogadores"""
@@ -155,32 +191,71 @@ class InterfaceService:
         }
 
     def get_chunk_by_id(self, chunk_id: int) -> Optional[Chunk]:
-        """Busca chunk por ID"""
+        """Busca chunk por ID (no índice em memória, com fallback para o banco)"""
+        chunk = self.game_service.chunk_repository.get_grid().get_by_id(chunk_id)
+        if chunk is not None:
+            return chunk
         return self.game_service.chunk_repository.find_by_id(chunk_id)
 
-    def get_map_by_id(self, map_id: int) -> Optional['Mapa']:
-        """Busca mapa por ID"""
-        from ..models.mapa import Mapa, TurnoType
+    def get_player_view(self, player: Player, chunk_id: int) -> Optional[PlayerView]:
+        """
+        Retorna tudo o que uma tela do jogo exibe: chunk atual, bioma, turno, vizinhos e pontes
         
+        Servido do índice de chunks, do índice de pontes e do cache de referência
+        quando o chunk está em memória; caso contrário, uma única consulta ao
+        PlayerViewRepository (sem as pontes).
+        
+        Args:
+            player: Jogador em sessão (mantido como está na visão)
+            chunk_id: Chunk onde o jogador está
+        """
         try:
-            # Try to find the map by ID from the mapa repository
-            mapas = self.game_service.mapa_repository.find_all()
-            for mapa in mapas:
-                if mapa.id_mapa == map_id:
-                    return mapa
+            grid = self.game_service.chunk_repository.get_grid()
+            cache = self.game_service.reference_cache
+            pontes = self.game_service.ponte_repository.get_index()
+            chunk = grid.get_by_id(chunk_id)
+            if chunk is not None:
+                def with_bioma(c: Chunk) -> ChunkView:
+                    bioma = cache.get_bioma(c.id_bioma)
+                    return ChunkView(chunk=c, bioma_nome=bioma.nome if bioma else str(c.id_bioma))
+                
+                return PlayerView(
+                    player=player,
+                    atual=with_bioma(chunk),
+                    mapa=cache.get_mapa(chunk.id_mapa),
+                    vizinhos=[with_bioma(c) for c in grid.neighbours(chunk_id)],
+                    pontes=[with_bioma(c) for c in map(grid.get_by_id, pontes.destinos(chunk_id))
+                            if c is not None]
+                )
+            
+            view = self.game_service.player_view_repository.find_by_player(player.id_player, chunk_id)
+            if view:
+                view.player = player
+            return view
+        except Exception as e:
+            print(f"Erro ao montar visão do jogador {player.id_player}: {str(e)}")
             return None
+
+    def get_map_by_id(self, map_id: int) -> Optional[Mapa]:
+        """Busca mapa por ID (servido pelo cache de referência)"""
+        try:
+            return self.game_service.reference_cache.get_mapa(map_id)
         except Exception as e:
             print(f"Erro ao buscar mapa {map_id}: {str(e)}")
             return None
 
-    def get_bioma_by_id(self, bioma_id: int) -> Optional['Bioma']:
-        """Busca bioma por ID"""
-        from ..models.bioma import Bioma
-        
+    def get_bioma_by_id(self, bioma_id: int) -> Optional[Bioma]:
+        """Busca bioma por ID (servido pelo cache de referência)"""
         try:
-            # Use the bioma repository from game_service
-            bioma = self.game_service.bioma_repository.find_by_id(bioma_id)
-            return bioma
+            return self.game_service.reference_cache.get_bioma(bioma_id)
         except Exception as e:
             print(f"Erro ao buscar bioma {bioma_id}: {str(e)}")
             return None
+
+    def get_item_by_id(self, item_id: int) -> Optional[Item]:
+        """Busca item por ID (servido pelo cache de referência)"""
+        try:
+            return self.game_service.reference_cache.get_item(item_id)
+        except Exception as e:
+            print(f"Erro ao buscar item {item_id}: {str(e)}")
+            return None
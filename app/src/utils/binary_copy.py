@@ -0,0 +1,109 @@
+"""
+Leitura de ``COPY ... TO STDOUT (FORMAT binary)`` direto para arrays NumPy
+
+Para consultas só com colunas ``integer`` (int4, NOT NULL), cada linha do
+formato binário tem tamanho fixo: contagem de campos (int16) e, por campo,
+tamanho (int32) e valor (int32), tudo big-endian. Os blocos recebidos do
+servidor são reinterpretados como um array estruturado, sem criar tuplas
+nem objetos por linha.
+"""
+
+from typing import List
+
+import numpy as np
+
+PGCOPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_HEADER_FIXED = len(PGCOPY_SIGNATURE) + 8  # assinatura, flags, tamanho da extensão
+_TRAILER = b"\xff\xff"
+# Bytes acumulados antes de decodificar um bloco de linhas
+DECODE_BLOCK_BYTES = 1 << 20
+
+
+def _row_dtype(n_columns: int) -> np.dtype:
+    fields = [("n", ">i2")]
+    for i in range(n_columns):
+        fields += [(f"len{i}", ">i4"), (f"col{i}", ">i4")]
+    return np.dtype(fields)
+
+
+class Int4CopyDecoder:
+    """
+    Destino de ``cursor.copy_expert`` que decodifica linhas de colunas int4
+
+    ``copy_expert`` chama ``write`` com cada mensagem recebida; a cada
+    ``DECODE_BLOCK_BYTES`` acumulados, as linhas completas viram um array e
+    só o resto (uma linha parcial) fica pendente.
+
+    Args:
+        n_columns: Quantidade de colunas da consulta
+    """
+
+    def __init__(self, n_columns: int):
+        self.n_columns = n_columns
+        self._dtype = _row_dtype(n_columns)
+        self._pending = bytearray()
+        self._header_done = False
+        self._finished = False
+        self._blocks: List[np.ndarray] = []
+
+    def _parse_header(self) -> bool:
+        if len(self._pending) < _HEADER_FIXED:
+            return False
+        if bytes(self._pending[:len(PGCOPY_SIGNATURE)]) != PGCOPY_SIGNATURE:
+            raise ValueError("Fluxo COPY sem a assinatura do formato binário")
+        extension = int.from_bytes(self._pending[_HEADER_FIXED - 4:_HEADER_FIXED], "big")
+        if len(self._pending) < _HEADER_FIXED + extension:
+            return False
+        del self._pending[:_HEADER_FIXED + extension]
+        self._header_done = True
+        return True
+
+    def write(self, data) -> int:
+        # O psycopg2 entrega uma linha por chamada: só acumula até formar um bloco
+        self._pending += data
+        if len(self._pending) >= DECODE_BLOCK_BYTES:
+            self._decode()
+        return len(data)
+
+    def _decode(self) -> None:
+        if not self._header_done and not self._parse_header():
+            return
+        n_rows = len(self._pending) // self._dtype.itemsize
+        if not n_rows or self._finished:
+            return
+        size = n_rows * self._dtype.itemsize
+        rows = np.frombuffer(bytes(self._pending[:size]), dtype=self._dtype)
+        del self._pending[:size]
+        invalidas = np.flatnonzero(rows["n"] != self.n_columns)
+        if len(invalidas):
+            raise ValueError(f"Linha com {rows['n'][invalidas[0]]} campos, esperado {self.n_columns}")
+        self._blocks.append(rows)
+
+    def columns(self) -> List[np.ndarray]:
+        """Colunas decodificadas (int32 na ordem nativa), após o fim do COPY"""
+        if not self._finished:
+            self._decode()
+            if not self._header_done or bytes(self._pending) != _TRAILER:
+                raise ValueError("Fluxo COPY binário incompleto ou sem o trailer")
+            self._finished = True
+            self._pending.clear()
+        rows = np.concatenate(self._blocks) if self._blocks else np.empty(0, dtype=self._dtype)
+        for i in range(self.n_columns):
+            if (rows[f"len{i}"] != 4).any():
+                raise ValueError(f"Coluna {i} com valores nulos ou que não são int4")
+        return [rows[f"col{i}"].astype(np.int32) for i in range(self.n_columns)]
+
+
+def copy_int4_columns(cursor, query: str, n_columns: int) -> List[np.ndarray]:
+    """
+    Executa ``COPY (query) TO STDOUT (FORMAT binary)`` e devolve as colunas
+
+    Args:
+        cursor: Cursor psycopg2
+        query: SELECT já com os parâmetros interpolados (``cursor.mogrify``),
+            só com colunas int4 não nulas
+        n_columns: Quantidade de colunas do SELECT
+    """
+    decoder = Int4CopyDecoder(n_columns)
+    cursor.copy_expert(f"COPY ({query}) TO STDOUT (FORMAT binary)", decoder)
+    return decoder.columns()
@@ -0,0 +1,98 @@
+"""
+Índice em memória das pontes ativas
+Responde se há ponte entre dois chunks e quais chunks uma ponte alcança
+sem ida ao banco
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..models.ponte import Ponte
+
+
+class BridgeIndex:
+    """
+    Pontes ativas indexadas por ``id``, por chunk de origem e por chunk de destino
+
+    Carregado uma vez a partir de ``PonteRepository.listar_ativas`` e mantido
+    em dia pelo próprio repositório em ``inserir``/``desativar``.
+
+    Args:
+        pontes: Pontes ativas
+        bidirecional: Se uma ponte também leva do destino à origem nas
+            consultas de ``existe`` e ``destinos`` (padrão: True)
+    """
+
+    def __init__(self, pontes: Iterable[Ponte] = (), bidirecional: bool = True):
+        self.bidirecional = bidirecional
+        self._by_id: Dict[int, Ponte] = {}
+        # chunk → {chunk do outro lado: IDs das pontes}
+        self._saida: Dict[int, Dict[int, Set[int]]] = {}
+        self._entrada: Dict[int, Dict[int, Set[int]]] = {}
+        for ponte in pontes:
+            self.add(ponte)
+
+    def add(self, ponte: Ponte) -> None:
+        """Adiciona ou substitui uma ponte no índice (pontes inativas são removidas)"""
+        self.remove(ponte.id)
+        if not ponte.ativa:
+            return
+        self._by_id[ponte.id] = ponte
+        self._saida.setdefault(ponte.chunk_origem, {}).setdefault(ponte.chunk_destino, set()).add(ponte.id)
+        self._entrada.setdefault(ponte.chunk_destino, {}).setdefault(ponte.chunk_origem, set()).add(ponte.id)
+
+    def remove(self, id_ponte: int) -> Optional[Ponte]:
+        """Remove uma ponte do índice, retornando-a se existia"""
+        ponte = self._by_id.pop(id_ponte, None)
+        if ponte is None:
+            return None
+        for mapa, chave, outra in ((self._saida, ponte.chunk_origem, ponte.chunk_destino),
+                                   (self._entrada, ponte.chunk_destino, ponte.chunk_origem)):
+            ligacoes = mapa.get(chave, {})
+            ids = ligacoes.get(outra, set())
+            ids.discard(id_ponte)
+            if not ids:
+                ligacoes.pop(outra, None)
+            if not ligacoes:
+                mapa.pop(chave, None)
+        return ponte
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, id_ponte: int) -> bool:
+        return id_ponte in self._by_id
+
+    def get(self, id_ponte: int) -> Optional[Ponte]:
+        return self._by_id.get(id_ponte)
+
+    def pontes(self) -> List[Ponte]:
+        """Todas as pontes ativas"""
+        return list(self._by_id.values())
+
+    def saindo_de(self, chunk_origem: int) -> List[Ponte]:
+        """Pontes com origem no chunk"""
+        return [self._by_id[i] for ids in self._saida.get(chunk_origem, {}).values() for i in sorted(ids)]
+
+    def chegando_em(self, chunk_destino: int) -> List[Ponte]:
+        """Pontes com destino no chunk"""
+        return [self._by_id[i] for ids in self._entrada.get(chunk_destino, {}).values() for i in sorted(ids)]
+
+    def existe(self, origem: int, destino: int, bidirecional: Optional[bool] = None) -> bool:
+        """
+        Verifica se há ponte ativa entre dois chunks, em O(1)
+
+        Args:
+            bidirecional: Aceita também a ponte de ``destino`` para ``origem``
+                (padrão: o do índice)
+        """
+        bidirecional = self.bidirecional if bidirecional is None else bidirecional
+        if destino in self._saida.get(origem, ()):
+            return True
+        return bidirecional and destino in self._entrada.get(origem, ())
+
+    def destinos(self, chunk: int) -> List[int]:
+        """Chunks alcançáveis por ponte a partir do chunk, em ordem de ID"""
+        alcancados = set(self._saida.get(chunk, ()))
+        if self.bidirecional:
+            alcancados.update(self._entrada.get(chunk, ()))
+        return sorted(alcancados)
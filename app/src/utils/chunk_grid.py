@@ -0,0 +1,122 @@
+"""
+Índice espacial em memória dos chunks
+Permite buscar vizinhos, linhas, colunas e regiões sem ida ao banco
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.chunk import Chunk
+
+
+# Deslocamentos (dx, dy) na ordem: cima, baixo, esquerda, direita
+NEIGHBOUR_OFFSETS: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+class ChunkGrid:
+    """
+    Índice dos chunks por coordenada ``(id_mapa, x, y)`` e por ``id_chunk``
+
+    Construído uma única vez a partir das colunas x/y da tabela chunk.
+    Todas as consultas são servidas de dicionários em memória.
+
+    Args:
+        chunks: Chunks que compõem o índice (de um ou mais mapas)
+    """
+
+    def __init__(self, chunks: Iterable[Chunk] = ()):
+        self._by_coord: Dict[Tuple[int, int, int], Chunk] = {}
+        self._by_id: Dict[int, Chunk] = {}
+        self._rows: Dict[Tuple[int, int], Dict[int, Chunk]] = {}
+        self._columns: Dict[Tuple[int, int], Dict[int, Chunk]] = {}
+        for chunk in chunks:
+            self.add(chunk)
+
+    def add(self, chunk: Chunk) -> None:
+        """Adiciona ou substitui um chunk no índice"""
+        self.remove(chunk.id_chunk)
+        self._by_coord[(chunk.id_mapa, chunk.x, chunk.y)] = chunk
+        self._by_id[chunk.id_chunk] = chunk
+        self._rows.setdefault((chunk.id_mapa, chunk.y), {})[chunk.x] = chunk
+        self._columns.setdefault((chunk.id_mapa, chunk.x), {})[chunk.y] = chunk
+
+    def remove(self, id_chunk: int) -> Optional[Chunk]:
+        """Remove um chunk do índice, retornando-o se existia"""
+        chunk = self._by_id.pop(id_chunk, None)
+        if chunk is None:
+            return None
+        self._by_coord.pop((chunk.id_mapa, chunk.x, chunk.y), None)
+        self._rows.get((chunk.id_mapa, chunk.y), {}).pop(chunk.x, None)
+        self._columns.get((chunk.id_mapa, chunk.x), {}).pop(chunk.y, None)
+        return chunk
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, id_chunk: int) -> bool:
+        return id_chunk in self._by_id
+
+    def get(self, id_mapa: int, x: int, y: int) -> Optional[Chunk]:
+        """Busca o chunk na coordenada (x, y) de um mapa"""
+        return self._by_coord.get((id_mapa, x, y))
+
+    def get_by_id(self, id_chunk: int) -> Optional[Chunk]:
+        """Busca o chunk pelo ID"""
+        return self._by_id.get(id_chunk)
+
+    def first(self) -> Optional[Chunk]:
+        """Chunk de menor ID (None se o índice estiver vazio)"""
+        return self._by_id[min(self._by_id)] if self._by_id else None
+
+    def neighbours(self, id_chunk: int, id_mapa: Optional[int] = None) -> List[Chunk]:
+        """
+        Retorna os vizinhos ortogonais de um chunk (cima, baixo, esquerda, direita)
+
+        Args:
+            id_chunk: ID do chunk de referência
+            id_mapa: Mapa onde procurar os vizinhos; por padrão o do próprio chunk
+                (útil para buscar a mesma posição no mapa do outro turno)
+
+        Returns:
+            Lista com os vizinhos existentes, omitindo as bordas do mapa
+        """
+        chunk = self._by_id.get(id_chunk)
+        if chunk is None:
+            return []
+        mapa = chunk.id_mapa if id_mapa is None else id_mapa
+        result = []
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            neighbour = self._by_coord.get((mapa, chunk.x + dx, chunk.y + dy))
+            if neighbour is not None:
+                result.append(neighbour)
+        return result
+
+    def row(self, id_mapa: int, y: int) -> List[Chunk]:
+        """Retorna os chunks da linha y de um mapa, ordenados por x"""
+        cells = self._rows.get((id_mapa, y), {})
+        return [cells[x] for x in sorted(cells)]
+
+    def column(self, id_mapa: int, x: int) -> List[Chunk]:
+        """Retorna os chunks da coluna x de um mapa, ordenados por y"""
+        cells = self._columns.get((id_mapa, x), {})
+        return [cells[y] for y in sorted(cells)]
+
+    def radius(self, id_chunk: int, raio: int) -> List[Chunk]:
+        """
+        Retorna os chunks no quadrado de lado ``2 * raio + 1`` centrado no chunk
+
+        Args:
+            id_chunk: ID do chunk central (incluído no resultado)
+            raio: Distância máxima em x e em y
+
+        Returns:
+            Chunks da região, em ordem de linha (y) e depois coluna (x)
+        """
+        chunk = self._by_id.get(id_chunk)
+        if chunk is None or raio < 0:
+            return []
+        result = []
+        for y in range(chunk.y - raio, chunk.y + raio + 1):
+            for x in range(chunk.x - raio, chunk.x + raio + 1):
+                cell = self._by_coord.get((chunk.id_mapa, x, y))
+                if cell is not None:
+                    result.append(cell)
+        return result
@@ -0,0 +1,216 @@
+"""
+Armazenamento colunar dos chunks em arrays NumPy
+
+Um mapa de 1M de chunks ocupa ~24 MB em cinco colunas, contra centenas de MB
+em instâncias de ``Chunk``. Objetos ``Chunk`` só são criados quando alguém
+pede um chunk específico; filtros e contagens rodam vetorizados nas colunas.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.chunk import Chunk
+from .chunk_grid import NEIGHBOUR_OFFSETS, ChunkGrid
+
+# Ordem das colunas (a mesma dos SELECTs do ChunkRepository)
+COLUMNS = ("id_chunk", "id_bioma", "id_mapa", "x", "y")
+COLUMN_DTYPES = {"id_chunk": np.int64, "id_bioma": np.int32, "id_mapa": np.int32,
+                 "x": np.int32, "y": np.int32}
+
+
+class ChunkStore:
+    """
+    Colunas ``id_chunk``, ``id_bioma``, ``id_mapa``, ``x`` e ``y`` ordenadas por id_chunk
+
+    A busca por coordenada usa uma matriz densa por mapa (posição → linha), O(1);
+    a busca por ID é uma busca binária na coluna ordenada.
+
+    Args:
+        id_chunk, id_bioma, id_mapa, x, y: Colunas de mesmo tamanho
+    """
+
+    def __init__(self, id_chunk, id_bioma, id_mapa, x, y):
+        columns = [np.asarray(c, dtype=COLUMN_DTYPES[name])
+                   for name, c in zip(COLUMNS, (id_chunk, id_bioma, id_mapa, x, y))]
+        if len({len(c) for c in columns}) > 1:
+            raise ValueError("Colunas do ChunkStore com tamanhos diferentes")
+        if len(columns[0]) > 1 and not (np.diff(columns[0]) > 0).all():
+            order = np.argsort(columns[0], kind="stable")
+            columns = [c[order] for c in columns]
+        self.id_chunk, self.id_bioma, self.id_mapa, self.x, self.y = columns
+        self._coords: Optional[Dict[int, Tuple[int, int, np.ndarray]]] = None
+
+    @classmethod
+    def empty(cls) -> 'ChunkStore':
+        return cls(*([] for _ in COLUMNS))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[int]]) -> 'ChunkStore':
+        """Monta a partir de linhas (id_chunk, id_bioma, id_mapa, x, y)"""
+        data = np.array(list(rows), dtype=np.int64).reshape(-1, len(COLUMNS))
+        return cls(*data.T)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Chunk]) -> 'ChunkStore':
+        return cls.from_rows((c.id_chunk, c.id_bioma, c.id_mapa, c.x, c.y) for c in chunks)
+
+    @classmethod
+    def concatenate(cls, stores: Sequence['ChunkStore']) -> 'ChunkStore':
+        if not stores:
+            return cls.empty()
+        return cls(*(np.concatenate([getattr(s, name) for s in stores]) for name in COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.id_chunk)
+
+    def __contains__(self, id_chunk: int) -> bool:
+        return self.index_of(id_chunk) is not None
+
+    def __iter__(self) -> Iterator[Chunk]:
+        for i in range(len(self)):
+            yield self.chunk(i)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelas colunas"""
+        return sum(getattr(self, name).nbytes for name in COLUMNS)
+
+    def chunk(self, i: int) -> Chunk:
+        """Cria o ``Chunk`` da linha i"""
+        return Chunk(int(self.id_chunk[i]), int(self.id_bioma[i]), int(self.id_mapa[i]),
+                     int(self.x[i]), int(self.y[i]))
+
+    def chunks(self, indices: Optional[np.ndarray] = None) -> List[Chunk]:
+        """Cria os ``Chunk`` das linhas pedidas (todas, por padrão)"""
+        indices = np.arange(len(self)) if indices is None else indices
+        return [self.chunk(i) for i in indices]
+
+    def index_of(self, id_chunk: int) -> Optional[int]:
+        """Linha do chunk com esse ID (None se não existir)"""
+        i = int(np.searchsorted(self.id_chunk, id_chunk))
+        if i < len(self) and self.id_chunk[i] == id_chunk:
+            return i
+        return None
+
+    def _coord_index(self) -> Dict[int, Tuple[int, int, np.ndarray]]:
+        """Por mapa: (x mínimo, y mínimo, matriz [y, x] → linha ou -1), montado no primeiro uso"""
+        if self._coords is None:
+            coords = {}
+            for id_mapa in np.unique(self.id_mapa):
+                rows = np.flatnonzero(self.id_mapa == id_mapa)
+                xs, ys = self.x[rows], self.y[rows]
+                x0, y0 = int(xs.min()), int(ys.min())
+                matrix = np.full((int(ys.max()) - y0 + 1, int(xs.max()) - x0 + 1), -1, dtype=np.int64)
+                matrix[ys - y0, xs - x0] = rows
+                coords[int(id_mapa)] = (x0, y0, matrix)
+            self._coords = coords
+        return self._coords
+
+    def index_at(self, id_mapa: int, x: int, y: int) -> Optional[int]:
+        """Linha do chunk na coordenada (x, y) do mapa (None se não existir)"""
+        entry = self._coord_index().get(id_mapa)
+        if entry is None:
+            return None
+        x0, y0, matrix = entry
+        row, col = y - y0, x - x0
+        if not (0 <= row < matrix.shape[0] and 0 <= col < matrix.shape[1]):
+            return None
+        i = int(matrix[row, col])
+        return i if i >= 0 else None
+
+    def get_by_id(self, id_chunk: int) -> Optional[Chunk]:
+        i = self.index_of(id_chunk)
+        return None if i is None else self.chunk(i)
+
+    def get(self, id_mapa: int, x: int, y: int) -> Optional[Chunk]:
+        i = self.index_at(id_mapa, x, y)
+        return None if i is None else self.chunk(i)
+
+    def select(self, mask: np.ndarray) -> 'ChunkStore':
+        """Novo store só com as linhas do filtro booleano"""
+        return ChunkStore(*(getattr(self, name)[mask] for name in COLUMNS))
+
+    def for_mapa(self, id_mapa: int) -> 'ChunkStore':
+        return self.select(self.id_mapa == id_mapa)
+
+    def ids_by_bioma(self, id_bioma: int) -> np.ndarray:
+        """IDs dos chunks do bioma, em ordem"""
+        return self.id_chunk[self.id_bioma == id_bioma]
+
+    def chunks_by_bioma(self, id_bioma: int) -> List[Chunk]:
+        return self.chunks(np.flatnonzero(self.id_bioma == id_bioma))
+
+    def bioma_distribution(self) -> Dict[int, int]:
+        """Quantidade de chunks por id_bioma"""
+        biomas, totais = np.unique(self.id_bioma, return_counts=True)
+        return {int(b): int(t) for b, t in zip(biomas, totais)}
+
+
+class ChunkStoreGrid(ChunkGrid):
+    """
+    ``ChunkGrid`` somente leitura servido por um ``ChunkStore``
+
+    Mesmas consultas do índice em dicionários, mas sem um ``Chunk`` por
+    posição na memória: cada chamada cria só os chunks que devolve. Usado
+    quando as colunas vêm de memória compartilhada ou de um snapshot.
+    """
+
+    def __init__(self, store: ChunkStore):
+        self.store = store
+
+    def add(self, chunk: Chunk) -> None:
+        raise TypeError("ChunkStoreGrid é somente leitura")
+
+    def remove(self, id_chunk: int) -> Optional[Chunk]:
+        raise TypeError("ChunkStoreGrid é somente leitura")
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __contains__(self, id_chunk: int) -> bool:
+        return id_chunk in self.store
+
+    def get(self, id_mapa: int, x: int, y: int) -> Optional[Chunk]:
+        return self.store.get(id_mapa, x, y)
+
+    def get_by_id(self, id_chunk: int) -> Optional[Chunk]:
+        return self.store.get_by_id(id_chunk)
+
+    def first(self) -> Optional[Chunk]:
+        # As colunas estão em ordem de ID
+        return self.store.chunk(0) if len(self.store) else None
+
+    def neighbours(self, id_chunk: int, id_mapa: Optional[int] = None) -> List[Chunk]:
+        i = self.store.index_of(id_chunk)
+        if i is None:
+            return []
+        mapa = int(self.store.id_mapa[i]) if id_mapa is None else id_mapa
+        x, y = int(self.store.x[i]), int(self.store.y[i])
+        result = []
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            neighbour = self.store.get(mapa, x + dx, y + dy)
+            if neighbour is not None:
+                result.append(neighbour)
+        return result
+
+    def row(self, id_mapa: int, y: int) -> List[Chunk]:
+        rows = np.flatnonzero((self.store.id_mapa == id_mapa) & (self.store.y == y))
+        return self.store.chunks(rows[np.argsort(self.store.x[rows], kind="stable")])
+
+    def column(self, id_mapa: int, x: int) -> List[Chunk]:
+        rows = np.flatnonzero((self.store.id_mapa == id_mapa) & (self.store.x == x))
+        return self.store.chunks(rows[np.argsort(self.store.y[rows], kind="stable")])
+
+    def radius(self, id_chunk: int, raio: int) -> List[Chunk]:
+        i = self.store.index_of(id_chunk)
+        if i is None or raio < 0:
+            return []
+        mapa, cx, cy = int(self.store.id_mapa[i]), int(self.store.x[i]), int(self.store.y[i])
+        result = []
+        for y in range(cy - raio, cy + raio + 1):
+            for x in range(cx - raio, cx + raio + 1):
+                cell = self.store.get(mapa, x, y)
+                if cell is not None:
+                    result.append(cell)
+        return result
@@ -1,8 +1,31 @@
 import psycopg2
+import psycopg2.errors
+import json
 import os
 import sys
+import time
+from .unit_of_work import current_unit_of_work
 
-def connection_db():
+# Tabelas que precisam existir para o jogo rodar
+EXPECTED_TABLES = [
+    'bioma', 'mapa', 'item', 'chunk', 'player',
+    'inventario', 'fantasma', 'pontes', 'totem', 'aldeao', 'bob_construtor',
+    'bob_mago', 'vila', 'casa_aldeao'
+]
+
+# Linhas buscadas por ida ao servidor nos iter_all (cursores no servidor)
+STREAM_ITERSIZE = int(os.getenv("DB_ITERSIZE", "2000"))
+
+# Arquivo opcional com o último resultado "pronto" da verificação (vazio desativa)
+READY_CACHE_PATH = os.getenv("DB_READY_CACHE", "")
+READY_CACHE_TTL = float(os.getenv("DB_READY_CACHE_TTL", "300"))
+
+_MISSING_TABLES_SQL = "ARRAY(SELECT t FROM unnest(%s::text[]) AS t WHERE to_regclass(t) IS NULL)"
+_SEEDED_SQL = """EXISTS (SELECT 1 FROM bioma) AND EXISTS (SELECT 1 FROM mapa)
+                 AND EXISTS (SELECT 1 FROM item) AND EXISTS (SELECT 1 FROM chunk)"""
+
+def create_raw_connection():
+    """Abre uma nova conexão física (usada pelo pool de conexões)"""
     # Configurar parâmetros via variáveis de ambiente para suportar conexões locais e Docker
     user = os.getenv("DB_USER", "postgres")
     password = os.getenv("DB_PASSWORD", "password")
@@ -17,6 +40,20 @@ def connection_db():
         database=database
     )
 
+def connection_db():
+    """
+    Empresta uma conexão do pool global do processo
+
+    Drop-in para o antigo ``psycopg2.connect``: ``close()`` e o fim do bloco
+    ``with`` devolvem a conexão ao pool em vez de fechar o socket. Dentro de
+    uma ``UnitOfWork`` retorna a conexão compartilhada da unidade.
+    """
+    unit_of_work = current_unit_of_work()
+    if unit_of_work is not None:
+        return unit_of_work.connection
+    from .db_pool import get_pool
+    return get_pool().getconn()
+
 def execute_sql_file(conn, file_path):
     """Executa um arquivo SQL no banco de dados"""
     try:
@@ -71,14 +108,7 @@ def check_new_structure_tables():
         conn = connection_db()
         cursor = conn.cursor()
         
-        # Lista de tabelas esperadas na nova estrutura
-        expected_tables = [
-            'bioma', 'mapa', 'item', 'chunk', 'player', 
-            'inventario', 'fantasma', 'pontes', 'totem', 'aldeao', 'bob_construtor',
-            'bob_mago', 'vila', 'casa_aldeao'
-        ]
-        
-        for table in expected_tables:
+        for table in EXPECTED_TABLES:
             cursor.execute("""
                 SELECT EXISTS (
                     SELECT 1 FROM information_schema.tables 
@@ -247,33 +277,110 @@ def initialize_database():
         print(f"Falha na inicialização do banco de dados: {str(e)}")
         return False
 
+def probe_database():
+    """
+    Verifica conexão, tabelas, dados iniciais e versão do schema em uma consulta
+
+    Tabelas ausentes fazem a consulta completa falhar; só nesse caso (banco
+    novo ou anterior às migrações) são feitas consultas adicionais.
+
+    Returns:
+        Dicionário com missing_tables, seeded e schema_version, ou None se
+        não for possível conectar
+    """
+    try:
+        with connection_db() as conn:
+            with conn.cursor() as cursor:
+                try:
+                    cursor.execute(f"""
+                        SELECT {_MISSING_TABLES_SQL}, {_SEEDED_SQL},
+                               (SELECT COALESCE(MAX(version), 0) FROM schema_version)
+                    """, (EXPECTED_TABLES,))
+                    missing, seeded, version = cursor.fetchone()
+                    return {"missing_tables": list(missing), "seeded": seeded, "schema_version": version}
+                except psycopg2.errors.UndefinedTable:
+                    conn.rollback()
+
+                cursor.execute(f"SELECT {_MISSING_TABLES_SQL}", (EXPECTED_TABLES,))
+                missing = list(cursor.fetchone()[0])
+                if missing:
+                    return {"missing_tables": missing, "seeded": False, "schema_version": 0}
+
+                # Só schema_version faltava: banco ainda sem migrações
+                cursor.execute(f"SELECT {_SEEDED_SQL}")
+                return {"missing_tables": [], "seeded": cursor.fetchone()[0], "schema_version": 0}
+    except Exception as e:
+        print(f"Erro ao conectar com o banco de dados: {str(e)}")
+        return None
+
+def _ready_cache_key():
+    return f"{os.getenv('DB_HOST', 'db')}:{os.getenv('DB_PORT', '5432')}/{os.getenv('DB_NAME', '2025_1_Minecraft')}"
+
+def _read_ready_cache():
+    """Retorna a versão do schema salva no cache, se ainda válida para este banco"""
+    if not READY_CACHE_PATH:
+        return None
+    try:
+        with open(READY_CACHE_PATH, 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+        if cached.get("database") != _ready_cache_key():
+            return None
+        if time.time() - cached.get("checked_at", 0) > READY_CACHE_TTL:
+            return None
+        return cached.get("schema_version")
+    except (OSError, ValueError):
+        return None
+
+def _write_ready_cache(schema_version):
+    if not READY_CACHE_PATH:
+        return
+    try:
+        with open(READY_CACHE_PATH, 'w', encoding='utf-8') as file:
+            json.dump({"database": _ready_cache_key(), "schema_version": schema_version,
+                       "checked_at": time.time()}, file)
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o cache de verificação: {str(e)}")
+
 def setup_database():
-    """Configura o banco de dados antes da execução da aplicação"""
+    """
+    Configura o banco de dados antes da execução da aplicação
+
+    No caminho comum (banco pronto e migrado) custa uma única consulta; com
+    ``DB_READY_CACHE`` definido, um resultado "pronto" recente pula até ela.
+    """
+    from .migrations import LATEST_VERSION, run_migrations
+
     print("Verificando configuração do banco de dados...")
-    
-    # Verificar conexão
-    if not check_database_connection():
+
+    if _read_ready_cache() == LATEST_VERSION:
+        print("Banco de dados verificado recentemente, pronto para uso!")
+        return True
+
+    status = probe_database()
+    if status is None:
         print("Erro: Não foi possível conectar ao banco de dados")
         return False
-    
-    # Verificar estrutura das tabelas da nova organização
-    if not check_new_structure_tables():
+
+    if status["missing_tables"] or not status["seeded"]:
+        if status["missing_tables"]:
+            print(f"Tabelas não encontradas: {', '.join(status['missing_tables'])}")
+        else:
+            print("Dados iniciais básicos não encontrados")
         print("Inicializando estrutura e dados do banco com nova organização...")
         if not initialize_database():
             print("Falha na inicialização do banco de dados.")
             return False
-    
-    # Verificar se há dados nas tabelas (fallback para método antigo se necessário)
-    if not check_data_seeded():
-        try:
-            # Tentar usar repositórios se estiverem disponíveis
-            if not check_tables_exist():
-                print("Inicializando dados básicos...")
-                if not initialize_database():
-                    print("Falha na inicialização dos dados.")
-                    return False
-        except Exception as e:
-            print(f"Repositórios não disponíveis, usando verificação direta: {str(e)}")
-    
+        status["schema_version"] = 0
+
+    # Aplicar migrações versionadas pendentes (índices etc.)
+    if status["schema_version"] < LATEST_VERSION:
+        if run_migrations():
+            status["schema_version"] = LATEST_VERSION
+        else:
+            print("Aviso: migrações pendentes não foram aplicadas")
+
+    if status["schema_version"] >= LATEST_VERSION:
+        _write_ready_cache(LATEST_VERSION)
+
     print("Banco de dados configurado e pronto para uso!")
     return True
@@ -0,0 +1,363 @@
+"""
+Pool de conexões com o PostgreSQL
+Mantém conexões abertas entre chamadas dos repositórios para evitar
+um novo handshake TCP + autenticação a cada consulta
+"""
+
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Any, List, Optional
+
+import psycopg2
+from psycopg2 import extensions, pool as pg_pool
+
+from .query_stats import instrument_cursor
+
+
+class PoolTimeoutError(pg_pool.PoolError):
+    """Nenhuma conexão ficou livre dentro do tempo limite do pool"""
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Métricas acumuladas do pool de conexões
+
+    Attributes:
+        checkouts: Total de conexões entregues pelo pool
+        total_wait_time: Tempo total (s) esperando por uma conexão livre
+        max_wait_time: Maior espera (s) observada em um checkout
+        in_use: Conexões emprestadas neste momento
+        idle: Conexões ociosas disponíveis no pool
+        created: Conexões físicas abertas desde a criação do pool
+        discarded: Conexões descartadas por estarem quebradas
+        reconnects: Conexões substituídas após falha no health check
+        timeouts: Checkouts que desistiram por falta de conexão livre
+    """
+    checkouts: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    in_use: int = 0
+    idle: int = 0
+    created: int = 0
+    discarded: int = 0
+    reconnects: int = 0
+    timeouts: int = 0
+
+    @property
+    def avg_wait_time(self) -> float:
+        """Tempo médio (s) de espera por checkout"""
+        return self.total_wait_time / self.checkouts if self.checkouts else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte as métricas para dicionário"""
+        data = asdict(self)
+        data['avg_wait_time'] = self.avg_wait_time
+        return data
+
+
+class PooledConnection:
+    """
+    Proxy de uma conexão psycopg2 emprestada pelo pool
+
+    Mantém a mesma interface usada pelos repositórios: ``close()`` devolve a
+    conexão ao pool em vez de fechá-la, e o bloco ``with`` faz commit/rollback
+    e também devolve a conexão ao final.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', conn):
+        self._pool = pool
+        self._conn = conn
+
+    @property
+    def raw(self):
+        """Conexão psycopg2 subjacente"""
+        if self._conn is None:
+            raise psycopg2.InterfaceError("Conexão já devolvida ao pool")
+        return self._conn
+
+    @property
+    def released(self) -> bool:
+        """Indica se a conexão já foi devolvida ao pool"""
+        return self._conn is None
+
+    def close(self) -> None:
+        """Devolve a conexão ao pool (idempotente)"""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool._release(conn)
+
+    def cursor(self, *args, **kwargs):
+        """Cursor da conexão, com a instrumentação de consultas (query_stats)"""
+        return instrument_cursor(self.raw.cursor(*args, **kwargs))
+
+    def commit(self) -> None:
+        if self._conn is not None:
+            self._conn.commit()
+
+    def rollback(self) -> None:
+        # Repositórios chamam rollback no except depois que o bloco
+        # ``with`` já devolveu a conexão; nesse caso não há o que desfazer
+        if self._conn is not None:
+            self._conn.rollback()
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if self._conn is not None and not self._conn.closed:
+                if exc_type is None:
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+        finally:
+            self.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.raw, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        # ``conn.autocommit = True`` e afins precisam chegar à conexão real
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.raw, name, value)
+
+    def __del__(self):
+        # Garante que uma conexão esquecida volte ao pool
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Pool de conexões thread-safe com tamanho mínimo/máximo configurável
+
+    Args:
+        connection_factory: Função que abre uma nova conexão psycopg2
+        minconn: Conexões abertas na criação do pool
+        maxconn: Limite de conexões simultâneas (ociosas + emprestadas)
+        timeout: Tempo máximo (s) de espera por uma conexão livre
+        health_check_interval: Conexões ociosas há mais tempo que isso (s)
+            recebem um ``SELECT 1`` antes de serem entregues
+    """
+
+    def __init__(self, connection_factory: Callable[[], Any], minconn: int = 1,
+                 maxconn: int = 10, timeout: float = 30.0,
+                 health_check_interval: float = 30.0):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Tamanho do pool inválido: exige 0 <= minconn <= maxconn e maxconn >= 1")
+
+        self._factory = connection_factory
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle: List[tuple] = []  # (conexão, instante em que ficou ociosa)
+        self._in_use = 0
+        self._closed = False
+        self.metrics = PoolMetrics()
+
+        for _ in range(minconn):
+            self._idle.append((self._connect(), time.monotonic()))
+        self.metrics.idle = len(self._idle)
+
+    def _connect(self):
+        conn = self._factory()
+        with self._cond:
+            self.metrics.created += 1
+        return conn
+
+    @staticmethod
+    def _is_broken(conn) -> bool:
+        """Conexão fechada ou com socket em estado desconhecido"""
+        if conn.closed:
+            return True
+        return conn.get_transaction_status() == extensions.TRANSACTION_STATUS_UNKNOWN
+
+    def _ping(self, conn) -> bool:
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @staticmethod
+    def _discard(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def getconn(self) -> PooledConnection:
+        """
+        Empresta uma conexão saudável do pool
+
+        Returns:
+            PooledConnection que volta ao pool em ``close()`` ou no fim do ``with``
+
+        Raises:
+            PoolTimeoutError: Se nenhuma conexão ficar livre dentro de ``timeout``
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise pg_pool.PoolError("Pool de conexões fechado")
+                if self._idle or self._in_use + len(self._idle) < self.maxconn:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.metrics.timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Nenhuma conexão livre após {self.timeout:.1f}s "
+                        f"({self._in_use}/{self.maxconn} em uso)"
+                    )
+                self._cond.wait(remaining)
+
+            entry = self._idle.pop() if self._idle else None
+            self._in_use += 1
+            self._update_gauges()
+
+        try:
+            conn = self._checkout(entry)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._update_gauges()
+                self._cond.notify()
+            raise
+
+        waited = time.monotonic() - start
+        with self._cond:
+            self.metrics.checkouts += 1
+            self.metrics.total_wait_time += waited
+            self.metrics.max_wait_time = max(self.metrics.max_wait_time, waited)
+        return PooledConnection(self, conn)
+
+    def _checkout(self, entry: Optional[tuple]):
+        """Valida a conexão ociosa (ou abre uma nova) fora do lock"""
+        if entry is None:
+            return self._connect()
+
+        conn, idle_since = entry
+        healthy = not self._is_broken(conn)
+        if healthy and time.monotonic() - idle_since >= self.health_check_interval:
+            healthy = self._ping(conn)
+        if healthy:
+            return conn
+
+        self._discard(conn)
+        with self._cond:
+            self.metrics.discarded += 1
+            self.metrics.reconnects += 1
+        return self._connect()
+
+    def _release(self, conn) -> None:
+        """Devolve uma conexão emprestada ao pool"""
+        broken = self._is_broken(conn)
+        if not broken and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            # Transação pendente não pode vazar para o próximo usuário
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+
+        with self._cond:
+            self._in_use -= 1
+            if broken or self._closed:
+                self._discard(conn)
+                if broken:
+                    self.metrics.discarded += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._update_gauges()
+            self._cond.notify()
+
+    def _update_gauges(self) -> None:
+        self.metrics.in_use = self._in_use
+        self.metrics.idle = len(self._idle)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Retorna um snapshot das métricas do pool"""
+        with self._cond:
+            data = self.metrics.to_dict()
+        data['minconn'] = self.minconn
+        data['maxconn'] = self.maxconn
+        return data
+
+    def closeall(self) -> None:
+        """Fecha todas as conexões ociosas; as emprestadas são fechadas ao voltar"""
+        with self._cond:
+            self._closed = True
+            for conn, _ in self._idle:
+                self._discard(conn)
+            self._idle.clear()
+            self._update_gauges()
+            self._cond.notify_all()
+
+
+# Pool global do processo
+_pool: Optional[ConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(connection_factory: Optional[Callable[[], Any]] = None) -> ConnectionPool:
+    """
+    Retorna o pool global do processo, criando-o na primeira chamada
+
+    O tamanho é lido de DB_POOL_MIN / DB_POOL_MAX, o tempo limite de
+    DB_POOL_TIMEOUT e o intervalo do health check de DB_POOL_HEALTHCHECK.
+    Após um ``fork`` o filho cria um pool próprio, sem reaproveitar os
+    sockets do processo pai.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            if connection_factory is None:
+                from .db_helpers import create_raw_connection
+                connection_factory = create_raw_connection
+            _pool = ConnectionPool(
+                connection_factory,
+                minconn=int(os.getenv("DB_POOL_MIN", "1")),
+                maxconn=int(os.getenv("DB_POOL_MAX", "10")),
+                timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                health_check_interval=float(os.getenv("DB_POOL_HEALTHCHECK", "30")),
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def close_pool() -> None:
+    """Fecha o pool global (ex.: ao encerrar a aplicação)"""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.closeall()
+        _pool = None
+        _pool_pid = None
+
+
+atexit.register(close_pool)
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Métricas do pool global, ou dicionário vazio se ainda não foi criado"""
+    if _pool is None or _pool_pid != os.getpid():
+        return {}
+    return _pool.get_metrics()
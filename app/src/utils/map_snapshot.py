@@ -0,0 +1,269 @@
+"""
+Snapshot binário de um mapa, aberto com mmap
+
+Formato (little-endian, arrays alinhados em 8 bytes)::
+
+    cabeçalho  128 bytes   magic, versão do formato, tamanho da paleta, id_mapa,
+                           quantidade de chunks, carimbo do banco, CRC32, nome, turno
+    paleta     32 bytes/bioma  (id_bioma int32, nome utf-8)
+    id_chunk   int64[n]
+    x          int32[n]
+    y          int32[n]
+    id_bioma   int32[n]
+
+Os arrays são lidos direto das páginas mapeadas (sem cópia), então vários
+processos que abrem o mesmo arquivo compartilham a memória pelo cache de
+páginas do sistema. O carimbo vem do contador ``mapa.versao`` (incrementado
+por trigger a cada alteração nos chunks do mapa) e da paleta de biomas; se ele
+mudar, o snapshot está desatualizado e é regravado.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .chunk_store import ChunkStore
+from .db_helpers import connection_db
+
+# Diretório dos snapshots; vazio desativa o uso em find_store_by_mapa
+SNAPSHOT_DIR = os.getenv("MAP_SNAPSHOT_DIR", "")
+# Segundos após a gravação em que o snapshot é usado sem conferir o carimbo
+SNAPSHOT_TTL = float(os.getenv("MAP_SNAPSHOT_TTL", "0"))
+
+MAGIC = b"MCMAPSNP"
+FORMAT_VERSION = 1
+HEADER_SIZE = 128
+_HEADER = struct.Struct("<8sHHiQQI64s8s")
+_PALETTE_ENTRY = struct.Struct("<i28s")
+
+# Carimbo do mapa: versão mantida pelo trigger da migração 0003 e a paleta de
+# biomas (tabela pequena), sem varrer os chunks
+_STAMP_SQL = """
+    SELECT m.id_mapa,
+           m.versao,
+           (SELECT string_agg(b.id_bioma || '=' || b.nome, ',' ORDER BY b.id_bioma) FROM bioma b)
+    FROM mapa m
+    WHERE m.nome = %s AND m.turno = %s
+"""
+
+# Arquivos cujo CRC32 já foi conferido neste processo: caminho → (inode, mtime)
+_verified: Dict[str, Tuple[int, int]] = {}
+
+
+class SnapshotError(Exception):
+    """Arquivo de snapshot inválido, truncado ou de outra versão do formato"""
+    pass
+
+
+def compute_stamp(*values) -> int:
+    """Reduz os valores do carimbo a um inteiro de 64 bits"""
+    digest = hashlib.blake2b(repr(values).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def snapshot_path(mapa_nome: str, turno: str, directory: Optional[str] = None) -> str:
+    nome = "".join(ch if ch.isalnum() else "_" for ch in mapa_nome)
+    return os.path.join(directory or SNAPSHOT_DIR, f"{nome}_{turno}.snap")
+
+
+def _layout(palette_len: int, count: int) -> Tuple[int, int, int, int, int]:
+    """Offsets de id_chunk, x, y, id_bioma e o tamanho total do arquivo"""
+    ids = HEADER_SIZE + palette_len * _PALETTE_ENTRY.size
+    xs = ids + 8 * count
+    ys = xs + 4 * count
+    biomas = ys + 4 * count
+    return ids, xs, ys, biomas, biomas + 4 * count
+
+
+def write_snapshot(path: str, store: ChunkStore, id_mapa: int, mapa_nome: str, turno: str,
+                   palette: Dict[int, str], stamp: int) -> None:
+    """
+    Grava o snapshot de um mapa
+
+    O arquivo é escrito ao lado do destino e trocado com ``os.replace``, então
+    processos com o snapshot antigo mapeado continuam lendo a versão antiga.
+    """
+    paleta = b"".join(_PALETTE_ENTRY.pack(id_bioma, nome.encode("utf-8")[:28])
+                      for id_bioma, nome in sorted(palette.items()))
+    colunas = [np.ascontiguousarray(store.id_chunk, dtype="<i8"),
+               np.ascontiguousarray(store.x, dtype="<i4"),
+               np.ascontiguousarray(store.y, dtype="<i4"),
+               np.ascontiguousarray(store.id_bioma, dtype="<i4")]
+    checksum = zlib.crc32(paleta)
+    for coluna in colunas:
+        checksum = zlib.crc32(coluna, checksum)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(palette), id_mapa, len(store), stamp,
+                          checksum, mapa_nome.encode("utf-8")[:64], turno.encode("utf-8")[:8])
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            f.write(paleta)
+            for coluna in colunas:
+                f.write(coluna)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _map_file(f, path: str) -> mmap.mmap:
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        raise SnapshotError(f"{path}: arquivo vazio")
+
+
+class MapSnapshot:
+    """
+    Snapshot aberto somente leitura
+
+    Attributes:
+        id_mapa, nome, turno: Mapa do snapshot
+        stamp: Carimbo do banco no momento da exportação
+        checksum: CRC32 da paleta e dos arrays
+        palette: id_bioma → nome do bioma
+        id_chunk, x, y, id_bioma: Arrays sobre as páginas mapeadas
+    """
+
+    def __init__(self, path: str, buffer, verify_checksum: bool = False):
+        self.path = path
+        if len(buffer) < HEADER_SIZE:
+            raise SnapshotError(f"{path}: arquivo menor que o cabeçalho")
+        (magic, version, palette_len, self.id_mapa, count, self.stamp, self.checksum,
+         nome, turno) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise SnapshotError(f"{path}: não é um snapshot de mapa")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"{path}: formato {version}, esperado {FORMAT_VERSION}")
+        self.nome = nome.rstrip(b"\0").decode("utf-8")
+        self.turno = turno.rstrip(b"\0").decode("utf-8")
+
+        ids, xs, ys, biomas, total = _layout(palette_len, count)
+        if len(buffer) != total:
+            raise SnapshotError(f"{path}: tamanho {len(buffer)}, esperado {total}")
+        if verify_checksum and zlib.crc32(memoryview(buffer)[HEADER_SIZE:]) != self.checksum:
+            raise SnapshotError(f"{path}: checksum não confere")
+
+        self.palette: Dict[int, str] = {}
+        for i in range(palette_len):
+            id_bioma, nome_bioma = _PALETTE_ENTRY.unpack_from(buffer, HEADER_SIZE + i * _PALETTE_ENTRY.size)
+            self.palette[id_bioma] = nome_bioma.rstrip(b"\0").decode("utf-8")
+
+        self.id_chunk = np.frombuffer(buffer, dtype="<i8", count=count, offset=ids)
+        self.x = np.frombuffer(buffer, dtype="<i4", count=count, offset=xs)
+        self.y = np.frombuffer(buffer, dtype="<i4", count=count, offset=ys)
+        self.id_bioma = np.frombuffer(buffer, dtype="<i4", count=count, offset=biomas)
+
+    @classmethod
+    def open(cls, path: str, verify_checksum: bool = False) -> 'MapSnapshot':
+        """Mapeia o arquivo na memória (somente leitura)"""
+        with open(path, "rb") as f:
+            buffer = _map_file(f, path)
+        return cls(path, buffer, verify_checksum)
+
+    def __len__(self) -> int:
+        return len(self.id_chunk)
+
+    def bioma_nome(self, id_bioma: int) -> str:
+        return self.palette.get(id_bioma, str(id_bioma))
+
+    def store(self) -> ChunkStore:
+        """ChunkStore sobre os arrays mapeados (id_mapa é uma coluna constante, sem cópia)"""
+        id_mapa = np.broadcast_to(np.int32(self.id_mapa), (len(self),))
+        return ChunkStore(self.id_chunk, self.id_bioma, id_mapa, self.x, self.y)
+
+
+def fetch_stamp(cursor, mapa_nome: str, turno: str) -> Optional[Tuple[int, int, Dict[int, str]]]:
+    """
+    Carimbo atual do mapa no banco
+
+    Returns:
+        (id_mapa, carimbo, paleta) ou None se o mapa não existir
+    """
+    cursor.execute(_STAMP_SQL, (mapa_nome, turno))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    id_mapa, versao, biomas = row
+    palette = {}
+    for entrada in (biomas or "").split(","):
+        if entrada:
+            id_bioma, _, nome = entrada.partition("=")
+            palette[int(id_bioma)] = nome
+    return id_mapa, compute_stamp(versao, biomas), palette
+
+
+def _current_stamp(mapa_nome: str, turno: str) -> Optional[Tuple[int, int, Dict[int, str]]]:
+    with connection_db() as conn:
+        with conn.cursor() as cursor:
+            return fetch_stamp(cursor, mapa_nome, turno)
+
+
+def open_verified(path: str) -> MapSnapshot:
+    """
+    Abre o snapshot conferindo o CRC32 na primeira abertura de cada arquivo
+
+    Arquivos são sempre trocados com ``os.replace``, então um novo inode (ou
+    mtime) indica conteúdo novo, que é conferido de novo.
+    """
+    with open(path, "rb") as f:
+        # fstat do mesmo descritor mapeado: uma troca no meio não passa sem conferência
+        info = os.fstat(f.fileno())
+        buffer = _map_file(f, path)
+    chave = (info.st_ino, info.st_mtime_ns)
+    snapshot = MapSnapshot(path, buffer, verify_checksum=_verified.get(path) != chave)
+    _verified[path] = chave
+    return snapshot
+
+
+def load_map_store(mapa_nome: str, turno: str, loader: Callable[[], ChunkStore],
+                   directory: Optional[str] = None) -> ChunkStore:
+    """
+    ChunkStore do mapa servido pelo snapshot, regravado quando desatualizado
+
+    Um snapshot gravado há menos de ``MAP_SNAPSHOT_TTL`` segundos é usado sem
+    ida ao banco. Depois disso, o carimbo do banco (versão do mapa e paleta,
+    uma leitura pela chave) é comparado com o do arquivo; se diferir,
+    ``loader`` relê o mapa do banco e o snapshot é regravado.
+
+    Args:
+        mapa_nome: Nome do mapa
+        turno: Turno do mapa
+        loader: Carrega o mapa do banco (ex.: consulta do ChunkRepository)
+        directory: Diretório dos snapshots (padrão: ``MAP_SNAPSHOT_DIR``)
+    """
+    path = snapshot_path(mapa_nome, turno, directory)
+    snapshot = None
+    try:
+        snapshot = open_verified(path)
+        if SNAPSHOT_TTL and time.time() - os.path.getmtime(path) < SNAPSHOT_TTL:
+            return snapshot.store()
+    except FileNotFoundError:
+        pass
+    except SnapshotError as e:
+        print(f"Snapshot do mapa {mapa_nome} ({turno}) inválido, regravando: {str(e)}")
+
+    atual = _current_stamp(mapa_nome, turno)
+    if atual is None:
+        return ChunkStore.empty()
+    id_mapa, stamp, palette = atual
+
+    if snapshot is not None and snapshot.stamp == stamp:
+        return snapshot.store()
+
+    store = loader()
+    # Leitura vazia (erro no loader) ou mapa alterado no meio não vira snapshot
+    if len(store) and _current_stamp(mapa_nome, turno) == atual:
+        write_snapshot(path, store, id_mapa, mapa_nome, turno, palette, stamp)
+    return store
@@ -0,0 +1,244 @@
+"""
+Migrações versionadas do schema
+
+Cada migração tem uma versão inteira crescente e uma lista de comandos
+idempotentes (``IF NOT EXISTS``). As versões aplicadas ficam registradas na
+tabela ``schema_version``, então rodar o runner de novo só aplica o que falta.
+
+Migrações não transacionais (``CREATE INDEX CONCURRENTLY``) rodam em uma
+conexão com autocommit, um comando por vez, sem bloquear escritas nas tabelas.
+Um índice que ficou INVALID por uma criação interrompida é removido e criado
+de novo na próxima execução.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Set
+
+from .db_helpers import create_raw_connection
+
+# Chave do advisory lock que impede dois processos de migrarem ao mesmo tempo
+MIGRATION_LOCK_KEY = 20251001
+
+# Nome do índice em um CREATE INDEX CONCURRENTLY IF NOT EXISTS
+_CONCURRENT_INDEX = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Passo de migração do schema
+
+    Attributes:
+        version: Versão sequencial (1, 2, 3...)
+        name: Descrição curta registrada em schema_version
+        statements: Comandos SQL idempotentes, executados em ordem
+        transactional: False para comandos que não podem rodar em transação
+    """
+    version: int
+    name: str
+    statements: Sequence[str]
+    transactional: bool = True
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        name="hot_path_indexes",
+        transactional=False,
+        statements=[
+            # Os índices de FK usados pelos joins (idx_player_chunk, idx_inventario_plr,
+            # idx_chunk_bioma) já vêm de db/init/02_schema/06_indexes.sql
+            # find_by_mapa filtra por mapa e ordena por (x, y)
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunk_mapa_xy ON chunk (id_mapa, x, y)",
+            # find_active_players e contagem de jogadores vivos
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_player_vivos "
+            "ON player (vida_atual) WHERE vida_atual > 0",
+        ],
+    ),
+    Migration(
+        version=2,
+        name="mundo",
+        statements=[
+            # Relógio global do mundo (linha única, avançada por MundoRepository.avancar_relogio)
+            """
+            CREATE TABLE IF NOT EXISTS mundo (
+                id_mundo       INT PRIMARY KEY CHECK (id_mundo = 1),
+                turno_atual    VARCHAR(10) NOT NULL DEFAULT 'Dia' CHECK (turno_atual IN ('Dia', 'Noite')),
+                ticks_no_turno INT NOT NULL DEFAULT 0 CHECK (ticks_no_turno >= 0)
+            )
+            """,
+            "INSERT INTO mundo (id_mundo) VALUES (1) ON CONFLICT (id_mundo) DO NOTHING",
+        ],
+    ),
+    Migration(
+        version=3,
+        name="mapa_versao",
+        statements=[
+            # Contador de alterações por mapa, lido pelo snapshot (map_snapshot.fetch_stamp)
+            "ALTER TABLE mapa ADD COLUMN IF NOT EXISTS versao BIGINT NOT NULL DEFAULT 0",
+            # Um incremento por comando e por mapa afetado (inclusive COPY do gerador de mundo)
+            """
+            CREATE OR REPLACE FUNCTION mapa_versao_chunk() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    UPDATE mapa SET versao = versao + 1
+                    WHERE id_mapa IN (SELECT id_mapa FROM novos);
+                ELSIF TG_OP = 'UPDATE' THEN
+                    UPDATE mapa SET versao = versao + 1
+                    WHERE id_mapa IN (SELECT id_mapa FROM novos UNION SELECT id_mapa FROM antigos);
+                ELSIF TG_OP = 'DELETE' THEN
+                    UPDATE mapa SET versao = versao + 1
+                    WHERE id_mapa IN (SELECT id_mapa FROM antigos);
+                ELSE
+                    UPDATE mapa SET versao = versao + 1;
+                END IF;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            "DROP TRIGGER IF EXISTS trg_chunk_versao_ins ON chunk",
+            "CREATE TRIGGER trg_chunk_versao_ins AFTER INSERT ON chunk "
+            "REFERENCING NEW TABLE AS novos FOR EACH STATEMENT EXECUTE FUNCTION mapa_versao_chunk()",
+            "DROP TRIGGER IF EXISTS trg_chunk_versao_upd ON chunk",
+            "CREATE TRIGGER trg_chunk_versao_upd AFTER UPDATE ON chunk "
+            "REFERENCING OLD TABLE AS antigos NEW TABLE AS novos "
+            "FOR EACH STATEMENT EXECUTE FUNCTION mapa_versao_chunk()",
+            "DROP TRIGGER IF EXISTS trg_chunk_versao_del ON chunk",
+            "CREATE TRIGGER trg_chunk_versao_del AFTER DELETE ON chunk "
+            "REFERENCING OLD TABLE AS antigos FOR EACH STATEMENT EXECUTE FUNCTION mapa_versao_chunk()",
+            "DROP TRIGGER IF EXISTS trg_chunk_versao_trunc ON chunk",
+            "CREATE TRIGGER trg_chunk_versao_trunc AFTER TRUNCATE ON chunk "
+            "FOR EACH STATEMENT EXECUTE FUNCTION mapa_versao_chunk()",
+        ],
+    ),
+]
+
+
+# Versão esperada do schema após todas as migrações
+LATEST_VERSION = max(m.version for m in MIGRATIONS)
+
+
+class MigrationRunner:
+    """Aplica as migrações pendentes e registra as versões em schema_version"""
+
+    def __init__(self, migrations: Optional[Sequence[Migration]] = None,
+                 connection_factory: Callable = create_raw_connection):
+        self.migrations = sorted(MIGRATIONS if migrations is None else migrations,
+                                 key=lambda m: m.version)
+        versions = [m.version for m in self.migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Versões de migração duplicadas: {versions}")
+        self._connection_factory = connection_factory
+
+    def _ensure_version_table(self, cursor) -> None:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT now()
+            )
+        """)
+
+    def _applied_versions(self, cursor) -> Set[int]:
+        cursor.execute("SELECT version FROM schema_version")
+        return {row[0] for row in cursor.fetchall()}
+
+    def current_version(self) -> int:
+        """Retorna a maior versão aplicada (0 se nenhuma)"""
+        conn = self._connection_factory()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                self._ensure_version_table(cursor)
+                return max(self._applied_versions(cursor), default=0)
+        finally:
+            conn.close()
+
+    def _apply(self, conn, cursor, migration: Migration) -> None:
+        if migration.transactional:
+            # Comandos e registro da versão na mesma transação
+            conn.autocommit = False
+            try:
+                for statement in migration.statements:
+                    cursor.execute(statement)
+                self._record(cursor, migration)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.autocommit = True
+        else:
+            # Cada comando é idempotente: uma falha no meio é retomada na próxima execução
+            for statement in migration.statements:
+                self._drop_invalid_index(cursor, statement)
+                cursor.execute(statement)
+            self._record(cursor, migration)
+
+    @staticmethod
+    def _drop_invalid_index(cursor, statement: str) -> None:
+        """
+        Remove o índice INVALID deixado por um CREATE INDEX CONCURRENTLY interrompido
+
+        O ``IF NOT EXISTS`` pularia esse índice, que nunca seria reconstruído
+        (e continuaria pesando nas escritas sem servir às consultas).
+        """
+        match = _CONCURRENT_INDEX.search(statement)
+        if match is None:
+            return
+        nome = match.group(1)
+        cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", (nome,))
+        row = cursor.fetchone()
+        if row is not None and not row[0]:
+            print(f"Índice {nome} inválido (criação interrompida), recriando...")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {nome}")
+
+    @staticmethod
+    def _record(cursor, migration: Migration) -> None:
+        cursor.execute(
+            "INSERT INTO schema_version (version, name) VALUES (%s, %s) "
+            "ON CONFLICT (version) DO NOTHING",
+            (migration.version, migration.name)
+        )
+
+    def run(self) -> List[int]:
+        """
+        Aplica as migrações pendentes em ordem de versão
+
+        Returns:
+            Versões aplicadas nesta execução
+        """
+        applied: List[int] = []
+        conn = self._connection_factory()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+                try:
+                    self._ensure_version_table(cursor)
+                    done = self._applied_versions(cursor)
+                    for migration in self.migrations:
+                        if migration.version in done:
+                            continue
+                        print(f"Aplicando migração {migration.version:04d}_{migration.name}...")
+                        self._apply(conn, cursor, migration)
+                        applied.append(migration.version)
+                finally:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+        finally:
+            conn.close()
+        return applied
+
+
+def run_migrations() -> bool:
+    """Aplica as migrações pendentes; retorna False se alguma falhar"""
+    try:
+        applied = MigrationRunner().run()
+        if applied:
+            print(f"Migrações aplicadas: {', '.join(str(v) for v in applied)}")
+        return True
+    except Exception as e:
+        print(f"Erro ao aplicar migrações: {str(e)}")
+        return False
@@ -0,0 +1,506 @@
+"""
+Busca de rotas entre chunks
+
+A grade de um mapa vira arrays planos (célula = linha * largura + coluna) com
+o custo de entrar em cada chunk, dado pelo bioma. Oceano é intransponível: só
+se chega nele ou se atravessa água por uma ponte ativa, que entra no grafo
+como uma aresta extra entre os dois chunks.
+
+Rotas avulsas usam A* com marcos (ALT): em mapas grandes, o grafo guarda os
+campos de distância de alguns chunks da borda de cada região, e a
+desigualdade triangular sobre esses campos dá uma estimativa bem mais justa
+que a distância de Manhattan. Destinos muito consultados ganham um campo de
+distâncias próprio (Dijkstra a partir do destino, calculado de uma vez sobre
+a grade inteira); com ele, a rota sai só seguindo o campo, em tempo
+proporcional ao tamanho do caminho.
+"""
+
+import heapq
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.bioma import Bioma
+from ..models.ponte import Ponte
+from .chunk_store import ChunkStore
+from .reference_cache import get_reference_version
+
+# Custo para entrar em um chunk de cada bioma; None = intransponível
+BIOMA_CUSTOS: Dict[str, Optional[int]] = {"Floresta": 1, "Deserto": 2, "Selva": 3, "Oceano": None}
+# Custo de uma ponte por chunk de extensão
+PONTE_CUSTO = 1
+# Consultas ao mesmo destino antes de montar o campo de distâncias dele
+ROTA_CAMPO_POPULAR = int(os.getenv("ROTA_CAMPO_POPULAR", "3"))
+# Campos de distância mantidos em memória (4 bytes por chunk cada)
+ROTA_CAMPOS_MAX = int(os.getenv("ROTA_CAMPOS_MAX", "8"))
+# Destinos com contagem de consultas guardada (os mais recentes)
+ROTA_CONSULTAS_MAX = int(os.getenv("ROTA_CONSULTAS_MAX", "4096"))
+# Marcos do A* por grafo (dois campos de 4 bytes por chunk cada); 0 desativa
+ROTA_MARCOS = int(os.getenv("ROTA_MARCOS", "8"))
+# Grafos com menos células usam só a distância de Manhattan
+ROTA_MARCOS_MIN_CELULAS = 1 << 14
+# Marcos usados em cada consulta (os de maior estimativa na origem), por sentido
+ROTA_MARCOS_ATIVOS = 3
+
+INALCANCAVEL = np.iinfo(np.int32).max
+
+
+@dataclass
+class Rota:
+    """
+    Caminho entre dois chunks
+
+    Attributes:
+        chunks: IDs dos chunks da origem ao destino, inclusive
+        custo: Soma dos custos de entrada de cada passo
+    """
+    chunks: List[int] = field(default_factory=list)
+    custo: int = 0
+
+    @property
+    def passos(self) -> int:
+        return max(0, len(self.chunks) - 1)
+
+
+def bioma_costs(biomas: Iterable[Bioma],
+                custos: Optional[Dict[str, Optional[int]]] = None) -> Dict[int, int]:
+    """Custo por id_bioma (0 = intransponível); biomas sem custo definido custam 1"""
+    custos = BIOMA_CUSTOS if custos is None else custos
+    return {b.id_bioma: custos.get(b.nome, 1) or 0 for b in biomas}
+
+
+class RouteGraph:
+    """
+    Grafo de movimento de um mapa sobre as colunas de um ``ChunkStore``
+
+    Args:
+        store: Store com os chunks do mapa (pode conter outros mapas)
+        id_mapa: Mapa do grafo
+        custos: Custo de entrada por id_bioma (0 = intransponível)
+        pontes: Pontes ativas; as que não ligam dois chunks do mapa são ignoradas
+    """
+
+    def __init__(self, store: ChunkStore, id_mapa: int, custos: Dict[int, int],
+                 pontes: Iterable[Ponte] = ()):
+        self.store = store
+        self.id_mapa = id_mapa
+        entry = store._coord_index().get(id_mapa)
+        if entry is None:
+            self.x0 = self.y0 = self.width = self.height = 0
+            rows = np.empty(0, dtype=np.int64)
+        else:
+            self.x0, self.y0, matrix = entry
+            self.height, self.width = matrix.shape
+            rows = matrix.ravel()
+        existe = rows >= 0
+        linhas = rows[existe]
+
+        lut = np.ones(int(store.id_bioma.max(initial=0)) + 1, dtype=np.int32)
+        for id_bioma, custo in custos.items():
+            if 0 <= id_bioma < len(lut):
+                lut[id_bioma] = custo
+        self.cost = np.zeros(len(rows), dtype=np.int32)
+        self.cost[existe] = lut[store.id_bioma[linhas]]
+        self.ids = np.full(len(rows), -1, dtype=np.int64)
+        self.ids[existe] = store.id_chunk[linhas]
+        # Listas Python para os laços do A* (indexar array NumPy elemento a elemento é lento)
+        self._cost = self.cost.tolist()
+        self._min_cost = min([int(c) for c in np.unique(self.cost) if c > 0] + [PONTE_CUSTO])
+
+        self.pontes: Dict[int, List[Tuple[int, int]]] = {}
+        for ponte in pontes:
+            a, b = self.cell_of(ponte.chunk_origem), self.cell_of(ponte.chunk_destino)
+            if a is None or b is None or a == b:
+                continue
+            custo = PONTE_CUSTO * max(1, self.manhattan(a, b))
+            self.pontes.setdefault(a, []).append((b, custo))
+            self.pontes.setdefault(b, []).append((a, custo))
+        self.componente = self._components()
+        self._marcos: Optional[Tuple[List[memoryview], List[memoryview]]] = None
+        self._marcos_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.cost)
+
+    def _components(self) -> np.ndarray:
+        """
+        Rótulo da região conexa de cada célula (células transitáveis e pontes)
+
+        Serve para recusar na hora rotas entre regiões separadas por água,
+        que obrigariam o A* a explorar a região inteira. União por mínimo com
+        saltos de ponteiro, vetorizada: poucas rodadas mesmo em mapas grandes.
+        """
+        n, width = len(self.cost), self.width
+        labels = np.arange(n, dtype=np.int64)
+        if not n:
+            return labels
+        # Extremos de ponte contam como transitáveis para a conectividade
+        aberta = self.cost > 0
+        if self.pontes:
+            aberta[list(self.pontes)] = True
+        grade = np.arange(n, dtype=np.int64).reshape(self.height, width)
+        aberta = aberta.reshape(self.height, width)
+        horizontal = aberta[:, :-1] & aberta[:, 1:]
+        vertical = aberta[:-1, :] & aberta[1:, :]
+        pares = [(grade[:, :-1][horizontal], grade[:, 1:][horizontal]),
+                 (grade[:-1, :][vertical], grade[1:, :][vertical])]
+        if self.pontes:
+            ligacoes = np.array([(a, b) for a, destinos in self.pontes.items() for b, _ in destinos],
+                                dtype=np.int64)
+            pares.append((ligacoes[:, 0], ligacoes[:, 1]))
+        a = np.concatenate([p[0] for p in pares])
+        b = np.concatenate([p[1] for p in pares])
+        while True:
+            la, lb = labels[a], labels[b]
+            diferentes = la != lb
+            if not diferentes.any():
+                return labels
+            a, b, la, lb = a[diferentes], b[diferentes], la[diferentes], lb[diferentes]
+            np.minimum.at(labels, np.maximum(la, lb), np.minimum(la, lb))
+            while True:
+                saltos = labels[labels]
+                if (saltos == labels).all():
+                    break
+                labels = saltos
+
+    def reachable(self, origem: int, destino: int) -> bool:
+        """Se pode existir caminho (mesma região, ou um passo da origem leva à região do destino)"""
+        alvo = self.componente[destino]
+        if self.componente[origem] == alvo:
+            return True
+        return any(self.componente[vizinho] == alvo for vizinho, _ in self.moves(origem))
+
+    def cell_of(self, id_chunk: int) -> Optional[int]:
+        """Célula do chunk no grafo (None se não for deste mapa)"""
+        i = self.store.index_of(id_chunk)
+        if i is None or int(self.store.id_mapa[i]) != self.id_mapa:
+            return None
+        return (int(self.store.y[i]) - self.y0) * self.width + int(self.store.x[i]) - self.x0
+
+    def manhattan(self, a: int, b: int) -> int:
+        return abs(a // self.width - b // self.width) + abs(a % self.width - b % self.width)
+
+    def moves(self, cell: int) -> Iterable[Tuple[int, int]]:
+        """Passos (célula, custo) possíveis a partir da célula: vizinhos transitáveis e pontes"""
+        width, cost = self.width, self._cost
+        x = cell % width
+        for vizinho, ok in ((cell - width, cell >= width), (cell + width, cell + width < len(cost)),
+                            (cell - 1, x > 0), (cell + 1, x < width - 1)):
+            if ok and cost[vizinho] > 0:
+                yield vizinho, cost[vizinho]
+        yield from self.pontes.get(cell, ())
+
+    def landmarks(self) -> Optional[Tuple[List[memoryview], List[memoryview]]]:
+        """
+        Campos dos marcos: (distância até o marco, distância a partir do marco)
+
+        Montados no primeiro A* do grafo. Cada linha tem um marco por região
+        grande (regiões não se alcançam, então compartilham o campo); os
+        marcos ficam nos extremos da região em ``ROTA_MARCOS`` direções.
+        None em grafos pequenos ou com os marcos desativados.
+        """
+        if self._marcos is not None or ROTA_MARCOS <= 0 or len(self) < ROTA_MARCOS_MIN_CELULAS:
+            return self._marcos
+        with self._marcos_lock:
+            if self._marcos is None:
+                fontes = self._landmark_cells(ROTA_MARCOS)
+                if fontes:
+                    # memoryview: indexar devolve int do Python, bem mais rápido que o array no laço
+                    self._marcos = ([memoryview(linha) for linha in self.distance_fields(fontes)],
+                                    [memoryview(linha) for linha in self.distance_fields(fontes, forward=True)])
+        return self._marcos
+
+    def _landmark_cells(self, quantidade: int) -> List[List[int]]:
+        """
+        Marcos de cada região grande, espalhados pela borda dela
+
+        Escolha gulosa pelo ponto mais distante: o primeiro é o mais longe do
+        centro da região; cada um dos seguintes, o mais longe dos já
+        escolhidos (distância de Manhattan, barata de vetorizar).
+        """
+        abertas = np.flatnonzero(self.cost > 0)
+        rotulos, tamanhos = np.unique(self.componente[abertas], return_counts=True)
+        grandes = rotulos[tamanhos >= max(64, len(self) // 256)]
+        fontes: List[List[int]] = [[] for _ in range(quantidade)]
+        for rotulo in grandes:
+            cells = abertas[self.componente[abertas] == rotulo]
+            y, x = np.divmod(cells, self.width)
+            longe = np.abs(x - x.mean()) + np.abs(y - y.mean())
+            for linha in fontes:
+                i = int(np.argmax(longe))
+                linha.append(int(cells[i]))
+                longe = np.minimum(longe, np.abs(x - x[i]) + np.abs(y - y[i]))
+        return fontes if grandes.size else []
+
+    def _active_landmarks(self, origem: int, destino: int):
+        """Marcos da consulta: os que dão a maior estimativa na origem, em cada sentido"""
+        marcos = self.landmarks()
+        if marcos is None:
+            return (), ()
+        ate, desde = marcos
+        reversos = [(m, m[destino]) for m in ate
+                    if m[destino] != INALCANCAVEL and m[origem] != INALCANCAVEL]
+        reversos.sort(key=lambda par: par[0][origem] - par[1], reverse=True)
+        diretos = [(m, m[destino]) for m in desde
+                   if m[destino] != INALCANCAVEL and m[origem] != INALCANCAVEL]
+        diretos.sort(key=lambda par: par[1] - par[0][origem], reverse=True)
+        return reversos[:ROTA_MARCOS_ATIVOS], diretos[:ROTA_MARCOS_ATIVOS]
+
+    def astar(self, origem: int, destino: int) -> Optional[Rota]:
+        """
+        Rota de menor custo pelo A*
+
+        Heurística: o maior entre Manhattan × menor custo e as estimativas dos
+        marcos, d(v, M) - d(t, M) e d(M, t) - d(M, v). Todas são consistentes,
+        então nenhuma célula é expandida duas vezes; empates vão para o maior
+        custo acumulado (mais perto do destino).
+        """
+        if origem == destino:
+            return self._rota([origem], 0)
+        if not self.reachable(origem, destino):
+            return None
+        escala = self._min_cost
+        width, cost, pontes = self.width, self._cost, self.pontes
+        n = len(cost)
+        dx, dy = destino % width, destino // width
+        reversos, diretos = self._active_landmarks(origem, destino)
+
+        def h(cell: int) -> int:
+            melhor = (abs(cell % width - dx) + abs(cell // width - dy)) * escala
+            for marco, alvo in reversos:
+                estimativa = marco[cell] - alvo
+                if estimativa > melhor:
+                    melhor = estimativa
+            for marco, alvo in diretos:
+                estimativa = alvo - marco[cell]
+                if estimativa > melhor:
+                    melhor = estimativa
+            return melhor
+
+        custo = {origem: 0}
+        anterior: Dict[int, int] = {}
+        fila = [(h(origem), 0, origem)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while fila:
+            _, g, cell = heappop(fila)
+            g = -g
+            if cell == destino:
+                caminho = [cell]
+                while cell != origem:
+                    cell = anterior[cell]
+                    caminho.append(cell)
+                return self._rota(caminho[::-1], g)
+            if g > custo[cell]:
+                continue
+            x = cell % width
+            passos = [(vizinho, cost[vizinho]) for vizinho, ok in (
+                (cell - width, cell >= width), (cell + width, cell + width < n),
+                (cell - 1, x > 0), (cell + 1, x < width - 1)) if ok and cost[vizinho]]
+            if cell in pontes:
+                passos += pontes[cell]
+            for vizinho, passo in passos:
+                novo = g + passo
+                if novo < custo.get(vizinho, INALCANCAVEL):
+                    custo[vizinho] = novo
+                    anterior[vizinho] = cell
+                    heappush(fila, (novo + h(vizinho), -novo, vizinho))
+        return None
+
+    def distance_field(self, destino: int) -> np.ndarray:
+        """Custo de cada célula até o destino (``INALCANCAVEL`` se não houver caminho)"""
+        return self.distance_fields([[destino]])[0]
+
+    def distance_fields(self, fontes: Sequence[Sequence[int]], forward: bool = False) -> np.ndarray:
+        """
+        Vários campos de distância de uma vez, um por linha
+
+        Cada linha parte das células de ``fontes[i]`` (distância 0). Por
+        padrão o campo é o custo de cada célula até a fonte mais próxima; com
+        ``forward``, o custo da fonte até a célula. Dijkstra com baldes por
+        distância (os custos são inteiros pequenos): as células de mesma
+        distância de todas as linhas são expandidas juntas com operações
+        vetorizadas.
+        """
+        n, width = len(self.cost), self.width
+        linhas = len(fontes)
+        dist = np.full(linhas * n, INALCANCAVEL, dtype=np.int32)
+        if not n or not linhas:
+            return dist.reshape(linhas, n)
+        fechado = np.zeros(linhas * n, dtype=bool)
+        inicio = np.concatenate([np.asarray(cells, dtype=np.int64) + i * n for i, cells in enumerate(fontes)])
+        dist[inicio] = 0
+        com_ponte = np.array(sorted(self.pontes), dtype=np.int64)
+        baldes: Dict[int, List[np.ndarray]] = {0: [inicio]}
+        while baldes:
+            d = min(baldes)
+            partes = baldes.pop(d)
+            flat = np.unique(np.concatenate(partes)) if len(partes) > 1 else partes[0]
+            flat = flat[(dist[flat] == d) & ~fechado[flat]]
+            if not len(flat):
+                continue
+            fechado[flat] = True
+            candidatos = []
+            # Pontes valem nos dois sentidos e partem de qualquer extremo já fechado
+            if len(com_ponte):
+                for i in np.flatnonzero(np.isin(flat % n, com_ponte)):
+                    cell = int(flat[i] % n)
+                    for outra, custo in self.pontes[cell]:
+                        candidatos.append((np.array([flat[i] - cell + outra]),
+                                           np.array([d + custo], dtype=np.int32)))
+            if not forward:
+                # Entrar em u custa cost[u]: quem está ao lado de u chega à fonte com d + cost[u]
+                flat = flat[self.cost[flat % n] > 0]
+            cells = flat % n
+            base = flat - cells
+            x = cells % width
+            for vizinho, ok in ((cells - width, cells >= width), (cells + width, cells + width < n),
+                                (cells - 1, x > 0), (cells + 1, x < width - 1)):
+                vizinho, alvo = vizinho[ok], base[ok] + vizinho[ok]
+                if forward:
+                    # A partir da fonte, entrar no vizinho custa cost[vizinho]
+                    passo = self.cost[vizinho]
+                    aberto = passo > 0
+                    candidatos.append((alvo[aberto], d + passo[aberto]))
+                else:
+                    candidatos.append((alvo, d + self.cost[cells[ok]]))
+            for vizinhos, nd in candidatos:
+                melhor = nd < dist[vizinhos]
+                vizinhos, nd = vizinhos[melhor], nd[melhor]
+                if not len(vizinhos):
+                    continue
+                np.minimum.at(dist, vizinhos, nd)
+                for valor in np.unique(nd):
+                    baldes.setdefault(int(valor), []).append(vizinhos[nd == valor])
+        return dist.reshape(linhas, n)
+
+    def follow(self, dist: np.ndarray, origem: int) -> Optional[Rota]:
+        """Rota da origem até o destino do campo, descendo pelas distâncias"""
+        total = int(dist[origem])
+        if total == INALCANCAVEL:
+            return None
+        caminho, restante, cell = [origem], total, origem
+        while restante:
+            for vizinho, passo in self.moves(cell):
+                if int(dist[vizinho]) + passo == restante:
+                    cell, restante = vizinho, restante - passo
+                    break
+            else:
+                return None
+            caminho.append(cell)
+        return self._rota(caminho, total)
+
+    def _rota(self, cells: List[int], custo: int) -> Rota:
+        return Rota([int(i) for i in self.ids[cells]], int(custo))
+
+
+class Pathfinder:
+    """
+    Rotas entre chunks de um mesmo mapa, com cache de grafos e de campos
+
+    O grafo de cada mapa é montado pelo ``graph_loader`` no primeiro uso e
+    refeito quando chunks, pontes ou biomas mudam (versões de
+    ``bump_reference_version``). Um destino consultado ``popular`` vezes ganha
+    um campo de distâncias; os ``max_fields`` campos mais recentes ficam em
+    memória. As contagens de consultas ficam só para os ``ROTA_CONSULTAS_MAX``
+    destinos consultados mais recentemente.
+
+    Args:
+        graph_loader: Função id_mapa → RouteGraph (None se o mapa não existir)
+        popular: Consultas ao destino antes de montar o campo (padrão: ROTA_CAMPO_POPULAR)
+        max_fields: Campos mantidos em memória (padrão: ROTA_CAMPOS_MAX)
+    """
+
+    VERSOES = ("chunk", "ponte", "bioma")
+
+    def __init__(self, graph_loader: Callable[[int], Optional[RouteGraph]],
+                 popular: Optional[int] = None, max_fields: Optional[int] = None):
+        self._loader = graph_loader
+        self.popular = ROTA_CAMPO_POPULAR if popular is None else popular
+        self.max_fields = ROTA_CAMPOS_MAX if max_fields is None else max_fields
+        self._graphs: Dict[int, Tuple[Tuple[int, ...], RouteGraph]] = {}
+        self._fields: 'OrderedDict[Tuple[int, int], np.ndarray]' = OrderedDict()
+        self._consultas: 'OrderedDict[Tuple[int, int], int]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _versao(self) -> Tuple[int, ...]:
+        return tuple(get_reference_version(tabela) for tabela in self.VERSOES)
+
+    def graph(self, id_mapa: int) -> Optional[RouteGraph]:
+        """Grafo do mapa, montado no primeiro uso e refeito quando o mundo muda"""
+        versao = self._versao()
+        cached = self._graphs.get(id_mapa)
+        if cached is not None and cached[0] == versao:
+            return cached[1]
+        graph = self._loader(id_mapa)
+        with self._lock:
+            # Campos do grafo anterior não valem para o novo
+            for chave in [k for k in self._fields if k[0] == id_mapa]:
+                del self._fields[chave]
+            if graph is None or not len(graph):
+                self._graphs.pop(id_mapa, None)
+                return None
+            self._graphs[id_mapa] = (versao, graph)
+        return graph
+
+    def mapa_of(self, id_chunk: int) -> Optional[int]:
+        """Mapa do chunk pelos grafos já montados (None se nenhum grafo atual o conhece)"""
+        versao = self._versao()
+        for id_mapa, (versao_grafo, graph) in list(self._graphs.items()):
+            if versao_grafo == versao and graph.cell_of(id_chunk) is not None:
+                return id_mapa
+        return None
+
+    def invalidate(self) -> None:
+        """Descarta grafos, campos e contagens"""
+        with self._lock:
+            self._graphs.clear()
+            self._fields.clear()
+            self._consultas.clear()
+
+    def field(self, id_mapa: int, destino: int) -> Optional[np.ndarray]:
+        """Campo de distâncias até o chunk destino, montando-o se ainda não existir"""
+        graph = self.graph(id_mapa)
+        cell = graph.cell_of(destino) if graph is not None else None
+        if cell is None:
+            return None
+        with self._lock:
+            dist = self._fields.get((id_mapa, destino))
+            if dist is not None:
+                self._fields.move_to_end((id_mapa, destino))
+                return dist
+        dist = graph.distance_field(cell)
+        with self._lock:
+            self._fields[(id_mapa, destino)] = dist
+            while len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        return dist
+
+    def route(self, id_mapa: int, origem: int, destino: int) -> Optional[Rota]:
+        """
+        Rota de menor custo entre dois chunks do mapa
+
+        Returns:
+            Rota, ou None se algum dos chunks não for do mapa ou não houver caminho
+        """
+        graph = self.graph(id_mapa)
+        if graph is None:
+            return None
+        a, b = graph.cell_of(origem), graph.cell_of(destino)
+        if a is None or b is None:
+            return None
+        with self._lock:
+            dist = self._fields.get((id_mapa, destino))
+            consultas = self._consultas.pop((id_mapa, destino), 0) + 1
+            self._consultas[(id_mapa, destino)] = consultas
+            while len(self._consultas) > ROTA_CONSULTAS_MAX:
+                self._consultas.popitem(last=False)
+            popular = self.max_fields > 0 and consultas >= self.popular
+        if dist is None and popular:
+            dist = self.field(id_mapa, destino)
+        if dist is not None:
+            return graph.follow(dist, a)
+        return graph.astar(a, b)
@@ -3,6 +3,7 @@ Gerenciador de Sessão do Personagem Global
 Mantém dados essenciais do personagem em memória para otimizar performance
 """
 
+import os
 from typing import Optional, List, Tuple
 from src.models.player import Player
 from src.models.chunk import Chunk
@@ -13,6 +14,9 @@ from colorama import Fore
 # Variável global para armazenar o personagem ativo
 current_player: Optional[Player] = None
 
+# Personagens exibidos por página nas telas de listagem e seleção
+PLAYER_PAGE_SIZE = int(os.getenv("PLAYER_PAGE_SIZE", "10"))
+
 
 def set_current_player(player_data: Player) -> None:
     """Define o personagem ativo da sessão"""
@@ -101,6 +105,58 @@ def get_all_players() -> List[Player]:
         print(f"Erro ao buscar personagens: {str(e)}")
         return []
 
+class PlayerPager:
+    """
+    Navegação paginada pela lista de personagens
+    
+    Cada página é buscada por chave (nome do último personagem da página
+    anterior); os nomes iniciais das páginas visitadas ficam guardados para
+    voltar. Só a página visível vem do banco.
+    """
+    
+    def __init__(self, page_size: int = PLAYER_PAGE_SIZE):
+        self.page_size = page_size
+        self._inicios: List[Optional[str]] = [None]
+        self.players: List[Player] = []
+        self.has_next = False
+        self.load()
+    
+    @property
+    def page_number(self) -> int:
+        return len(self._inicios)
+    
+    @property
+    def has_previous(self) -> bool:
+        return len(self._inicios) > 1
+    
+    def load(self) -> List[Player]:
+        """(Re)carrega a página atual; um personagem a mais indica que há próxima"""
+        try:
+            interface_service = InterfaceService.get_instance()
+            players = interface_service.get_players_page(self._inicios[-1], self.page_size + 1)
+        except Exception as e:
+            print(f"Erro ao buscar personagens: {str(e)}")
+            players = []
+        self.has_next = len(players) > self.page_size
+        self.players = players[:self.page_size]
+        return self.players
+    
+    def next_page(self) -> bool:
+        """Avança para a próxima página, se houver"""
+        if not self.has_next:
+            return False
+        self._inicios.append(self.players[-1].nome)
+        self.load()
+        return True
+    
+    def previous_page(self) -> bool:
+        """Volta para a página anterior, se houver"""
+        if not self.has_previous:
+            return False
+        self._inicios.pop()
+        self.load()
+        return True
+
 def create_new_player(nome: str, vida_maxima: int = 100, forca: int = 10) -> Optional[Player]:
     """
     Cria um novo personagem no banco de dados usando repositório
@@ -179,7 +235,7 @@ def display_player_status(player: Optional[Player] = None) -> None:
         return
     
     # Usar métodos da model para formatação
-    localizacao = f"Chunk {player.localizacao}" if player.localizacao else "Desconhecida"
+    localizacao = player.localizacao_display
     vida_str = f"{player.vida_atual}/{player.vida_maxima}"
     
     table_width = 50
@@ -199,7 +255,7 @@ def get_player_status_lines(player: Player, is_current: bool = False) -> list:
     table_width = 50
     
     # Usar métodos da model para formatação
-    localizacao = f"Chunk {player.localizacao}" if player.localizacao else "Desconhecida"
+    localizacao = player.localizacao_display
     vida_str = f"{player.vida_atual}/{player.vida_maxima}"
     
     # Título com indicador de personagem atual
@@ -277,14 +333,14 @@ def display_players_grid(players_data: List[Player]) -> None:
         if i + tables_per_line < len(player_sessions):
             print()  # Linha vazia entre grupos
 
-def get_adjacent_chunks(chunk_id: int, turno: str = 'Dia') -> List[Tuple[int, str]]:
+def get_adjacent_chunks(chunk_id: int) -> List[Tuple[int, str]]:
     """
     Retorna os chunks adjacentes ao chunk atual usando repositório
     Retorna lista de tuplas (chunk_id, bioma)
     """
     try:
         interface_service = InterfaceService.get_instance()
-        return interface_service.get_adjacent_chunks(chunk_id, turno)
+        return interface_service.get_adjacent_chunks(chunk_id)
     except Exception as e:
         print(f"Erro ao buscar chunks adjacentes: {str(e)}")
         return []
@@ -0,0 +1,249 @@
+"""
+Buffer write-behind do estado dos jogadores
+Acumula em memória as alterações dos jogadores (movimento, vida, XP...) e
+grava tudo em um único UPDATE em lote, em vez de uma ida ao banco por ação
+"""
+
+import atexit
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import psycopg2
+
+from ..models.player import Player
+
+# Erros causados pelos dados de um jogador (FK, tipo, restrição), não pela conexão
+ROW_ERRORS = (psycopg2.IntegrityError, psycopg2.DataError)
+
+
+def default_flush_interval() -> Optional[float]:
+    """Intervalo (s) entre flushes automáticos, lido de PLAYER_FLUSH_INTERVAL; 0 desativa"""
+    interval = float(os.getenv("PLAYER_FLUSH_INTERVAL", "5"))
+    return interval if interval > 0 else None
+
+
+def default_flush_ticks() -> Optional[int]:
+    """Ticks do mundo entre flushes, lido de PLAYER_FLUSH_TICKS; 0 desativa"""
+    ticks = int(os.getenv("PLAYER_FLUSH_TICKS", "10"))
+    return ticks if ticks > 0 else None
+
+
+class PlayerStateBuffer:
+    """
+    Buffer write-behind dos jogadores
+
+    Cada jogador marcado como sujo fica guardado por ``id_player``; marcar o
+    mesmo jogador várias vezes antes do flush gera uma única linha no UPDATE
+    (o último estado vence). O flush usa ``PlayerRepository.update_many``, então
+    todos os jogadores pendentes são gravados em uma só transação.
+
+    O flush acontece:
+        - a cada ``flush_interval`` segundos, se ``start()`` foi chamado;
+        - a cada ``flush_ticks`` chamadas de ``tick()`` (ticks do mundo);
+        - explicitamente, via ``flush()`` / ``flush_player()`` (ex.: logout);
+        - no encerramento limpo do processo, via ``close()`` registrado no atexit.
+
+    Um jogador ruim não trava o lote:
+        - jogadores inválidos são descartados antes do UPDATE;
+        - se o lote falhar por causa dos dados (ex.: FK de ``current_chunk_id``),
+          os jogadores são regravados um a um e só os que falham ficam em
+          quarentena (``quarantined``), fora dos próximos flushes;
+        - jogadores que não existem mais no banco contam como gravados.
+    Falhas de conexão devolvem as alterações ao buffer, para o próximo flush,
+    sem sobrescrever alterações mais recentes.
+
+    Enquanto um lote está sendo gravado, seus jogadores continuam visíveis em
+    ``get()``; assim quem lê no meio do flush não cai em uma linha antiga do banco.
+
+    Args:
+        player_repository: Repositório com ``update_many``
+        flush_interval: Segundos entre flushes do timer (padrão: PLAYER_FLUSH_INTERVAL)
+        flush_ticks: Ticks entre flushes (padrão: PLAYER_FLUSH_TICKS)
+    """
+
+    def __init__(self, player_repository, flush_interval: Optional[float] = None,
+                 flush_ticks: Optional[int] = None):
+        self.player_repository = player_repository
+        if flush_interval is None:
+            flush_interval = default_flush_interval()
+        if flush_ticks is None:
+            flush_ticks = default_flush_ticks()
+        # Valores <= 0 desativam o gatilho correspondente
+        self.flush_interval = flush_interval if flush_interval and flush_interval > 0 else None
+        self.flush_ticks = flush_ticks if flush_ticks and flush_ticks > 0 else None
+        self._dirty: Dict[int, Player] = {}
+        # Lote em gravação; sai daqui só depois do commit ou da devolução ao buffer
+        self._inflight: Dict[int, Player] = {}
+        # Jogadores que o banco recusou; saem daqui se forem marcados de novo
+        self.quarantined: Dict[int, Player] = {}
+        self._lock = threading.Lock()
+        # Serializa os flushes para que o timer e o jogo não gravem em paralelo
+        self._flush_lock = threading.Lock()
+        self._ticks = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._atexit_registered = False
+
+    def __len__(self) -> int:
+        return len(self._dirty)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._dirty
+
+    def mark_dirty(self, player: Player) -> None:
+        """Registra o estado atual do jogador para o próximo flush"""
+        if not player.id_player:
+            raise ValueError("Somente jogadores já salvos podem ser bufferizados")
+        with self._lock:
+            self._dirty[player.id_player] = player
+            self.quarantined.pop(player.id_player, None)
+
+    def get(self, player_id: int) -> Optional[Player]:
+        """Retorna o estado pendente do jogador (ainda não gravado), se houver"""
+        with self._lock:
+            player = self._dirty.get(player_id)
+            return player if player is not None else self._inflight.get(player_id)
+
+    def overlay(self, players: Iterable[Player]) -> List[Player]:
+        """Troca cada jogador lido do banco pelo seu estado pendente, se houver"""
+        with self._lock:
+            return [self._dirty.get(p.id_player) or self._inflight.get(p.id_player) or p
+                    for p in players]
+
+    def discard(self, player_id: int) -> Optional[Player]:
+        """Remove o jogador do buffer sem gravá-lo (ex.: já salvo ou deletado)"""
+        with self._lock:
+            self._inflight.pop(player_id, None)
+            return self._dirty.pop(player_id, None)
+
+    def pending(self) -> List[Player]:
+        """Lista os jogadores com alterações pendentes"""
+        with self._lock:
+            return list(self._dirty.values())
+
+    def flush(self) -> int:
+        """
+        Grava todos os jogadores pendentes em um único lote
+
+        Returns:
+            Número de jogadores gravados
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._dirty = self._dirty, {}
+                self._inflight = dict(batch)
+                self._ticks = 0
+            return self._write(batch)[0]
+
+    def flush_player(self, player_id: int) -> bool:
+        """
+        Grava imediatamente as alterações pendentes de um jogador (ex.: logout)
+
+        Returns:
+            True se não havia pendências ou se a gravação deu certo
+        """
+        with self._flush_lock:
+            with self._lock:
+                player = self._dirty.pop(player_id, None)
+                if player is not None:
+                    self._inflight = {player_id: player}
+            if player is None:
+                return True
+            _, failed = self._write({player_id: player})
+            return not failed
+
+    def tick(self) -> int:
+        """
+        Conta um tick do mundo e faz o flush quando atingir ``flush_ticks``
+
+        Returns:
+            Número de jogadores gravados neste tick (0 se não houve flush)
+        """
+        with self._lock:
+            self._ticks += 1
+            due = self.flush_ticks is not None and self._ticks >= self.flush_ticks
+        return self.flush() if due else 0
+
+    def _write(self, batch: Dict[int, Player]) -> Tuple[int, List[int]]:
+        """
+        Grava um lote de jogadores
+
+        Returns:
+            (jogadores gravados, IDs que não foram gravados)
+        """
+        if not batch:
+            return 0, []
+        valid: Dict[int, Player] = {}
+        rejected: List[int] = []
+        for player_id, player in batch.items():
+            erro = player.validation_error()
+            if erro:
+                print(f"{erro} (jogador '{player.nome}'): descartado do buffer")
+                rejected.append(player_id)
+            else:
+                valid[player_id] = player
+
+        saved, retry = 0, []
+        try:
+            saved = len(self.player_repository.update_many(valid.values())) if valid else 0
+        except ROW_ERRORS as e:
+            print(f"Erro ao gravar jogadores em lote, gravando um a um: {str(e)}")
+            for player_id, player in valid.items():
+                try:
+                    saved += len(self.player_repository.update_many([player]))
+                except ROW_ERRORS as e:
+                    print(f"Erro ao gravar jogador '{player.nome}': {str(e)}")
+                    rejected.append(player_id)
+                except Exception as e:
+                    print(f"Erro ao gravar jogador '{player.nome}': {str(e)}")
+                    retry.append(player_id)
+        except Exception as e:
+            print(f"Erro ao gravar jogadores em lote: {str(e)}")
+            retry = list(valid)
+
+        with self._lock:
+            # Um estado mais novo marcado durante o flush tem precedência
+            for player_id in rejected:
+                if player_id not in self._dirty:
+                    self.quarantined[player_id] = batch[player_id]
+            # Devolve ao buffer, preservando alterações feitas durante o flush
+            for player_id in retry:
+                self._dirty.setdefault(player_id, batch[player_id])
+            self._inflight = {}
+        return saved, rejected + retry
+
+    def start(self) -> None:
+        """Inicia o flush periódico e garante o flush no encerramento do processo"""
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+        if self.flush_interval is None or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="player-state-flush", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def stop(self) -> None:
+        """Interrompe o flush periódico (sem gravar as pendências)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> int:
+        """
+        Para o timer e grava tudo o que está pendente (encerramento limpo)
+
+        Returns:
+            Número de jogadores gravados
+        """
+        self.stop()
+        if self._atexit_registered:
+            atexit.unregister(self.close)
+            self._atexit_registered = False
+        return self.flush()
@@ -0,0 +1,60 @@
+"""
+Orçamento de idas ao banco para um bloco de código
+
+Conta os comandos SQL registrados pela instrumentação (``query_stats``)
+durante o bloco, na thread do bloco, e falha se passarem do orçamento
+declarado. Consultas de outras threads (ex.: o flush periódico do buffer de
+jogadores) não entram na conta. Serve para pegar
+padrões N+1 em testes, contra o banco real ou contra cursores simulados
+envolvidos em ``InstrumentedCursor``.
+"""
+
+from collections import Counter
+from typing import Dict, Optional
+
+from .query_stats import QueryStats, get_query_stats
+
+
+class QueryBudgetExceeded(AssertionError):
+    """O bloco executou mais consultas do que o orçamento permite"""
+    pass
+
+
+class QueryBudget:
+    """
+    Context manager que limita o número de consultas de um bloco
+
+    Example:
+        with QueryBudget(2, "get_map_statistics"):
+            game_service.get_map_statistics()
+
+    Args:
+        max_queries: Máximo de comandos SQL permitidos no bloco
+        label: Nome do bloco na mensagem de erro
+        stats: Registro de consultas (padrão: o global do processo)
+    """
+
+    def __init__(self, max_queries: int, label: str = "", stats: Optional[QueryStats] = None):
+        self.max_queries = max_queries
+        self.label = label
+        self._stats = stats or get_query_stats()
+        self._contador: Counter = Counter()
+        self.used = 0
+        self.callers: Dict[str, int] = {}
+
+    def __enter__(self) -> 'QueryBudget':
+        self._contador = Counter()
+        self._stats.watch(self._contador)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stats.unwatch(self._contador)
+        self.used = sum(self._contador.values())
+        self.callers = dict(self._contador)
+        if exc_type is None and self.used > self.max_queries:
+            detalhes = ", ".join(f"{caller} x{total}" for caller, total in
+                                 sorted(self.callers.items(), key=lambda item: -item[1]))
+            raise QueryBudgetExceeded(
+                f"{self.label or 'Bloco'} executou {self.used} consultas "
+                f"(orçamento: {self.max_queries}): {detalhes}"
+            )
@@ -0,0 +1,298 @@
+"""
+Instrumentação das consultas feitas pelos repositórios
+
+Os cursores entregues pelas conexões do pool registram, para cada
+``execute``: a impressão digital do SQL (literais trocados por ``?``), a
+quantidade de parâmetros, as linhas retornadas/afetadas, o tempo de parede e
+o método de repositório que fez a chamada. Os totais ficam em memória no
+processo; consultas acima de ``SLOW_QUERY_MS`` vão para o log de consultas
+lentas, em WARNING: no arquivo ``SLOW_QUERY_LOG``, se definido, ou nos
+handlers configurados pelo ponto de entrada (o módulo não escreve no
+terminal, que no jogo pertence à interface curses).
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Counter, Dict, List
+
+# Desligue com DB_INSTRUMENTATION=0
+INSTRUMENTATION_ENABLED = os.getenv("DB_INSTRUMENTATION", "1") != "0"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "")
+
+# Limites superiores (ms) das faixas do histograma de latência
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, float("inf"))
+
+slow_query_logger = logging.getLogger("minecraft.slow_query")
+slow_query_logger.addHandler(logging.NullHandler())
+slow_query_logger.setLevel(logging.WARNING)
+if SLOW_QUERY_LOG:
+    _handler = logging.FileHandler(SLOW_QUERY_LOG, encoding="utf-8")
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_query_logger.addHandler(_handler)
+    # Já vai para o arquivo; não repete nos handlers da raiz
+    slow_query_logger.propagate = False
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+# Listas de tamanho variável (IN, ARRAY, VALUES em lote) viram uma só forma
+_VALUE_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_ROW_LIST = re.compile(r"\(\?(?:, \.\.\.)?\)(?:\s*,\s*\(\?(?:, \.\.\.)?\))+")
+
+# Módulos ignorados ao procurar quem fez a consulta
+_INTERNAL_FILES = ("query_stats.py", "db_pool.py", "unit_of_work.py", os.sep + "psycopg2" + os.sep)
+
+
+def fingerprint(sql: Any) -> str:
+    """Normaliza o SQL: espaços colapsados e literais trocados por ``?``"""
+    if isinstance(sql, bytes):
+        sql = sql.decode("utf-8", errors="replace")
+    elif not isinstance(sql, str):
+        sql = str(sql)
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _VALUE_LIST.sub("?, ...", sql)
+    sql = _ROW_LIST.sub("(?, ...), ...", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _param_count(params: Any) -> int:
+    if params is None:
+        return 0
+    try:
+        return len(params)
+    except TypeError:
+        return 1
+
+
+def find_caller() -> str:
+    """Método de repositório (ou, na falta, a primeira função fora do pool) que executou a consulta"""
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not any(internal in filename for internal in _INTERNAL_FILES):
+            owner = frame.f_locals.get("self")
+            name = (f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None
+                    else f"{os.path.basename(filename)}:{frame.f_code.co_name}")
+            if os.sep + "repositories" + os.sep in filename:
+                return name
+            if fallback is None:
+                fallback = name
+        frame = frame.f_back
+    return fallback or "desconhecido"
+
+
+@dataclass
+class QueryStat:
+    """
+    Totais de uma impressão digital de SQL
+
+    Attributes:
+        fingerprint: SQL normalizado
+        calls: Execuções
+        total_time: Tempo total (s)
+        max_time: Maior tempo (s) de uma execução
+        rows: Linhas retornadas/afetadas (quando o driver informa)
+        params: Parâmetros da última execução
+        histogram: Execuções por faixa de ``HISTOGRAM_BUCKETS_MS``
+        callers: Execuções por método chamador
+    """
+    fingerprint: str
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+    params: int = 0
+    histogram: List[int] = field(default_factory=lambda: [0] * len(HISTOGRAM_BUCKETS_MS))
+    callers: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "calls": self.calls,
+            "total_ms": self.total_time * 1000,
+            "avg_ms": self.avg_time * 1000,
+            "max_ms": self.max_time * 1000,
+            "rows": self.rows,
+            "params": self.params,
+            "histogram": {
+                ("+inf" if limite == float("inf") else f"<={limite}ms"): total
+                for limite, total in zip(HISTOGRAM_BUCKETS_MS, self.histogram)
+            },
+            "callers": dict(self.callers),
+        }
+
+
+class QueryStats:
+    """Registro thread-safe das consultas executadas no processo"""
+
+    def __init__(self, slow_query_ms: float = SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._stats: Dict[str, QueryStat] = {}
+        self._total = 0
+        self._slow = 0
+        # Contadores de QueryBudget ativos, por thread
+        self._local = threading.local()
+
+    def watch(self, counter: Counter[str]) -> None:
+        """Passa a contar em ``counter`` (por caller) as consultas desta thread"""
+        watchers = getattr(self._local, "watchers", None)
+        if watchers is None:
+            watchers = self._local.watchers = []
+        watchers.append(counter)
+
+    def unwatch(self, counter: Counter[str]) -> None:
+        """Para de contar as consultas desta thread em ``counter``"""
+        watchers = getattr(self._local, "watchers", [])
+        for i in range(len(watchers) - 1, -1, -1):
+            if watchers[i] is counter:
+                del watchers[i]
+                break
+
+    def record(self, sql: Any, params: Any, elapsed: float, rows: int, caller: str) -> None:
+        key = fingerprint(sql)
+        elapsed_ms = elapsed * 1000
+        bucket = next(i for i, limite in enumerate(HISTOGRAM_BUCKETS_MS) if elapsed_ms <= limite)
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                stat = self._stats[key] = QueryStat(key)
+            stat.calls += 1
+            stat.total_time += elapsed
+            stat.max_time = max(stat.max_time, elapsed)
+            stat.rows += max(rows, 0)
+            stat.params = _param_count(params)
+            stat.histogram[bucket] += 1
+            stat.callers[caller] = stat.callers.get(caller, 0) + 1
+            self._total += 1
+            slow = elapsed_ms >= self.slow_query_ms
+            if slow:
+                self._slow += 1
+        if slow:
+            slow_query_logger.warning("%.1f ms | %s | %d linhas | %d parâmetros | %s",
+                                   elapsed_ms, caller, rows, _param_count(params), key)
+        # record roda na thread que executou a consulta
+        for counter in getattr(self._local, "watchers", ()):
+            counter[caller] += 1
+
+    @property
+    def total_queries(self) -> int:
+        return self._total
+
+    @property
+    def slow_queries(self) -> int:
+        return self._slow
+
+    def top(self, n: int = 10, by: str = "total_time") -> List[QueryStat]:
+        """As ``n`` consultas com maior ``by`` (total_time, calls, max_time ou rows)"""
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: getattr(s, by), reverse=True)[:n]
+
+    def by_caller(self) -> Dict[str, int]:
+        """Execuções por método chamador"""
+        totals: Dict[str, int] = {}
+        with self._lock:
+            for stat in self._stats.values():
+                for caller, calls in stat.callers.items():
+                    totals[caller] = totals.get(caller, 0) + calls
+        return totals
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = [s.to_dict() for s in self._stats.values()]
+            total, slow = self._total, self._slow
+        return {"total_queries": total, "slow_queries": slow, "queries": stats}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._total = 0
+            self._slow = 0
+
+    def format(self, n: int = 10) -> str:
+        """Tabela das consultas mais caras, para relatórios no terminal"""
+        linhas = [f"Consultas: {self._total} (lentas: {self._slow})"]
+        for stat in self.top(n):
+            chamador = max(stat.callers, key=stat.callers.get)
+            linhas.append(f"{stat.calls:>7} x {stat.avg_time * 1000:8.2f} ms  "
+                          f"{chamador:<40} {stat.fingerprint[:80]}")
+        return "\n".join(linhas)
+
+
+class InstrumentedCursor:
+    """Proxy de cursor que mede cada ``execute``/``executemany``"""
+
+    def __init__(self, cursor, stats: QueryStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def _measure(self, method, sql, params):
+        start = time.perf_counter()
+        try:
+            return method(sql, params) if params is not None else method(sql)
+        finally:
+            elapsed = time.perf_counter() - start
+            try:
+                rows = self._cursor.rowcount
+                rows = rows if isinstance(rows, int) else -1
+            except Exception:
+                rows = -1
+            self._stats.record(sql, params, elapsed, rows, find_caller())
+
+    def execute(self, sql, params=None):
+        return self._measure(self._cursor.execute, sql, params)
+
+    def executemany(self, sql, params_seq):
+        return self._measure(self._cursor.executemany, sql, params_seq)
+
+    def copy_expert(self, sql, file, size=8192):
+        return self._measure(lambda s: self._cursor.copy_expert(s, file, size), sql, None)
+
+    def __enter__(self) -> 'InstrumentedCursor':
+        self._cursor.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._cursor.__exit__(exc_type, exc_value, traceback)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._cursor, name, value)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._cursor, name)
+
+
+_query_stats = QueryStats()
+
+
+def get_query_stats() -> QueryStats:
+    """Registro global de consultas do processo"""
+    return _query_stats
+
+
+def instrument_cursor(cursor):
+    """Envolve o cursor com a instrumentação, se habilitada"""
+    if not INSTRUMENTATION_ENABLED:
+        return cursor
+    return InstrumentedCursor(cursor, _query_stats)
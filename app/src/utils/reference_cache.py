@@ -0,0 +1,164 @@
+"""
+Cache de leitura para tabelas de referência (Bioma, Mapa, Item)
+Essas tabelas quase nunca mudam, então as buscas por ID são servidas de
+dicionários em memória em vez de irem ao PostgreSQL
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from ..models.bioma import Bioma
+from ..models.item import Item
+from ..models.mapa import Mapa, TurnoType
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+# Versão de cada tabela de referência no processo. Os repositórios
+# incrementam a versão em save/delete, o que invalida todos os caches.
+_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+
+def bump_reference_version(table: str) -> int:
+    """Marca uma tabela de referência como alterada e retorna a nova versão"""
+    with _versions_lock:
+        _versions[table] = _versions.get(table, 0) + 1
+        return _versions[table]
+
+
+def get_reference_version(table: str) -> int:
+    """Versão atual de uma tabela de referência"""
+    return _versions.get(table, 0)
+
+
+def default_ttl() -> Optional[float]:
+    """TTL padrão (s) lido de REFERENCE_CACHE_TTL; 0 desativa a expiração"""
+    ttl = float(os.getenv("REFERENCE_CACHE_TTL", "300"))
+    return ttl if ttl > 0 else None
+
+
+class ReferenceCache(Generic[K, V]):
+    """
+    Cache read-through de uma tabela de referência inteira
+
+    A tabela é carregada de uma vez pelo ``loader`` e indexada por ``key``.
+    O conteúdo é recarregado no próximo acesso quando o TTL expira ou quando
+    a versão da tabela muda (ver ``bump_reference_version``).
+
+    Args:
+        table: Nome da tabela, usado na checagem de versão
+        loader: Função que retorna todas as linhas da tabela
+        key: Função que extrai a chave de cada linha
+        ttl: Validade do conteúdo em segundos (None = sem expiração)
+    """
+
+    def __init__(self, table: str, loader: Callable[[], Iterable[V]],
+                 key: Callable[[V], K], ttl: Optional[float] = None):
+        self.table = table
+        self._loader = loader
+        self._key = key
+        self.ttl = ttl
+        self._items: Dict[K, V] = {}
+        self._loaded_at: Optional[float] = None
+        self._version = -1
+        self._lock = threading.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        """Indica se o conteúdo precisa ser recarregado"""
+        if self._loaded_at is None:
+            return True
+        if self._version != get_reference_version(self.table):
+            return True
+        return self.ttl is not None and time.monotonic() - self._loaded_at >= self.ttl
+
+    def load(self) -> None:
+        """
+        Recarrega a tabela inteira
+
+        Uma tabela vazia também fica em cache; só uma exceção do ``loader``
+        mantém o conteúdo anterior e faz o próximo acesso tentar de novo.
+        """
+        with self._lock:
+            version = get_reference_version(self.table)
+            try:
+                rows = list(self._loader())
+            except Exception as e:
+                print(f"Erro ao carregar a tabela {self.table}: {str(e)}")
+                return
+            self._items = {self._key(row): row for row in rows}
+            self._loaded_at = time.monotonic()
+            self._version = version
+
+    def invalidate(self) -> None:
+        """Descarta o conteúdo atual"""
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_loaded(self) -> None:
+        if self.is_stale:
+            self.load()
+
+    def get(self, key: K) -> Optional[V]:
+        """Busca uma linha pela chave"""
+        self._ensure_loaded()
+        return self._items.get(key)
+
+    def all(self) -> List[V]:
+        """Retorna todas as linhas em cache"""
+        self._ensure_loaded()
+        return list(self._items.values())
+
+
+class ReferenceDataCache:
+    """
+    Agrupa os caches de Bioma, Mapa e Item usados pelo GameService
+
+    As tabelas são lidas com ``load_all``, que propaga erros de banco: com
+    ``find_all`` uma falha viraria uma tabela vazia guardada até o TTL.
+
+    Args:
+        bioma_repository: Repositório de biomas
+        mapa_repository: Repositório de mapas
+        item_repository: Repositório de itens
+        ttl: Validade do conteúdo em segundos (padrão: REFERENCE_CACHE_TTL)
+    """
+
+    def __init__(self, bioma_repository, mapa_repository, item_repository,
+                 ttl: Optional[float] = None):
+        ttl = default_ttl() if ttl is None else ttl
+        self.biomas: ReferenceCache[int, Bioma] = ReferenceCache(
+            'bioma', bioma_repository.load_all, lambda b: b.id_bioma, ttl)
+        self.mapas: ReferenceCache[int, Mapa] = ReferenceCache(
+            'mapa', mapa_repository.load_all, lambda m: m.id_mapa, ttl)
+        self.itens: ReferenceCache[int, Item] = ReferenceCache(
+            'item', item_repository.load_all, lambda i: i.id_item, ttl)
+
+    def load(self) -> None:
+        """Carrega todas as tabelas de referência (chamado na inicialização)"""
+        for cache in (self.biomas, self.mapas, self.itens):
+            cache.load()
+
+    def invalidate(self) -> None:
+        """Descarta todas as tabelas em cache"""
+        for cache in (self.biomas, self.mapas, self.itens):
+            cache.invalidate()
+
+    def get_bioma(self, id_bioma: int) -> Optional[Bioma]:
+        """Busca bioma por ID"""
+        return self.biomas.get(id_bioma)
+
+    def get_mapa(self, id_mapa: int) -> Optional[Mapa]:
+        """Busca mapa por ID"""
+        return self.mapas.get(id_mapa)
+
+    def get_mapa_by_nome(self, nome: str, turno: TurnoType) -> Optional[Mapa]:
+        """Busca mapa por nome e turno"""
+        return next((m for m in self.mapas.all() if m.nome == nome and m.turno == turno), None)
+
+    def get_item(self, id_item: int) -> Optional[Item]:
+        """Busca item por ID"""
+        return self.itens.get(id_item)
@@ -71,15 +71,15 @@ def format_player_card(player) -> str:
 ╠══════════════════════════════════════════════════════════════╣
 ║ ❤️  Vida: {player.vida_atual}/{player.vida_maxima} {health_bar} ║
 ║ ⭐ XP: {player.experiencia:<8} 💪 Força: {player.forca:<8} 📍 Nível: {player.nivel} ║
-║ 📍 Localização: Chunk {player.localizacao or 'Desconhecida':<35} ║
+║ 📍 Localização: {player.localizacao_display:<41} ║
 ╚══════════════════════════════════════════════════════════════╝
 """
     return card
 
 
-def display_player_list(players, title: str = "LISTA DE JOGADORES"):
-    """Exibe uma lista formatada de jogadores"""
-    print(f"📋 {title}")
+def display_player_list(players, title: str = "LISTA DE JOGADORES", pagina: int = None):
+    """Exibe uma lista formatada de jogadores (uma página, se ``pagina`` for informada)"""
+    print(f"📋 {title}" + (f" - Página {pagina}" if pagina else ""))
     print("=" * 60)
     
     if not players:
@@ -89,8 +89,8 @@ def display_player_list(players, title: str = "LISTA DE JOGADORES"):
     for i, player in enumerate(players, 1):
         print(f"{i}. {player.nome} - Nível {player.nivel}")
         print(f"   ❤️  {player.vida_atual}/{player.vida_maxima} | ⭐ {player.experiencia} XP | 💪 {player.forca}")
-        if player.localizacao:
-            print(f"   📍 Chunk {player.localizacao}")
+        if player.has_location():
+            print(f"   📍 {player.localizacao_display}")
         print()
     
     print("=" * 60)
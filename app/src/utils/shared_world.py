@@ -0,0 +1,356 @@
+"""
+Cache do mundo em memória compartilhada entre processos
+
+Um processo carregador (``publish_world.py``) publica as colunas dos chunks,
+as matrizes de coordenadas e as tabelas de referência (bioma, mapa, item)
+em um segmento de ``multiprocessing.shared_memory``. Os processos do jogo
+com ``SHARED_WORLD`` definido se anexam ao segmento e leem os arrays sem
+cópia, então a memória não cresce com o número de sessões.
+
+Atualização segura: cada publicação cria um segmento novo
+(``<nome>_<geração>``) e só então grava a geração no segmento de controle
+(``<nome>``). Quem já está anexado continua lendo a geração antiga até
+perceber a troca; o segmento antigo só some quando o último processo
+deixa de usá-lo.
+
+Escritas locais: depois que o próprio processo altera uma tabela publicada
+(``bump_reference_version``), ``current_world(tabela)`` devolve None para
+ela, e o chamador lê do banco, até que se anexe a uma geração carregada
+depois da escrita. Escritas de outros processos aparecem na próxima
+republicação (``publish_world.py`` republica a cada 60 s por padrão).
+"""
+
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.bioma import Bioma
+from ..models.item import Item
+from ..models.mapa import Mapa
+from .chunk_store import ChunkStore, ChunkStoreGrid
+from .reference_cache import bump_reference_version, get_reference_version
+
+# Nome do segmento de controle; vazio desativa o mundo compartilhado
+SHARED_WORLD_NAME = os.getenv("SHARED_WORLD", "")
+
+MAGIC = b"MCWORLD1"
+_CONTROL = struct.Struct("<8sQ")            # magic, geração atual
+_HEADER = struct.Struct("<8sQQQQ")          # magic, geração, chunks, offset e tamanho do JSON
+_ATTACH_RETRIES = 3
+
+_COLUMN_LAYOUT = (("id_chunk", "<i8"), ("id_bioma", "<i4"), ("id_mapa", "<i4"), ("x", "<i4"), ("y", "<i4"))
+
+# Tabelas publicadas no segmento
+_TABLES = ("bioma", "mapa", "item", "chunk")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Anexa a um segmento existente sem registrá-lo no resource_tracker
+
+    Antes do Python 3.13 todo processo que anexa registra o segmento e o
+    apaga ao sair, derrubando os outros leitores; só o publicador é dono.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(segment._name, "shared_memory")
+    except Exception:
+        pass
+    return segment
+
+
+def _tables_to_json(biomas: Iterable[Bioma], mapas: Iterable[Mapa], itens: Iterable[Item]) -> Dict[str, Any]:
+    return {
+        "bioma": [[b.id_bioma, b.nome, b.descricao] for b in biomas],
+        "mapa": [[m.id_mapa, m.nome, m.turno.value] for m in mapas],
+        "item": [[i.id_item, i.nome, i.tipo, i.poder, i.durabilidade] for i in itens],
+    }
+
+
+class SharedWorldPublisher:
+    """
+    Lado carregador: cria e mantém os segmentos do mundo compartilhado
+
+    O processo publicador é o dono dos segmentos; ``close()`` (ou o fim do
+    processo) os remove.
+
+    Args:
+        name: Nome do segmento de controle
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name or SHARED_WORLD_NAME or "minecraft_world"
+        self.generation = 0
+        self._control: Optional[shared_memory.SharedMemory] = None
+        self._data: Optional[shared_memory.SharedMemory] = None
+
+    def _ensure_control(self) -> shared_memory.SharedMemory:
+        if self._control is None:
+            try:
+                self._control = shared_memory.SharedMemory(name=self.name, create=True, size=_CONTROL.size)
+            except FileExistsError:
+                # Publicador anterior encerrado sem limpar: assume o controle e segue a numeração
+                self._control = shared_memory.SharedMemory(name=self.name)
+                magic, generation = _CONTROL.unpack_from(self._control.buf, 0)
+                if magic == MAGIC:
+                    self.generation = generation
+        return self._control
+
+    def publish(self, store: ChunkStore, biomas: Iterable[Bioma], mapas: Iterable[Mapa],
+                itens: Iterable[Item], loaded_at: Optional[float] = None) -> int:
+        """
+        Publica uma nova geração do mundo
+
+        Args:
+            loaded_at: Instante (``time.time()``) em que a leitura do banco
+                começou; padrão: agora
+
+        Returns:
+            Número da geração publicada
+        """
+        control = self._ensure_control()
+        generation = self.generation + 1
+        count = len(store)
+
+        # Colunas, depois uma matriz posição → linha por mapa (a mesma do ChunkStore)
+        offset = _align(_HEADER.size)
+        layout = []
+        for name, dtype in _COLUMN_LAYOUT:
+            coluna = np.ascontiguousarray(getattr(store, name), dtype=dtype)
+            layout.append((offset, coluna))
+            offset = _align(offset + coluna.nbytes)
+        matrizes = []
+        for id_mapa, (x0, y0, matriz) in store._coord_index().items():
+            matriz = np.ascontiguousarray(matriz, dtype="<i8")
+            matrizes.append({"id_mapa": id_mapa, "x0": x0, "y0": y0,
+                             "shape": list(matriz.shape), "offset": offset})
+            layout.append((offset, matriz))
+            offset = _align(offset + matriz.nbytes)
+
+        tabelas = _tables_to_json(biomas, mapas, itens)
+        tabelas["coords"] = matrizes
+        tabelas["loaded_at"] = time.time() if loaded_at is None else loaded_at
+        payload = json.dumps(tabelas).encode("utf-8")
+        size = offset + len(payload)
+
+        data = shared_memory.SharedMemory(name=f"{self.name}_{generation}", create=True, size=size)
+        _HEADER.pack_into(data.buf, 0, MAGIC, generation, count, offset, len(payload))
+        for inicio, array in layout:
+            data.buf[inicio:inicio + array.nbytes] = array.tobytes()
+        data.buf[offset:offset + len(payload)] = payload
+
+        # A troca de geração é a última escrita: leitores nunca veem um segmento pela metade
+        _CONTROL.pack_into(control.buf, 0, MAGIC, generation)
+        anterior, self._data, self.generation = self._data, data, generation
+        if anterior is not None:
+            anterior.close()
+            anterior.unlink()
+        return generation
+
+    def close(self) -> None:
+        """Remove os segmentos (leitores já anexados mantêm o mapeamento até fechar)"""
+        for segment in (self._data, self._control):
+            if segment is not None:
+                segment.close()
+                try:
+                    segment.unlink()
+                except FileNotFoundError:
+                    pass
+        self._data = self._control = None
+
+
+class SharedWorld:
+    """
+    Lado leitor: visão somente leitura de uma geração do mundo publicado
+
+    Attributes:
+        generation: Geração anexada
+        loaded_at: Instante em que o publicador começou a ler o banco
+        store: ChunkStore sobre a memória compartilhada (sem cópia)
+        biomas, mapas, itens: Tabelas de referência da geração
+    """
+
+    def __init__(self, name: str, control: shared_memory.SharedMemory,
+                 data: shared_memory.SharedMemory):
+        self.name = name
+        self._control = control
+        self._data = data
+        magic, self.generation, count, json_offset, json_size = _HEADER.unpack_from(data.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Segmento {data.name} não é um mundo compartilhado")
+        tabelas = json.loads(bytes(data.buf[json_offset:json_offset + json_size]))
+        self.loaded_at = tabelas.get("loaded_at", 0.0)
+
+        offset = _align(_HEADER.size)
+        colunas = []
+        for _, dtype in _COLUMN_LAYOUT:
+            coluna = np.frombuffer(data.buf, dtype=dtype, count=count, offset=offset)
+            coluna.flags.writeable = False
+            colunas.append(coluna)
+            offset = _align(offset + coluna.nbytes)
+        self.store = ChunkStore(*colunas)
+
+        coords = {}
+        for entrada in tabelas["coords"]:
+            altura, largura = entrada["shape"]
+            matriz = np.frombuffer(data.buf, dtype="<i8", count=altura * largura,
+                                   offset=entrada["offset"]).reshape(altura, largura)
+            matriz.flags.writeable = False
+            coords[entrada["id_mapa"]] = (entrada["x0"], entrada["y0"], matriz)
+        self.store._coords = coords
+
+        self.biomas = [Bioma(*row) for row in tabelas["bioma"]]
+        self.mapas = [Mapa(*row) for row in tabelas["mapa"]]
+        self.itens = [Item(*row) for row in tabelas["item"]]
+        self.grid = ChunkStoreGrid(self.store)
+
+    @classmethod
+    def attach(cls, name: Optional[str] = None) -> Optional['SharedWorld']:
+        """Anexa à geração atual (None se nada foi publicado com esse nome)"""
+        name = name or SHARED_WORLD_NAME
+        try:
+            control = _attach(name)
+        except FileNotFoundError:
+            return None
+        for _ in range(_ATTACH_RETRIES):
+            magic, generation = _CONTROL.unpack_from(control.buf, 0)
+            if magic != MAGIC:
+                break
+            try:
+                data = _attach(f"{name}_{generation}")
+            except FileNotFoundError:
+                # Geração trocada entre a leitura do controle e o attach
+                continue
+            return cls(name, control, data)
+        control.close()
+        return None
+
+    @property
+    def current_generation(self) -> int:
+        return _CONTROL.unpack_from(self._control.buf, 0)[1]
+
+    @property
+    def stale(self) -> bool:
+        """Outra geração foi publicada depois desta"""
+        return self.current_generation != self.generation
+
+    def tables(self, table: str) -> List[Any]:
+        return {"bioma": self.biomas, "mapa": self.mapas, "item": self.itens}[table]
+
+    @property
+    def segments(self) -> Tuple[shared_memory.SharedMemory, shared_memory.SharedMemory]:
+        """Segmentos de controle e de dados, fechados com ``close_segments``"""
+        return self._control, self._data
+
+
+def close_segments(segments: Tuple[shared_memory.SharedMemory, shared_memory.SharedMemory]) -> bool:
+    """
+    Desanexa dos segmentos de uma geração
+
+    Os arrays de um ``SharedWorld`` apontam para o mapeamento; enquanto o
+    objeto (ou qualquer array dele) estiver em uso, o fechamento falha com
+    ``BufferError`` e fica para a próxima tentativa.
+
+    Returns:
+        False se ainda há arrays desta geração em uso
+    """
+    control, data = segments
+    try:
+        data.close()
+    except BufferError:
+        return False
+    control.close()
+    return True
+
+
+_current: Optional[SharedWorld] = None
+_retired: List[Tuple[shared_memory.SharedMemory, shared_memory.SharedMemory]] = []
+_lock = threading.Lock()
+
+# Versões das tabelas já vistas e instante em que uma escrita local foi percebida
+_seen_versions: Dict[str, int] = {}
+_written_at: Dict[str, float] = {}
+
+
+def _has_local_writes() -> bool:
+    return any(_seen_versions.get(table, 0) != get_reference_version(table) for table in _TABLES)
+
+
+def _note_local_writes() -> None:
+    """Registra o instante das escritas locais ainda não vistas (chamar com _lock)"""
+    for table in _TABLES:
+        versao = get_reference_version(table)
+        if _seen_versions.get(table, 0) != versao:
+            _seen_versions[table] = versao
+            _written_at[table] = time.time()
+
+
+def current_world(table: Optional[str] = None) -> Optional[SharedWorld]:
+    """
+    Mundo compartilhado da geração atual, ou None se desativado/não publicado
+
+    Anexa na primeira chamada e troca de geração quando o publicador atualiza.
+    A geração antiga é fechada assim que nenhum array dela estiver em uso.
+
+    Args:
+        table: Tabela que o chamador vai ler (bioma, mapa, item ou chunk). Se
+            o processo a alterou depois da carga desta geração, retorna None
+            para que a leitura vá ao banco.
+    """
+    global _current
+    if not SHARED_WORLD_NAME:
+        return None
+    world = _current
+    # Gerações aposentadas são fechadas de novo a cada chamada até soltarem o mapeamento
+    if world is None or world.stale or _retired or _has_local_writes():
+        with _lock:
+            _note_local_writes()
+            if _current is None or _current.stale:
+                novo = SharedWorld.attach(SHARED_WORLD_NAME)
+                if novo is not None:
+                    if _current is not None:
+                        # Só os segmentos: quem ainda usa o objeto antigo continua lendo
+                        _retired.append(_current.segments)
+                    _current = novo
+                    # Caches de referência e rotas montados sobre a geração anterior são
+                    # refeitos; esse incremento não conta como escrita local
+                    for nome in _TABLES:
+                        if bump_reference_version(nome) == _seen_versions.get(nome, 0) + 1:
+                            _seen_versions[nome] = _seen_versions.get(nome, 0) + 1
+            _retired[:] = [segments for segments in _retired if not close_segments(segments)]
+            world = _current
+    if world is not None and table is not None and _written_at.get(table, 0.0) >= world.loaded_at:
+        return None
+    return world
+
+
+class SharedReferenceSource:
+    """
+    Fonte de uma tabela de referência para o ReferenceDataCache
+
+    Lê do mundo compartilhado quando publicado; senão, do repositório.
+    """
+
+    def __init__(self, table: str, repository):
+        self.table = table
+        self._repository = repository
+
+    def load_all(self) -> List[Any]:
+        world = current_world(self.table)
+        if world is not None:
+            return list(world.tables(self.table))
+        return self._repository.load_all()
@@ -0,0 +1,310 @@
+"""
+Simulação headless de vários jogadores
+Dirige o InterfaceService/GameService sem o loop de input() da interface,
+com jogadores roteirizados, para medir vazão, latência e idas ao banco
+"""
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from ..models.player import Player
+
+# Operações que cada jogador simulado pode executar
+OPERACOES = ("mover", "salvar", "fantasma", "tick")
+# Recusa de GameService.realizar_acao_fantasma que não conta como erro
+FANTASMA_JA_AGIU = "Fantasma já realizou sua ação"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil pelo método nearest-rank sobre uma lista já ordenada"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def pool_checkouts() -> int:
+    """Total de conexões entregues pelo pool (uma por chamada de repositório)"""
+    from .db_pool import get_pool_metrics
+    return get_pool_metrics().get('checkouts', 0)
+
+
+def executed_queries() -> int:
+    """Total de comandos SQL executados no processo (instrumentação dos cursores)"""
+    from .query_stats import get_query_stats
+    return get_query_stats().total_queries
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Parâmetros da simulação
+
+    Attributes:
+        players: Número de jogadores simulados (um thread por jogador)
+        duration: Duração máxima da simulação em segundos
+        seed: Semente dos geradores aleatórios (mesma semente, mesmo roteiro)
+        max_actions: Limite de ações por jogador (None = só a duração limita)
+        weights: Peso relativo de cada operação no sorteio
+        think_time: Pausa (s) entre ações de um mesmo jogador
+        cleanup: Remove os jogadores criados ao final
+    """
+    players: int = 10
+    duration: float = 10.0
+    seed: int = 42
+    max_actions: Optional[int] = None
+    weights: Dict[str, float] = field(default_factory=lambda: {
+        "mover": 70, "salvar": 10, "fantasma": 10, "tick": 10
+    })
+    think_time: float = 0.0
+    cleanup: bool = True
+
+
+@dataclass
+class OperationStats:
+    """Latências (s) e erros acumulados de uma operação"""
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self) -> Dict[str, float]:
+        """Resumo com contagem, média e percentis em milissegundos"""
+        values = sorted(self.latencies)
+        mean = sum(values) / len(values) if values else 0.0
+        return {
+            "count": len(values),
+            "errors": self.errors,
+            "mean_ms": mean * 1000,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+        }
+
+
+@dataclass
+class SimulationReport:
+    """
+    Resultado de uma simulação
+
+    Attributes:
+        config: Configuração usada
+        elapsed: Duração real (s)
+        operations: Estatísticas por operação
+        round_trips: Idas ao banco durante a simulação
+    """
+    config: SimulationConfig
+    elapsed: float
+    operations: Dict[str, OperationStats]
+    round_trips: int
+
+    @property
+    def total_actions(self) -> int:
+        return sum(len(op.latencies) for op in self.operations.values())
+
+    @property
+    def throughput(self) -> float:
+        """Ações por segundo"""
+        return self.total_actions / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def round_trips_per_action(self) -> float:
+        return self.round_trips / self.total_actions if self.total_actions else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """Converte o relatório para dicionário (ex.: para salvar em JSON)"""
+        return {
+            "players": self.config.players,
+            "seed": self.config.seed,
+            "elapsed_s": self.elapsed,
+            "total_actions": self.total_actions,
+            "throughput": self.throughput,
+            "round_trips": self.round_trips,
+            "round_trips_per_action": self.round_trips_per_action,
+            "operations": {nome: op.summary() for nome, op in self.operations.items()},
+        }
+
+    def format(self) -> str:
+        """Tabela de texto com o resultado"""
+        lines = [
+            f"Jogadores: {self.config.players} | Semente: {self.config.seed} | "
+            f"Duração: {self.elapsed:.2f}s",
+            f"Ações: {self.total_actions} | Vazão: {self.throughput:.1f} ações/s | "
+            f"Idas ao banco: {self.round_trips} ({self.round_trips_per_action:.2f}/ação)",
+            "",
+            f"{'operação':<10} {'qtd':>7} {'erros':>6} {'média':>9} {'p50':>9} {'p95':>9} {'p99':>9}",
+        ]
+        for nome, op in self.operations.items():
+            s = op.summary()
+            lines.append(
+                f"{nome:<10} {s['count']:>7} {s['errors']:>6} {s['mean_ms']:>7.2f}ms "
+                f"{s['p50_ms']:>7.2f}ms {s['p95_ms']:>7.2f}ms {s['p99_ms']:>7.2f}ms"
+            )
+        return "\n".join(lines)
+
+
+class SimulatedPlayer:
+    """
+    Jogador roteirizado: sorteia ações com um gerador próprio
+
+    Args:
+        player: Jogador no banco
+        rng: Gerador aleatório do jogador
+        chunk_id: Chunk onde o jogador começa
+    """
+
+    def __init__(self, player: Player, rng: random.Random, chunk_id: int):
+        self.player = player
+        self.rng = rng
+        self.chunk_id = chunk_id
+
+
+class SimulationRunner:
+    """
+    Executa N jogadores simulados em paralelo contra o InterfaceService
+
+    Movimento e salvamento passam pelo InterfaceService (mesmo caminho da
+    interface); ações de fantasma e ticks do mundo vão direto ao GameService.
+
+    Args:
+        config: Parâmetros da simulação
+        interface_service: InterfaceService (padrão: singleton)
+        round_trip_counter: Função que retorna o total acumulado de idas ao banco
+    """
+
+    def __init__(self, config: SimulationConfig, interface_service=None,
+                 round_trip_counter: Callable[[], int] = executed_queries):
+        if interface_service is None:
+            from ..services.interface_service import InterfaceService
+            interface_service = InterfaceService.get_instance()
+        self.config = config
+        self.interface_service = interface_service
+        self.game_service = interface_service.game_service
+        self.round_trip_counter = round_trip_counter
+        self._stats: Dict[str, OperationStats] = {nome: OperationStats() for nome in OPERACOES}
+        self._stats_lock = threading.Lock()
+        self._fantasmas: List[Dict] = []
+        self._created_ids: List[int] = []
+
+    def _setup_players(self) -> List[SimulatedPlayer]:
+        sims = []
+        for i in range(self.config.players):
+            nome = f"sim_{self.config.seed}_{i}"
+            player = self.interface_service.get_player_by_name(nome)
+            if player is None:
+                player = self.interface_service.create_player(nome)
+                if player is None:
+                    print(f"Erro ao criar jogador simulado {nome}")
+                    continue
+                self._created_ids.append(player.id_player)
+            chunk_id = player.current_chunk_id or self._start_chunk()
+            if chunk_id is None:
+                print(f"Nenhum chunk para posicionar o jogador simulado {nome}")
+                continue
+            sims.append(SimulatedPlayer(player, random.Random(self.config.seed + i), chunk_id))
+        return sims
+
+    def _start_chunk(self) -> Optional[int]:
+        """Chunk de partida para jogadores sem localização: o primeiro do índice espacial"""
+        chunk = self.game_service.chunk_repository.get_grid().first()
+        return chunk.id_chunk if chunk is not None else None
+
+    def _teardown_players(self) -> None:
+        if not self.config.cleanup or not self._created_ids:
+            return
+        for player_id in self._created_ids:
+            self.game_service.player_state_buffer.discard(player_id)
+        self.game_service.player_repository.delete_many(self._created_ids)
+        self._created_ids = []
+
+    def _record(self, operacao: str, elapsed: float, ok: bool) -> None:
+        with self._stats_lock:
+            stats = self._stats[operacao]
+            stats.latencies.append(elapsed)
+            if not ok:
+                stats.errors += 1
+
+    def _choose(self, sim: SimulatedPlayer) -> str:
+        nomes = [nome for nome in OPERACOES if self.config.weights.get(nome, 0) > 0]
+        pesos = [self.config.weights[nome] for nome in nomes]
+        return sim.rng.choices(nomes, weights=pesos)[0]
+
+    def _mover(self, sim: SimulatedPlayer) -> bool:
+        vizinhos = self.interface_service.get_adjacent_chunks(sim.chunk_id)
+        if not vizinhos:
+            return False
+        destino, _ = sim.rng.choice(vizinhos)
+        if self.interface_service.move_player_to_chunk(sim.player, destino) is None:
+            return False
+        sim.chunk_id = destino
+        return True
+
+    def _salvar(self, sim: SimulatedPlayer) -> bool:
+        return self.interface_service.save_player(sim.player) is not None
+
+    def _fantasma(self, sim: SimulatedPlayer) -> bool:
+        if not self._fantasmas:
+            return False
+        fantasma = sim.rng.choice(self._fantasmas)
+        if fantasma.get("tipo") == "minerador":
+            resultado = self.game_service.realizar_acao_fantasma(
+                fantasma["id"], "minerar", material=sim.rng.choice(["madeira", "pedra", "ferro"]))
+        else:
+            resultado = self.game_service.realizar_acao_fantasma(
+                fantasma["id"], "construir", tipo="totem",
+                recursos={"pedra": 10, "carvão": 3, "redstone": 1})
+        # A recusa por ação já realizada é regra de jogo, não falha
+        return resultado.get("error") in (None, FANTASMA_JA_AGIU)
+
+    def _tick(self, sim: SimulatedPlayer) -> bool:
+        return "error" not in self.game_service.avancar_tempo()
+
+    def _run_player(self, sim: SimulatedPlayer, deadline: float) -> None:
+        acoes = {"mover": self._mover, "salvar": self._salvar,
+                 "fantasma": self._fantasma, "tick": self._tick}
+        feitas = 0
+        while time.monotonic() < deadline:
+            if self.config.max_actions is not None and feitas >= self.config.max_actions:
+                break
+            operacao = self._choose(sim)
+            inicio = time.perf_counter()
+            try:
+                ok = acoes[operacao](sim)
+            except Exception as e:
+                print(f"Erro na simulação ({operacao}): {str(e)}")
+                ok = False
+            self._record(operacao, time.perf_counter() - inicio, ok)
+            feitas += 1
+            if self.config.think_time:
+                time.sleep(self.config.think_time)
+
+    def run(self) -> SimulationReport:
+        """Executa a simulação e retorna o relatório"""
+        sims = self._setup_players()
+        try:
+            self._fantasmas = self.game_service.get_all_fantasmas()
+        except Exception as e:
+            print(f"Erro ao carregar fantasmas: {str(e)}")
+            self._fantasmas = []
+
+        round_trips_inicio = self.round_trip_counter()
+        inicio = time.monotonic()
+        deadline = inicio + self.config.duration
+        threads = [
+            threading.Thread(target=self._run_player, args=(sim, deadline),
+                             name=f"sim-player-{i}", daemon=True)
+            for i, sim in enumerate(sims)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # As alterações bufferizadas fazem parte do custo da simulação
+        self.game_service.player_state_buffer.flush()
+        elapsed = time.monotonic() - inicio
+        round_trips = self.round_trip_counter() - round_trips_inicio
+
+        self._teardown_players()
+        return SimulationReport(self.config, elapsed, self._stats, round_trips)
@@ -0,0 +1,165 @@
+"""
+Unidade de trabalho (unit of work) para transações entre repositórios
+
+Dentro de um bloco ``with UnitOfWork():`` toda chamada a ``connection_db()``
+na mesma thread recebe a conexão da unidade em vez de emprestar outra do
+pool. Os ``commit()`` dos repositórios são adiados para o fim do bloco, então
+uma ação com vários passos usa uma conexão e um commit, com semântica de
+tudo-ou-nada.
+
+Efeitos em memória de uma gravação (índices, versões dos caches) são
+registrados com ``on_commit`` e só acontecem se a unidade for confirmada.
+"""
+
+import threading
+from typing import Any, Callable, List, Optional
+
+_local = threading.local()
+
+
+class UnitOfWorkError(Exception):
+    """Algum passo da unidade de trabalho falhou; nada foi gravado"""
+    pass
+
+
+class EnlistedConnection:
+    """
+    Conexão da unidade de trabalho entregue aos repositórios
+
+    ``commit()``, ``close()`` e o fim do bloco ``with`` não encerram a
+    transação; ``rollback()`` ou uma exceção dentro do bloco marcam a unidade
+    para ser desfeita.
+    """
+
+    def __init__(self, unit_of_work: 'UnitOfWork', conn):
+        self._unit_of_work = unit_of_work
+        self._conn = conn
+
+    def commit(self) -> None:
+        """Adiado para o fim da unidade de trabalho"""
+        pass
+
+    def rollback(self) -> None:
+        self._unit_of_work.mark_failed("rollback solicitado por um repositório")
+
+    def close(self) -> None:
+        """A conexão pertence à unidade de trabalho"""
+        pass
+
+    def __enter__(self) -> 'EnlistedConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self._unit_of_work.mark_failed(str(exc_value))
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+class UnitOfWork:
+    """
+    Transação única compartilhada pelos repositórios chamados dentro do bloco
+
+    Blocos aninhados na mesma thread participam da unidade mais externa, que é
+    a única a fazer commit. Se algum passo falhar (mesmo que o repositório
+    tenha tratado o erro e devolvido None/False), tudo é desfeito e
+    ``UnitOfWorkError`` é levantada ao sair do bloco.
+
+    Example:
+        with UnitOfWork():
+            aldeao_repository.save(aldeao, mago)
+            player_repository.save(player)
+    """
+
+    def __init__(self, connection_factory: Optional[Callable[[], Any]] = None):
+        self._connection_factory = connection_factory
+        self._conn = None
+        self._enlisted: Optional[EnlistedConnection] = None
+        self._outer: Optional['UnitOfWork'] = None
+        self._erro: Optional[str] = None
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def failed(self) -> bool:
+        root = self._outer or self
+        return root._erro is not None
+
+    @property
+    def connection(self) -> EnlistedConnection:
+        """Conexão compartilhada, aberta no primeiro uso"""
+        root = self._outer or self
+        if root._enlisted is None:
+            if root._connection_factory is None:
+                from .db_pool import get_pool
+                root._conn = get_pool().getconn()
+            else:
+                root._conn = root._connection_factory()
+            root._enlisted = EnlistedConnection(root, root._conn)
+        return root._enlisted
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Agenda ``callback`` para depois do commit da unidade mais externa"""
+        root = self._outer or self
+        root._callbacks.append(callback)
+
+    def mark_failed(self, motivo: str) -> None:
+        root = self._outer or self
+        if root._erro is None:
+            root._erro = motivo
+
+    def __enter__(self) -> 'UnitOfWork':
+        self._outer = current_unit_of_work()
+        if self._outer is None:
+            _local.unit_of_work = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.mark_failed(str(exc_value))
+        if self._outer is not None:
+            # Bloco aninhado: a unidade externa decide
+            return
+
+        _local.unit_of_work = None
+        conn, self._conn, self._enlisted = self._conn, None, None
+        callbacks, self._callbacks = self._callbacks, []
+        if conn is not None:
+            try:
+                if self._erro is None:
+                    conn.commit()
+                else:
+                    conn.rollback()
+            finally:
+                conn.close()
+
+        if self._erro is not None:
+            # Desfeita: os efeitos agendados com on_commit são descartados
+            if exc_type is None:
+                raise UnitOfWorkError(self._erro)
+            return
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Erro ao aplicar efeito após o commit: {str(e)}")
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Unidade de trabalho ativa na thread atual, se houver"""
+    return getattr(_local, 'unit_of_work', None)
+
+
+def on_commit(callback: Callable[[], None]) -> None:
+    """
+    Executa ``callback`` quando a gravação atual estiver confirmada
+
+    Dentro de uma ``UnitOfWork`` o callback espera o commit da unidade mais
+    externa (e é descartado no rollback); fora dela, o repositório já fez o
+    commit e o callback roda na hora.
+    """
+    unit_of_work = current_unit_of_work()
+    if unit_of_work is None:
+        callback()
+    else:
+        unit_of_work.on_commit(callback)
@@ -0,0 +1,220 @@
+"""
+Gerador procedural de mundos com NumPy
+
+O terreno é calculado de uma vez para o grid inteiro: dois campos de ruído
+(elevação e umidade) definem o bioma de cada posição. O mesmo terreno é
+gravado nos mapas de Dia e de Noite, então a posição (x, y) é a mesma
+nos dois turnos. As linhas vão para a tabela chunk por ``COPY FROM STDIN``,
+em faixas de linhas do grid, sem montar todos os INSERTs em memória.
+"""
+
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from ..models.bioma import BiomaType
+from ..models.mapa import TurnoType
+from .db_helpers import connection_db
+from .reference_cache import bump_reference_version
+
+# Códigos do grid gerado, na ordem da elevação: oceano abaixo do nível do mar,
+# e a terra dividida pela umidade (seco → úmido)
+BIOMA_ORDER = (BiomaType.OCEANO, BiomaType.DESERTO, BiomaType.FLORESTA, BiomaType.SELVA)
+OCEANO, DESERTO, FLORESTA, SELVA = range(len(BIOMA_ORDER))
+
+# Fração do mapa abaixo do nível do mar (além da borda, sempre oceano)
+OCEAN_FRACTION = 0.3
+
+# Linhas do grid por bloco enviado ao COPY
+COPY_BAND_ROWS = 64
+COPY_BUFFER_SIZE = 1 << 20
+
+_COPY_SQL = "COPY chunk (id_bioma, id_mapa, x, y) FROM STDIN"
+
+
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3 - 2 * t)
+
+
+def value_noise(width: int, height: int, cell: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Ruído de valor: reticulado aleatório a cada ``cell`` posições, interpolado
+
+    Returns:
+        Array (height, width) com valores em [0, 1)
+    """
+    cell = max(1, cell)
+    lattice = rng.random((height // cell + 2, width // cell + 2))
+    xs = np.arange(width) / cell
+    ys = np.arange(height) / cell
+    x0 = xs.astype(np.intp)
+    y0 = ys.astype(np.intp)
+    tx = _smoothstep(xs - x0)[np.newaxis, :]
+    ty = _smoothstep(ys - y0)[:, np.newaxis]
+
+    a = lattice[np.ix_(y0, x0)]
+    b = lattice[np.ix_(y0, x0 + 1)]
+    c = lattice[np.ix_(y0 + 1, x0)]
+    d = lattice[np.ix_(y0 + 1, x0 + 1)]
+    top = a + (b - a) * tx
+    bottom = c + (d - c) * tx
+    return top + (bottom - top) * ty
+
+
+def fractal_noise(width: int, height: int, rng: np.random.Generator,
+                  scale: int = 32, octaves: int = 4) -> np.ndarray:
+    """Soma de oitavas de ``value_noise`` (detalhe dobrando, amplitude caindo pela metade)"""
+    total = np.zeros((height, width))
+    amplitude = 1.0
+    for octave in range(octaves):
+        total += amplitude * value_noise(width, height, scale >> octave, rng)
+        amplitude /= 2
+    return total / (2 - 2 ** (1 - octaves))
+
+
+def generate_bioma_grid(width: int, height: int, seed: Optional[int] = None,
+                        scale: int = 32, octaves: int = 4) -> np.ndarray:
+    """
+    Gera o bioma de cada posição do mapa
+
+    Args:
+        width: Largura do mapa (eixo x)
+        height: Altura do mapa (eixo y)
+        seed: Semente do gerador (mesma semente, mesmo mundo)
+        scale: Tamanho, em chunks, das maiores formações
+        octaves: Camadas de detalhe do ruído
+
+    Returns:
+        Array uint8 (height, width) com índices de ``BIOMA_ORDER``
+    """
+    if width < 1 or height < 1:
+        raise ValueError(f"Dimensões inválidas: {width}x{height}")
+
+    rng = np.random.default_rng(seed)
+    elevation = fractal_noise(width, height, rng, scale, octaves)
+    moisture = fractal_noise(width, height, rng, scale, octaves)
+
+    # A borda é sempre oceano, como no mapa original
+    ocean = elevation < np.quantile(elevation, OCEAN_FRACTION)
+    ocean[[0, -1], :] = True
+    ocean[:, [0, -1]] = True
+
+    grid = np.full((height, width), OCEANO, dtype=np.uint8)
+    land = ~ocean
+    if land.any():
+        seco, umido = np.quantile(moisture[land], [1 / 3, 2 / 3])
+        grid[land] = np.select(
+            [moisture[land] < seco, moisture[land] < umido],
+            [DESERTO, FLORESTA],
+            default=SELVA,
+        )
+    return grid
+
+
+def copy_rows(bioma_ids: np.ndarray, id_mapa: int,
+              band_rows: int = COPY_BAND_ROWS) -> Iterator[bytes]:
+    """
+    Linhas do COPY (formato texto) em blocos de ``band_rows`` linhas do grid
+
+    A ordem é a do seed original (y externo, x interno), então os id_chunk
+    gerados pela sequência ficam em ``primeiro + y * width + x``.
+    """
+    height, width = bioma_ids.shape
+    xs = np.arange(width)
+    for y0 in range(0, height, band_rows):
+        band = bioma_ids[y0:y0 + band_rows]
+        rows = len(band)
+        columns = np.column_stack((
+            band.ravel(),
+            np.full(band.size, id_mapa),
+            np.tile(xs, rows),
+            np.repeat(np.arange(y0, y0 + rows), width),
+        ))
+        yield (("%d\t%d\t%d\t%d\n" * band.size) % tuple(columns.ravel().tolist())).encode()
+
+
+class _BlockReader:
+    """Arquivo somente leitura sobre um iterador de blocos de bytes (entrada do copy_expert)"""
+
+    def __init__(self, blocks: Iterable[bytes]):
+        self._blocks = iter(blocks)
+        self._current = b""
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            if self._pos >= len(self._current):
+                self._current = next(self._blocks, None)
+                self._pos = 0
+                if self._current is None:
+                    self._current = b""
+                    break
+            end = len(self._current) if size < 0 else min(len(self._current), self._pos + remaining)
+            parts.append(self._current[self._pos:end])
+            remaining -= end - self._pos
+            self._pos = end
+        return b"".join(parts)
+
+
+def _bioma_ids(cursor) -> np.ndarray:
+    """Traduz os códigos de BIOMA_ORDER para os id_bioma do banco"""
+    cursor.execute("SELECT nome, id_bioma FROM bioma")
+    por_nome = dict(cursor.fetchall())
+    faltando = [b.value for b in BIOMA_ORDER if b.value not in por_nome]
+    if faltando:
+        raise ValueError(f"Biomas ausentes no banco: {', '.join(faltando)}")
+    return np.array([por_nome[b.value] for b in BIOMA_ORDER], dtype=np.int64)
+
+
+def seed_world(width: int, height: int, mapa_nome: str = "Mapa_Principal",
+               seed: Optional[int] = None, replace: bool = False,
+               turnos: Sequence[TurnoType] = (TurnoType.DIA, TurnoType.NOITE)) -> Dict[str, int]:
+    """
+    Gera um mundo width × height e grava os chunks de cada turno com COPY
+
+    Args:
+        width: Largura do mapa
+        height: Altura do mapa
+        mapa_nome: Nome dos mapas (um por turno), criados se não existirem
+        seed: Semente do terreno
+        replace: Apaga os chunks já existentes nesses mapas; sem ela, mapas
+            com chunks são recusados
+        turnos: Turnos que recebem o terreno
+
+    Returns:
+        Dicionário turno → id_mapa
+    """
+    grid = generate_bioma_grid(width, height, seed)
+    mapas: Dict[str, int] = {}
+
+    with connection_db() as conn:
+        with conn.cursor() as cursor:
+            bioma_ids = _bioma_ids(cursor)[grid]
+
+            for turno in turnos:
+                cursor.execute("""
+                    INSERT INTO mapa (nome, turno) VALUES (%s, %s)
+                    ON CONFLICT ON CONSTRAINT uk_mapa_nome_turno DO NOTHING
+                """, (mapa_nome, turno.value))
+                cursor.execute("SELECT id_mapa FROM mapa WHERE nome = %s AND turno = %s",
+                               (mapa_nome, turno.value))
+                mapas[turno.value] = cursor.fetchone()[0]
+
+            ids = list(mapas.values())
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM chunk WHERE id_mapa = ANY(%s))", (ids,))
+            if cursor.fetchone()[0]:
+                if not replace:
+                    raise ValueError(f"O mapa {mapa_nome} já tem chunks (use replace=True)")
+                cursor.execute("DELETE FROM chunk WHERE id_mapa = ANY(%s)", (ids,))
+
+            for id_mapa in ids:
+                cursor.copy_expert(_COPY_SQL, _BlockReader(copy_rows(bioma_ids, id_mapa)),
+                                   size=COPY_BUFFER_SIZE)
+            cursor.execute("ANALYZE chunk")
+        conn.commit()
+
+    bump_reference_version('mapa')
+    bump_reference_version('chunk')
+    return mapas
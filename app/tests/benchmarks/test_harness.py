@@ -0,0 +1,43 @@
+"""
+Testes para o harness da suíte de benchmarks
+"""
+from benchmarks.harness import BenchmarkResult, compare, load_results, measure, save_results
+from benchmarks.seed import parse_scale
+
+
+def test_measure_discards_warmup_and_runs_setup():
+    calls = []
+    samples = measure(lambda: calls.append("fn"), repeat=3, warmup=2,
+                      setup=lambda: calls.append("setup"))
+
+    assert len(samples) == 3
+    assert calls == ["setup", "fn"] * 5
+
+
+def test_results_round_trip_and_regression_check(tmp_path):
+    path = tmp_path / "base.json"
+    baseline = [BenchmarkResult("find_all", "1k", [0.010, 0.012, 0.011]),
+                BenchmarkResult("find_by_mapa", "1k", [0.020, 0.020, 0.020])]
+    save_results(str(path), baseline, {"scales": ["1k"]})
+
+    medians = load_results(str(path))
+    assert medians == {"1k:find_all": 0.011, "1k:find_by_mapa": 0.020}
+
+    current = [BenchmarkResult("find_all", "1k", [0.012]),        # +9%: dentro da tolerância
+               BenchmarkResult("find_by_mapa", "1k", [0.030]),    # +50%: regressão
+               BenchmarkResult("find_by_mapa", "100k", [9.0])]    # sem linha de base
+    regressions = compare(medians, current, tolerance=0.2)
+
+    assert [r.key for r in regressions] == ["1k:find_by_mapa"]
+    assert round(regressions[0].ratio, 2) == 1.5
+
+
+def test_parse_scale():
+    assert parse_scale("100k") == ("100k", 100_000)
+    assert parse_scale("1M") == ("1M", 1_000_000)
+    assert parse_scale("2500") == ("2500", 2500)
+
+
+def test_rows_per_second_uses_median():
+    assert BenchmarkResult("find_store_by_mapa", "1k", [0.5, 0.25, 1.0], rows=1000).rows_per_second == 2000
+    assert BenchmarkResult("find_all", "1k", [0.5]).to_dict()["rows_per_second"] is None
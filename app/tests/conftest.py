@@ -9,6 +9,52 @@ from unittest.mock import MagicMock, Mock, patch
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+
+class FakeDatabase:
+    """
+    Banco simulado para testes de serviço
+
+    As respostas são registradas por trecho de SQL (o primeiro trecho contido
+    na consulta vence; sem correspondência, nenhuma linha). Os cursores são
+    instrumentados, então cada ``execute`` conta no ``QueryStats`` global e
+    nos orçamentos de ``QueryBudget``.
+    """
+
+    def __init__(self):
+        self._respostas = []
+        self.executed = []
+
+    def respond(self, trecho, rows):
+        self._respostas.append((trecho, list(rows)))
+
+    def _rows_for(self, sql):
+        texto = sql.decode() if isinstance(sql, bytes) else str(sql)
+        return next((rows for trecho, rows in self._respostas if trecho in texto), [])
+
+    def _cursor(self):
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        estado = {"rows": []}
+
+        def execute(sql, params=None):
+            self.executed.append(sql)
+            estado["rows"] = list(self._rows_for(sql))
+            cursor.rowcount = len(estado["rows"])
+
+        cursor.execute.side_effect = execute
+        cursor.fetchall.side_effect = lambda: estado["rows"]
+        cursor.fetchone.side_effect = lambda: estado["rows"][0] if estado["rows"] else None
+        cursor.__iter__.side_effect = lambda: iter(estado["rows"])
+        return cursor
+
+    def connection(self):
+        from src.utils.query_stats import InstrumentedCursor, get_query_stats
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        conn.__exit__.return_value = None
+        conn.cursor.side_effect = lambda *args, **kwargs: InstrumentedCursor(self._cursor(), get_query_stats())
+        return conn
+
 @pytest.fixture
 def mock_db_connection():
     """Mock para conexão com banco de dados"""
@@ -59,4 +105,53 @@ def sample_mapas():
         Mapa(1, "Mapa_Principal", TurnoType.DIA),
         Mapa(2, "Mapa_Principal", TurnoType.NOITE),
         Mapa(3, "Mapa_Secundario", TurnoType.DIA),
-    ] 
+    ]
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Troca o connection_db de todos os repositórios por um FakeDatabase"""
+    import importlib
+    import pkgutil
+    import src.repositories as repositories
+    from src.repositories.chunk_repository import ChunkRepositoryImpl
+    from src.repositories.ponte_repository import PonteRepositoryImpl
+
+    db = FakeDatabase()
+    for info in pkgutil.iter_modules(repositories.__path__):
+        module = importlib.import_module(f"src.repositories.{info.name}")
+        if hasattr(module, "connection_db"):
+            monkeypatch.setattr(module, "connection_db", db.connection)
+    ChunkRepositoryImpl.invalidate_grid()
+    PonteRepositoryImpl.invalidate_index()
+    yield db
+    ChunkRepositoryImpl.invalidate_grid()
+    PonteRepositoryImpl.invalidate_index()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Orçamento de consultas para um bloco do teste
+
+    Example:
+        with query_budget(1, "get_players_in_bioma"):
+            service.get_players_in_bioma(1)
+    """
+    from src.utils.query_budget import QueryBudget
+    return QueryBudget
+
+
+@pytest.fixture
+def pgcopy_binary():
+    """Monta um fluxo ``COPY ... (FORMAT binary)`` com linhas de colunas int4"""
+    import struct
+    from src.utils.binary_copy import PGCOPY_SIGNATURE
+
+    def build(rows):
+        body = b"".join(
+            struct.pack(">h", len(row)) + b"".join(struct.pack(">ii", 4, v) for v in row)
+            for row in rows
+        )
+        return PGCOPY_SIGNATURE + struct.pack(">ii", 0, 0) + body + b"\xff\xff"
+    return build
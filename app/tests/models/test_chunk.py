@@ -103,7 +103,17 @@ class TestChunk:
         assert 501 in adjacentes_500  # Direita
         assert 468 in adjacentes_500  # Abaixo
         assert 532 in adjacentes_500  # Acima
-    
+
+    def test_get_adjacent_chunk_ids_rectangular_map(self):
+        """Testa mapas não quadrados e a borda direita"""
+        # Mapa 64x8: último chunk da primeira linha (x=63, y=0)
+        chunk = Chunk(64, 1, 1, 63, 0)
+        assert sorted(chunk.get_adjacent_chunk_ids(64, 8)) == [63, 128]
+
+        # Última linha não tem vizinho abaixo
+        chunk = Chunk(450, 1, 1, 1, 7)
+        assert sorted(chunk.get_adjacent_chunk_ids(64, 8)) == [386, 449, 451]
+
     def test_belongs_to_map(self):
         """Testa verificação de pertencimento ao mapa"""
         chunk = Chunk(1, 1, 1, 0, 0)  # id_mapa=1, x=0
@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import patch, Mock
 from src.models.mapa import Mapa, TurnoType
 from src.models.chunk import Chunk
+from src.utils.chunk_store import ChunkStore
 
 
 class TestMapa:
@@ -74,8 +75,7 @@ class TestMapa:
         
         # Mock do repository
         mock_repo = Mock()
-        mock_chunks = [Chunk(i, 1, 1, i%32, i//32) for i in range(1, 1001)]
-        mock_repo.find_by_mapa.return_value = mock_chunks
+        mock_repo.count_by_bioma.return_value = {1: 1000}
         mapa.set_chunk_repository(mock_repo)
         
         info = mapa.get_display_info()
@@ -84,6 +84,7 @@ class TestMapa:
         assert info['tipo'] == "Dia"
         assert info['total_chunks'] == 1000
         assert 'distribuicao' in info
+        mock_repo.find_by_mapa.assert_not_called()
     
     def test_get_display_info_with_chunks(self):
         """Testa informações de exibição com chunks"""
@@ -91,12 +92,8 @@ class TestMapa:
         
         # Mock do repository
         mock_repo = Mock()
-        chunks = [
-            Chunk(1, 1, 1, 0, 0),  # id_bioma=1 (Deserto)
-            Chunk(2, 2, 1, 1, 0),  # id_bioma=2 (Oceano)
-            Chunk(3, 1, 1, 2, 0),  # id_bioma=1 (Deserto)
-        ]
-        mock_repo.find_by_mapa.return_value = chunks
+        # id_bioma=1 (Deserto) x2, id_bioma=2 (Oceano) x1
+        mock_repo.count_by_bioma.return_value = {1: 2, 2: 1}
         mapa.set_chunk_repository(mock_repo)
         
         info = mapa.get_display_info()
@@ -118,16 +115,32 @@ class TestMapa:
             Chunk(2, 2, 1, 1, 0),  # id_bioma=2
             Chunk(3, 1, 1, 2, 0),  # id_bioma=1
         ]
-        mock_repo.find_by_mapa.return_value = chunks
+        mock_repo.find_store_by_mapa.return_value = ChunkStore.from_chunks(chunks)
         mapa.set_chunk_repository(mock_repo)
         
         chunks_bioma_1 = mapa.get_chunks_by_bioma(1)
         chunks_bioma_2 = mapa.get_chunks_by_bioma(2)
         chunks_bioma_3 = mapa.get_chunks_by_bioma(3)
         
-        assert len(chunks_bioma_1) == 2
+        assert [c.id_chunk for c in chunks_bioma_1] == [1, 3]
         assert len(chunks_bioma_2) == 1
         assert len(chunks_bioma_3) == 0
+        # O store é carregado uma vez e reaproveitado
+        mock_repo.find_store_by_mapa.assert_called_once_with("Mapa_Principal", "Dia")
+    
+    def test_get_bioma_distribution_uses_loaded_store(self):
+        """Testa distribuição calculada no ChunkStore já carregado"""
+        mapa = Mapa(1, "Mapa_Principal", TurnoType.DIA)
+        
+        mock_repo = Mock()
+        mock_repo.find_store_by_mapa.return_value = ChunkStore.from_chunks([
+            Chunk(1, 1, 1, 0, 0), Chunk(2, 2, 1, 1, 0), Chunk(3, 1, 1, 2, 0),
+        ])
+        mapa.set_chunk_repository(mock_repo)
+        mapa.get_chunk_store()
+        
+        assert mapa.get_bioma_distribution() == {1: 2, 2: 1}
+        mock_repo.count_by_bioma.assert_not_called()
     
     def test_get_bioma_distribution(self):
         """Testa distribuição de biomas"""
@@ -135,13 +148,7 @@ class TestMapa:
         
         # Mock do repository
         mock_repo = Mock()
-        chunks = [
-            Chunk(1, 1, 1, 0, 0),  # id_bioma=1
-            Chunk(2, 2, 1, 1, 0),  # id_bioma=2
-            Chunk(3, 1, 1, 2, 0),  # id_bioma=1
-            Chunk(4, 3, 1, 3, 0),  # id_bioma=3
-        ]
-        mock_repo.find_by_mapa.return_value = chunks
+        mock_repo.count_by_bioma.return_value = {1: 2, 2: 1, 3: 1}
         mapa.set_chunk_repository(mock_repo)
         
         distribuicao = mapa.get_bioma_distribution()
@@ -149,6 +156,8 @@ class TestMapa:
         assert distribuicao[1] == 2  # bioma ID 1
         assert distribuicao[2] == 1  # bioma ID 2
         assert distribuicao[3] == 1  # bioma ID 3
+        mock_repo.count_by_bioma.assert_called_once_with("Mapa_Principal", "Dia")
+        mock_repo.find_by_mapa.assert_not_called()
     
     def test_get_bioma_distribution_empty(self):
         """Testa distribuição de biomas sem chunks"""
@@ -156,7 +165,7 @@ class TestMapa:
         
         # Mock do repository
         mock_repo = Mock()
-        mock_repo.find_by_mapa.return_value = []
+        mock_repo.count_by_bioma.return_value = {}
         mapa.set_chunk_repository(mock_repo)
         
         distribuicao = mapa.get_bioma_distribution()
@@ -23,6 +23,44 @@ def test_find_all_chunks(mock_db_connection):
         ]
 
 
+def test_iter_all_streams_with_server_side_cursor(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.__iter__.return_value = iter([(1, 1, 1, 0, 0), (2, 2, 1, 1, 0)])
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        repo = ChunkRepositoryImpl()
+        chunks = repo.iter_all(itersize=500)
+        mock_conn.cursor.assert_not_called()
+        assert next(chunks) == Chunk(1, 1, 1, 0, 0)
+        mock_conn.cursor.assert_called_once_with(name="iter_chunk")
+        assert mock_cursor.itersize == 500
+        assert list(chunks) == [Chunk(2, 2, 1, 1, 0)]
+        mock_cursor.fetchall.assert_not_called()
+
+
+def test_iter_all_releases_connection_when_stopped_early(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.__iter__.return_value = iter([(1, 1, 1, 0, 0), (2, 2, 1, 1, 0)])
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        chunks = ChunkRepositoryImpl().iter_all()
+        next(chunks)
+        chunks.close()
+        mock_conn.__exit__.assert_called_once()
+
+
+def test_find_store_by_mapa_decodes_binary_copy(mock_db_connection, pgcopy_binary):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.mogrify.return_value = b"SELECT ..."
+    stream = pgcopy_binary([(1, 1, 1, 0, 0), (2, 2, 1, 1, 0), (3, 1, 1, 0, 1)])
+    mock_cursor.copy_expert.side_effect = lambda sql, f: f.write(stream)
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        store = ChunkRepositoryImpl().find_store_by_mapa("Mapa_Principal", "Dia")
+    sql = mock_cursor.copy_expert.call_args[0][0]
+    assert sql == "COPY (SELECT ...) TO STDOUT (FORMAT binary)"
+    assert store.id_chunk.tolist() == [1, 2, 3]
+    assert store.get(1, 0, 1) == Chunk(3, 1, 1, 0, 1)
+    mock_cursor.fetchall.assert_not_called()
+
+
 def test_find_chunk_by_id(mock_db_connection):
     mock_conn, mock_cursor = mock_db_connection
     mock_cursor.fetchone.return_value = (3, 2, 1, 2, 2)
@@ -81,3 +119,53 @@ def test_find_by_bioma(mock_db_connection):
         chunks = repo.find_by_bioma(3)
         mock_cursor.execute.assert_called_once()
         assert chunks == [Chunk(5, 3, 2, 4, 4)]
+
+
+def test_find_by_ids_uses_single_any_query(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [
+        (1, 1, 1, 0, 0),
+        (7, 2, 1, 6, 0)
+    ]
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        repo = ChunkRepositoryImpl()
+        chunks = repo.find_by_ids([1, 7])
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "ANY(%s)" in sql
+        assert params == ([1, 7],)
+        assert chunks == [Chunk(1, 1, 1, 0, 0), Chunk(7, 2, 1, 6, 0)]
+
+
+def test_save_many_single_transaction(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    chunks = [Chunk(1, 1, 1, 0, 0), Chunk(2, 2, 1, 1, 0)]
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn), \
+         patch('src.repositories.chunk_repository.execute_values', return_value=[(1,), (2,)]) as mock_ev:
+        repo = ChunkRepositoryImpl()
+        affected = repo.save_many(chunks)
+        mock_ev.assert_called_once()
+        assert mock_ev.call_args[0][2] == [(1, 1, 1, 0, 0), (2, 2, 1, 1, 0)]
+        mock_conn.commit.assert_called_once()
+        assert affected == 2
+
+
+def test_delete_many_reports_rows(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.rowcount = 3
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        repo = ChunkRepositoryImpl()
+        assert repo.delete_many([4, 5, 6]) == 3
+        mock_cursor.execute.assert_called_once_with("DELETE FROM chunk WHERE id_chunk = ANY(%s)", ([4, 5, 6],))
+        assert repo.delete_many([]) == 0
+
+
+def test_count_by_bioma_groups_in_sql(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(1, 600), (2, 400)]
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        repo = ChunkRepositoryImpl()
+        assert repo.count_by_bioma("Mapa_Principal", "Dia") == {1: 600, 2: 400}
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "GROUP BY c.id_bioma" in sql
+        assert params == ("Mapa_Principal", "Dia")
@@ -23,6 +23,14 @@ def test_find_all_items(mock_db_connection):
             Item(2, 'Poção', 'Consumo', None, None)
         ]
 
+def test_iter_all_items(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.__iter__.return_value = iter([(1, 'Espada', 'Arma', 10, 100)])
+    with patch('src.repositories.item_repository.connection_db', return_value=mock_conn):
+        repo = ItemRepositoryImpl()
+        assert list(repo.iter_all()) == [Item(1, 'Espada', 'Arma', 10, 100)]
+        mock_conn.cursor.assert_called_once_with(name="iter_item")
+
 def test_find_item_by_id(mock_db_connection):
     mock_conn, mock_cursor = mock_db_connection
     mock_cursor.fetchone.return_value = (1, 'Espada', 'Arma', 10, 100)
@@ -0,0 +1,28 @@
+"""
+Testes para MundoRepositoryImpl
+"""
+from unittest.mock import patch
+from src.repositories.mundo_repository import MundoRepositoryImpl
+from src.models.mundo import Mundo
+
+
+def test_avancar_relogio_uses_single_update_returning(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchone.return_value = (1, 'Noite', 0)
+    with patch('src.repositories.mundo_repository.connection_db', return_value=mock_conn):
+        mundo = MundoRepositoryImpl().avancar_relogio(20)
+
+    mock_cursor.execute.assert_called_once()
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "UPDATE Mundo" in sql and "RETURNING" in sql
+    assert "SELECT" not in sql
+    assert params == {"max": 20}
+    mock_conn.commit.assert_called_once()
+    assert mundo == Mundo(1, 'Noite', 0)
+
+
+def test_avancar_relogio_without_row(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchone.return_value = None
+    with patch('src.repositories.mundo_repository.connection_db', return_value=mock_conn):
+        assert MundoRepositoryImpl().avancar_relogio(20) is None
@@ -0,0 +1,121 @@
+"""
+Testes para as operações em lote do PlayerRepositoryImpl
+"""
+import pytest
+from unittest.mock import patch
+from src.repositories.player_repository import PlayerRepositoryImpl
+from src.models.player import Player
+
+
+def test_save_many_splits_updates_and_inserts(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    existing = Player(1, "Steve", 100, 80, 10, "Mapa 1 - Chunk 5", 1, 0, current_chunk_id=5)
+    novo = Player(0, "Alex", 100, 100, 10, "Mapa 1 - Chunk 1", 1, 0)
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn), \
+         patch('src.repositories.player_repository.execute_values', side_effect=[[(1,)], [(42,)]]) as mock_ev:
+        repo = PlayerRepositoryImpl()
+        affected = repo.save_many([existing, novo])
+
+        assert affected == 2
+        assert mock_ev.call_count == 2
+        update_sql, update_rows = mock_ev.call_args_list[0][0][1:3]
+        assert "UPDATE Player" in update_sql
+        assert update_rows[0][0] == 1
+        assert update_rows[0][-1] == 5  # current_chunk_id gravado direto da coluna
+        assert "INSERT INTO Player" in mock_ev.call_args_list[1][0][1]
+        assert novo.id_player == 42
+        mock_conn.commit.assert_called_once()
+
+
+def test_save_many_rejects_invalid_batch(mock_db_connection):
+    mock_conn, _ = mock_db_connection
+    invalido = Player(2, "", 100, 100, 10, "", 1, 0)
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn) as mock_connection:
+        repo = PlayerRepositoryImpl()
+        assert repo.save_many([invalido]) == 0
+        mock_connection.assert_not_called()
+
+
+def test_find_by_ids_and_delete_many(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [
+        (1, "Steve", 100, 80, 10, "Mapa 1 - Chunk 5", 1, 0, 5),
+    ]
+    mock_cursor.rowcount = 2
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn):
+        repo = PlayerRepositoryImpl()
+        players = repo.find_by_ids([1, 3])
+        assert [p.nome for p in players] == ["Steve"]
+        assert players[0].current_chunk_id == 5
+        assert repo.delete_many([1, 3]) == 2
+
+
+def test_find_by_bioma_joins_on_current_chunk(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [
+        (1, "Steve", 100, 80, 10, None, 1, 0, 5),
+    ]
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn):
+        repo = PlayerRepositoryImpl()
+        players = repo.find_by_bioma(2)
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "JOIN chunk c ON c.id_chunk = p.current_chunk_id" in sql
+        assert "c.id_bioma = %s" in sql
+        assert params == (2,)
+        assert players[0].current_chunk_id == 5
+        assert players[0].localizacao_display == "Chunk 5"
+
+
+def test_find_page_uses_keyset_condition(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(7, "Zoe", 100, 100, 10, None, 1, 0, 1)]
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn):
+        repo = PlayerRepositoryImpl()
+        players = repo.find_page("Steve", 11)
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "p.nome > %s" in sql
+        assert "ORDER BY p.nome" in sql and "LIMIT %s" in sql
+        assert "OFFSET" not in sql
+        assert params == ("Steve", 11)
+        assert [p.nome for p in players] == ["Zoe"]
+
+        repo.find_page(None, 11)
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "p.nome >" not in sql and "WHERE" not in sql
+        assert params == (11,)
+
+def test_move_to_sets_chunk_and_display_text():
+    player = Player(1, "Steve", 100, 100, 10, "", 1, 0)
+    assert not player.has_location()
+
+    player.move_to(364, 1)
+
+    assert player.current_chunk_id == 364
+    assert player.localizacao == "Mapa 1 - Chunk 364"
+
+
+def test_update_many_returns_written_ids_and_propagates_errors(mock_db_connection):
+    mock_conn, _ = mock_db_connection
+    players = [Player(1, "Steve", 100, 80, 10, "", 1, 0, 5), Player(2, "Alex", 100, 100, 10, "", 1, 0, 7)]
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn), \
+         patch('src.repositories.player_repository.execute_values', return_value=[(1,)]) as mock_ev:
+        repo = PlayerRepositoryImpl()
+        # O jogador 2 não existe mais: fica fora dos IDs gravados
+        assert repo.update_many(players) == [1]
+        assert "UPDATE Player" in mock_ev.call_args[0][1]
+
+        mock_ev.side_effect = Exception("violates foreign key constraint")
+        with pytest.raises(Exception):
+            repo.update_many(players)
+
+
+def test_iter_all_defaults_missing_location_to_empty(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.__iter__.return_value = iter([(1, "Steve", 100, 100, 10, None, 1, 0, None)])
+    with patch('src.repositories.player_repository.connection_db', return_value=mock_conn):
+        players = list(PlayerRepositoryImpl().iter_all())
+
+    assert players == [Player(1, "Steve", 100, 100, 10, "", 1, 0)]
+    mock_conn.cursor.assert_called_once_with(name="iter_player")
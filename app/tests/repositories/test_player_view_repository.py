@@ -0,0 +1,49 @@
+"""
+Testes para PlayerViewRepositoryImpl
+"""
+import pytest
+from unittest.mock import patch
+from src.repositories.player_view_repository import PlayerViewRepositoryImpl
+from src.models.chunk import Chunk
+from src.models.mapa import TurnoType
+
+
+PLAYER_COLS = (1, "Steve", 100, 80, 10, "Mapa 1 - Chunk 34", 1, 0, 34)
+CURRENT_COLS = (34, 3, 1, 1, 1, "Selva", "Mapa_Principal", "Dia")
+
+
+def test_find_by_player_single_query(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [
+        PLAYER_COLS + CURRENT_COLS + (2, 2, 1, 1, 0, "Oceano"),
+        PLAYER_COLS + CURRENT_COLS + (66, 4, 1, 1, 2, "Floresta"),
+    ]
+    with patch('src.repositories.player_view_repository.connection_db', return_value=mock_conn):
+        repo = PlayerViewRepositoryImpl()
+        view = repo.find_by_player(1, 34)
+
+        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_args[0][1] == (34, 1)
+        assert view.player.nome == "Steve"
+        assert view.atual.chunk == Chunk(34, 3, 1, 1, 1)
+        assert view.atual.bioma_nome == "Selva"
+        assert view.mapa.turno == TurnoType.DIA
+        assert view.turno == "Dia"
+        assert [(v.chunk.id_chunk, v.bioma_nome) for v in view.vizinhos] == [(2, "Oceano"), (66, "Floresta")]
+
+
+def test_find_by_player_without_chunk(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [PLAYER_COLS + (None,) * 14]
+    with patch('src.repositories.player_view_repository.connection_db', return_value=mock_conn):
+        view = PlayerViewRepositoryImpl().find_by_player(1)
+        assert view.atual is None
+        assert view.mapa is None
+        assert view.vizinhos == []
+
+
+def test_find_by_player_not_found(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = []
+    with patch('src.repositories.player_view_repository.connection_db', return_value=mock_conn):
+        assert PlayerViewRepositoryImpl().find_by_player(99) is None
@@ -0,0 +1,97 @@
+"""
+Testes para PonteRepositoryImpl
+"""
+import pytest
+from unittest.mock import patch
+from src.repositories.ponte_repository import PonteRepositoryImpl
+from src.repositories.chunk_repository import ChunkRepositoryImpl
+from src.models.ponte import Ponte
+from src.utils.reference_cache import get_reference_version
+from src.utils.unit_of_work import UnitOfWork
+
+
+def test_listar_ativas_reads_built_bridges(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(1, 'Chunk-001', 'Chunk-002'), (2, '40', '42'), (3, 'Vila', '7')]
+    with patch('src.repositories.ponte_repository.connection_db', return_value=mock_conn):
+        pontes = PonteRepositoryImpl().listar_ativas()
+
+    sql = mock_cursor.execute.call_args[0][0]
+    assert "construida = TRUE" in sql
+    # Referências que não identificam um chunk são ignoradas
+    assert pontes == [Ponte(1, 1, 2, ativa=True), Ponte(2, 40, 42, ativa=True)]
+
+
+def test_listar_ativas_on_error(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.execute.side_effect = Exception("sem conexão")
+    with patch('src.repositories.ponte_repository.connection_db', return_value=mock_conn):
+        assert PonteRepositoryImpl().listar_ativas() == []
+
+
+def test_index_is_loaded_once_and_updated_in_place(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(1, '10', '20')]
+    mock_cursor.fetchone.return_value = (2,)
+    PonteRepositoryImpl.invalidate_index()
+    repo = PonteRepositoryImpl()
+    try:
+        with patch('src.repositories.ponte_repository.connection_db', return_value=mock_conn):
+            assert repo.existe_ponte_entre(10, 20)
+            assert not repo.existe_ponte_entre(20, 30)
+
+            repo.inserir(Ponte(chunk_origem=20, chunk_destino=30))
+            assert repo.existe_ponte_entre(20, 30)
+            repo.desativar(1)
+            assert not repo.existe_ponte_entre(10, 20)
+
+        # Só a carga inicial leu a tabela; as verificações vieram do índice
+        selects = [c for c in mock_cursor.execute.call_args_list if "SELECT" in c[0][0]]
+        assert len(selects) == 1
+        assert mock_cursor.execute.call_args_list[1][0][1] == ('20', '30', True)
+    finally:
+        PonteRepositoryImpl.invalidate_index()
+
+
+def test_index_load_failure_is_not_memoized(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.execute.side_effect = Exception("sem conexão")
+    PonteRepositoryImpl.invalidate_index()
+    with patch('src.repositories.ponte_repository.connection_db', return_value=mock_conn):
+        assert len(PonteRepositoryImpl().get_index()) == 0
+    assert PonteRepositoryImpl._index is None
+
+
+def test_rolled_back_unit_leaves_index_and_versions_untouched(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(1, '10', '20')]
+    mock_cursor.fetchone.return_value = (2,)
+    PonteRepositoryImpl.invalidate_index()
+    repo = PonteRepositoryImpl()
+    try:
+        with patch('src.repositories.ponte_repository.connection_db', return_value=mock_conn):
+            assert repo.existe_ponte_entre(10, 20)
+        versoes = get_reference_version('ponte'), get_reference_version('chunk')
+        geracao = ChunkRepositoryImpl._grid_generation
+
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(connection_factory=lambda: mock_conn):
+                repo.inserir(Ponte(chunk_origem=20, chunk_destino=30))
+                repo.desativar(1)
+                ChunkRepositoryImpl.invalidate_grid()
+                raise RuntimeError("passo seguinte falhou")
+
+        mock_conn.rollback.assert_called_once()
+        assert repo.existe_ponte_entre(10, 20)
+        assert not repo.existe_ponte_entre(20, 30)
+        assert (get_reference_version('ponte'), get_reference_version('chunk')) == versoes
+        assert ChunkRepositoryImpl._grid_generation == geracao
+
+        with UnitOfWork(connection_factory=lambda: mock_conn):
+            repo.inserir(Ponte(chunk_origem=20, chunk_destino=30))
+            # Só aparece no índice depois do commit
+            assert not repo.existe_ponte_entre(20, 30)
+        assert repo.existe_ponte_entre(20, 30)
+        assert get_reference_version('ponte') == versoes[0] + 1
+    finally:
+        PonteRepositoryImpl.invalidate_index()
@@ -9,7 +9,8 @@ from src.repositories import (
     BiomaRepositoryImpl,
     ChunkRepositoryImpl,
     MapaRepositoryImpl,
-    PlayerRepositoryImpl
+    PlayerRepositoryImpl,
+    StatisticsRepositoryImpl
 )
 from src.models.mapa import Mapa, TurnoType
 from src.models.player import Player
@@ -97,13 +98,17 @@ class TestRepositoryPattern:
         
         # Mock dos repositories
         with patch.object(MapaRepositoryImpl, 'find_by_id', return_value=mock_mapa), \
-             patch.object(ChunkRepositoryImpl, 'find_by_mapa', return_value=mock_chunks):
+             patch.object(ChunkRepositoryImpl, 'count_by_bioma', return_value={1: 2, 2: 1}), \
+             patch.object(ChunkRepositoryImpl, 'find_by_mapa', return_value=mock_chunks) as mock_find:
             
             service = GameServiceImpl()
             
             # Act
             info = service.get_map_info("Mapa_Principal", TurnoType.DIA)
             
+            # Só a amostra de chunks é carregada
+            mock_find.assert_called_once_with("Mapa_Principal", "Dia", limit=10)
+            assert info["chunks"] == [1, 2, 3]
             # Assert
             assert info["nome"] == "Mapa_Principal"
             assert info["turno"] == "Dia"
@@ -117,7 +122,7 @@ class TestRepositoryPattern:
         mock_saved_player = Player(1, "NovoJogador", 100, 100, 10, "Spawn", 1, 0)
         
         # Mock dos repositories
-        with patch.object(PlayerRepositoryImpl, 'find_all', return_value=[]), \
+        with patch.object(PlayerRepositoryImpl, 'find_by_name', return_value=None), \
              patch.object(PlayerRepositoryImpl, 'save', return_value=mock_saved_player):
             
             service = GameServiceImpl()
@@ -137,7 +142,7 @@ class TestRepositoryPattern:
         existing_player = Player(1, "JogadorExistente", 100, 100, 10, "Spawn", 1, 0)
         
         # Mock do repository
-        with patch.object(PlayerRepositoryImpl, 'find_all', return_value=[existing_player]):
+        with patch.object(PlayerRepositoryImpl, 'find_by_name', return_value=existing_player):
             service = GameServiceImpl()
             
             # Act
@@ -168,30 +173,26 @@ class TestRepositoryPattern:
             assert result["success"] is True
             assert "movido para" in result["message"]
             assert result["player"]["localizacao"] == "Mapa 1 - Chunk 5"
+            assert result["player"]["current_chunk_id"] == 5
             assert result["chunk"]["id"] == 5
             assert result["chunk"]["bioma"] == 1  # id_bioma=1
     
     def test_game_service_get_map_statistics(self):
         """Testa obtenção de estatísticas dos mapas"""
         # Arrange
-        mock_mapas = [
-            Mapa(1, "Mapa_Principal", TurnoType.DIA),
-            Mapa(2, "Mapa_Principal", TurnoType.NOITE),
-        ]
-        mock_chunks = [
-            Chunk(1, 1, 1, 0, 0),
-            Chunk(2, 2, 1, 1, 0),
-            Chunk(3, 1, 2, 0, 1),
-        ]
-        mock_players = [
-            Player(1, "Jogador1", 100, 50, 10, "Spawn", 1, 0),  # Vivo
-            Player(2, "Jogador2", 100, 0, 10, "Spawn", 1, 0),   # Morto
-        ]
+        mock_stats = {
+            "total_mapas": 2,
+            "total_chunks": 3,
+            "total_jogadores": 2,
+            "jogadores_ativos": 1,
+            "jogadores_mortos": 1,
+            "chunks_por_turno": {"Dia": 2, "Noite": 1}
+        }
         
-        # Mock dos repositories
-        with patch.object(MapaRepositoryImpl, 'find_all', return_value=mock_mapas), \
-             patch.object(ChunkRepositoryImpl, 'find_all', return_value=mock_chunks), \
-             patch.object(PlayerRepositoryImpl, 'find_all', return_value=mock_players):
+        # As estatísticas vêm agregadas do banco, sem carregar chunks ou jogadores
+        with patch.object(StatisticsRepositoryImpl, 'get_map_statistics', return_value=mock_stats), \
+             patch.object(ChunkRepositoryImpl, 'find_all') as mock_chunks, \
+             patch.object(PlayerRepositoryImpl, 'find_all') as mock_players:
             
             service = GameServiceImpl()
             
@@ -199,13 +200,9 @@ class TestRepositoryPattern:
             stats = service.get_map_statistics()
             
             # Assert
-            assert stats["total_mapas"] == 2
-            assert stats["total_chunks"] == 3
-            assert stats["total_jogadores"] == 2
-            assert stats["jogadores_ativos"] == 1
-            assert stats["jogadores_mortos"] == 1
-            assert stats["chunks_por_turno"]["Dia"] == 2
-            assert stats["chunks_por_turno"]["Noite"] == 1
+            assert stats == mock_stats
+            mock_chunks.assert_not_called()
+            mock_players.assert_not_called()
     
     def test_repository_interface_compliance(self):
         """Testa se as implementações seguem a interface"""
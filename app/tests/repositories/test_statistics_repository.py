@@ -0,0 +1,33 @@
+"""
+Testes para o StatisticsRepositoryImpl
+"""
+from unittest.mock import patch
+from src.repositories.statistics_repository import StatisticsRepositoryImpl
+
+
+def test_get_map_statistics_aggregates_in_sql(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchone.return_value = (2, 2000, 5, 3)
+    mock_cursor.fetchall.return_value = [("Dia", 1000), ("Noite", 1000)]
+    with patch('src.repositories.statistics_repository.connection_db', return_value=mock_conn):
+        stats = StatisticsRepositoryImpl().get_map_statistics()
+
+    assert stats == {
+        "total_mapas": 2,
+        "total_chunks": 2000,
+        "total_jogadores": 5,
+        "jogadores_ativos": 3,
+        "jogadores_mortos": 2,
+        "chunks_por_turno": {"Dia": 1000, "Noite": 1000}
+    }
+    sqls = [call[0][0] for call in mock_cursor.execute.call_args_list]
+    assert len(sqls) == 2
+    assert "GROUP BY m.turno" in sqls[1]
+
+
+def test_get_map_statistics_keeps_shape_on_error():
+    with patch('src.repositories.statistics_repository.connection_db', side_effect=Exception("sem banco")):
+        stats = StatisticsRepositoryImpl().get_map_statistics()
+
+    assert stats["total_chunks"] == 0
+    assert stats["chunks_por_turno"] == {}
@@ -0,0 +1,55 @@
+"""
+Testes para a criação de jogadores no GameServiceImpl
+"""
+from unittest.mock import Mock
+
+from src.models.chunk import Chunk
+from src.models.player import Player
+from src.services.game_service import GameServiceImpl
+from src.utils.unit_of_work import current_unit_of_work
+
+
+def make_service():
+    GameServiceImpl.reset_instance()
+    service = GameServiceImpl.get_instance()
+    service.player_repository = Mock()
+    service.chunk_repository = Mock()
+    service.chunk_repository.find_by_id.return_value = Chunk(1, 1, 1, 0, 0)
+    return service
+
+
+def teardown_function():
+    GameServiceImpl.reset_instance()
+
+
+def test_name_check_uses_find_by_name():
+    service = make_service()
+    service.player_repository.find_by_name.return_value = Player(3, "Steve", 100, 100, 10, "", 1, 0)
+
+    assert service.create_new_player("Steve") == {"error": "Nome de jogador já existe"}
+    service.player_repository.find_by_name.assert_called_once_with("Steve")
+    service.player_repository.find_all.assert_not_called()
+    service.player_repository.save.assert_not_called()
+
+
+def test_unique_violation_from_concurrent_create_is_reported_as_duplicate():
+    service = make_service()
+    # Livre na verificação; outro create com o mesmo nome é confirmado antes do INSERT
+    service.player_repository.find_by_name.side_effect = [
+        None, Player(3, "Steve", 100, 100, 10, "", 1, 0)]
+
+    def save_duplicado(player):
+        current_unit_of_work().mark_failed('duplicate key value violates unique constraint "player_nome_key"')
+        return player
+
+    service.player_repository.save.side_effect = save_duplicado
+
+    assert service.create_new_player("Steve") == {"error": "Nome de jogador já existe"}
+
+
+def test_other_failures_are_not_reported_as_duplicate():
+    service = make_service()
+    service.player_repository.find_by_name.return_value = None
+    service.player_repository.save.side_effect = lambda player: current_unit_of_work().mark_failed("sem conexão")
+
+    assert service.create_new_player("Steve") == {"error": "Falha ao criar jogador"}
@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch, MagicMock
 from src.services.interface_service import InterfaceService
 from src.models.player import Player
 from src.models.chunk import Chunk
+from src.utils.player_state_buffer import PlayerStateBuffer
 
 
 class TestInterfaceServiceIntegration:
@@ -28,11 +29,26 @@ class TestInterfaceServiceIntegration:
         self.mock_game_service.player_repository = self.mock_player_repo
         self.mock_game_service.chunk_repository = self.mock_chunk_repo
         self.mock_game_service.mapa_repository = self.mock_mapa_repo
+        self.mock_game_service.player_state_buffer = PlayerStateBuffer(
+            self.mock_player_repo, flush_interval=0, flush_ticks=0)
         
         # Patch GameServiceImpl para retornar nosso mock
         with patch('src.services.interface_service.GameServiceImpl', return_value=self.mock_game_service):
             self.interface_service = InterfaceService.get_instance()
     
+    def test_reads_by_name_and_lists_include_pending_moves(self):
+        """Testa que buscas por nome e listas não devolvem o estado antigo do banco"""
+        antigo = Player(1, "Steve", 100, 100, 10, "Mapa 1 - Chunk 1", 1, 0)
+        movido = Player(1, "Steve", 100, 100, 10, "Mapa 1 - Chunk 5", 1, 0)
+        self.mock_player_repo.find_by_name.return_value = antigo
+        self.mock_player_repo.find_all.return_value = [antigo]
+        # O flush falha e o movimento volta ao buffer
+        self.mock_player_repo.update_many.side_effect = Exception("conexão perdida")
+        self.mock_game_service.player_state_buffer.mark_dirty(movido)
+
+        assert self.interface_service.get_player_by_name("Steve") is movido
+        assert self.interface_service.get_all_players() == [movido]
+    
     def test_create_player_integration(self):
         """Testa a criação de jogador através do InterfaceService"""
         # Arrange
@@ -0,0 +1,121 @@
+"""
+Orçamentos de consultas dos métodos de serviço mais usados
+
+Cada teste roda o método contra o FakeDatabase (cursores instrumentados) e
+falha se ele fizer mais idas ao banco do que o orçamento, pegando regressões
+N+1 (uma consulta por chunk, por vizinho, por jogador...).
+"""
+import threading
+
+import pytest
+
+from src.models.mapa import TurnoType
+from src.models.player import Player
+from src.services.game_service import GameServiceImpl
+from src.services.interface_service import InterfaceService
+from src.utils.query_budget import QueryBudgetExceeded
+
+PLAYER_ROW = (1, "Steve", 100, 100, 10, "Mapa_Principal - Chunk 1", 1, 0, 1)
+
+
+@pytest.fixture
+def world(fake_db):
+    """Mundo 2x2 com um jogador, carregado pelo FakeDatabase"""
+    fake_db.respond("COUNT(*) FILTER", [(2, 4, 1, 1)])
+    fake_db.respond("GROUP BY m.turno", [("Dia", 4)])
+    fake_db.respond("GROUP BY c.id_bioma", [(1, 2), (2, 2)])
+    fake_db.respond("UPDATE Mundo", [(1, "Dia", 1)])
+    fake_db.respond("FROM bioma", [(1, "Deserto", "Areia"), (2, "Selva", "Árvores")])
+    fake_db.respond("FROM mapa", [(1, "Mapa_Principal", "Dia")])
+    fake_db.respond("FROM item", [(1, "Espada", "Arma", 5, 100)])
+    fake_db.respond("FROM chunk", [(1, 1, 1, 0, 0), (2, 2, 1, 1, 0), (3, 1, 1, 0, 1), (4, 2, 1, 1, 1)])
+    fake_db.respond("FROM Player", [PLAYER_ROW])
+    fake_db.respond("FROM pontes", [(1, "1", "4")])
+
+    GameServiceImpl.reset_instance()
+    InterfaceService.reset_instance()
+    yield InterfaceService.get_instance()
+    InterfaceService.reset_instance()
+    GameServiceImpl.reset_instance()
+
+
+def test_get_players_in_bioma_is_one_join(world, query_budget):
+    with query_budget(1, "get_players_in_bioma"):
+        players = world.game_service.get_players_in_bioma(1)
+    assert [p["nome"] for p in players] == ["Steve"]
+
+
+def test_get_map_statistics_is_constant(world, query_budget):
+    with query_budget(2, "get_map_statistics"):
+        stats = world.game_service.get_map_statistics()
+    assert stats["total_chunks"] == 4
+
+
+def test_get_map_info_does_not_load_every_chunk(world, query_budget):
+    with query_budget(3, "get_map_info"):
+        info = world.game_service.get_map_info("Mapa_Principal", TurnoType.DIA)
+    assert info["total_chunks"] == 4
+
+
+def test_move_player_reads_player_and_chunk_once(world, query_budget):
+    with query_budget(2, "move_player_to_chunk"):
+        result = world.game_service.move_player_to_chunk(1, 2)
+    assert result["success"]
+
+
+def test_avancar_tempo_is_single_round_trip(world, query_budget):
+    with query_budget(1, "avancar_tempo") as budget:
+        world.game_service.avancar_tempo()
+    assert budget.used == 1
+
+
+def test_get_players_page_is_one_query(world, query_budget):
+    with query_budget(1, "get_players_page"):
+        page = world.get_players_page(None, 10)
+    assert [p.nome for p in page] == ["Steve"]
+
+
+def test_adjacent_chunks_with_warm_grid_hit_no_database(world, query_budget):
+    world.game_service.chunk_repository.get_grid()
+
+    with query_budget(0, "get_adjacent_chunks"):
+        vizinhos = world.get_adjacent_chunks(1)
+        biomas = [world.get_bioma_by_id(id_bioma) for _, id_bioma in vizinhos]
+    assert len(vizinhos) == 2
+    assert all(biomas)
+
+
+def test_player_view_with_warm_grid_hits_no_database(world, query_budget):
+    world.game_service.chunk_repository.get_grid()
+    world.game_service.ponte_repository.get_index()
+    player = Player(*PLAYER_ROW[:8], current_chunk_id=1)
+
+    with query_budget(0, "get_player_view"):
+        view = world.get_player_view(player, 1)
+    assert view.atual.bioma_nome == "Deserto"
+    assert [p.chunk.id_chunk for p in view.pontes] == [4]
+
+
+def test_bridge_checks_with_warm_index_hit_no_database(world, query_budget):
+    pontes = world.game_service.ponte_repository
+    pontes.get_index()
+
+    with query_budget(0, "existe_ponte_entre"):
+        assert pontes.existe_ponte_entre(1, 4)
+        assert not pontes.existe_ponte_entre(4, 1)
+
+
+def test_budget_exceeded_names_callers(world, query_budget):
+    with pytest.raises(QueryBudgetExceeded, match="PlayerRepositoryImpl"):
+        with query_budget(1, "N+1"):
+            for player_id in (1, 2, 3):
+                world.game_service.player_repository.find_by_id(player_id)
+
+
+def test_queries_from_other_threads_are_not_charged(world, query_budget):
+    # Ex.: o flush periódico do buffer de jogadores rodando durante o bloco
+    outra = threading.Thread(target=world.game_service.player_repository.find_by_id, args=(1,))
+    with query_budget(0, "outra thread") as budget:
+        outra.start()
+        outra.join()
+    assert budget.used == 0
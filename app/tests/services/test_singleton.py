@@ -6,6 +6,7 @@ Verifica se o InterfaceService implementa corretamente o Singleton
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from src.services.interface_service import InterfaceService
+from src.utils.player_state_buffer import PlayerStateBuffer
 
 
 class TestInterfaceServiceSingleton:
@@ -165,6 +166,8 @@ class TestInterfaceServiceIntegration:
         self.mock_game_service.player_repository = self.mock_player_repo
         self.mock_game_service.chunk_repository = self.mock_chunk_repo
         self.mock_game_service.mapa_repository = self.mock_mapa_repo
+        self.mock_game_service.player_state_buffer = PlayerStateBuffer(
+            self.mock_player_repo, flush_interval=0, flush_ticks=0)
     
     def test_singleton_persistence_across_calls(self):
         """Testa se o Singleton mantém estado entre chamadas"""
@@ -0,0 +1,73 @@
+"""
+Testes para a viagem de vários passos no GameServiceImpl
+"""
+from unittest.mock import Mock
+
+from src.models.bioma import Bioma
+from src.models.chunk import Chunk
+from src.models.player import Player
+from src.services.game_service import GameServiceImpl
+from src.utils.chunk_grid import ChunkGrid
+from src.utils.chunk_store import ChunkStore
+from src.utils.pathfinding import Pathfinder, RouteGraph, bioma_costs
+
+# Mapa 3x2: oceano no meio da linha de cima (id = 1 + x + 3 * y)
+CHUNKS = [Chunk(1, 2, 1, 0, 0), Chunk(2, 1, 1, 1, 0), Chunk(3, 2, 1, 2, 0),
+          Chunk(4, 2, 1, 0, 1), Chunk(5, 2, 1, 1, 1), Chunk(6, 2, 1, 2, 1)]
+CUSTOS = bioma_costs([Bioma(1, "Oceano", ""), Bioma(2, "Floresta", "")])
+
+
+def make_service(chunk_atual=1):
+    GameServiceImpl.reset_instance()
+    service = GameServiceImpl.get_instance()
+    player = Player(1, "Steve", 100, 100, 10, f"Chunk {chunk_atual}", 1, 0, chunk_atual)
+    service.player_state_buffer = Mock()
+    service.player_state_buffer.get.return_value = player
+    service.chunk_repository = Mock()
+    service.chunk_repository.find_by_id.side_effect = ChunkGrid(CHUNKS).get_by_id
+    graph = RouteGraph(ChunkStore.from_chunks(CHUNKS), 1, CUSTOS)
+    service.pathfinder = Pathfinder(lambda id_mapa: graph)
+    return service, player
+
+
+def teardown_function():
+    GameServiceImpl.reset_instance()
+
+
+def test_travel_runs_whole_route_in_one_write():
+    service, player = make_service()
+
+    result = service.travel_player_to_chunk(1, 3)
+
+    assert result["success"]
+    assert result["rota"] == [1, 4, 5, 6, 3]
+    assert (result["passos"], result["custo"]) == (4, 4)
+    assert player.current_chunk_id == 3
+    service.player_state_buffer.mark_dirty.assert_called_once_with(player)
+
+
+def test_travel_to_ocean_without_bridge_fails():
+    service, player = make_service()
+
+    result = service.travel_player_to_chunk(1, 2)
+
+    assert "error" in result
+    assert player.current_chunk_id == 1
+    service.player_state_buffer.mark_dirty.assert_not_called()
+
+
+def test_travel_to_unknown_chunk():
+    service, _ = make_service()
+
+    assert service.travel_player_to_chunk(1, 99) == {"error": "Chunk não encontrado"}
+
+
+def test_route_resolves_map_without_loading_the_grid():
+    service, _ = make_service()
+
+    assert service.find_route(1, 3).chunks == [1, 4, 5, 6, 3]
+    # Com o grafo do mapa montado, a origem é localizada nele, sem ida ao banco
+    assert service.find_route(4, 6).chunks == [4, 5, 6]
+
+    service.chunk_repository.get_grid.assert_not_called()
+    service.chunk_repository.find_by_id.assert_called_once_with(1)
@@ -0,0 +1,70 @@
+"""
+Testes para o relógio do mundo no GameServiceImpl
+"""
+from unittest.mock import Mock
+from src.models.mundo import Mundo
+from src.services.game_service import GameServiceImpl
+
+
+def make_service():
+    GameServiceImpl.reset_instance()
+    service = GameServiceImpl.get_instance()
+    service.mundo_repository = Mock()
+    service.player_state_buffer = Mock()
+    service._mundo_cache = None
+    return service
+
+
+def teardown_function():
+    GameServiceImpl.reset_instance()
+
+
+def test_avancar_tempo_is_one_round_trip():
+    service = make_service()
+    service.mundo_repository.avancar_relogio.return_value = Mundo(1, 'Dia', 5)
+
+    result = service.avancar_tempo()
+
+    service.mundo_repository.avancar_relogio.assert_called_once_with(service.TEMPO_MAX_TURNO)
+    service.mundo_repository.get_estado.assert_not_called()
+    service.mundo_repository.update_estado.assert_not_called()
+    assert result["success"] and not result["turno_mudou"]
+    assert result["progresso"] == f"5/{service.TEMPO_MAX_TURNO}"
+    service.player_state_buffer.tick.assert_called_once()
+
+
+def test_turn_flip_and_cached_state():
+    service = make_service()
+    service.mundo_repository.avancar_relogio.return_value = Mundo(1, 'Noite', 0)
+
+    assert service._avancar_relogio_mundo() == Mundo(1, 'Noite', 0)
+    assert service.avancar_tempo()["turno_mudou"]
+
+    estado = service.get_mundo_estado()
+    assert estado["turno_atual"] == 'Noite'
+    service.mundo_repository.get_estado.assert_not_called()
+
+
+def test_avancar_tempo_failure():
+    service = make_service()
+    service.mundo_repository.avancar_relogio.return_value = None
+
+    assert "error" in service.avancar_tempo()
+    service.player_state_buffer.tick.assert_not_called()
+
+
+def test_advance_returns_its_own_state_not_the_shared_cache():
+    service = make_service()
+    proprio = Mundo(1, 'Dia', 3)
+    service.mundo_repository.avancar_relogio.return_value = proprio
+    cache_mundo = service._cache_mundo
+
+    def cache_then_overwritten(mundo):
+        cache_mundo(mundo)
+        # Outra thread grava o estado dela logo em seguida
+        service._mundo_cache = Mundo(1, 'Dia', 4)
+
+    service._cache_mundo = cache_then_overwritten
+
+    assert service._avancar_relogio_mundo() is proprio
+    assert service.avancar_tempo()["ticks_no_turno"] == 3
@@ -0,0 +1,68 @@
+"""
+Testes para a decodificação de COPY binário em arrays NumPy
+"""
+import struct
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.utils import binary_copy
+from src.utils.binary_copy import Int4CopyDecoder, copy_int4_columns
+
+
+def feed(decoder, stream, step):
+    for i in range(0, len(stream), step):
+        decoder.write(stream[i:i + step])
+    return decoder.columns()
+
+
+@pytest.mark.parametrize("step", [1, 7, 42, 10_000])
+def test_decodes_rows_split_across_writes(pgcopy_binary, monkeypatch, step):
+    monkeypatch.setattr(binary_copy, 'DECODE_BLOCK_BYTES', 64)
+    rows = [(i, i % 4, 1, i % 10, i // 10) for i in range(1, 101)]
+
+    columns = feed(Int4CopyDecoder(5), pgcopy_binary(rows), step)
+
+    assert [c.tolist() for c in columns] == [list(col) for col in zip(*rows)]
+    assert columns[0].dtype.byteorder in ("=", "<", "|")
+
+
+def test_negative_values_and_empty_result(pgcopy_binary):
+    assert [c.tolist() for c in feed(Int4CopyDecoder(2), pgcopy_binary([(-5, 2 ** 31 - 1)]), 3)] == [[-5], [2 ** 31 - 1]]
+    assert [len(c) for c in feed(Int4CopyDecoder(2), pgcopy_binary([]), 100)] == [0, 0]
+
+
+def test_header_extension_is_skipped(pgcopy_binary):
+    stream = pgcopy_binary([(1, 2)])
+    signature = len(binary_copy.PGCOPY_SIGNATURE)
+    stream = stream[:signature] + struct.pack(">ii", 0, 3) + b"abc" + stream[signature + 8:]
+
+    assert [c.tolist() for c in feed(Int4CopyDecoder(2), stream, 5)] == [[1], [2]]
+
+
+def test_malformed_streams_are_rejected(pgcopy_binary):
+    with pytest.raises(ValueError, match="assinatura"):
+        feed(Int4CopyDecoder(2), b"X" * 40, 40)
+
+    with pytest.raises(ValueError, match="trailer"):
+        feed(Int4CopyDecoder(2), pgcopy_binary([(1, 2)])[:-2], 100)
+
+    with pytest.raises(ValueError, match="campos"):
+        feed(Int4CopyDecoder(2), pgcopy_binary([(1, 2, 3)] * 3), 100)
+
+    # NULL (tamanho -1) em uma coluna
+    stream = bytearray(pgcopy_binary([(1, 2)]))
+    stream[19 + 2 + 8:19 + 2 + 12] = struct.pack(">i", -1)
+    with pytest.raises(ValueError, match="nulos"):
+        feed(Int4CopyDecoder(2), bytes(stream), 100)
+
+
+def test_copy_int4_columns_wraps_query(pgcopy_binary):
+    cursor = MagicMock()
+    cursor.copy_expert.side_effect = lambda sql, f: f.write(pgcopy_binary([(7, 8)]))
+
+    columns = copy_int4_columns(cursor, "SELECT a, b FROM t", 2)
+
+    cursor.copy_expert.assert_called_once()
+    assert cursor.copy_expert.call_args[0][0] == "COPY (SELECT a, b FROM t) TO STDOUT (FORMAT binary)"
+    assert [c.tolist() for c in columns] == [[7], [8]]
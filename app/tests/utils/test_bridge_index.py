@@ -0,0 +1,50 @@
+"""
+Testes para o índice em memória das pontes
+"""
+from src.models.ponte import Ponte
+from src.utils.bridge_index import BridgeIndex
+
+PONTES = [Ponte(1, 10, 20), Ponte(2, 20, 30), Ponte(3, 40, 10), Ponte(4, 50, 60, ativa=False)]
+
+
+def test_lookups_by_origin_and_destination():
+    index = BridgeIndex(PONTES)
+
+    assert len(index) == 3 and 4 not in index
+    assert [p.id for p in index.saindo_de(10)] == [1]
+    assert [p.id for p in index.chegando_em(10)] == [3]
+    assert index.saindo_de(99) == []
+
+
+def test_existe_respects_direction():
+    index = BridgeIndex(PONTES)
+
+    assert index.existe(10, 20) and index.existe(20, 10)
+    assert not index.existe(20, 10, bidirecional=False)
+    assert not index.existe(10, 30)
+    assert not BridgeIndex(PONTES, bidirecional=False).existe(20, 10)
+
+
+def test_destinos():
+    index = BridgeIndex(PONTES)
+
+    assert index.destinos(10) == [20, 40]
+    assert index.destinos(20) == [10, 30]
+    assert BridgeIndex(PONTES, bidirecional=False).destinos(10) == [20]
+
+
+def test_incremental_updates():
+    index = BridgeIndex(PONTES)
+
+    index.add(Ponte(5, 10, 20))
+    assert index.remove(1).id == 1
+    # Outra ponte ainda liga os mesmos chunks
+    assert index.existe(10, 20)
+    index.remove(5)
+    assert not index.existe(10, 20)
+    assert index.remove(99) is None
+
+    # Ponte reenviada como inativa sai do índice
+    index.add(Ponte(2, 20, 30, ativa=False))
+    assert index.destinos(20) == []
+    assert len(index) == 1
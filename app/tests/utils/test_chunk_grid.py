@@ -0,0 +1,84 @@
+"""
+Testes para o índice espacial ChunkGrid
+"""
+import pytest
+from unittest.mock import patch
+from src.models.chunk import Chunk
+from src.utils.chunk_grid import ChunkGrid
+from src.repositories.chunk_repository import ChunkRepositoryImpl
+
+
+@pytest.fixture
+def grid():
+    """Mapa 1 com grade 3x3 (ids 1..9) e mapa 2 com a mesma grade (ids 11..19)"""
+    chunks = []
+    for id_mapa, base in ((1, 0), (2, 10)):
+        for y in range(3):
+            for x in range(3):
+                chunks.append(Chunk(base + y * 3 + x + 1, (x + y) % 4 + 1, id_mapa, x, y))
+    return ChunkGrid(chunks)
+
+
+def test_lookup_by_coord_and_id(grid):
+    assert len(grid) == 18
+    assert grid.get(1, 1, 1).id_chunk == 5
+    assert grid.get(2, 1, 1).id_chunk == 15
+    assert grid.get_by_id(9) == Chunk(9, 1, 1, 2, 2)
+    assert grid.get(1, 5, 5) is None
+
+
+def test_neighbours_center_and_corner(grid):
+    assert [c.id_chunk for c in grid.neighbours(5)] == [2, 8, 4, 6]
+    assert [c.id_chunk for c in grid.neighbours(1)] == [4, 2]
+    assert grid.neighbours(999) == []
+
+
+def test_neighbours_in_other_map(grid):
+    assert [c.id_chunk for c in grid.neighbours(5, id_mapa=2)] == [12, 18, 14, 16]
+
+
+def test_row_column_and_radius(grid):
+    assert [c.id_chunk for c in grid.row(1, 2)] == [7, 8, 9]
+    assert [c.id_chunk for c in grid.column(2, 0)] == [11, 14, 17]
+    assert [c.id_chunk for c in grid.radius(1, 1)] == [1, 2, 4, 5]
+    assert len(grid.radius(5, 1)) == 9
+
+
+def test_add_and_remove_update_indexes(grid):
+    grid.add(Chunk(5, 4, 1, 1, 1))
+    assert grid.get(1, 1, 1).id_bioma == 4
+    grid.remove(5)
+    assert 5 not in grid
+    assert [c.id_chunk for c in grid.row(1, 1)] == [4, 6]
+
+
+def test_repository_grid_loaded_once_and_invalidated(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(1, 1, 1, 0, 0), (2, 2, 1, 1, 0)]
+    mock_cursor.rowcount = 1
+    ChunkRepositoryImpl.invalidate_grid()
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        repo = ChunkRepositoryImpl()
+        first = repo.get_grid()
+        assert repo.get_grid() is first
+        assert mock_cursor.execute.call_count == 1
+
+        repo.delete(2)
+        assert ChunkRepositoryImpl._grid is None
+    ChunkRepositoryImpl.invalidate_grid()
+
+
+def test_repository_grid_read_before_invalidation_is_not_published():
+    repo = ChunkRepositoryImpl()
+    ChunkRepositoryImpl.invalidate_grid()
+
+    def find_all_racing_a_save():
+        # Um save termina enquanto a leitura ainda está em andamento
+        ChunkRepositoryImpl.invalidate_grid()
+        return [Chunk(1, 1, 1, 0, 0)]
+
+    with patch.object(repo, 'find_all', side_effect=find_all_racing_a_save):
+        grid = repo.get_grid()
+
+    assert 1 in grid
+    assert ChunkRepositoryImpl._grid is None
@@ -0,0 +1,67 @@
+"""
+Testes para o armazenamento colunar de chunks
+"""
+import numpy as np
+import pytest
+
+from src.models.chunk import Chunk
+from src.utils.chunk_store import ChunkStore, ChunkStoreGrid
+
+
+@pytest.fixture
+def store():
+    # Mapa 1 (3x2) e mapa 2 (1 chunk), fora de ordem de ID
+    return ChunkStore.from_rows([
+        (4, 2, 1, 0, 1), (1, 1, 1, 0, 0), (2, 2, 1, 1, 0), (3, 3, 1, 2, 0),
+        (5, 1, 1, 1, 1), (6, 1, 1, 2, 1), (7, 4, 2, 5, 5),
+    ])
+
+
+def test_columns_are_sorted_by_id(store):
+    assert store.id_chunk.tolist() == [1, 2, 3, 4, 5, 6, 7]
+    assert store.id_bioma.dtype == np.int32
+    assert len(store) == 7
+
+
+def test_lookup_by_id_and_coordinate(store):
+    assert store.get_by_id(4) == Chunk(4, 2, 1, 0, 1)
+    assert store.get_by_id(99) is None
+    assert 7 in store and 0 not in store
+
+    chunk = store.get(1, 2, 1)
+    assert (chunk.id_chunk, chunk.x, chunk.y) == (6, 2, 1)
+    assert store.get(2, 5, 5).id_chunk == 7
+    assert store.get(1, 3, 0) is None
+    assert store.get(1, -1, 0) is None
+    assert store.get(9, 0, 0) is None
+
+
+def test_bioma_queries_are_vectorized(store):
+    assert store.ids_by_bioma(1).tolist() == [1, 5, 6]
+    assert [c.id_chunk for c in store.chunks_by_bioma(2)] == [2, 4]
+    assert store.bioma_distribution() == {1: 3, 2: 2, 3: 1, 4: 1}
+    assert store.for_mapa(1).bioma_distribution() == {1: 3, 2: 2, 3: 1}
+
+
+def test_round_trip_from_chunks(store):
+    chunks = list(store)
+    assert ChunkStore.from_chunks(chunks).id_chunk.tolist() == [c.id_chunk for c in chunks]
+    assert isinstance(chunks[0].id_chunk, int)
+
+
+def test_store_grid_first_chunk(store):
+    assert ChunkStoreGrid(store).first() == Chunk(1, 1, 1, 0, 0)
+    assert ChunkStoreGrid(ChunkStore.empty()).first() is None
+
+
+def test_empty_store():
+    store = ChunkStore.empty()
+    assert len(store) == 0
+    assert store.get(1, 0, 0) is None
+    assert store.bioma_distribution() == {}
+    assert ChunkStore.concatenate([]).nbytes == 0
+
+
+def test_mismatched_columns_are_rejected():
+    with pytest.raises(ValueError):
+        ChunkStore([1, 2], [1], [1, 1], [0, 1], [0, 0])
@@ -0,0 +1,86 @@
+"""
+Testes para a verificação de prontidão do banco na inicialização
+"""
+import psycopg2.errors
+from unittest.mock import MagicMock, patch
+from src.utils import db_helpers
+from src.utils.migrations import LATEST_VERSION
+
+
+def make_connection():
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cursor = conn.cursor.return_value.__enter__.return_value
+    return conn, cursor
+
+
+def test_probe_uses_single_query_when_ready():
+    conn, cursor = make_connection()
+    cursor.fetchone.return_value = ([], True, LATEST_VERSION)
+
+    with patch('src.utils.db_helpers.connection_db', return_value=conn):
+        status = db_helpers.probe_database()
+
+    assert status == {"missing_tables": [], "seeded": True, "schema_version": LATEST_VERSION}
+    assert cursor.execute.call_count == 1
+
+
+def test_probe_reports_missing_tables():
+    conn, cursor = make_connection()
+    cursor.execute.side_effect = [psycopg2.errors.UndefinedTable(), None]
+    cursor.fetchone.return_value = (['player'],)
+
+    with patch('src.utils.db_helpers.connection_db', return_value=conn):
+        status = db_helpers.probe_database()
+
+    assert status == {"missing_tables": ['player'], "seeded": False, "schema_version": 0}
+    conn.rollback.assert_called_once()
+
+
+def test_probe_without_schema_version_table():
+    conn, cursor = make_connection()
+    cursor.execute.side_effect = [psycopg2.errors.UndefinedTable(), None, None]
+    cursor.fetchone.side_effect = [([],), (True,)]
+
+    with patch('src.utils.db_helpers.connection_db', return_value=conn):
+        status = db_helpers.probe_database()
+
+    assert status == {"missing_tables": [], "seeded": True, "schema_version": 0}
+
+
+def test_setup_skips_initialization_and_migrations_when_ready():
+    status = {"missing_tables": [], "seeded": True, "schema_version": LATEST_VERSION}
+    with patch('src.utils.db_helpers.probe_database', return_value=status), \
+         patch('src.utils.db_helpers.initialize_database') as initialize, \
+         patch('src.utils.migrations.run_migrations') as migrate:
+        assert db_helpers.setup_database() is True
+
+    initialize.assert_not_called()
+    migrate.assert_not_called()
+
+
+def test_setup_initializes_and_migrates_empty_database():
+    status = {"missing_tables": ['bioma'], "seeded": False, "schema_version": 0}
+    with patch('src.utils.db_helpers.probe_database', return_value=status), \
+         patch('src.utils.db_helpers.initialize_database', return_value=True) as initialize, \
+         patch('src.utils.migrations.run_migrations', return_value=True) as migrate:
+        assert db_helpers.setup_database() is True
+
+    initialize.assert_called_once()
+    migrate.assert_called_once()
+
+
+def test_ready_cache_skips_probe(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_helpers, 'READY_CACHE_PATH', str(tmp_path / 'ready.json'))
+    status = {"missing_tables": [], "seeded": True, "schema_version": LATEST_VERSION}
+
+    with patch('src.utils.db_helpers.probe_database', return_value=status) as probe:
+        assert db_helpers.setup_database() is True
+        assert db_helpers.setup_database() is True
+
+    probe.assert_called_once()
+
+
+def test_setup_fails_without_connection():
+    with patch('src.utils.db_helpers.probe_database', return_value=None):
+        assert db_helpers.setup_database() is False
@@ -0,0 +1,117 @@
+"""
+Testes para o pool de conexões
+"""
+import pytest
+from unittest.mock import MagicMock
+from psycopg2 import extensions
+from src.utils.db_pool import ConnectionPool, PooledConnection, PoolTimeoutError
+
+
+def make_fake_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_IDLE
+    return conn
+
+
+def make_pool(**kwargs):
+    factory = MagicMock(side_effect=make_fake_connection)
+    params = dict(minconn=1, maxconn=2, timeout=0.05, health_check_interval=60)
+    params.update(kwargs)
+    return ConnectionPool(factory, **params), factory
+
+
+def test_pool_opens_minconn_on_creation():
+    pool, factory = make_pool(minconn=2, maxconn=3)
+    assert factory.call_count == 2
+    assert pool.get_metrics()['idle'] == 2
+
+
+def test_close_returns_connection_to_pool():
+    pool, factory = make_pool()
+    conn = pool.getconn()
+    raw = conn.raw
+    assert isinstance(conn, PooledConnection)
+    assert pool.get_metrics()['in_use'] == 1
+
+    conn.close()
+    again = pool.getconn()
+    assert again.raw is raw
+    assert factory.call_count == 1
+    raw.close.assert_not_called()
+
+
+def test_context_manager_commits_and_releases():
+    pool, _ = make_pool()
+    with pool.getconn() as conn:
+        raw = conn.raw
+    raw.commit.assert_called_once()
+    assert conn.released
+    assert pool.get_metrics()['in_use'] == 0
+
+
+def test_context_manager_rolls_back_on_error():
+    pool, _ = make_pool()
+    with pytest.raises(RuntimeError):
+        with pool.getconn() as conn:
+            raw = conn.raw
+            raise RuntimeError("falha")
+    raw.rollback.assert_called()
+    raw.commit.assert_not_called()
+    # rollback depois do with não deve falhar
+    conn.rollback()
+
+
+def test_attribute_writes_reach_raw_connection():
+    pool, _ = make_pool()
+    conn = pool.getconn()
+    raw = conn.raw
+
+    conn.autocommit = True
+    conn.isolation_level = extensions.ISOLATION_LEVEL_SERIALIZABLE
+
+    assert raw.autocommit is True
+    assert raw.isolation_level == extensions.ISOLATION_LEVEL_SERIALIZABLE
+    assert conn.autocommit is True
+    conn.close()
+
+
+def test_broken_connection_is_replaced_on_checkout():
+    pool, factory = make_pool()
+    conn = pool.getconn()
+    raw = conn.raw
+    conn.close()
+    raw.closed = 2
+
+    fresh = pool.getconn()
+    assert fresh.raw is not raw
+    metrics = pool.get_metrics()
+    assert metrics['reconnects'] == 1
+    assert metrics['created'] == 2
+
+
+def test_stale_idle_connection_is_pinged():
+    pool, _ = make_pool(health_check_interval=0)
+    conn = pool.getconn()
+    raw = conn.raw
+    cursor = MagicMock()
+    raw.cursor.return_value.__enter__.return_value = cursor
+    conn.close()
+
+    pool.getconn()
+    cursor.execute.assert_called_once_with("SELECT 1")
+
+
+def test_pool_times_out_when_exhausted():
+    pool, _ = make_pool(maxconn=1)
+    held = pool.getconn()
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+    assert pool.get_metrics()['timeouts'] == 1
+    held.close()
+    assert pool.getconn() is not None
+
+
+def test_invalid_sizes_raise():
+    with pytest.raises(ValueError):
+        ConnectionPool(make_fake_connection, minconn=3, maxconn=2)
@@ -0,0 +1,146 @@
+"""
+Testes para o snapshot binário de mapas
+"""
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+
+from src.models.chunk import Chunk
+from src.utils import map_snapshot
+from src.utils.chunk_store import ChunkStore
+from src.utils.map_snapshot import MapSnapshot, SnapshotError, load_map_store, write_snapshot
+
+PALETTE = {1: "Deserto", 2: "Oceano"}
+
+
+@pytest.fixture
+def store():
+    return ChunkStore.from_rows([(10, 1, 3, 0, 0), (11, 2, 3, 1, 0), (12, 1, 3, 0, 1), (13, 2, 3, 1, 1)])
+
+
+def stamp_connection(id_mapa, *versoes):
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cursor = conn.cursor.return_value.__enter__.return_value
+    rows = [(id_mapa, versao, "1=Deserto,2=Oceano") for versao in versoes]
+    if len(rows) == 1:
+        cursor.fetchone.return_value = rows[0]
+    else:
+        cursor.fetchone.side_effect = rows
+    return conn
+
+
+def test_round_trip_is_zero_copy(tmp_path, store):
+    path = str(tmp_path / "mapa.snap")
+    write_snapshot(path, store, 3, "Mapa_Principal", "Dia", PALETTE, stamp=42)
+
+    snapshot = MapSnapshot.open(path, verify_checksum=True)
+
+    assert (snapshot.id_mapa, snapshot.nome, snapshot.turno, snapshot.stamp) == (3, "Mapa_Principal", "Dia", 42)
+    assert snapshot.palette == PALETTE
+    assert snapshot.bioma_nome(2) == "Oceano"
+    assert snapshot.id_chunk.tolist() == [10, 11, 12, 13]
+    assert not snapshot.id_chunk.flags.writeable
+    assert not snapshot.id_chunk.flags.owndata
+
+    loaded = snapshot.store()
+    assert np.shares_memory(loaded.id_chunk, snapshot.id_chunk)
+    assert loaded.get(3, 1, 1) == Chunk(13, 2, 3, 1, 1)
+    assert loaded.bioma_distribution() == {1: 2, 2: 2}
+
+
+def test_corrupted_and_truncated_files_are_rejected(tmp_path, store):
+    path = tmp_path / "mapa.snap"
+    write_snapshot(str(path), store, 3, "Mapa_Principal", "Dia", PALETTE, stamp=1)
+    data = bytearray(path.read_bytes())
+
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match="checksum"):
+        MapSnapshot.open(str(path), verify_checksum=True)
+
+    path.write_bytes(bytes(data[:-4]))
+    with pytest.raises(SnapshotError, match="tamanho"):
+        MapSnapshot.open(str(path))
+
+    path.write_bytes(b"X" * 200)
+    with pytest.raises(SnapshotError):
+        MapSnapshot.open(str(path))
+
+
+def test_load_map_store_rebuilds_only_when_stamp_changes(tmp_path, store):
+    loader = Mock(return_value=store)
+
+    with patch.object(map_snapshot, 'connection_db', return_value=stamp_connection(3, 7)) as connection:
+        first = load_map_store("Mapa_Principal", "Dia", loader, str(tmp_path))
+        second = load_map_store("Mapa_Principal", "Dia", loader, str(tmp_path))
+
+    assert loader.call_count == 1
+    assert first.id_chunk.tolist() == second.id_chunk.tolist()
+    assert not second.id_chunk.flags.writeable  # veio do arquivo mapeado
+    sql = connection.return_value.cursor.return_value.__enter__.return_value.execute.call_args[0][0]
+    assert "m.versao" in sql and "chunk" not in sql  # sem varrer os chunks
+
+    with patch.object(map_snapshot, 'connection_db', return_value=stamp_connection(3, 8)):
+        load_map_store("Mapa_Principal", "Dia", loader, str(tmp_path))
+    assert loader.call_count == 2
+
+
+def test_read_during_map_change_is_not_saved(tmp_path, store):
+    loader = Mock(return_value=store)
+
+    # A versão muda entre a leitura do carimbo e o fim do loader
+    with patch.object(map_snapshot, 'connection_db', return_value=stamp_connection(3, 7, 8)):
+        assert len(load_map_store("Mapa_Principal", "Dia", loader, str(tmp_path))) == 4
+    with patch.object(map_snapshot, 'connection_db', return_value=stamp_connection(3, 7)):
+        load_map_store("Mapa_Principal", "Dia", Mock(return_value=ChunkStore.empty()), str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_checksum_is_verified_on_first_open_of_each_file(tmp_path, store):
+    path = str(tmp_path / "mapa.snap")
+    write_snapshot(path, store, 3, "Mapa_Principal", "Dia", PALETTE, stamp=1)
+
+    with patch.object(map_snapshot.zlib, 'crc32', wraps=map_snapshot.zlib.crc32) as crc32:
+        map_snapshot.open_verified(path)
+        map_snapshot.open_verified(path)
+        assert crc32.call_count == 1
+
+        # Arquivo trocado (novo inode): confere de novo
+        write_snapshot(path, store, 3, "Mapa_Principal", "Dia", PALETTE, stamp=2)
+        crc32.reset_mock()
+        map_snapshot.open_verified(path)
+        assert crc32.call_count == 1
+
+
+def test_corrupted_snapshot_is_rebuilt_on_load(tmp_path, store):
+    path = tmp_path / "Mapa_Principal_Dia.snap"
+    write_snapshot(str(path), store, 3, "Mapa_Principal", "Dia", PALETTE,
+                   stamp=map_snapshot.compute_stamp(7, "1=Deserto,2=Oceano"))
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    loader = Mock(return_value=store)
+
+    with patch.object(map_snapshot, 'connection_db', return_value=stamp_connection(3, 7)):
+        loaded = load_map_store("Mapa_Principal", "Dia", loader, str(tmp_path))
+
+    # Mesmo com o carimbo igual, o conteúdo corrompido não é servido
+    loader.assert_called_once()
+    assert loaded.id_bioma.tolist() == [1, 2, 1, 2]
+
+
+def test_find_store_by_mapa_uses_snapshot_dir(tmp_path, monkeypatch, store):
+    from src.repositories.chunk_repository import ChunkRepositoryImpl
+    monkeypatch.setattr(map_snapshot, 'SNAPSHOT_DIR', str(tmp_path))
+    repo = ChunkRepositoryImpl()
+
+    with patch.object(map_snapshot, 'connection_db', return_value=stamp_connection(3, 7)), \
+         patch.object(ChunkRepositoryImpl, '_query_store', return_value=store) as query:
+        repo.find_store_by_mapa("Mapa_Principal", "Dia")
+        loaded = repo.find_store_by_mapa("Mapa_Principal", "Dia")
+
+    query.assert_called_once_with("Mapa_Principal", "Dia")
+    assert len(loaded) == 4
+    assert (tmp_path / "Mapa_Principal_Dia.snap").exists()
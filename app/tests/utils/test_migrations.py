@@ -0,0 +1,106 @@
+"""
+Testes para o runner de migrações versionadas
+"""
+import os
+import re
+
+import pytest
+from unittest.mock import MagicMock
+from src.utils.migrations import _CONCURRENT_INDEX, MIGRATIONS, Migration, MigrationRunner
+
+
+def make_connection(applied=()):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [(v,) for v in applied]
+    return conn, cursor
+
+
+def executed(cursor):
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+def test_applies_pending_migrations_in_order():
+    conn, cursor = make_connection()
+    migrations = [
+        Migration(2, "segunda", ["CREATE INDEX IF NOT EXISTS b ON t (b)"]),
+        Migration(1, "primeira", ["CREATE INDEX IF NOT EXISTS a ON t (a)"], transactional=False),
+    ]
+
+    applied = MigrationRunner(migrations, connection_factory=lambda: conn).run()
+
+    assert applied == [1, 2]
+    sql = executed(cursor)
+    assert sql.index("CREATE INDEX IF NOT EXISTS a ON t (a)") < sql.index("CREATE INDEX IF NOT EXISTS b ON t (b)")
+    assert any("CREATE TABLE IF NOT EXISTS schema_version" in s for s in sql)
+    assert sum("INSERT INTO schema_version" in s for s in sql) == 2
+    assert "pg_advisory_unlock" in sql[-1]
+    conn.commit.assert_called_once()
+    conn.close.assert_called_once()
+
+
+def test_skips_applied_versions():
+    conn, cursor = make_connection(applied=[1])
+    migrations = [Migration(1, "primeira", ["SELECT 1"]), Migration(2, "segunda", ["SELECT 2"])]
+
+    applied = MigrationRunner(migrations, connection_factory=lambda: conn).run()
+
+    assert applied == [2]
+    assert "SELECT 1" not in executed(cursor)
+
+
+def test_transactional_failure_rolls_back_and_releases_lock():
+    conn, cursor = make_connection()
+
+    def fail(sql, params=None):
+        if sql == "BROKEN":
+            raise RuntimeError("erro de sintaxe")
+
+    cursor.execute.side_effect = fail
+    runner = MigrationRunner([Migration(1, "quebrada", ["BROKEN"])], connection_factory=lambda: conn)
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    conn.rollback.assert_called_once()
+    assert "pg_advisory_unlock" in executed(cursor)[-1]
+    conn.close.assert_called_once()
+
+
+def test_duplicate_versions_are_rejected():
+    with pytest.raises(ValueError):
+        MigrationRunner([Migration(1, "a", []), Migration(1, "b", [])])
+
+
+def test_hot_path_indexes_are_concurrent_and_idempotent():
+    first = MIGRATIONS[0]
+    assert first.version == 1 and not first.transactional
+    assert all("CONCURRENTLY IF NOT EXISTS" in s for s in first.statements)
+    assert any("WHERE vida_atual > 0" in s for s in first.statements)
+
+
+def test_hot_path_indexes_do_not_redeclare_schema_indexes():
+    schema = os.path.join(os.path.dirname(__file__), "..", "..", "..",
+                          "db", "init", "02_schema", "06_indexes.sql")
+    with open(schema, encoding="utf-8") as f:
+        existentes = set(re.findall(r"CREATE INDEX (\w+)", f.read()))
+    criados = {_CONCURRENT_INDEX.search(s).group(1) for s in MIGRATIONS[0].statements}
+    assert existentes and not criados & existentes
+
+
+def test_invalid_concurrent_index_is_dropped_before_rebuild():
+    conn, cursor = make_connection()
+    # idx_a ficou INVALID; idx_b está válido
+    cursor.fetchone.side_effect = [(False,), (True,)]
+    migrations = [Migration(1, "indices", [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON t (a)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_b ON t (b)",
+    ], transactional=False)]
+
+    MigrationRunner(migrations, connection_factory=lambda: conn).run()
+
+    sql = executed(cursor)
+    drop = sql.index("DROP INDEX CONCURRENTLY IF EXISTS idx_a")
+    assert drop < sql.index("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON t (a)")
+    assert "DROP INDEX CONCURRENTLY IF EXISTS idx_b" not in sql
+    assert sum("pg_index" in s for s in sql) == 2
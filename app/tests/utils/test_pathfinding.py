@@ -0,0 +1,196 @@
+"""
+Testes para a busca de rotas entre chunks
+"""
+import heapq
+
+import numpy as np
+import pytest
+
+from src.models.bioma import Bioma
+from src.models.ponte import Ponte
+from src.utils.chunk_store import ChunkStore
+from src.utils import pathfinding
+from src.utils.pathfinding import INALCANCAVEL, Pathfinder, RouteGraph, bioma_costs
+from src.utils.reference_cache import bump_reference_version
+
+OCEANO, FLORESTA, DESERTO, SELVA = 1, 2, 3, 4
+CUSTOS = bioma_costs([Bioma(OCEANO, "Oceano", ""), Bioma(FLORESTA, "Floresta", ""),
+                      Bioma(DESERTO, "Deserto", ""), Bioma(SELVA, "Selva", "")])
+
+
+def make_store(biomas, id_mapa=1):
+    """Store de um mapa a partir de uma matriz [y][x] de id_bioma; id = 1 + x + largura * y"""
+    biomas = np.asarray(biomas)
+    altura, largura = biomas.shape
+    ys, xs = np.divmod(np.arange(altura * largura), largura)
+    return ChunkStore(np.arange(1, altura * largura + 1), biomas.ravel(),
+                      np.full(altura * largura, id_mapa), xs, ys)
+
+
+def dijkstra(graph, origem, destino):
+    """Referência sem heurística nem vetorização"""
+    custo, fila = {origem: 0}, [(0, origem)]
+    while fila:
+        d, cell = heapq.heappop(fila)
+        if cell == destino:
+            return d
+        if d > custo[cell]:
+            continue
+        for vizinho, passo in graph.moves(cell):
+            if d + passo < custo.get(vizinho, INALCANCAVEL):
+                custo[vizinho] = d + passo
+                heapq.heappush(fila, (d + passo, vizinho))
+    return None
+
+
+# Faixa de oceano na coluna 2 separa os dois lados
+RIO = [[FLORESTA, FLORESTA, OCEANO, FLORESTA, FLORESTA]] * 3
+
+
+def test_ocean_is_impassable_without_bridge():
+    graph = RouteGraph(make_store(RIO), 1, CUSTOS)
+
+    assert graph.astar(graph.cell_of(1), graph.cell_of(5)) is None
+    assert graph.distance_field(graph.cell_of(5))[graph.cell_of(1)] == INALCANCAVEL
+
+
+def test_bridge_crosses_the_river():
+    graph = RouteGraph(make_store(RIO), 1, CUSTOS, [Ponte(1, 7, 9)])
+
+    rota = graph.astar(graph.cell_of(1), graph.cell_of(5))
+
+    assert rota.chunks[0] == 1 and rota.chunks[-1] == 5
+    assert 7 in rota.chunks and 9 in rota.chunks
+    assert 3 not in rota.chunks and 8 not in rota.chunks
+    assert rota.custo == dijkstra(graph, graph.cell_of(1), graph.cell_of(5))
+
+
+def test_bridges_from_other_maps_are_ignored():
+    graph = RouteGraph(make_store(RIO), 1, CUSTOS, [Ponte(1, 7, 999)])
+
+    assert graph.pontes == {}
+
+
+def test_route_prefers_cheaper_biomes():
+    mapa = [[FLORESTA, SELVA, SELVA, FLORESTA],
+            [FLORESTA, FLORESTA, FLORESTA, FLORESTA]]
+    graph = RouteGraph(make_store(mapa), 1, CUSTOS)
+
+    rota = graph.astar(graph.cell_of(1), graph.cell_of(4))
+
+    # Contornar por baixo (5 passos de floresta) é mais barato que a selva (3 + 3 + 1)
+    assert rota.chunks == [1, 5, 6, 7, 8, 4]
+    assert (rota.custo, rota.passos) == (5, 5)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_astar_and_distance_field_are_optimal(seed):
+    rng = np.random.default_rng(seed)
+    biomas = rng.choice([OCEANO, FLORESTA, DESERTO, SELVA], size=(24, 30), p=[0.25, 0.35, 0.2, 0.2])
+    pontes = [Ponte(i, int(a), int(b)) for i, (a, b) in enumerate(rng.integers(1, 24 * 30 + 1, (5, 2)))]
+    graph = RouteGraph(make_store(biomas), 1, CUSTOS, pontes)
+    destino = int(rng.choice(np.flatnonzero(graph.cost > 0)))
+    dist = graph.distance_field(destino)
+
+    for origem in rng.integers(0, len(graph), 40):
+        origem = int(origem)
+        esperado = dijkstra(graph, origem, destino)
+        rota = graph.astar(origem, destino)
+        seguida = graph.follow(dist, origem)
+        if esperado is None:
+            assert rota is None and seguida is None
+            continue
+        assert rota.custo == seguida.custo == esperado
+        assert rota.chunks[0] == seguida.chunks[0] == int(graph.ids[origem])
+        assert rota.chunks[-1] == seguida.chunks[-1] == int(graph.ids[destino])
+
+
+def random_graph(seed, altura=24, largura=30):
+    rng = np.random.default_rng(seed)
+    biomas = rng.choice([OCEANO, FLORESTA, DESERTO, SELVA], size=(altura, largura), p=[0.25, 0.35, 0.2, 0.2])
+    pontes = [Ponte(i, int(a), int(b)) for i, (a, b) in enumerate(rng.integers(1, altura * largura + 1, (5, 2)))]
+    return rng, RouteGraph(make_store(biomas), 1, CUSTOS, pontes)
+
+
+def test_forward_fields_match_dijkstra():
+    rng, graph = random_graph(4)
+    fontes = [int(c) for c in rng.choice(np.flatnonzero(graph.cost > 0), 2)]
+
+    ida = graph.distance_fields([[fontes[0]], [fontes[1]]], forward=True)
+    volta = graph.distance_fields([[fontes[0]], [fontes[1]]])
+
+    for destino in rng.integers(0, len(graph), 30):
+        for linha, fonte in enumerate(fontes):
+            esperado = dijkstra(graph, fonte, int(destino))
+            assert ida[linha, destino] == (INALCANCAVEL if esperado is None else esperado)
+            esperado = dijkstra(graph, int(destino), fonte)
+            assert volta[linha, destino] == (INALCANCAVEL if esperado is None else esperado)
+
+
+@pytest.mark.parametrize("seed", [5, 6])
+def test_astar_with_landmarks_is_optimal(monkeypatch, seed):
+    monkeypatch.setattr(pathfinding, 'ROTA_MARCOS_MIN_CELULAS', 0)
+    monkeypatch.setattr(pathfinding, 'ROTA_MARCOS', 4)
+    rng, graph = random_graph(seed, 40, 40)
+    destino = int(rng.choice(np.flatnonzero(graph.cost > 0)))
+
+    ate, desde = graph.landmarks()
+    assert len(ate) == len(desde) == 4
+
+    for origem in rng.integers(0, len(graph), 40):
+        origem = int(origem)
+        esperado = dijkstra(graph, origem, destino)
+        rota = graph.astar(origem, destino)
+        assert (rota.custo if rota else None) == esperado
+
+
+def test_small_graphs_skip_landmarks():
+    graph = RouteGraph(make_store(RIO), 1, CUSTOS)
+
+    assert graph.landmarks() is None
+
+
+def test_pathfinder_builds_field_for_popular_targets():
+    graph = RouteGraph(make_store([[FLORESTA] * 4] * 4), 1, CUSTOS)
+    pathfinder = Pathfinder(lambda id_mapa: graph, popular=2, max_fields=1)
+
+    assert pathfinder.route(1, 1, 16).custo == 6
+    assert pathfinder._fields == {}
+    assert pathfinder.route(1, 2, 16).custo == 5
+    assert list(pathfinder._fields) == [(1, 16)]
+
+    # Só o campo mais recente fica em memória
+    pathfinder.route(1, 1, 4)
+    pathfinder.route(1, 2, 4)
+    assert list(pathfinder._fields) == [(1, 4)]
+
+
+def test_pathfinder_query_counts_are_bounded(monkeypatch):
+    monkeypatch.setattr(pathfinding, "ROTA_CONSULTAS_MAX", 4)
+    graph = RouteGraph(make_store([[FLORESTA] * 4] * 4), 1, CUSTOS)
+    pathfinder = Pathfinder(lambda id_mapa: graph, popular=2)
+
+    for destino in range(2, 17):
+        pathfinder.route(1, 1, destino)
+    assert list(pathfinder._consultas) == [(1, 13), (1, 14), (1, 15), (1, 16)]
+    # Um destino esquecido volta a contar do zero
+    pathfinder.route(1, 1, 2)
+    assert pathfinder._fields == {}
+
+
+def test_pathfinder_rebuilds_graph_when_world_changes():
+    loads = []
+
+    def loader(id_mapa):
+        loads.append(id_mapa)
+        return RouteGraph(make_store(RIO), id_mapa, CUSTOS)
+
+    pathfinder = Pathfinder(loader)
+    assert pathfinder.route(1, 1, 2) is not None
+    assert pathfinder.route(1, 1, 4) is None
+    assert loads == [1]
+
+    bump_reference_version('ponte')
+    pathfinder.route(1, 1, 2)
+    assert loads == [1, 1]
+    assert pathfinder.route(2, 1, 2) is None  # chunks de outro mapa
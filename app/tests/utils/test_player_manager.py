@@ -0,0 +1,48 @@
+"""
+Testes para a navegação paginada de personagens
+"""
+from unittest.mock import patch
+from src.models.player import Player
+from src.utils.player_manager import PlayerPager
+
+
+def make_players(nomes):
+    return [Player(i, nome, 100, 100, 10, "", 1, 0) for i, nome in enumerate(nomes, 1)]
+
+
+def fake_page(nomes):
+    def get_players_page(after_nome, limit):
+        return make_players([n for n in nomes if after_nome is None or n > after_nome][:limit])
+    return get_players_page
+
+
+def test_pager_walks_pages_by_key():
+    nomes = ["Alex", "Bia", "Caio", "Duda", "Enzo"]
+    with patch('src.utils.player_manager.InterfaceService') as service_cls:
+        service = service_cls.get_instance.return_value
+        service.get_players_page.side_effect = fake_page(nomes)
+
+        pager = PlayerPager(page_size=2)
+        assert [p.nome for p in pager.players] == ["Alex", "Bia"]
+        assert pager.has_next and not pager.has_previous
+        service.get_players_page.assert_called_with(None, 3)
+
+        assert pager.next_page()
+        assert [p.nome for p in pager.players] == ["Caio", "Duda"]
+        service.get_players_page.assert_called_with("Bia", 3)
+
+        assert pager.next_page()
+        assert [p.nome for p in pager.players] == ["Enzo"]
+        assert not pager.has_next
+        assert not pager.next_page()
+        assert pager.page_number == 3
+
+        assert pager.previous_page()
+        assert [p.nome for p in pager.players] == ["Caio", "Duda"]
+
+
+def test_pager_handles_service_errors():
+    with patch('src.utils.player_manager.InterfaceService') as service_cls:
+        service_cls.get_instance.return_value.get_players_page.side_effect = RuntimeError("sem banco")
+        pager = PlayerPager(page_size=2)
+        assert pager.players == [] and not pager.has_next
@@ -0,0 +1,147 @@
+"""
+Testes para o buffer write-behind dos jogadores
+"""
+import threading
+from unittest.mock import Mock
+
+import psycopg2
+
+from src.models.player import Player
+from src.utils.player_state_buffer import PlayerStateBuffer
+
+
+def make_player(id_player, localizacao="Mapa 1 - Chunk 1"):
+    return Player(id_player, f"Jogador{id_player}", 100, 100, 10, localizacao, 1, 0)
+
+
+def make_buffer(side_effect=None, **kwargs):
+    repo = Mock()
+    repo.update_many.side_effect = side_effect or (lambda players: [p.id_player for p in players])
+    kwargs.setdefault("flush_interval", 0)
+    kwargs.setdefault("flush_ticks", 0)
+    return PlayerStateBuffer(repo, **kwargs), repo
+
+
+def test_repeated_changes_are_coalesced_into_one_batch():
+    buffer, repo = make_buffer()
+    for chunk in range(1, 6):
+        buffer.mark_dirty(make_player(1, f"Mapa 1 - Chunk {chunk}"))
+    buffer.mark_dirty(make_player(2))
+
+    assert len(buffer) == 2
+    assert buffer.get(1).localizacao == "Mapa 1 - Chunk 5"
+    assert buffer.flush() == 2
+    repo.update_many.assert_called_once()
+    assert len(buffer) == 0
+    assert buffer.flush() == 0
+    repo.update_many.assert_called_once()
+
+
+def test_flush_on_tick_count():
+    buffer, repo = make_buffer(flush_ticks=3)
+    buffer.mark_dirty(make_player(1))
+
+    assert buffer.tick() == 0
+    assert buffer.tick() == 0
+    assert buffer.tick() == 1
+    repo.update_many.assert_called_once()
+
+
+def test_failed_flush_keeps_changes_without_overwriting_newer_ones():
+    buffer, repo = make_buffer(side_effect=psycopg2.OperationalError("conexão perdida"))
+    buffer.mark_dirty(make_player(1, "Mapa 1 - Chunk 1"))
+    buffer.mark_dirty(make_player(2))
+
+    assert buffer.flush() == 0
+    assert len(buffer) == 2
+
+    newer = make_player(1, "Mapa 1 - Chunk 9")
+    buffer.mark_dirty(newer)
+    buffer._write({1: make_player(1, "Mapa 1 - Chunk 1")})
+    assert buffer.get(1) is newer
+
+
+def test_flush_player_writes_only_that_player():
+    buffer, repo = make_buffer()
+    buffer.mark_dirty(make_player(1))
+    buffer.mark_dirty(make_player(2))
+
+    assert buffer.flush_player(1) is True
+    written = list(repo.update_many.call_args[0][0])
+    assert [p.id_player for p in written] == [1]
+    assert 2 in buffer and 1 not in buffer
+    assert buffer.flush_player(3) is True
+
+
+def test_close_flushes_pending_changes():
+    buffer, repo = make_buffer(flush_interval=60)
+    buffer.start()
+    buffer.mark_dirty(make_player(1))
+
+    assert buffer.close() == 1
+    assert len(buffer) == 0
+    assert buffer._thread is None
+
+
+def test_invalid_player_is_dropped_and_the_rest_is_written():
+    buffer, repo = make_buffer()
+    invalido = make_player(1)
+    invalido.nome = ""
+    buffer.mark_dirty(invalido)
+    buffer.mark_dirty(make_player(2))
+
+    assert buffer.flush() == 1
+    assert [p.id_player for p in repo.update_many.call_args[0][0]] == [2]
+    assert len(buffer) == 0
+    assert buffer.quarantined == {1: invalido}
+
+
+def test_row_error_quarantines_only_the_failing_player():
+    def update_many(players):
+        players = list(players)
+        if any(p.id_player == 2 for p in players):
+            raise psycopg2.IntegrityError("violates foreign key constraint")
+        return [p.id_player for p in players]
+
+    buffer, repo = make_buffer(side_effect=update_many)
+    for player_id in (1, 2, 3):
+        buffer.mark_dirty(make_player(player_id))
+
+    assert buffer.flush() == 2
+    assert len(buffer) == 0
+    assert list(buffer.quarantined) == [2]
+    assert buffer.flush_player(2) is True
+
+    # Um estado novo do jogador sai da quarentena e volta ao próximo flush
+    buffer.mark_dirty(make_player(2))
+    assert 2 in buffer and not buffer.quarantined
+
+
+def test_deleted_players_count_as_written():
+    buffer, repo = make_buffer(side_effect=lambda players: [])
+    buffer.mark_dirty(make_player(1))
+
+    assert buffer.flush_player(1) is True
+    assert len(buffer) == 0 and not buffer.quarantined
+
+
+def test_players_stay_visible_while_the_batch_is_written():
+    writing, release = threading.Event(), threading.Event()
+
+    def slow_update_many(players):
+        writing.set()
+        release.wait(5)
+        return [p.id_player for p in players]
+
+    buffer, _ = make_buffer(side_effect=slow_update_many)
+    player = make_player(1, "Mapa 1 - Chunk 7")
+    buffer.mark_dirty(player)
+    flusher = threading.Thread(target=buffer.flush)
+    flusher.start()
+    assert writing.wait(5)
+
+    # Sem o lote em gravação, get() cairia na linha antiga do banco
+    assert buffer.get(1) is player
+    release.set()
+    flusher.join(5)
+    assert buffer.get(1) is None
@@ -0,0 +1,59 @@
+"""
+Testes para o publicador do mundo em memória compartilhada
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import publish_world
+from src.models.bioma import Bioma
+from src.models.item import Item
+from src.models.mapa import Mapa, TurnoType
+
+BIOMAS = [Bioma(1, "Deserto", "Areia")]
+MAPAS = [Mapa(1, "Mapa_Principal", TurnoType.DIA)]
+ITENS = [Item(1, "Espada", "Arma", 5, 100)]
+
+
+def patch_tables(biomas=BIOMAS, mapas=MAPAS, itens=ITENS):
+    return (patch.object(publish_world.BiomaRepositoryImpl, "load_all", return_value=biomas),
+            patch.object(publish_world.MapaRepositoryImpl, "load_all", return_value=mapas),
+            patch.object(publish_world.ItemRepositoryImpl, "load_all", return_value=itens))
+
+
+@pytest.mark.parametrize("vazia", ["biomas", "itens"])
+def test_empty_reference_table_keeps_previous_generation(vazia):
+    publisher = MagicMock()
+    bioma, mapa, item = patch_tables(**{vazia: []})
+    with bioma, mapa, item, pytest.raises(RuntimeError, match="vazia"):
+        publish_world.publish(publisher)
+    publisher.publish.assert_not_called()
+
+
+def test_reference_table_error_keeps_previous_generation():
+    publisher = MagicMock()
+    with patch.object(publish_world.BiomaRepositoryImpl, "load_all",
+                      side_effect=Exception("sem conexão")), pytest.raises(Exception):
+        publish_world.publish(publisher)
+    publisher.publish.assert_not_called()
+
+
+def test_unchanged_world_is_not_republished():
+    publisher = MagicMock()
+    publisher.publish.return_value = 1
+    store = MagicMock(nbytes=0)
+    store.__len__.return_value = 4
+    versoes = iter([(1, 10, {}), (1, 10, {}), (1, 11, {})])
+    bioma, mapa, item = patch_tables()
+    with bioma, mapa, item, \
+            patch.object(publish_world, "connection_db", MagicMock()), \
+            patch.object(publish_world.map_snapshot, "fetch_stamp", side_effect=lambda *a: next(versoes)), \
+            patch.object(publish_world.ChunkStore, "concatenate", return_value=store), \
+            patch.object(publish_world.ChunkRepositoryImpl, "find_store_by_mapa") as find_store:
+        stamp = publish_world.publish(publisher)
+        # Mesmo mapa.versao e mesmas tabelas: nada é relido nem publicado
+        assert publish_world.publish(publisher, stamp) == stamp
+        assert publisher.publish.call_count == 1 and find_store.call_count == 1
+        # O trigger incrementou mapa.versao: nova geração
+        assert publish_world.publish(publisher, stamp) != stamp
+        assert publisher.publish.call_count == 2
@@ -0,0 +1,60 @@
+"""
+Testes para a instrumentação de consultas
+"""
+import logging
+from unittest.mock import MagicMock, patch
+from src.repositories.chunk_repository import ChunkRepositoryImpl
+from src.utils.query_stats import InstrumentedCursor, QueryStats, fingerprint, slow_query_logger
+
+
+def test_fingerprint_normalizes_literals_and_lists():
+    assert fingerprint("SELECT *\n  FROM chunk WHERE id = 10 AND nome = 'x'") == \
+        "SELECT * FROM chunk WHERE id = ? AND nome = ?"
+    assert fingerprint(b"INSERT INTO t VALUES (1, 'a'), (2, 'b')") == "INSERT INTO t VALUES (?, ...), ..."
+    assert fingerprint("WHERE id = ANY(ARRAY[1,2,3])") == fingerprint("WHERE id = ANY(ARRAY[4,5])")
+
+
+def test_record_counts_histogram_and_slow_log(caplog):
+    stats = QueryStats(slow_query_ms=100)
+    # Sem configurar nível: o log de consultas lentas sai por padrão
+    stats.record("SELECT 1", None, 0.002, 1, "A.a")
+    stats.record("SELECT 2", (1,), 0.250, 3, "B.b")
+
+    stat = stats.top(1)[0]
+    assert stats.total_queries == 2 and stats.slow_queries == 1
+    assert stat.calls == 2 and stat.rows == 4
+    assert stat.to_dict()["histogram"]["<=5ms"] == 1
+    assert stat.to_dict()["histogram"]["<=500ms"] == 1
+    assert stats.by_caller() == {"A.a": 1, "B.b": 1}
+    assert len(caplog.records) == 1 and "B.b" in caplog.text
+    assert caplog.records[0].levelno == logging.WARNING
+
+
+def test_slow_query_log_does_not_write_to_the_terminal():
+    # O stderr pertence à interface curses; a saída fica a cargo do ponto de entrada
+    assert not [h for h in slow_query_logger.handlers
+                if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)]
+    assert any(isinstance(h, logging.NullHandler) for h in slow_query_logger.handlers)
+
+
+def test_cursor_records_calling_repository_method(mock_db_connection):
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchone.return_value = (3, 2, 1, 2, 2)
+    mock_cursor.rowcount = 1
+    stats = QueryStats()
+    mock_conn.cursor.return_value = InstrumentedCursor(mock_cursor, stats)
+
+    with patch('src.repositories.chunk_repository.connection_db', return_value=mock_conn):
+        ChunkRepositoryImpl().find_by_id(3)
+
+    assert stats.by_caller() == {"ChunkRepositoryImpl.find_by_id": 1}
+    assert stats.top(1)[0].params == 1
+
+
+def test_cursor_proxies_attributes_and_iteration():
+    raw = MagicMock()
+    raw.__iter__.return_value = iter([(1,), (2,)])
+    cursor = InstrumentedCursor(raw, QueryStats())
+    cursor.itersize = 50
+    assert raw.itersize == 50
+    assert list(cursor) == [(1,), (2,)]
@@ -0,0 +1,84 @@
+"""
+Testes para o cache das tabelas de referência
+"""
+from unittest.mock import Mock, patch
+from src.repositories.bioma_repository import BiomaRepositoryImpl
+from src.models.bioma import Bioma
+from src.models.item import Item
+from src.models.mapa import Mapa, TurnoType
+from src.utils.reference_cache import (
+    ReferenceCache, ReferenceDataCache, bump_reference_version
+)
+
+
+def make_cache(sample_biomas, sample_mapas, ttl=None):
+    bioma_repo = Mock()
+    bioma_repo.load_all.return_value = sample_biomas
+    mapa_repo = Mock()
+    mapa_repo.load_all.return_value = sample_mapas
+    item_repo = Mock()
+    item_repo.load_all.return_value = [Item(1, "Espada", "Arma", 8, 200)]
+    return ReferenceDataCache(bioma_repo, mapa_repo, item_repo, ttl=ttl), bioma_repo, mapa_repo
+
+
+def test_lookups_served_from_memory(sample_biomas, sample_mapas):
+    cache, bioma_repo, mapa_repo = make_cache(sample_biomas, sample_mapas)
+    cache.load()
+
+    for _ in range(5):
+        assert cache.get_bioma(2).nome == "Oceano"
+        assert cache.get_mapa(2).turno == TurnoType.NOITE
+    assert cache.get_mapa_by_nome("Mapa_Principal", TurnoType.DIA).id_mapa == 1
+    assert cache.get_item(1).nome == "Espada"
+    assert cache.get_bioma(99) is None
+    bioma_repo.load_all.assert_called_once()
+    mapa_repo.load_all.assert_called_once()
+
+
+def test_version_bump_forces_reload(sample_biomas, sample_mapas):
+    cache, bioma_repo, _ = make_cache(sample_biomas, sample_mapas)
+    cache.load()
+
+    bump_reference_version('bioma')
+    cache.get_bioma(1)
+    assert bioma_repo.load_all.call_count == 2
+
+
+def test_ttl_expiration_forces_reload():
+    loader = Mock(return_value=[Bioma(1, "Deserto", "")])
+    cache = ReferenceCache('bioma_ttl', loader, lambda b: b.id_bioma, ttl=0)
+    cache.get(1)
+    cache.get(1)
+    assert loader.call_count == 2
+
+
+def test_empty_load_is_cached():
+    loader = Mock(return_value=[])
+    cache = ReferenceCache('mapa_empty', loader, lambda m: m.id_mapa)
+    assert cache.get(1) is None
+    assert cache.get(1) is None
+    assert cache.all() == []
+    loader.assert_called_once()
+
+
+def test_failed_load_is_retried():
+    loader = Mock(side_effect=[Exception("sem conexão"), [Mapa(1, "Mapa_Principal", TurnoType.DIA)]])
+    cache = ReferenceCache('mapa_falha', loader, lambda m: m.id_mapa)
+    assert cache.get(1) is None
+    assert cache.get(1).nome == "Mapa_Principal"
+    assert loader.call_count == 2
+
+
+
+def test_database_failure_is_not_cached_as_empty_table(mock_db_connection, sample_mapas):
+    # O find_all do repositório real engole o erro e devolve []; o cache não pode guardar isso
+    mock_conn, mock_cursor = mock_db_connection
+    mock_cursor.fetchall.return_value = [(1, 'Deserto', 'desc1')]
+    mapa_repo, item_repo = Mock(), Mock()
+    mapa_repo.load_all.return_value = sample_mapas
+    item_repo.load_all.return_value = []
+    cache = ReferenceDataCache(BiomaRepositoryImpl(), mapa_repo, item_repo)
+    with patch('src.repositories.bioma_repository.connection_db',
+               side_effect=[Exception("sem conexão"), mock_conn]):
+        cache.load()
+        assert cache.get_bioma(1).nome == "Deserto"
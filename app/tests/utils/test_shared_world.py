@@ -0,0 +1,175 @@
+"""
+Testes para o mundo em memória compartilhada
+"""
+import uuid
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.models.bioma import Bioma
+from src.models.chunk import Chunk
+from src.models.item import Item
+from src.models.mapa import Mapa
+from src.utils import shared_world
+from src.utils.chunk_store import ChunkStore, ChunkStoreGrid
+from src.utils.reference_cache import bump_reference_version, get_reference_version
+from src.utils.shared_world import SharedReferenceSource, SharedWorld, SharedWorldPublisher, close_segments
+
+BIOMAS = [Bioma(1, "Deserto", "Areia"), Bioma(2, "Oceano", "Água")]
+MAPAS = [Mapa(1, "Mapa_Principal", "Dia")]
+ITENS = [Item(1, "Espada", "Arma", 10, 100)]
+
+
+def make_store():
+    # Mapa 3x3 com ids por coordenada: id = 1 + x + 3 * y
+    return ChunkStore.from_rows([(1 + x + 3 * y, 1 + (x + y) % 2, 1, x, y)
+                                 for y in range(3) for x in range(3)])
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedWorldPublisher(f"mcw_test_{uuid.uuid4().hex[:8]}")
+    yield publisher
+    publisher.close()
+
+
+@pytest.fixture
+def attached(monkeypatch, publisher):
+    # Ativa o mundo compartilhado só durante o teste, sem herdar o leitor de outro teste
+    monkeypatch.setattr(shared_world, 'SHARED_WORLD_NAME', publisher.name)
+    monkeypatch.setattr(shared_world, '_current', None)
+    monkeypatch.setattr(shared_world, '_retired', [])
+    monkeypatch.setattr(shared_world, '_seen_versions',
+                        {table: get_reference_version(table) for table in shared_world._TABLES})
+    monkeypatch.setattr(shared_world, '_written_at', {})
+    yield publisher
+    segments = list(shared_world._retired)
+    if shared_world._current is not None:
+        segments.append(shared_world._current.segments)
+    shared_world._current = None
+    for pair in segments:
+        close_segments(pair)
+
+
+def test_attach_sees_published_world_read_only(publisher):
+    publisher.publish(make_store(), BIOMAS, MAPAS, ITENS)
+
+    world = SharedWorld.attach(publisher.name)
+
+    assert world.generation == 1 and not world.stale
+    assert world.store.get(1, 2, 1) == Chunk(6, 2, 1, 2, 1)
+    assert world.store.get_by_id(9) == Chunk(9, 1, 1, 2, 2)
+    assert not world.store.id_chunk.flags.writeable
+    assert not world.store.id_chunk.flags.owndata
+    assert [b.nome for b in world.tables("bioma")] == ["Deserto", "Oceano"]
+    assert world.mapas[0].turno.value == "Dia"
+    assert world.itens[0].poder == 10
+    assert world.loaded_at > 0
+    segments = world.segments
+    del world
+    assert close_segments(segments)
+
+
+def test_new_generation_marks_readers_stale(publisher):
+    publisher.publish(make_store(), BIOMAS, MAPAS, ITENS)
+    world = SharedWorld.attach(publisher.name)
+
+    assert publisher.publish(make_store().select(np.arange(9) < 3), BIOMAS, MAPAS, ITENS) == 2
+
+    assert world.stale
+    # A geração antiga continua legível por quem já estava anexado
+    assert len(world.store) == 9
+    novo = SharedWorld.attach(publisher.name)
+    assert novo.generation == 2 and len(novo.store) == 3
+    # Enquanto o objeto existe, os arrays seguram o mapeamento
+    segments = [world.segments, novo.segments]
+    assert not close_segments(segments[0])
+    del world, novo
+    assert all(close_segments(pair) for pair in segments)
+
+
+def test_attach_without_publisher_returns_none():
+    assert SharedWorld.attach(f"mcw_missing_{uuid.uuid4().hex[:8]}") is None
+
+
+def test_current_world_follows_generations(attached):
+    attached.publish(make_store(), BIOMAS, MAPAS, ITENS)
+    first = shared_world.current_world()
+    assert first is shared_world.current_world()
+
+    versao = get_reference_version("bioma")
+    attached.publish(make_store(), BIOMAS[:1], MAPAS, ITENS)
+    second = shared_world.current_world()
+
+    assert second.generation == 2
+    assert get_reference_version("bioma") > versao
+    assert len(SharedReferenceSource("bioma", Mock()).load_all()) == 1
+
+
+def test_retired_generation_stays_readable_until_released(attached):
+    attached.publish(make_store(), BIOMAS, MAPAS, ITENS)
+    first = shared_world.current_world()
+    attached.publish(make_store().select(np.arange(9) < 3), BIOMAS, MAPAS, ITENS)
+
+    assert shared_world.current_world().generation == 2
+    # Quem pegou a geração 1 antes da troca continua lendo normalmente
+    assert len(first.store) == 9 and first.grid.neighbours(5)
+    assert len(shared_world._retired) == 1
+
+    del first
+    shared_world.current_world()
+    assert shared_world._retired == []
+
+
+def test_local_writes_read_from_database_until_next_generation(attached):
+    attached.publish(make_store(), BIOMAS, MAPAS, ITENS)
+    assert shared_world.current_world("chunk") is not None
+
+    bump_reference_version("chunk")  # ex.: ChunkRepositoryImpl.save
+
+    assert shared_world.current_world("chunk") is None
+    assert shared_world.current_world("bioma") is not None
+    repository = Mock()
+    repository.load_all.return_value = BIOMAS[:1]
+    assert SharedReferenceSource("bioma", repository).load_all() == BIOMAS
+
+    # Geração carregada antes da escrita não serve; uma carregada depois, sim
+    attached.publish(make_store(), BIOMAS, MAPAS, ITENS, loaded_at=0.0)
+    assert shared_world.current_world("chunk") is None
+    attached.publish(make_store(), BIOMAS, MAPAS, ITENS)
+    assert shared_world.current_world("chunk").generation == 3
+
+
+def test_reference_source_falls_back_to_repository(monkeypatch):
+    monkeypatch.setattr(shared_world, 'SHARED_WORLD_NAME', "")
+    repository = Mock()
+    repository.load_all.return_value = BIOMAS
+
+    assert SharedReferenceSource("bioma", repository).load_all() == BIOMAS
+
+
+def test_chunk_repository_grid_comes_from_shared_world(attached):
+    from src.repositories.chunk_repository import ChunkRepositoryImpl
+    attached.publish(make_store(), BIOMAS, MAPAS, ITENS)
+
+    grid = ChunkRepositoryImpl().get_grid()
+
+    assert isinstance(grid, ChunkStoreGrid)
+    assert sorted(c.id_chunk for c in grid.neighbours(5)) == [2, 4, 6, 8]
+    del grid
+
+
+def test_chunk_store_grid_matches_chunk_grid():
+    from src.utils.chunk_grid import ChunkGrid
+    store = make_store()
+    grid, reference = ChunkStoreGrid(store), ChunkGrid(list(store))
+
+    assert len(grid) == 9 and 5 in grid and 42 not in grid
+    assert grid.neighbours(1) == reference.neighbours(1)
+    assert grid.neighbours(5) == reference.neighbours(5)
+    assert grid.row(1, 2) == reference.row(1, 2)
+    assert grid.column(1, 0) == reference.column(1, 0)
+    assert grid.radius(5, 1) == reference.radius(5, 1)
+    with pytest.raises(TypeError):
+        grid.add(Chunk(10, 1, 1, 5, 5))
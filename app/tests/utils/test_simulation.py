@@ -0,0 +1,83 @@
+"""
+Testes para a simulação headless de jogadores
+"""
+from unittest.mock import Mock
+from src.models.chunk import Chunk
+from src.models.player import Player
+from src.utils.chunk_grid import ChunkGrid
+from src.utils.simulation import (
+    OperationStats, SimulationConfig, SimulationRunner, percentile
+)
+
+
+def make_interface_service():
+    service = Mock()
+    service.get_player_by_name.return_value = None
+    service.create_player.side_effect = lambda nome: Player(
+        int(nome.rsplit("_", 1)[1]) + 1, nome, 100, 100, 10, "Mapa 1 - Chunk 1", 1, 0)
+    service.get_adjacent_chunks.return_value = [(2, 1), (33, 2)]
+    service.move_player_to_chunk.side_effect = lambda player, chunk_id: player
+    service.save_player.side_effect = lambda player: player
+    service.game_service.get_all_fantasmas.return_value = [{"id": 1, "tipo": "minerador"}]
+    service.game_service.realizar_acao_fantasma.return_value = {"error": "Fantasma já realizou sua ação"}
+    service.game_service.avancar_tempo.return_value = {"success": True}
+    return service
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+    assert OperationStats([0.001, 0.003]).summary()["p50_ms"] == 1.0
+
+
+def test_runner_reports_every_action_and_round_trips():
+    service = make_interface_service()
+    counter = iter([100, 160])
+    config = SimulationConfig(players=3, duration=5, seed=1, max_actions=20)
+
+    report = SimulationRunner(config, service, round_trip_counter=lambda: next(counter)).run()
+
+    assert report.total_actions == 60
+    assert report.round_trips == 60
+    assert report.round_trips_per_action == 1.0
+    assert sum(op.errors for op in report.operations.values()) == 0
+    service.game_service.player_state_buffer.flush.assert_called_once()
+    service.game_service.player_repository.delete_many.assert_called_once_with([1, 2, 3])
+    assert "Vazão" in report.format()
+
+
+def test_same_seed_gives_same_script():
+    def run(seed):
+        service = make_interface_service()
+        config = SimulationConfig(players=2, duration=5, seed=seed, max_actions=30)
+        report = SimulationRunner(config, service, round_trip_counter=lambda: 0).run()
+        return {nome: len(op.latencies) for nome, op in report.operations.items()}
+
+    assert run(7) == run(7)
+
+
+def test_ghost_errors_are_counted_but_already_acted_is_not():
+    service = make_interface_service()
+    service.game_service.realizar_acao_fantasma.side_effect = [
+        {"error": "Fantasma já realizou sua ação"}, {"error": "Fantasma não encontrado"},
+        {"success": True}, {"error": "Ação ou tipo de fantasma inválido"}]
+    config = SimulationConfig(players=1, duration=5, seed=1, max_actions=4,
+                              weights={"fantasma": 1})
+
+    report = SimulationRunner(config, service, round_trip_counter=lambda: 0).run()
+
+    assert report.operations["fantasma"].errors == 2
+
+
+def test_players_without_location_start_at_first_grid_chunk():
+    service = make_interface_service()
+    service.game_service.chunk_repository.get_grid.return_value = ChunkGrid(
+        [Chunk(7, 1, 1, 1, 0), Chunk(5, 1, 1, 0, 0)])
+    config = SimulationConfig(players=1, duration=5, seed=1, max_actions=0)
+
+    runner = SimulationRunner(config, service, round_trip_counter=lambda: 0)
+
+    assert [sim.chunk_id for sim in runner._setup_players()] == [5]
@@ -0,0 +1,102 @@
+"""
+Testes para a unidade de trabalho entre repositórios
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from src.utils.db_helpers import connection_db
+from src.utils.unit_of_work import UnitOfWork, UnitOfWorkError, current_unit_of_work, on_commit
+
+
+def make_factory():
+    conn = MagicMock()
+    factory = MagicMock(return_value=conn)
+    return factory, conn
+
+
+def repository_write(ok=True):
+    """Padrão dos repositórios: with connection_db(), commit e erros tratados"""
+    try:
+        with connection_db() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("UPDATE player SET nivel = nivel + 1")
+                if not ok:
+                    raise RuntimeError("violação de constraint")
+                conn.commit()
+                return True
+    except Exception:
+        return False
+
+
+def test_repositories_share_one_connection_and_commit():
+    factory, conn = make_factory()
+    with patch('src.utils.db_pool.get_pool') as get_pool:
+        with UnitOfWork(connection_factory=factory):
+            assert repository_write()
+            assert repository_write()
+        get_pool.assert_not_called()
+
+    factory.assert_called_once()
+    assert conn.cursor.call_count == 2
+    conn.commit.assert_called_once()
+    conn.rollback.assert_not_called()
+    conn.close.assert_called_once()
+    assert current_unit_of_work() is None
+
+
+def test_handled_repository_error_rolls_back_everything():
+    factory, conn = make_factory()
+    with pytest.raises(UnitOfWorkError):
+        with UnitOfWork(connection_factory=factory):
+            assert repository_write()
+            assert not repository_write(ok=False)
+
+    conn.commit.assert_not_called()
+    conn.rollback.assert_called_once()
+    conn.close.assert_called_once()
+
+
+def test_nested_blocks_join_outer_unit():
+    factory, conn = make_factory()
+    with UnitOfWork(connection_factory=factory) as outer:
+        with UnitOfWork() as inner:
+            assert repository_write()
+            assert current_unit_of_work() is outer
+        conn.commit.assert_not_called()
+        assert inner.connection is outer.connection
+
+    factory.assert_called_once()
+    conn.commit.assert_called_once()
+
+
+def test_unused_unit_opens_no_connection():
+    factory, conn = make_factory()
+    with UnitOfWork(connection_factory=factory):
+        pass
+    factory.assert_not_called()
+
+
+def test_failure_without_connection_still_raises():
+    with pytest.raises(UnitOfWorkError):
+        with UnitOfWork() as uow:
+            uow.mark_failed("falha antes de qualquer consulta")
+    assert current_unit_of_work() is None
+
+
+def test_on_commit_waits_for_outer_commit():
+    factory, conn = make_factory()
+    efeitos = []
+    on_commit(lambda: efeitos.append("fora"))
+    assert efeitos == ["fora"]
+
+    with UnitOfWork(connection_factory=factory):
+        with UnitOfWork():
+            assert repository_write()
+            on_commit(lambda: efeitos.append("aninhado"))
+        assert efeitos == ["fora"]
+    assert efeitos == ["fora", "aninhado"]
+
+    with pytest.raises(UnitOfWorkError):
+        with UnitOfWork(connection_factory=factory):
+            on_commit(lambda: efeitos.append("desfeito"))
+            assert not repository_write(ok=False)
+    assert efeitos == ["fora", "aninhado"]
@@ -0,0 +1,86 @@
+"""
+Testes para o gerador procedural de mundos
+"""
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils import world_generator
+from src.utils.world_generator import (
+    BIOMA_ORDER, OCEANO, _BlockReader, copy_rows, generate_bioma_grid, seed_world
+)
+
+
+def test_grid_shape_and_determinism():
+    grid = generate_bioma_grid(40, 25, seed=7)
+
+    assert grid.shape == (25, 40)
+    assert grid.dtype == np.uint8
+    assert np.array_equal(grid, generate_bioma_grid(40, 25, seed=7))
+    assert not np.array_equal(grid, generate_bioma_grid(40, 25, seed=8))
+
+
+def test_grid_has_ocean_border_and_every_bioma():
+    grid = generate_bioma_grid(128, 96, seed=1)
+
+    assert (grid[[0, -1], :] == OCEANO).all()
+    assert (grid[:, [0, -1]] == OCEANO).all()
+    assert set(np.unique(grid)) == set(range(len(BIOMA_ORDER)))
+
+
+def test_grid_rejects_empty_map():
+    with pytest.raises(ValueError):
+        generate_bioma_grid(0, 10)
+
+
+def test_copy_rows_follow_chunk_id_order():
+    bioma_ids = np.array([[1, 2, 3], [4, 5, 6]])
+
+    data = b"".join(copy_rows(bioma_ids, id_mapa=9, band_rows=1)).decode()
+
+    assert data.splitlines() == [
+        "1\t9\t0\t0", "2\t9\t1\t0", "3\t9\t2\t0",
+        "4\t9\t0\t1", "5\t9\t1\t1", "6\t9\t2\t1",
+    ]
+
+
+def test_block_reader_respects_read_size():
+    reader = _BlockReader([b"abc", b"", b"defgh"])
+
+    assert reader.read(2) == b"ab"
+    assert reader.read(4) == b"cdef"
+    assert reader.read() == b"gh"
+    assert reader.read(10) == b""
+
+
+def test_seed_world_copies_each_turn():
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [(b.value, i + 1) for i, b in enumerate(BIOMA_ORDER)]
+    cursor.fetchone.side_effect = [(10,), (11,), (False,)]
+    copied = []
+    cursor.copy_expert.side_effect = lambda sql, f, size: copied.append(f.read())
+
+    with patch.object(world_generator, 'connection_db', return_value=conn), \
+         patch.object(world_generator, 'bump_reference_version'):
+        mapas = seed_world(8, 4, seed=3)
+
+    assert mapas == {"Dia": 10, "Noite": 11}
+    assert [len(data.splitlines()) for data in copied] == [32, 32]
+    assert copied[0].replace(b"\t10\t", b"\t11\t") == copied[1]
+    conn.commit.assert_called_once()
+
+
+def test_seed_world_refuses_populated_map():
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [(b.value, i + 1) for i, b in enumerate(BIOMA_ORDER)]
+    cursor.fetchone.side_effect = [(10,), (11,), (True,)]
+
+    with patch.object(world_generator, 'connection_db', return_value=conn):
+        with pytest.raises(ValueError):
+            seed_world(8, 4)
+
+    cursor.copy_expert.assert_not_called()
@@ -1,5 +1,8 @@
 -- Drop das tabelas existentes (para recriação limpa)
 DROP TABLE IF EXISTS Inventario, Item, Player, Chunk, Mapa, Bioma, fantasma, pontes, totem, Aldeao, Casa_aldeao, vila, Bob_construtor, Bob_mago CASCADE;
 
+-- Versões de migração ficam inválidas quando o schema é recriado
+DROP TABLE IF EXISTS schema_version;
+
 -- Extensões necessárias
 CREATE EXTENSION IF NOT EXISTS pg_cron;